@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Measure the time of loading the arguments of a single command, i.e. MainCommandsLoader.load_arguments.
+
+Usage: python measure_argument_loading.py [--runs N] [command words ...]
+
+The first run includes importing the _params modules and the SDK models used by the argument registrations, the
+following runs measure the evaluation of argument contexts and the update of command definitions alone.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+from azure.cli.core import get_default_cli
+
+DEFAULT_COMMAND = 'network vnet subnet update'
+
+
+def mean(data):
+    return sum(data) / float(len(data))
+
+
+def load_arguments_once(command):
+    cli = get_default_cli()
+    cli.invocation = cli.invocation_cls(cli_ctx=cli, parser_cls=cli.parser_cls,
+                                        commands_loader_cls=cli.commands_loader_cls, help_cls=cli.help_cls)
+    cli.invocation.data['command_string'] = command
+    loader = cli.invocation.commands_loader
+    loader.load_command_table(command.split())
+    if command not in loader.command_table:
+        raise ValueError("'{}' is not a command".format(command))
+
+    start = timeit.default_timer()
+    loader.load_arguments(command)
+    elapsed = (timeit.default_timer() - start) * 1000
+    return elapsed, len(loader.command_table[command].arguments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', nargs='*', help="Command without the leading 'az'. Default: '{}'".format(
+        DEFAULT_COMMAND))
+    parser.add_argument('--runs', type=int, default=20, help='Number of warm runs.')
+    args = parser.parse_args()
+    command = ' '.join(args.command) or DEFAULT_COMMAND
+
+    # keep the user's configuration and command index untouched
+    os.environ['AZURE_CONFIG_DIR'] = tempfile.mkdtemp()
+    os.environ['AZURE_CORE_COLLECT_TELEMETRY'] = 'no'
+
+    cold, count = load_arguments_once(command)
+    warm = [load_arguments_once(command)[0] for _ in range(args.runs)]
+    print('az {}: {} arguments'.format(command, count))
+    print('  first run: {:.1f} ms'.format(cold))
+    print('  warm runs: mean {:.2f} ms, min {:.2f} ms over {} runs'.format(mean(warm), min(warm), len(warm)))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
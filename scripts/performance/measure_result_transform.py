@@ -0,0 +1,95 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Measure the post-processing of command results over a large synthetic ARM payload.
+
+Usage: python measure_result_transform.py [--resources N] [--runs N]
+
+Compares knack's todict followed by the global transforms, each walking the result once, with the single pass of
+todict_with_global_transforms, and checks that both produce the same output.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+
+from knack.util import todict
+
+from azure.cli.core.commands import AzCliCommandInvoker
+from azure.cli.core.commands.transform import _add_resource_group, _add_x509_hex, todict_with_global_transforms
+
+RESOURCE_ID = '/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/rg{}/providers/' \
+              'Microsoft.Compute/virtualMachines/vm{}'
+
+
+class Model:  # pylint: disable=too-few-public-methods
+    """Mimics an SDK model: public attributes in snake case plus additional_properties."""
+
+    def __init__(self, **kwargs):
+        self.additional_properties = {}
+        self.__dict__.update(kwargs)
+
+
+def make_resource(index):
+    resource_id = RESOURCE_ID.format(index % 50, index)
+    return Model(
+        id=resource_id, name='vm{}'.format(index), location='westus', tags={'env': 'test', 'owner': 'team'},
+        provisioning_state='Succeeded',
+        hardware_profile=Model(vm_size='Standard_D2s_v3'),
+        storage_profile=Model(
+            os_disk=Model(name='osdisk', caching='ReadWrite', disk_size_gb=30,
+                          managed_disk=Model(id=resource_id + '/disks/osdisk', storage_account_type='Premium_LRS')),
+            data_disks=[Model(lun=lun, name='data{}'.format(lun), disk_size_gb=128,
+                              managed_disk=Model(id=resource_id + '/disks/data{}'.format(lun)))
+                        for lun in range(4)]),
+        network_profile=Model(network_interfaces=[Model(id=resource_id + '/nic{}'.format(n), primary=n == 0)
+                                                  for n in range(2)]),
+        os_profile=Model(computer_name='vm{}'.format(index), admin_username='azureuser',
+                         secrets=[Model(source_vault=Model(id=resource_id + '/vaults/kv'),
+                                        vault_certificates=[Model(certificate_url='https://kv/cert',
+                                                                  x509_thumbprint='AAECAwQFBgcICQ==')])]))
+
+
+def run_separate_passes(result):
+    result = todict(result, AzCliCommandInvoker.remove_additional_prop_layer)
+    _add_resource_group(result)
+    _add_x509_hex(result)
+    return result
+
+
+def run_single_pass(result):
+    return todict_with_global_transforms(result, AzCliCommandInvoker.remove_additional_prop_layer)
+
+
+def measure(func, payload, runs):
+    times = []
+    for _ in range(runs):
+        start = timeit.default_timer()
+        func(payload)
+        times.append((timeit.default_timer() - start) * 1000)
+    return min(times), sum(times) / len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resources', type=int, default=5000, help='Number of resources in the payload.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of measured runs.')
+    args = parser.parse_args()
+
+    payload = [make_resource(i) for i in range(args.resources)]
+    if json.dumps(run_separate_passes(payload)) != json.dumps(run_single_pass(payload)):
+        print('The outputs differ')
+        return 1
+
+    print('{} resources, {} runs'.format(args.resources, args.runs))
+    for name, func in [('todict + transforms', run_separate_passes), ('single pass', run_single_pass)]:
+        best, average = measure(func, payload, args.runs)
+        print('  {:<20} min {:8.1f} ms, mean {:8.1f} ms'.format(name, best, average))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
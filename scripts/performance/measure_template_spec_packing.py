@@ -0,0 +1,108 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Measure the packing of a Template Spec with a generated tree of linked templates.
+
+Usage: python measure_template_spec_packing.py [--depth N] [--width N] [--links N] [--runs N] [--output FILE]
+
+The root template links to the templates of the first level. Each template of a level links to --links templates of
+the next level, so that the templates of a level are shared by the ones of the level above, like modules. With
+--output, the packed template is written as JSON to compare the output of two versions.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from azure.cli.core import get_default_cli
+
+
+def _template(links, resources=10):
+    return {
+        '$schema': 'https://schema.management.azure.com/schemas/2019-04-01/deploymentTemplate.json#',
+        'contentVersion': '1.0.0.0',
+        'parameters': {'location': {'type': 'string', 'defaultValue': '[resourceGroup().location]'}},
+        'resources': [{
+            'type': 'Microsoft.Storage/storageAccounts',
+            'apiVersion': '2021-04-01',
+            'name': "[concat('storage', uniqueString(resourceGroup().id), '{}')]".format(i),
+            'location': "[parameters('location')]",
+            'sku': {'name': 'Standard_LRS'},
+            'kind': 'StorageV2',
+            'properties': {'supportsHttpsTrafficOnly': True}
+        } for i in range(resources)] + [{
+            'type': 'Microsoft.Resources/deployments',
+            'apiVersion': '2020-10-01',
+            'name': 'link{}'.format(i),
+            'properties': {'mode': 'Incremental', 'templateLink': {'relativePath': link}}
+        } for i, link in enumerate(links)]
+    }
+
+
+def _write_template(path, template):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('// generated template\n')
+        json.dump(template, f, indent=2)
+
+
+def generate_template_tree(root_dir, depth, width, links):
+    """Generate the templates and return the path of the root template."""
+    def _links(level, index, prefix):
+        if level >= depth:
+            return []
+        return ['{}level{}/template{}.json'.format(prefix, level, (index + i) % width) for i in range(links)]
+
+    for level in range(depth):
+        for index in range(width):
+            _write_template(os.path.join(root_dir, 'level{}'.format(level), 'template{}.json'.format(index)),
+                            _template(_links(level + 1, index, '../')))
+    root_template_file = os.path.join(root_dir, 'main.json')
+    _write_template(root_template_file, _template(['level0/template{}.json'.format(i) for i in range(width)]))
+    return root_template_file
+
+
+def main():
+    from azure.cli.command_modules.resource._packing_engine import pack
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--depth', type=int, default=8, help='Number of levels of linked templates.')
+    parser.add_argument('--width', type=int, default=40, help='Number of templates of each level.')
+    parser.add_argument('--links', type=int, default=5, help='Number of templates linked by each template.')
+    parser.add_argument('--runs', type=int, default=3, help='Number of runs.')
+    parser.add_argument('--output', help='Write the packed template to this file.')
+    args = parser.parse_args()
+
+    # keep the user's configuration untouched
+    os.environ['AZURE_CONFIG_DIR'] = tempfile.mkdtemp()
+    os.environ['AZURE_CORE_COLLECT_TELEMETRY'] = 'no'
+    cmd = SimpleNamespace(cli_ctx=get_default_cli())
+
+    root_dir = tempfile.mkdtemp()
+    try:
+        root_template_file = generate_template_tree(root_dir, args.depth, args.width, args.links)
+        times = []
+        for _ in range(args.runs):
+            start = timeit.default_timer()
+            packed = pack(cmd, root_template_file)
+            times.append(timeit.default_timer() - start)
+    finally:
+        shutil.rmtree(root_dir)
+
+    print('{} linked templates, {} links'.format(len(packed.Artifacts), (args.depth * args.links + 1) * args.width))
+    print('  pack: mean {:.3f} s, min {:.3f} s over {} runs'.format(sum(times) / len(times), min(times), len(times)))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'template': packed.RootTemplate,
+                       'artifacts': [{'path': a.path, 'template': a.template} for a in packed.Artifacts]}, f)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Measure how the subscription discovery of `az login` scales with the number of tenants.
+
+Usage: python measure_tenant_discovery.py [--tenants N [N ...]] [--latency MS] [--workers N]
+
+The ADAL context factory and the ARM client factory are stubbed: acquiring a token and listing the subscriptions of
+a tenant each sleep for the given latency. Compares finding the tenants one by one with the bounded thread pool.
+"""
+
+import argparse
+import sys
+import time
+import timeit
+
+from azure.cli.core._profile import SubscriptionFinder, _TENANT_DISCOVERY_WORKERS
+
+
+class TenantStub:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, tenant_id):
+        self.tenant_id = tenant_id
+        self.display_name = tenant_id
+
+
+class SubscriptionStub:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, tenant_id):
+        self.id = '/subscriptions/' + tenant_id
+        self.subscription_id = tenant_id
+        self.display_name = tenant_id
+        self.tenant_id = tenant_id
+
+
+class ConfigStub:
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def getint(self, section, option, fallback=None):  # pylint: disable=unused-argument
+        return self.workers if option == 'tenant_discovery_workers' else fallback
+
+    def getfloat(self, section, option, fallback=None):  # pylint: disable=unused-argument,no-self-use
+        return fallback
+
+
+class CliStub:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, workers):
+        self.config = ConfigStub(workers)
+
+
+def make_finder(tenant_count, latency, workers):
+    tenants = [TenantStub('tenant{}'.format(i)) for i in range(tenant_count)]
+
+    class AuthContextStub:  # pylint: disable=too-few-public-methods
+
+        def __init__(self, tenant):
+            self.tenant = tenant
+
+        def acquire_token(self, *_):
+            time.sleep(latency)
+            return {'accessToken': self.tenant}
+
+    class ArmClientStub:  # pylint: disable=too-few-public-methods
+
+        def __init__(self, credentials):
+            self.tenant = credentials.access_token
+            self.tenants = self
+            self.subscriptions = self
+
+        def list(self):
+            time.sleep(latency)
+            return tenants if self.tenant == 'common' else [SubscriptionStub(self.tenant)]
+
+    finder = SubscriptionFinder(CliStub(workers), lambda _, tenant, _1: AuthContextStub(tenant), None, ArmClientStub)
+    finder.user_id = 'user@example.com'
+    return finder
+
+
+def measure(tenant_count, latency, workers):
+    finder = make_finder(tenant_count, latency, workers)
+    start = timeit.default_timer()
+    # pylint: disable=protected-access
+    subscriptions = finder._find_using_common_tenant('common', 'https://management.core.windows.net/')
+    elapsed = timeit.default_timer() - start
+    if [s.subscription_id for s in subscriptions] != ['tenant{}'.format(i) for i in range(tenant_count)]:
+        raise ValueError('Unexpected subscriptions with {} workers'.format(workers))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tenants', type=int, nargs='+', default=[1, 10, 50, 150], help='Numbers of tenants.')
+    parser.add_argument('--latency', type=float, default=100, help='Latency of each request in milliseconds.')
+    parser.add_argument('--workers', type=int, default=_TENANT_DISCOVERY_WORKERS, help='Size of the thread pool.')
+    args = parser.parse_args()
+
+    latency = args.latency / 1000
+    measure(1, 0, 1)  # warm up the imports
+    print('{} ms per request, {} workers'.format(args.latency, args.workers))
+    print('  {:>8} {:>12} {:>12}'.format('tenants', 'serial', 'concurrent'))
+    for tenant_count in args.tenants:
+        try:
+            serial = measure(tenant_count, latency, 1)
+            concurrent = measure(tenant_count, latency, args.workers)
+        except ValueError as ex:
+            print(ex)
+            return 1
+        print('  {:>8} {:>10.2f} s {:>10.2f} s'.format(tenant_count, serial, concurrent))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,6 +11,7 @@ import sys
 import timeit
 
 from knack.cli import CLI
+from knack.events import EVENT_CLI_POST_EXECUTE
 from knack.commands import CLICommandsLoader
 from knack.completion import ARGCOMPLETE_ENV_NAME
 from knack.introspection import extract_args_from_signature, extract_full_summary_from_signature
@@ -53,6 +54,14 @@ def _configure_knack():
 _configure_knack()
 
 
+def close_connection_pools(_, **__):
+    """Close the connections kept for the clients of the command when it completes."""
+    # The pools are only loaded by the commands which send requests
+    transport = sys.modules.get('azure.cli.core._transport')
+    if transport:
+        transport.close_pools()
+
+
 class AzCli(CLI):
 
     def __init__(self, **kwargs):
@@ -66,6 +75,7 @@ class AzCli(CLI):
         from azure.cli.core._session import ACCOUNT, CONFIG, SESSION, INDEX, VERSIONS
         from azure.cli.core.util import handle_version_update
         from azure.cli.core.commands.query_examples import register_global_query_examples_argument
+        from azure.cli.core.perf_trace import register_global_perf_trace_argument
 
         from knack.util import ensure_dir
 
@@ -90,8 +100,10 @@ class AzCli(CLI):
         register_global_transforms(self)
         register_global_subscription_argument(self)
         register_global_query_examples_argument(self)
+        register_global_perf_trace_argument(self)
         register_ids_argument(self)  # global subscription must be registered first!
         register_cache_arguments(self)
+        self.register_event(EVENT_CLI_POST_EXECUTE, close_connection_pools)
 
         self.progress_controller = None
 
@@ -228,6 +240,7 @@ class MainCommandsLoader(CLICommandsLoader):
             _load_module_command_loader, _load_extension_command_loader, BLOCKED_MODS, ExtensionCommandSource)
         from azure.cli.core.extension import (
             get_extensions, get_extension_path, get_extension_modname)
+        from azure.cli.core.perf_trace import trace_span
 
         def _update_command_table_from_modules(args, command_modules=None):
             """Loads command tables from modules and merge into the main command table.
@@ -263,7 +276,8 @@ class MainCommandsLoader(CLICommandsLoader):
             for mod in [m for m in command_modules if m not in BLOCKED_MODS]:
                 try:
                     start_time = timeit.default_timer()
-                    module_command_table, module_group_table = _load_module_command_loader(self, args, mod)
+                    with trace_span(mod, category='module'):
+                        module_command_table, module_group_table = _load_module_command_loader(self, args, mod)
                     for cmd in module_command_table.values():
                         cmd.command_source = mod
                     self.command_table.update(module_command_table)
@@ -357,8 +371,9 @@ class MainCommandsLoader(CLICommandsLoader):
                         # from an extension requires this map to be up-to-date.
                         # self._mod_to_ext_map[ext_mod] = ext_name
                         start_time = timeit.default_timer()
-                        extension_command_table, extension_group_table = \
-                            _load_extension_command_loader(self, args, ext_mod)
+                        with trace_span(ext_mod, category='extension'):
+                            extension_command_table, extension_group_table = \
+                                _load_extension_command_loader(self, args, ext_mod)
 
                         for cmd_name, cmd in extension_command_table.items():
                             cmd.command_source = ExtensionCommandSource(
@@ -483,6 +498,7 @@ class MainCommandsLoader(CLICommandsLoader):
     def load_arguments(self, command=None):
         from azure.cli.core.commands.parameters import (
             resource_group_name_type, get_location_type, deployment_name_type, vnet_name_type, subnet_name_type)
+        from azure.cli.core.perf_trace import trace_span
         from knack.arguments import ignore_type
 
         # omit specific command to load everything
@@ -496,29 +512,29 @@ class MainCommandsLoader(CLICommandsLoader):
 
         if command_loaders:
             for loader in command_loaders:
-
-                # register global args
-                with loader.argument_context('') as c:
-                    c.argument('resource_group_name', resource_group_name_type)
-                    c.argument('location', get_location_type(self.cli_ctx))
-                    c.argument('vnet_name', vnet_name_type)
-                    c.argument('subnet', subnet_name_type)
-                    c.argument('deployment_name', deployment_name_type)
-                    c.argument('cmd', ignore_type)
-
-                if command is None:
-                    # load all arguments via reflection
-                    for cmd in loader.command_table.values():
-                        cmd.load_arguments()  # this loads the arguments via reflection
-                    loader.skip_applicability = True
-                    loader.load_arguments('')  # this adds entries to the argument registries
-                else:
-                    loader.command_name = command
-                    self.command_table[command].load_arguments()  # this loads the arguments via reflection
-                    loader.load_arguments(command)  # this adds entries to the argument registries
-                self.argument_registry.arguments.update(loader.argument_registry.arguments)
-                self.extra_argument_registry.update(loader.extra_argument_registry)
-                loader._update_command_definitions()  # pylint: disable=protected-access
+                with trace_span(loader.__module__, category='arguments'):
+                    # register global args
+                    with loader.argument_context('') as c:
+                        c.argument('resource_group_name', resource_group_name_type)
+                        c.argument('location', get_location_type(self.cli_ctx))
+                        c.argument('vnet_name', vnet_name_type)
+                        c.argument('subnet', subnet_name_type)
+                        c.argument('deployment_name', deployment_name_type)
+                        c.argument('cmd', ignore_type)
+
+                    if command is None:
+                        # load all arguments via reflection
+                        for cmd in loader.command_table.values():
+                            cmd.load_arguments()  # this loads the arguments via reflection
+                        loader.skip_applicability = True
+                        loader.load_arguments('')  # this adds entries to the argument registries
+                    else:
+                        loader.command_name = command
+                        self.command_table[command].load_arguments()  # this loads the arguments via reflection
+                        loader.load_arguments(command)  # this adds entries to the argument registries
+                    self.argument_registry.arguments.update(loader.argument_registry.arguments)
+                    self.extra_argument_registry.update(loader.extra_argument_registry)
+                    loader._update_command_definitions()  # pylint: disable=protected-access
 
 
 class CommandIndex:
@@ -609,6 +625,12 @@ class CommandIndex:
         self.INDEX[self._COMMAND_INDEX] = index
         logger.debug("Updated command index in %.3f seconds.", elapsed_time)
 
+        # Tab completion of the commands is answered from the completion index, built along with the command index
+        if self.INDEX.filename:
+            from azure.cli.core._completion import CompletionIndex
+            CompletionIndex(os.path.dirname(self.INDEX.filename)).update(command_table, __version__,
+                                                                         self.cloud_profile)
+
     def invalidate(self):
         """Invalidate the command index.
 
@@ -674,7 +696,16 @@ class AzCommandsLoader(CLICommandsLoader):  # pylint: disable=too-many-instance-
         master_arg_registry = self.cli_ctx.invocation.commands_loader.argument_registry
         master_extra_arg_registry = self.cli_ctx.invocation.commands_loader.extra_argument_registry
 
-        for command_name, command in self.command_table.items():
+        if self.skip_applicability or not self.command_name:
+            command_names = self.command_table
+        else:
+            # When a single command is loaded, only it and the commands with extra arguments registered to an
+            # applicable scope can have arguments. The rest of the table has nothing to update.
+            command_names = {self.command_name}.union(master_extra_arg_registry)
+        for command_name in command_names:
+            command = self.command_table.get(command_name)
+            if command is None:
+                continue
             # Add any arguments explicitly registered for this command
             for argument_name, argument_definition in master_extra_arg_registry[command_name].items():
                 command.arguments[argument_name] = argument_definition
@@ -908,6 +939,7 @@ def get_default_cli():
     from azure.cli.core._config import GLOBAL_CONFIG_DIR, ENV_VAR_PREFIX
     from azure.cli.core._help import AzCliHelp
     from azure.cli.core._output import AzOutputProducer
+    from azure.cli.core._query import AzCliQuery
 
     return AzCli(cli_name='az',
                  config_dir=GLOBAL_CONFIG_DIR,
@@ -917,4 +949,5 @@ def get_default_cli():
                  parser_cls=AzCliCommandParser,
                  logging_cls=AzCliLogging,
                  output_cls=AzOutputProducer,
+                 query_cls=AzCliQuery,
                  help_cls=AzCliHelp)
@@ -0,0 +1,238 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Answer tab completion from a precomputed index, without loading the command modules.
+
+The command groups and commands are indexed when the command index is rebuilt. The options and static choices of a
+command are indexed the first time it is completed through the parser. Completions which need a dynamic completer,
+or which the index can't answer, fall back to the parser.
+"""
+
+import argparse
+import json
+import os
+
+_COMPLETION_INDEX_FILE = 'completionIndex.json'
+_COMMAND_INDEX_FILE = 'commandIndex.json'
+
+_VERSION = 'version'
+_CLOUD_PROFILE = 'cloudProfile'
+_GROUPS = 'groups'
+_ROOT_OPTIONS = 'rootOptions'
+_GROUP_OPTIONS = 'groupOptions'
+_COMMANDS = 'commands'
+
+# The options which may be given more than once
+_APPEND_ACTIONS = (argparse._AppendAction, argparse._AppendConstAction)  # pylint: disable=protected-access
+
+
+def _get_index_path(file_name, config_dir=None):
+    from azure.cli.core._environment import get_config_dir
+    return os.path.join(config_dir or get_config_dir(), file_name)
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_arguments(parser):
+    """Get the options of a parser, with the values they take, in the order argcomplete completes them."""
+    arguments = []
+    positionals = False
+    for action in parser._actions:  # pylint: disable=protected-access
+        if action.help == argparse.SUPPRESS:
+            continue
+        if not action.option_strings:
+            positionals = True
+            continue
+        argument = {'options': list(action.option_strings), 'nargs': action.nargs}
+        # argcomplete replaces the class of the actions while it completes
+        if issubclass(getattr(action, '_orig_class', type(action)), _APPEND_ACTIONS):
+            argument['repeatable'] = True
+        if getattr(action, 'completer', None) is not None:
+            argument['completer'] = True
+        elif action.choices is not None:
+            argument['choices'] = [str(c) for c in action.choices]
+        arguments.append(argument)
+    return arguments, positionals
+
+
+class CompletionIndex:
+
+    def __init__(self, config_dir=None):
+        self.path = _get_index_path(_COMPLETION_INDEX_FILE, config_dir)
+        self.data = None
+
+    def load(self):
+        if self.data is None:
+            self.data = _load_json(self.path)
+        return self.data
+
+    def save(self):
+        # Replace the index atomically, so that a concurrent completion never reads a partial index
+        from azure.cli.core.util import write_file_json
+        try:
+            write_file_json(self.path, self.data, separators=(',', ':'))
+        except OSError as ex:
+            from knack.log import get_logger
+            get_logger(__name__).debug("Failed to save the completion index %s: %s", self.path, ex)
+
+    def update(self, command_table, version, cloud_profile):
+        """Index the command groups and commands of a command table loaded from all the modules and extensions.
+
+        The options of the commands are dropped, as they may have changed with the command table.
+        """
+        groups = {}
+        for command_name, command in command_table.items():
+            deprecate_info = command.deprecate_info
+            if deprecate_info and deprecate_info.expired():
+                continue
+            parts = command_name.split()
+            for i, part in enumerate(parts):
+                children = groups.setdefault(' '.join(parts[:i]), [])
+                if part not in children:
+                    children.append(part)
+        self.data = {_VERSION: version, _CLOUD_PROFILE: cloud_profile, _GROUPS: groups, _COMMANDS: {}}
+        self.save()
+
+    def is_valid(self, version, command_index):
+        """The completion index is valid as long as the command index it was built with."""
+        data = self.load()
+        return bool(data.get(_VERSION)) and data.get(_VERSION) == version and \
+            data.get(_VERSION) == command_index.get(_VERSION) and \
+            data.get(_CLOUD_PROFILE) == command_index.get(_CLOUD_PROFILE)
+
+    def add_parser(self, parser, command):
+        """Index the options of the root parser and of the parsers of the completed command or group."""
+        data = self.load()
+        if not data.get(_GROUPS):
+            return
+        path = command.split() if command else []
+        subparsers = parser.subparsers or {}
+        updated = False
+        if _ROOT_OPTIONS not in data:
+            data[_ROOT_OPTIONS] = _get_arguments(parser)[0]
+            updated = True
+        # All the group parsers are created alike, so the options of one stand for all of them
+        if _GROUP_OPTIONS not in data and path and () in subparsers and path[0] in subparsers[()].choices:
+            group_parser = subparsers[()].choices[path[0]]
+            if group_parser.is_group():
+                data[_GROUP_OPTIONS] = _get_arguments(group_parser)[0]
+                updated = True
+        if command in parser.subparser_map and command not in data[_COMMANDS]:
+            arguments, positionals = _get_arguments(parser.subparser_map[command])
+            data[_COMMANDS][command] = {'arguments': arguments, 'positionals': positionals}
+            updated = True
+        if updated:
+            self.save()
+
+    def get_completions(self, words, prefix):
+        """Get the completions of the word being typed, or None if they need the parser.
+
+        :param words: the words before the one being typed, without the executable
+        :param prefix: the beginning of the word being typed
+        """
+        data = self.load()
+        groups = data.get(_GROUPS, {})
+        if '--' in words or '=' in prefix:
+            return None
+
+        group = ''
+        for i, word in enumerate(words):
+            name = '{} {}'.format(group, word).strip()
+            if name in groups:
+                group = name
+            elif word in groups.get(group, []):
+                return self._get_command_completions(name, words[i + 1:], prefix)
+            else:
+                return None
+
+        options = data.get(_GROUP_OPTIONS if group else _ROOT_OPTIONS)
+        if options is None:
+            return None
+        completions = _get_option_completions(options, prefix)
+        if not prefix.startswith('-'):
+            completions += [c for c in groups.get(group, []) if c.lower().startswith(prefix.lower())]
+        return completions
+
+    def _get_command_completions(self, command, words, prefix):
+        command_data = self.data[_COMMANDS].get(command)
+        if command_data is None or command_data['positionals']:
+            return None
+        arguments = command_data['arguments']
+        by_option = {o: a for a in arguments for o in a['options']}
+
+        # Find the option the last words belong to
+        values = 0
+        argument = None
+        for word in reversed(words):
+            if word in by_option:
+                argument = by_option[word]
+                break
+            if word.startswith('-'):
+                return None
+            values += 1
+        if argument is None:
+            expected_values = 0
+        elif argument['nargs'] == 0:
+            expected_values = 0
+        elif argument['nargs'] is None:
+            expected_values = 1
+        else:
+            return None
+        if values > expected_values:
+            return None
+
+        if values < expected_values and not prefix.startswith('-'):
+            # The word being typed is the value of the option
+            if argument.get('completer'):
+                return None
+            return [c for c in argument.get('choices', []) if c.lower().startswith(prefix.lower())]
+        # An option can't be given twice, unless its values are appended. The last option is given once it has a value.
+        given = words[:-1] if values < expected_values else words
+        used = [by_option[w] for w in given if w in by_option and not by_option[w].get('repeatable')]
+        return _get_option_completions([a for a in arguments if a not in used], prefix)
+
+
+def _get_option_completions(arguments, prefix):
+    return [o for a in arguments for o in a['options'] if o.lower().startswith(prefix.lower())]
+
+
+def complete_from_index(exit_method=os._exit):  # pylint: disable=protected-access
+    """Print the completions of the command line if the completion index can answer them, and exit.
+
+    Returns without any output when the completion needs the parser.
+    """
+    import argcomplete
+    from azure.cli.core import __version__
+
+    try:
+        comp_line = os.environ['COMP_LINE']
+        comp_point = int(os.environ['COMP_POINT'])
+        start = int(os.environ['_ARGCOMPLETE']) - 1
+    except (KeyError, ValueError):
+        return
+    ifs = os.environ.get('_ARGCOMPLETE_IFS', '\013')
+    if len(ifs) != 1 or os.environ.get('_ARGCOMPLETE_DFS'):
+        return
+
+    index = CompletionIndex()
+    if not index.is_valid(__version__, _load_json(_get_index_path(_COMMAND_INDEX_FILE))):
+        return
+    cword_prequote, cword_prefix, _, comp_words, last_wordbreak_pos = argcomplete.split_line(comp_line, comp_point)
+    completions = index.get_completions(comp_words[start + 1:], cword_prefix)
+    if completions is None:
+        return
+
+    finder = argcomplete.CompletionFinder()
+    completions = finder.quote_completions(finder.filter_completions(completions), cword_prequote, last_wordbreak_pos)
+    filename = os.environ.get('_ARGCOMPLETE_STDOUT_FILENAME')
+    with (open(filename, 'wb') if filename else os.fdopen(8, 'wb')) as output_stream:
+        output_stream.write(ifs.join(completions).encode('utf-8'))
+    exit_method(0)
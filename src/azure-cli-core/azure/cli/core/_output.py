@@ -3,14 +3,191 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import errno
+from collections import OrderedDict
+
 import knack.output
+from knack.log import get_logger
+
+logger = get_logger(__name__)
+
+# Size of the pieces of output written at once
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# orjson writes floats outside of this range in another notation than the json module, e.g. 1e16 instead of 1e+16
+_FAST_JSON_MIN_FLOAT = 1e-4
+_FAST_JSON_MAX_FLOAT = 1e16
+_FAST_JSON_MIN_INT = -2 ** 63
+_FAST_JSON_MAX_INT = 2 ** 64
+
+_fast_json_encoder = None
+
+
+def _get_fast_json_encoder():
+    """Return the orjson module if it is installed, otherwise False."""
+    global _fast_json_encoder  # pylint: disable=global-statement
+    if _fast_json_encoder is None:
+        try:
+            import orjson
+            _fast_json_encoder = orjson
+        except ImportError:
+            _fast_json_encoder = False
+    return _fast_json_encoder
+
+
+def _is_fast_json_compatible(obj):
+    """Whether orjson encodes obj byte for byte like the json module does with the options of format_json."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if type(key) is not str or not _is_fast_json_compatible(value):  # pylint: disable=unidiomatic-typecheck
+                return False
+        return True
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            if not _is_fast_json_compatible(item):
+                return False
+        return True
+    obj_type = type(obj)
+    if obj_type is str or obj_type is bool or obj is None:
+        return True
+    if obj_type is int:
+        return _FAST_JSON_MIN_INT <= obj < _FAST_JSON_MAX_INT
+    if obj_type is float:
+        return obj == 0 or _FAST_JSON_MIN_FLOAT <= abs(obj) < _FAST_JSON_MAX_FLOAT
+    # bytes and anything the json module would reject
+    return False
+
+
+def iter_json(obj):
+    """Yield the output of knack's format_json in pieces.
+
+    When orjson is installed and encodes the result identically, it is used instead of the json module.
+    """
+    result = obj.result
+    # OrderedDict.__dict__ is always '{}', to persist the data, convert to dict first.
+    input_dict = dict(result) if hasattr(result, '__dict__') else result
+
+    orjson = _get_fast_json_encoder()
+    if orjson and _is_fast_json_compatible(input_dict):
+        try:
+            output = orjson.dumps(input_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode('utf-8')
+        except TypeError:
+            # e.g. a string with a lone surrogate
+            pass
+        else:
+            yield output
+            yield '\n'
+            return
+
+    encoder_cls = knack.output._ComplexEncoder  # pylint: disable=protected-access
+    encoder = encoder_cls(ensure_ascii=False, indent=2, sort_keys=True, separators=(',', ': '))
+    for chunk in encoder.iterencode(input_dict):
+        yield chunk
+    yield '\n'
+
+
+def format_json(obj):
+    return ''.join(iter_json(obj))
+
+
+def _tsv_cell(value):
+    if isinstance(value, list):
+        return str(len(value))
+    if isinstance(value, dict):
+        # We need to print something to avoid mismatching
+        # number of columns if the value is None for some instances
+        # and a dictionary value in other...
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def iter_tsv(obj):
+    """Yield the rows of knack's format_tsv."""
+    result = obj.result
+    for data in result if isinstance(result, list) else [result]:
+        if isinstance(data, (dict, list)):
+            # Iterate through the items either sorted by key value (if dict) or in the order
+            # they were added (in the cases of an ordered dict) in order to make the output
+            # stable
+            if isinstance(data, OrderedDict):
+                values = data.values()
+            elif isinstance(data, dict):
+                values = [value for _, value in sorted(data.items())]
+            else:
+                values = data
+            yield '\t'.join([_tsv_cell(value) for value in values]) + '\n'
+        elif isinstance(data, bool):
+            yield str(data).lower() + '\n'
+        else:
+            yield _tsv_cell(data) + '\n'
+
+
+def format_tsv(obj):
+    return ''.join(iter_tsv(obj))
+
+
+def _write_chunks(chunks, out_file):
+    """Write the chunks in pieces of about OUTPUT_CHUNK_SIZE characters, like print in knack's OutputProducer.out."""
+    import sys
+    out_file = out_file or sys.stdout
+    encode_ascii = False
+    buffer, size = [], 0
+
+    def _flush(data):
+        nonlocal encode_ascii
+        if encode_ascii:
+            data = data.encode('ascii', 'ignore').decode('utf-8', 'ignore')
+        try:
+            out_file.write(data)
+        except UnicodeEncodeError:
+            logger.warning("Unable to encode the output with %s encoding. Unsupported characters are discarded.",
+                           out_file.encoding)
+            encode_ascii = True
+            out_file.write(data.encode('ascii', 'ignore').decode('utf-8', 'ignore'))
+
+    try:
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= OUTPUT_CHUNK_SIZE:
+                _flush(''.join(buffer))
+                buffer, size = [], 0
+        if buffer:
+            _flush(''.join(buffer))
+    except IOError as ex:
+        if ex.errno != errno.EPIPE:
+            raise
 
 
 class AzOutputProducer(knack.output.OutputProducer):
 
+    _FORMAT_DICT = dict(knack.output.OutputProducer._FORMAT_DICT, json=format_json, tsv=format_tsv)
+    # formatters whose output is produced and written in pieces
+    _CHUNKED_FORMATTERS = {format_json: iter_json, format_tsv: iter_tsv}
+
     def check_valid_format_type(self, format_type):
         return format_type in self._FORMAT_DICT
 
+    def get_formatter(self, format_type):
+        # remove color if stdout is not a tty
+        if not self.cli_ctx.enable_color and format_type == 'jsonc':
+            return self._FORMAT_DICT['json']
+        if not self.cli_ctx.enable_color and format_type == 'yamlc':
+            return self._FORMAT_DICT['yaml']
+        return self._FORMAT_DICT[format_type]
+
+    def out(self, obj, formatter=None, out_file=None):
+        from azure.cli.core.perf_trace import trace_span
+        from knack.util import CommandResultItem
+        with trace_span('output', category='output'):
+            iter_output = self._CHUNKED_FORMATTERS.get(formatter)
+            if iter_output is None:
+                super(AzOutputProducer, self).out(obj, formatter=formatter, out_file=out_file)
+                return
+            if not isinstance(obj, CommandResultItem):
+                raise TypeError('Expected {} got {}'.format(CommandResultItem.__name__, type(obj)))
+            _write_chunks(iter_output(obj), out_file)
+
 
 def get_output_format(cli_ctx):
     return cli_ctx.invocation.data.get("output", None)
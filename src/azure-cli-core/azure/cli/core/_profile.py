@@ -77,6 +77,11 @@ _AZ_LOGIN_MESSAGE = "Please run 'az login' to setup account."
 
 _USE_VENDORED_SUBSCRIPTION_SDK = False
 
+# Number of tenants whose subscriptions are found concurrently during login, and the seconds to wait for each of them.
+# Overridden by the config options core.tenant_discovery_workers and core.tenant_discovery_timeout
+_TENANT_DISCOVERY_WORKERS = 10
+_TENANT_DISCOVERY_TIMEOUT = 60
+
 
 def load_subscriptions(cli_ctx, all_clouds=False, refresh=False):
     profile = Profile(cli_ctx=cli_ctx)
@@ -886,7 +891,11 @@ class SubscriptionFinder:
                 raise CLIInternalError("Unable to get '{}' in profile '{}'"
                                        .format(ResourceType.MGMT_RESOURCE_SUBSCRIPTIONS, cli_ctx.cloud.profile))
             api_version = get_api_version(cli_ctx, ResourceType.MGMT_RESOURCE_SUBSCRIPTIONS)
+            from azure.cli.core._transport import create_requests_transport
             client_kwargs = _prepare_client_kwargs_track2(cli_ctx)
+            # Tenants are searched concurrently, with a client each. Share the connections between them.
+            client_kwargs['transport'] = create_requests_transport(
+                **{key: client_kwargs[key] for key in ['connection_verify'] if key in client_kwargs})
             # We don't need to change credential_scopes as 'scopes' is ignored by BasicTokenCredential anyway
             client = client_type(credentials, api_version=api_version,
                                  base_url=self.cli_ctx.cloud.endpoints.resource_manager, **client_kwargs)
@@ -964,6 +973,7 @@ class SubscriptionFinder:
 
     def _find_using_common_tenant(self, access_token, resource):
         import adal
+        from concurrent.futures import TimeoutError as FutureTimeoutError
         from azure.cli.core.adal_authentication import BasicTokenCredential
 
         all_subscriptions = []
@@ -971,19 +981,16 @@ class SubscriptionFinder:
         mfa_tenants = []
         token_credential = BasicTokenCredential(access_token)
         client = self._arm_client_factory(token_credential)
-        tenants = client.tenants.list()
+        tenants = list(client.tenants.list())
         for t in tenants:
-            tenant_id = t.tenant_id
-            logger.debug("Finding subscriptions under tenant %s", tenant_id)
             # display_name is available since /tenants?api-version=2018-06-01,
             # not available in /tenants?api-version=2016-06-01
             if not hasattr(t, 'display_name'):
                 t.display_name = None
-            temp_context = self._create_auth_context(tenant_id)
-            try:
-                logger.debug("Acquiring a token with tenant=%s, resource=%s", tenant_id, resource)
-                temp_credentials = temp_context.acquire_token(resource, self.user_id, _CLIENT_ID)
-            except adal.AdalError as ex:
+
+        # Tenants are discovered concurrently, but the results are merged in the order in which the tenants are listed
+        for t, subscriptions, ex in self._discover_tenants(tenants, resource):
+            if isinstance(ex, adal.AdalError):
                 # because user creds went through the 'common' tenant, the error here must be
                 # tenant specific, like the account was disabled. For such errors, we will continue
                 # with other tenants.
@@ -994,9 +1001,13 @@ class SubscriptionFinder:
                 else:
                     logger.warning("Failed to authenticate '%s' due to error '%s'", t, ex)
                 continue
-            subscriptions = self._find_using_specific_tenant(
-                tenant_id,
-                temp_credentials[_ACCESS_TOKEN])
+            if isinstance(ex, FutureTimeoutError):
+                logger.warning("Timed out finding subscriptions under tenant '%s'. It will be skipped.", t.tenant_id)
+                continue
+            if ex is not None:
+                logger.warning("Failed to find subscriptions under tenant '%s' due to error '%s'", t.tenant_id, ex)
+                continue
+            self.tenants.append(t.tenant_id)
 
             if not subscriptions:
                 empty_tenants.append(t)
@@ -1037,7 +1048,112 @@ class SubscriptionFinder:
                     logger.warning("%s", t.tenant_id)
         return all_subscriptions
 
+    def _discover_tenants(self, tenants, resource):
+        """Find the subscriptions under each tenant. Yield (tenant, subscriptions, error) in the order of `tenants`,
+        where error is the exception raised while acquiring the token or listing the subscriptions of the tenant.
+
+        With a single worker the tenants are found one by one as before: only ADAL errors are yielded and any other
+        error fails the login. Concurrently, any error only skips its tenant."""
+        import adal
+        max_workers = self.cli_ctx.config.getint('core', 'tenant_discovery_workers',
+                                                 fallback=_TENANT_DISCOVERY_WORKERS)
+        if max_workers < 2 or len(tenants) < 2:
+            for t in tenants:
+                try:
+                    subscriptions = self._find_in_tenant(t.tenant_id, resource)
+                except adal.AdalError as ex:
+                    yield t, None, ex
+                    continue
+                yield t, subscriptions, None
+            return
+
+        timeout = self.cli_ctx.config.getfloat('core', 'tenant_discovery_timeout',
+                                               fallback=_TENANT_DISCOVERY_TIMEOUT)
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        futures = self._discover_tenants_concurrently(tenants, resource, max_workers, timeout)
+        for t, future in zip(tenants, futures):
+            if future.cancelled():
+                # never started because the workers were all taken by tenants which timed out
+                yield t, None, FutureTimeoutError()
+                continue
+            try:
+                yield t, future.result(timeout=0), None
+            except Exception as ex:  # pylint: disable=broad-except
+                yield t, None, ex
+
+    def _discover_tenants_concurrently(self, tenants, resource, max_workers, timeout):
+        """Find the subscriptions under the tenants on a bounded number of threads and wait for all of them to complete.
+        A tenant which takes longer than `timeout` seconds is abandoned and its future is left pending. The threads
+        are daemon threads, so an abandoned one doesn't keep the CLI from exiting."""
+        import queue
+        import threading
+        import time
+        from concurrent.futures import Future, wait, FIRST_COMPLETED
+
+        started = {}
+        futures = [Future() for _ in tenants]
+        work = queue.Queue()
+        for index, t in enumerate(tenants):
+            work.put((index, t.tenant_id))
+
+        def _worker():
+            while True:
+                try:
+                    index, tenant_id = work.get_nowait()
+                except queue.Empty:
+                    return
+                future = futures[index]
+                if not future.set_running_or_notify_cancel():
+                    continue
+                started[index] = time.time()
+                try:
+                    future.set_result(self._find_in_tenant(tenant_id, resource))
+                except Exception as ex:  # pylint: disable=broad-except
+                    future.set_exception(ex)
+
+        max_workers = min(max_workers, len(tenants))
+        for _ in range(max_workers):
+            threading.Thread(target=_worker, daemon=True).start()
+
+        pending = dict(zip(futures, range(len(futures))))
+        abandoned = []
+        try:
+            while pending:
+                now = time.time()
+                for future, index in list(pending.items()):
+                    if future.done():
+                        del pending[future]
+                    elif index in started and now - started[index] >= timeout:
+                        # A running thread can't be interrupted. Stop waiting for it and skip the tenant.
+                        del pending[future]
+                        abandoned.append(future)
+                if sum(1 for future in abandoned if not future.done()) >= max_workers:
+                    # no worker is left for the tenants which haven't started yet
+                    for future, index in list(pending.items()):
+                        if index not in started and future.cancel():
+                            del pending[future]
+                if pending:
+                    remaining = [started[i] + timeout - now for i in pending.values() if i in started]
+                    wait(pending, timeout=max(min(remaining or [timeout]), 0.01), return_when=FIRST_COMPLETED)
+        finally:
+            for future in futures:
+                future.cancel()
+        return futures
+
+    def _find_in_tenant(self, tenant, resource):
+        """Acquire a token for the tenant and list the subscriptions under it. This is thread-safe."""
+        logger.debug("Finding subscriptions under tenant %s", tenant)
+        temp_context = self._create_auth_context(tenant)
+        logger.debug("Acquiring a token with tenant=%s, resource=%s", tenant, resource)
+        temp_credentials = temp_context.acquire_token(resource, self.user_id, _CLIENT_ID)
+        return self._list_subscriptions(tenant, temp_credentials[_ACCESS_TOKEN])
+
     def _find_using_specific_tenant(self, tenant, access_token):
+        all_subscriptions = self._list_subscriptions(tenant, access_token)
+        self.tenants.append(tenant)
+        return all_subscriptions
+
+    def _list_subscriptions(self, tenant, access_token):
         from azure.cli.core.adal_authentication import BasicTokenCredential
 
         token_credential = BasicTokenCredential(access_token)
@@ -1050,7 +1166,6 @@ class SubscriptionFinder:
                 setattr(s, 'home_tenant_id', s.tenant_id)
             setattr(s, 'tenant_id', tenant)
             all_subscriptions.append(s)
-        self.tenants.append(tenant)
         return all_subscriptions
 
     def _get_subscription_client_class(self):  # pylint: disable=no-self-use
@@ -0,0 +1,130 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import collections
+from functools import lru_cache
+
+from knack.events import EVENT_PARSER_GLOBAL_CREATE, EVENT_INVOKER_POST_PARSE_ARGS, EVENT_INVOKER_FILTER_RESULT
+from knack.query import CLIQuery
+from knack.util import CtxTypeError
+
+
+class AzQuery:
+    """A compiled JMESPath expression.
+
+    Expressions of the shapes `[].expr`, `[*].expr`, `[?condition].expr` and `length(@)` only look at one item of a
+    list at a time. They can be evaluated while the items are produced, without holding the whole list in memory.
+    """
+
+    def __init__(self, parsed_result):
+        self.expression = parsed_result.expression
+        self.parsed = parsed_result.parsed
+        self._parsed_result = parsed_result
+
+    def search(self, value, options=None):
+        return self._parsed_result.search(value, options=options)
+
+    @property
+    def streamable(self):
+        node = self.parsed
+        if node['type'] == 'function_expression':
+            return node['value'] == 'length' and [child['type'] for child in node['children']] == ['current']
+        if node['type'] == 'projection':
+            left = node['children'][0]
+            if left['type'] == 'flatten':
+                left = left['children'][0]
+            return left['type'] == 'identity'
+        if node['type'] == 'filter_projection':
+            return node['children'][0]['type'] == 'identity'
+        return False
+
+    def search_items(self, items, options=None):
+        """Evaluate a streamable expression over a list given as an iterable of its items."""
+        from jmespath.visitor import TreeInterpreter
+        node = self.parsed
+        if node['type'] == 'function_expression':
+            return sum(1 for _ in items)
+
+        interpreter = TreeInterpreter(options)
+        left, right = node['children'][:2]
+        condition = node['children'][2] if node['type'] == 'filter_projection' else None
+        if left['type'] == 'flatten':
+            items = _flatten(items)
+        collected = []
+        for item in items:
+            if condition is not None and \
+                    not interpreter._is_true(interpreter.visit(condition, item)):  # pylint: disable=protected-access
+                continue
+            current = interpreter.visit(right, item)
+            if current is not None:
+                collected.append(current)
+        return collected
+
+
+def _flatten(items):
+    for item in items:
+        if isinstance(item, list):
+            for element in item:
+                yield element
+        else:
+            yield item
+
+
+@lru_cache(maxsize=128)
+def compile_query(expression):
+    """Compile a JMESPath expression once per process."""
+    import jmespath
+    return AzQuery(jmespath.compile(expression))
+
+
+class AzCliQuery(CLIQuery):
+
+    @staticmethod
+    def jmespath_type(raw_query):
+        """Compile the query with JMESPath and return the compiled result.
+        JMESPath raises exceptions which subclass from ValueError.
+        In addition though, JMESPath can raise a KeyError.
+        ValueErrors are caught by argparse so argument errors can be generated.
+        """
+        try:
+            return compile_query(raw_query)
+        except KeyError as ex:
+            # Raise a ValueError which argparse can handle
+            raise ValueError from ex
+
+    @staticmethod
+    def on_global_arguments(_, **kwargs):
+        arg_group = kwargs.get('arg_group')
+        arg_group.add_argument('--query', dest='_jmespath_query', metavar='JMESPATH',
+                               help='JMESPath query string. See http://jmespath.org/ for more'
+                                    ' information and examples.',
+                               type=AzCliQuery.jmespath_type)
+
+    @staticmethod
+    def handle_query_parameter(cli_ctx, **kwargs):
+        args = kwargs['args']
+        query_expression = args._jmespath_query  # pylint: disable=protected-access
+        del args._jmespath_query
+        if query_expression:
+            def filter_output(cli_ctx, **kwargs):
+                from jmespath import Options
+                event_data = kwargs['event_data']
+                # the query may have been applied to the items of the result already
+                if not event_data.get('query_applied'):
+                    event_data['result'] = query_expression.search(event_data['result'],
+                                                                   Options(collections.OrderedDict))
+                cli_ctx.unregister_event(EVENT_INVOKER_FILTER_RESULT, filter_output)
+            cli_ctx.register_event(EVENT_INVOKER_FILTER_RESULT, filter_output)
+            cli_ctx.invocation.data['query_active'] = True
+            if query_expression.streamable:
+                cli_ctx.invocation.data['query_stream'] = query_expression
+
+    def __init__(self, cli_ctx=None):  # pylint: disable=super-init-not-called
+        from knack.cli import CLI
+        if cli_ctx is not None and not isinstance(cli_ctx, CLI):
+            raise CtxTypeError(cli_ctx)
+        self.cli_ctx = cli_ctx
+        self.cli_ctx.register_event(EVENT_PARSER_GLOBAL_CREATE, AzCliQuery.on_global_arguments)
+        self.cli_ctx.register_event(EVENT_INVOKER_POST_PARSE_ARGS, AzCliQuery.handle_query_parameter)
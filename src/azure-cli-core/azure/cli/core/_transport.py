@@ -0,0 +1,122 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Connection pools shared by the HTTP clients of the process.
+
+Every SDK client and every `requests.Session` normally owns a connection pool, so each client created by a command
+opens its own connections and performs its own TLS handshakes, even to the same endpoint. The adapters created here
+keep their connections in pools shared by the whole process. urllib3 keeps a pool per endpoint (scheme, host, port and
+TLS settings), so Track 1 clients, Track 2 clients and raw requests to the same endpoint reuse the same keep-alive
+connections.
+
+AzCli closes the pools when a command completes. A process which runs several commands, like a daemon, can keep the
+connections between them by unregistering `azure.cli.core.close_connection_pools`.
+"""
+
+import threading
+
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK
+
+# Number of endpoints and connections per endpoint kept in the shared pools. The connections per endpoint cover the
+# thread pools used for concurrent requests, e.g. --ids.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32
+
+_lock = threading.Lock()
+_pool_managers = {}
+_proxy_managers = {}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter which keeps its connections in the pools shared by the process.
+
+    The retry settings remain specific to the adapter. Closing the adapter, e.g. when the session or the SDK client is
+    closed, leaves the shared connections open for the next client.
+    """
+
+    def __init__(self, max_retries=0):
+        super(PooledHTTPAdapter, self).__init__(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                                                max_retries=max_retries)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        from urllib3.poolmanager import PoolManager
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        key = (connections, maxsize, block, tuple(sorted(pool_kwargs.items())))
+        with _lock:
+            if key not in _pool_managers:
+                _pool_managers[key] = PoolManager(num_pools=connections, maxsize=maxsize, block=block, strict=True,
+                                                  **pool_kwargs)
+            self.poolmanager = _pool_managers[key]
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        key = (proxy, self._pool_connections, self._pool_maxsize, self._pool_block,
+               tuple(sorted(proxy_kwargs.items())))
+        with _lock:
+            if key not in _proxy_managers:
+                _proxy_managers[key] = super(PooledHTTPAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+            self.proxy_manager[proxy] = _proxy_managers[key]
+            return _proxy_managers[key]
+
+    def close(self):
+        # The shared pools are only closed by close_pools
+        self.proxy_manager = {}
+
+
+def mount_pooled_adapters(session):
+    """Make a `requests.Session` send its requests through the shared pools, keeping its retry settings."""
+    for prefix in ('https://', 'http://'):
+        adapter = session.adapters.get(prefix)
+        if not isinstance(adapter, PooledHTTPAdapter):
+            session.mount(prefix, PooledHTTPAdapter(max_retries=adapter.max_retries if adapter else 0))
+    return session
+
+
+def create_session():
+    """Create a `requests.Session` whose connections are kept in the shared pools."""
+    import requests
+    return mount_pooled_adapters(requests.Session())
+
+
+def create_requests_transport(**kwargs):
+    """Create a transport for Track 2 SDK clients whose connections are kept in the shared pools.
+
+    :param kwargs: The connection settings of the transport, e.g. connection_verify.
+    """
+    from azure.core.pipeline.transport import RequestsTransport
+    from urllib3.util.retry import Retry
+    import requests
+
+    session = requests.Session()
+    # Track 2 SDK clients retry in their pipeline. Like RequestsTransport, disable the retries of urllib3.
+    adapter = PooledHTTPAdapter(max_retries=Retry(total=False, redirect=False, raise_on_status=False))
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, adapter)
+    # The transport doesn't own the session, so closing the client leaves the connections in the shared pools
+    return RequestsTransport(session=session, session_owner=False, **kwargs)
+
+
+def use_pooled_adapters(config):
+    """Make a Track 1 SDK client send its requests through the shared pools.
+
+    :param config: The `msrest.Configuration` of the client.
+    """
+    configure_session = config.session_configuration_callback
+
+    def _configure_session(session, global_config, local_config, **kwargs):
+        mount_pooled_adapters(session)
+        return configure_session(session, global_config, local_config, **kwargs)
+
+    config.session_configuration_callback = _configure_session
+
+
+def close_pools():
+    """Close the connections of the shared pools."""
+    with _lock:
+        for manager in list(_pool_managers.values()) + list(_proxy_managers.values()):
+            manager.clear()
+        _pool_managers.clear()
+        _proxy_managers.clear()
@@ -10,6 +10,7 @@ from msrest.authentication import Authentication
 from msrestazure.azure_active_directory import MSIAuthentication
 from azure.core.credentials import AccessToken
 from azure.cli.core.util import in_cloud_console, scopes_to_resource, resource_to_scopes
+from azure.cli.core.perf_trace import trace_span
 
 from knack.util import CLIError
 from knack.log import get_logger
@@ -42,9 +43,10 @@ class AdalAuthentication(Authentication):  # pylint: disable=too-few-public-meth
 
         external_tenant_tokens = None
         try:
-            scheme, token, token_entry = self._token_retriever(token_resource)
-            if self._external_tenant_token_retriever:
-                external_tenant_tokens = self._external_tenant_token_retriever(token_resource)
+            with trace_span('get_token', category='auth', resource=token_resource):
+                scheme, token, token_entry = self._token_retriever(token_resource)
+                if self._external_tenant_token_retriever:
+                    external_tenant_tokens = self._external_tenant_token_retriever(token_resource)
         except CLIError as err:
             if in_cloud_console():
                 AdalAuthentication._log_hostname()
@@ -171,7 +173,8 @@ class MSIAuthenticationWrapper(MSIAuthentication):
         import traceback
         from azure.cli.core.azclierror import AzureConnectionError, AzureResponseError
         try:
-            super(MSIAuthenticationWrapper, self).set_token()
+            with trace_span('get_token', category='auth', resource=self.resource):
+                super(MSIAuthenticationWrapper, self).set_token()
         except requests.exceptions.ConnectionError as err:
             logger.debug('throw requests.exceptions.ConnectionError when doing MSIAuthentication: \n%s',
                          traceback.format_exc())
@@ -421,6 +421,7 @@ def get_parameter_mappings(command_table):
         '--query': None,
         '--debug': None,
         '--verbose': None,
+        '--perf-trace': None,
         '--yes': None,
         '--no-wait': None
     }
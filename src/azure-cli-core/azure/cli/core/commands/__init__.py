@@ -7,6 +7,7 @@
 
 import argparse
 import datetime
+import functools
 import json
 import logging as logs
 import os
@@ -27,7 +28,10 @@ from azure.cli.core.util import (
     get_command_type_kwarg, read_file_content, get_arg_list, poller_classes)
 from azure.cli.core.local_context import LocalContextAction
 import azure.cli.core.telemetry as telemetry
+from azure.cli.core.perf_trace import get_tracer, find_perf_trace_arg, start_perf_trace, trace_span
 from azure.cli.core.commands.progress import IndeterminateProgressBar
+from azure.cli.core.commands.lro_scheduler import get_lro_scheduler, get_retry_after
+from azure.cli.core.commands.transform import todict_with_global_transforms
 
 from knack.arguments import CLICommandArgument
 from knack.commands import CLICommand, CommandGroup, PREVIEW_EXPERIMENTAL_CONFLICT_ERROR
@@ -36,7 +40,7 @@ from knack.invocation import CommandInvoker
 from knack.preview import ImplicitPreviewItem, PreviewItem, resolve_preview_info
 from knack.experimental import ImplicitExperimentalItem, ExperimentalItem, resolve_experimental_info
 from knack.log import get_logger
-from knack.util import CLIError, CommandResultItem, todict
+from knack.util import CLIError, CommandResultItem
 from knack.events import EVENT_INVOKER_TRANSFORM_RESULT
 from knack.validators import DefaultStr
 
@@ -47,6 +51,9 @@ except AttributeError:  # in Python 2.7
 
 logger = get_logger(__name__)
 DEFAULT_CACHE_TTL = '10'
+# interval in seconds of the activity log queries reporting the progress of deployments in verbose mode
+MIN_PROGRESS_REPORT_INTERVAL = 10
+MAX_PROGRESS_REPORT_INTERVAL = 60
 
 
 def _explode_list_args(args):
@@ -130,6 +137,8 @@ class CacheObject:
             raise CLIError('cloud name unexpectedly empty')
         copy_kwargs = kwargs.copy()
         copy_kwargs.pop('self', None)
+        # the options of the request don't identify the object
+        copy_kwargs.pop('polling', None)
         resource_group = copy_kwargs.pop('resource_group_name', None) or args[0]
 
         if len(args) > 2:
@@ -187,6 +196,7 @@ class CacheObject:
     def _dump_to_file(self, open_file):
         cache_obj_dump = json.dumps({
             'last_saved': self.last_saved,
+            'etag': self._etag,
             '_payload': self._payload
         })
         open_file.write(cache_obj_dump)
@@ -201,7 +211,11 @@ class CacheObject:
             obj_data = json.loads(f.read())
             self._payload = obj_data['_payload']
             self.last_saved = obj_data['last_saved']
+            self._etag = obj_data.get('etag')
         self._payload = self.result()
+        # The ETag is read-only, so it isn't part of the payload. Restore it for the commit of the object.
+        if self._etag and 'etag' in getattr(self._payload, '_attribute_map', {}):
+            self._payload.etag = self._etag
 
     def save(self, args, kwargs):
         from knack.util import ensure_dir
@@ -232,7 +246,7 @@ class CacheObject:
             'group': self._resource_group
         }
 
-    def __init__(self, cmd, payload, operation, model_path=None):
+    def __init__(self, cmd, payload, operation, model_path=None, etag=None):
         self._cmd = cmd
         self._operation = operation
         self._resource_group = None
@@ -240,6 +254,7 @@ class CacheObject:
         self._model_name = None
         self._model_path = model_path
         self._payload = payload
+        self._etag = etag
         self.last_saved = None
         self._resolve_model()
 
@@ -414,32 +429,51 @@ def cached_get(cmd_obj, operation, *args, **kwargs):
     cache_obj = CacheObject(cmd_obj, None, operation, model_path=model_path)
     try:
         cache_obj.load(args, kwargs)
-        if _is_stale(cmd_obj.cli_ctx, cache_obj):
-            message = "{model} '{name}' stale in cache. Retrieving from Azure...".format(**cache_obj.prop_dict())
-            logger.warning(message)
-            return _get_operation()
-        return cache_obj
     except Exception:  # pylint: disable=broad-except
         message = "{model} '{name}' not found in cache. Retrieving from Azure...".format(**cache_obj.prop_dict())
         logger.debug(message)
         return _get_operation()
 
+    if _is_stale(cmd_obj.cli_ctx, cache_obj):
+        # Without an ETag, committing the cached object would overwrite the changes made to it since
+        if not cache_obj._etag:  # pylint: disable=protected-access
+            message = "{model} '{name}' stale in cache. Retrieving from Azure...".format(**cache_obj.prop_dict())
+            logger.warning(message)
+            return _get_operation()
+        # The cached object holds the changes of the deferred commands, which retrieving it again would discard.
+        # Committing them fails if the object was changed since.
+        logger.warning("%s '%s' has changes deferred since %s which aren't sent to Azure yet. Committing them fails "
+                       "if it was changed since. Use `az cache delete` to discard them.",
+                       cache_obj.prop_dict()['model'], cache_obj.prop_dict()['name'], cache_obj.last_saved)
+    return cache_obj
+
 
 def cached_put(cmd_obj, operation, parameters, *args, setter_arg_name='parameters', **kwargs):
     """
     setter_arg_name: The name of the argument in the setter which corresponds to the object being updated.
     In track2, unknown kwargs will raise, so we should not pass 'parameters" for operation when the name of the argument
     in the setter which corresponds to the object being updated is not 'parameters'.
+
+    With positional args, kwargs are passed to the operation as options, e.g. polling=False with sdk_no_wait.
+
+    The commands deferred with --defer apply their changes to the cached object. The next command which isn't deferred
+    commits all the changes with a single PUT. The PUT is conditional on the ETag of the object when it was first
+    retrieved, so changes made by others in the meantime aren't overwritten.
     """
-    def _put_operation():
+    def _put_operation(headers=None):
         result = None
+        options = {}
+        if headers:
+            options['custom_headers' if 'custom_headers' in get_arg_list(operation) else 'headers'] = headers
         if args:
             extended_args = args + (parameters,)
-            result = operation(*extended_args)
+            result = operation(*extended_args, **kwargs, **options)
         elif kwargs is not None:
             kwargs[setter_arg_name] = parameters
-            result = operation(**kwargs)
-            del kwargs[setter_arg_name]
+            try:
+                result = operation(**kwargs, **options)
+            finally:
+                del kwargs[setter_arg_name]
         return result
 
     # early out if the command does not use the cache
@@ -447,20 +481,35 @@ def cached_put(cmd_obj, operation, parameters, *args, setter_arg_name='parameter
         return _put_operation()
 
     use_cache = cmd_obj.cli_ctx.data.get('_cache', False)
-    if not use_cache:
-        result = _put_operation()
 
     # allow overriding model path, e.g. for extensions
     model_path = cmd_obj.command_kwargs.get('model_path', None)
 
-    cache_obj = CacheObject(cmd_obj, parameters.serialize(), operation, model_path=model_path)
     if use_cache:
+        cache_obj = CacheObject(cmd_obj, parameters.serialize(), operation, model_path=model_path,
+                                etag=getattr(parameters, 'etag', None))
         cache_obj.save(args, kwargs)
         return cache_obj
 
-    # for a successful PUT, attempt to delete the cache file
+    cache_obj = CacheObject(cmd_obj, None, operation, model_path=model_path)
     obj_dir, obj_file = cache_obj.path(args, kwargs)
     obj_path = os.path.join(obj_dir, obj_file)
+    if not os.path.exists(obj_path):
+        return _put_operation()
+
+    # commit the changes of the deferred commands
+    etag = getattr(parameters, 'etag', None)
+    try:
+        result = _put_operation(headers={'If-Match': etag} if etag else None)
+    except Exception as ex:  # pylint: disable=broad-except
+        if getattr(ex, 'status_code', None) != 412:
+            raise
+        from azure.cli.core.azclierror import AzureResponseError
+        raise AzureResponseError(
+            "{model} '{name}' was changed since it was cached. Delete it from the cache with `az cache delete` "
+            "and apply the changes again.".format(**cache_obj.prop_dict()))
+
+    # for a successful PUT, attempt to delete the cache file
     try:
         os.remove(obj_path)
     except (OSError, IOError):  # FileNotFoundError introduced in Python 3
@@ -505,11 +554,14 @@ class AzCliCommandInvoker(CommandInvoker):
         from azure.cli.core.commands.events import (
             EVENT_INVOKER_PRE_CMD_TBL_TRUNCATE, EVENT_INVOKER_PRE_LOAD_ARGUMENTS, EVENT_INVOKER_POST_LOAD_ARGUMENTS)
 
+        start_perf_trace(self.cli_ctx, args)
+
         # TODO: Can't simply be invoked as an event because args are transformed
         args = _pre_command_table_create(self.cli_ctx, args)
 
         self.cli_ctx.raise_event(EVENT_INVOKER_PRE_CMD_TBL_CREATE, args=args)
-        self.commands_loader.load_command_table(args)
+        with trace_span('load_command_table'):
+            self.commands_loader.load_command_table(args)
         self.cli_ctx.raise_event(EVENT_INVOKER_PRE_CMD_TBL_TRUNCATE,
                                  load_cmd_tbl_func=self.commands_loader.load_command_table, args=args)
         command = self._rudimentary_get_command(args)
@@ -552,17 +604,24 @@ class AzCliCommandInvoker(CommandInvoker):
 
         self.commands_loader.command_table = self.commands_loader.command_table  # update with the truncated table
         self.commands_loader.command_name = command
-        self.cli_ctx.raise_event(EVENT_INVOKER_PRE_LOAD_ARGUMENTS, commands_loader=self.commands_loader)
-        self.commands_loader.load_arguments(command)
-        self.cli_ctx.raise_event(EVENT_INVOKER_POST_LOAD_ARGUMENTS, commands_loader=self.commands_loader)
-        self.cli_ctx.raise_event(EVENT_INVOKER_POST_CMD_TBL_CREATE, commands_loader=self.commands_loader)
+        with trace_span('load_arguments'):
+            self.cli_ctx.raise_event(EVENT_INVOKER_PRE_LOAD_ARGUMENTS, commands_loader=self.commands_loader)
+            self.commands_loader.load_arguments(command)
+            self.cli_ctx.raise_event(EVENT_INVOKER_POST_LOAD_ARGUMENTS, commands_loader=self.commands_loader)
+            self.cli_ctx.raise_event(EVENT_INVOKER_POST_CMD_TBL_CREATE, commands_loader=self.commands_loader)
         self.parser.cli_ctx = self.cli_ctx
-        self.parser.load_command_table(self.commands_loader)
+        with trace_span('parser.load_command_table'):
+            self.parser.load_command_table(self.commands_loader)
 
         self.cli_ctx.raise_event(EVENT_INVOKER_CMD_TBL_LOADED, cmd_tbl=self.commands_loader.command_table,
                                  parser=self.parser)
 
-        arg_check = [a for a in args if a not in ['--debug', '--verbose']]
+        if self.cli_ctx.data['completer_active']:
+            # Index the options of the command, so that its next completions don't need the parser
+            from azure.cli.core._completion import CompletionIndex
+            CompletionIndex(self.cli_ctx.config.config_dir).add_parser(self.parser, command)
+
+        arg_check = [a for a in args if a not in ['--debug', '--verbose'] and not find_perf_trace_arg([a])[0]]
         if not arg_check:
             self.parser.enable_autocomplete()
             subparser = self.parser.subparsers[tuple()]
@@ -578,9 +637,10 @@ class AzCliCommandInvoker(CommandInvoker):
 
         self.parser.enable_autocomplete()
 
-        self.cli_ctx.raise_event(EVENT_INVOKER_PRE_PARSE_ARGS, args=args)
-        parsed_args = self.parser.parse_args(args)
-        self.cli_ctx.raise_event(EVENT_INVOKER_POST_PARSE_ARGS, command=parsed_args.command, args=parsed_args)
+        with trace_span('parse_args'):
+            self.cli_ctx.raise_event(EVENT_INVOKER_PRE_PARSE_ARGS, args=args)
+            parsed_args = self.parser.parse_args(args)
+            self.cli_ctx.raise_event(EVENT_INVOKER_POST_PARSE_ARGS, command=parsed_args.command, args=parsed_args)
 
         # print local context warning
         if self.cli_ctx.local_context.is_on and command and command in self.commands_loader.command_table:
@@ -642,11 +702,15 @@ class AzCliCommandInvoker(CommandInvoker):
             if hasattr(expanded_arg, '_subscription'):
                 cmd_copy.cli_ctx.data['subscription_id'] = expanded_arg._subscription  # pylint: disable=protected-access
 
-            self._validation(expanded_arg)
+            with trace_span('validation'):
+                self._validation(expanded_arg)
             jobs.append((expanded_arg, cmd_copy))
 
         ids = getattr(parsed_args, '_ids', None) or [None] * len(jobs)
-        if self.cli_ctx.config.getboolean('core', 'disable_concurrent_ids', False) or len(ids) < 2:
+        if len(jobs) == 1 and self.data['query_stream']:
+            # the query only looks at one item at a time, apply it while paging through the result
+            results, exceptions = self._run_jobs_serially(jobs, ids, query=self.data['query_stream'])
+        elif self.cli_ctx.config.getboolean('core', 'disable_concurrent_ids', False) or len(ids) < 2:
             results, exceptions = self._run_jobs_serially(jobs, ids)
         else:
             results, exceptions = self._run_jobs_concurrently(jobs, ids)
@@ -665,7 +729,7 @@ class AzCliCommandInvoker(CommandInvoker):
         if results and len(results) == 1:
             results = results[0]
 
-        event_data = {'result': results}
+        event_data = {'result': results, 'query_applied': bool(self.data['query_applied'])}
         self.cli_ctx.raise_event(EVENT_INVOKER_FILTER_RESULT, event_data=event_data)
 
         # save to local context if it is turned on after command executed successfully
@@ -685,39 +749,61 @@ class AzCliCommandInvoker(CommandInvoker):
         return [(p.split('=', 1)[0] if p.startswith('--') else p[:2]) for p in args if
                 (p.startswith('-') and not p.startswith('---') and len(p) > 1)]
 
-    def _run_job(self, expanded_arg, cmd_copy):
+    def _run_job(self, expanded_arg, cmd_copy, query=None):
         params = self._filter_params(expanded_arg)
         try:
-            result = cmd_copy(params)
-            if cmd_copy.supports_no_wait and getattr(expanded_arg, 'no_wait', False):
-                result = None
-            elif cmd_copy.no_wait_param and getattr(expanded_arg, cmd_copy.no_wait_param, False):
-                result = None
-
-            transform_op = cmd_copy.command_kwargs.get('transform', None)
-            if transform_op:
-                result = transform_op(result)
-
-            if _is_poller(result):
-                result = LongRunningOperation(cmd_copy.cli_ctx, 'Starting {}'.format(cmd_copy.name))(result)
-            elif _is_paged(result):
-                result = list(result)
-
-            result = todict(result, AzCliCommandInvoker.remove_additional_prop_layer)
-            event_data = {'result': result}
-            cmd_copy.cli_ctx.raise_event(EVENT_INVOKER_TRANSFORM_RESULT, event_data=event_data)
-            return event_data['result']
+            with trace_span('execute', command=cmd_copy.name):
+                with trace_span('handler'):
+                    result = cmd_copy(params)
+                if cmd_copy.supports_no_wait and getattr(expanded_arg, 'no_wait', False):
+                    result = None
+                elif cmd_copy.no_wait_param and getattr(expanded_arg, cmd_copy.no_wait_param, False):
+                    result = None
+
+                transform_op = cmd_copy.command_kwargs.get('transform', None)
+                if transform_op:
+                    result = transform_op(result)
+
+                if _is_poller(result):
+                    result = LongRunningOperation(cmd_copy.cli_ctx, 'Starting {}'.format(cmd_copy.name))(result)
+                elif _is_paged(result):
+                    if query is not None:
+                        from collections import OrderedDict
+                        from jmespath import Options
+                        with trace_span('paging'):
+                            # only the queried values are kept from the items
+                            result = query.search_items((self._transform_item(cmd_copy, item) for item in result),
+                                                        Options(OrderedDict))
+                        self.data['query_applied'] = True
+                        return result
+                    with trace_span('paging'):
+                        result = list(result)
+
+                with trace_span('todict'):
+                    # convert and apply the global transforms in a single pass
+                    result = todict_with_global_transforms(result, AzCliCommandInvoker.remove_additional_prop_layer)
+                event_data = {'result': result, 'global_transforms_applied': True}
+                with trace_span('transform_result'):
+                    cmd_copy.cli_ctx.raise_event(EVENT_INVOKER_TRANSFORM_RESULT, event_data=event_data)
+                return event_data['result']
         except Exception as ex:  # pylint: disable=broad-except
             if cmd_copy.exception_handler:
                 return cmd_copy.exception_handler(ex)
             raise
 
-    def _run_jobs_serially(self, jobs, ids):
+    @staticmethod
+    def _transform_item(cmd_copy, item):
+        item = todict_with_global_transforms(item, AzCliCommandInvoker.remove_additional_prop_layer)
+        event_data = {'result': item, 'global_transforms_applied': True}
+        cmd_copy.cli_ctx.raise_event(EVENT_INVOKER_TRANSFORM_RESULT, event_data=event_data)
+        return event_data['result']
+
+    def _run_jobs_serially(self, jobs, ids, query=None):
         results, exceptions = [], []
         for job, id_arg in zip(jobs, ids):
             expanded_arg, cmd_copy = job
             try:
-                results.append(self._run_job(expanded_arg, cmd_copy))
+                results.append(self._run_job(expanded_arg, cmd_copy, query=query))
             except(Exception, SystemExit) as ex:  # pylint: disable=broad-except
                 exceptions.append((ex, id_arg))
         return results, exceptions
@@ -725,7 +811,9 @@ class AzCliCommandInvoker(CommandInvoker):
     def _run_jobs_concurrently(self, jobs, ids):
         from concurrent.futures import ThreadPoolExecutor, as_completed
         tasks, results, exceptions = [], [], []
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        # long-running operations of all jobs are polled from one loop and share a progress bar
+        progress_bar = IndeterminateProgressBar(self.cli_ctx) if _is_progress_bar_enabled(self.cli_ctx) else None
+        with get_lro_scheduler().shared_progress(progress_bar), ThreadPoolExecutor(max_workers=10) as executor:
             for expanded_arg, cmd_copy in jobs:
                 tasks.append(executor.submit(self._run_job, expanded_arg, cmd_copy))
             for index, task in enumerate(as_completed(tasks)):
@@ -865,6 +953,10 @@ class AzCliCommandInvoker(CommandInvoker):
             pass
 
 
+def _is_progress_bar_enabled(cli_ctx):
+    return not cli_ctx.config.getboolean('core', 'disable_progress_bar', False) and not cli_ctx.only_show_errors
+
+
 class LongRunningOperation:  # pylint: disable=too-few-public-methods
     def __init__(self, cli_ctx, start_msg='', finish_msg='', poller_done_interval_ms=500.0,
                  progress_bar=None):
@@ -875,15 +967,13 @@ class LongRunningOperation:  # pylint: disable=too-few-public-methods
         self.poller_done_interval_ms = poller_done_interval_ms
         self.deploy_dict = {}
         self.last_progress_report = datetime.datetime.now()
+        self.progress_report_interval = MIN_PROGRESS_REPORT_INTERVAL
+        self._correlation_id = None
 
         self.progress_bar = None
-        disable_progress_bar = self.cli_ctx.config.getboolean('core', 'disable_progress_bar', False)
-        if not disable_progress_bar and not cli_ctx.only_show_errors:
+        if _is_progress_bar_enabled(cli_ctx):
             self.progress_bar = progress_bar if progress_bar is not None else IndeterminateProgressBar(cli_ctx)
 
-    def _delay(self):
-        time.sleep(self.poller_done_interval_ms / 1000.0)
-
     def _generate_template_progress(self, correlation_id):  # pylint: disable=no-self-use
         """ gets the progress for template deployments """
         from azure.cli.core.commands.client_factory import get_mgmt_service_client
@@ -947,55 +1037,68 @@ class LongRunningOperation:  # pylint: disable=too-few-public-methods
                             if update:
                                 logger.info(result)
 
+    def _get_correlation_id(self, poller):  # pylint: disable=no-self-use
+        try:
+            # pylint: disable=protected-access
+            return json.loads(poller._response.__dict__['_content'].decode())['properties']['correlationId']
+        except:  # pylint: disable=bare-except
+            return None
+
+    def _on_tick(self, poller, progress_bar, is_verbose):
+        if self._correlation_id is None:
+            self._correlation_id = self._get_correlation_id(poller)
+
+        current_time = datetime.datetime.now()
+        if is_verbose and self._correlation_id is not None and \
+                current_time - self.last_progress_report >= datetime.timedelta(seconds=self.progress_report_interval):
+            self.last_progress_report = current_time
+            # the activity log changes no faster than the operation, back off while it runs for long
+            self.progress_report_interval = min(
+                max(self.progress_report_interval * 1.5, get_retry_after(poller) or 0),
+                MAX_PROGRESS_REPORT_INTERVAL)
+            try:
+                self._generate_template_progress(self._correlation_id)
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning('%s during progress reporting: %s', getattr(type(ex), '__name__', type(ex)), ex)
+        if progress_bar:
+            progress_bar.update_progress()
+
     def __call__(self, poller):  # pylint: disable=too-many-statements
         from msrest.exceptions import ClientException
         from azure.core.exceptions import HttpResponseError
 
-        correlation_message = ''
-        if self.progress_bar:
-            self.progress_bar.begin()
-        correlation_id = None
+        scheduler = get_lro_scheduler()
+        # the progress of concurrent operations is reported on the progress bar of the scheduler
+        progress_bar = None if scheduler.progress_bar is not None else self.progress_bar
+        if progress_bar:
+            progress_bar.begin()
+        self._correlation_id = None
 
         cli_logger = get_logger()  # get CLI logger which has the level set through command lines
         is_verbose = any(handler.level <= logs.INFO for handler in cli_logger.handlers)
 
         telemetry.poll_start()
         poll_flag = False
-        while not poller.done():
-            poll_flag = True
-
-            try:
-                # pylint: disable=protected-access
-                correlation_id = json.loads(
-                    poller._response.__dict__['_content'].decode())['properties']['correlationId']
-
-                correlation_message = 'Correlation ID: {}'.format(correlation_id)
-            except:  # pylint: disable=bare-except
-                pass
-
-            current_time = datetime.datetime.now()
-            if is_verbose and current_time - self.last_progress_report >= datetime.timedelta(seconds=10):
-                self.last_progress_report = current_time
-                try:
-                    self._generate_template_progress(correlation_id)
-                except Exception as ex:  # pylint: disable=broad-except
-                    logger.warning('%s during progress reporting: %s', getattr(type(ex), '__name__', type(ex)), ex)
-            try:
-                if self.progress_bar:
-                    self.progress_bar.update_progress()
-                self._delay()
-            except KeyboardInterrupt:
-                if self.progress_bar:
-                    self.progress_bar.stop()
-                logger.error('Long-running operation wait cancelled.  %s', correlation_message)
-                raise
+        poll_start_time = time.perf_counter()
+        on_tick = functools.partial(self._on_tick, poller, progress_bar, is_verbose) \
+            if progress_bar or is_verbose else None
+        operation = scheduler.add(poller, interval=self.poller_done_interval_ms / 1000.0, on_tick=on_tick)
+        try:
+            poll_flag = scheduler.wait(operation)
+        except KeyboardInterrupt:
+            if progress_bar:
+                progress_bar.stop()
+            correlation_id = self._correlation_id or self._get_correlation_id(poller)
+            logger.error('Long-running operation wait cancelled.  %s',
+                         'Correlation ID: {}'.format(correlation_id) if correlation_id else '')
+            raise
 
         try:
             result = poller.result()
         except (ClientException, HttpResponseError) as exception:
             from azure.cli.core.commands.arm import handle_long_running_operation_exception
-            if self.progress_bar:
-                self.progress_bar.stop()
+            if progress_bar:
+                progress_bar.stop()
             if getattr(exception, 'status_code', None) == 404 and \
                ('delete' in self.cli_ctx.data['command'] or 'purge' in self.cli_ctx.data['command']):
                 logger.debug('Service returned 404 on the long-running delete or purge operation. CLI treats it as '
@@ -1006,8 +1109,9 @@ class LongRunningOperation:  # pylint: disable=too-few-public-methods
             else:
                 raise exception
         finally:
-            if self.progress_bar:
-                self.progress_bar.end()
+            get_tracer().add_span('lro_poll', poll_start_time, time.perf_counter(), 'lro')
+            if progress_bar:
+                progress_bar.end()
             if poll_flag:
                 telemetry.poll_end()
 
@@ -1447,7 +1551,9 @@ def register_cache_arguments(cli_ctx):
                     nargs='?',
                     action=CacheAction,
                     help='Temporarily store the object in the local cache instead of sending to Azure. '
-                         'Use `az cache` commands to view/clear.',
+                         'Use `az cache` commands to view/clear. A cached object older than the `core.cache_ttl` '
+                         'config is still used if it has an ETag, and committing it fails if the object was changed '
+                         'in Azure since. Otherwise it is retrieved from Azure again, discarding the deferred changes.',
                     is_preview=True
                 )
 
@@ -430,9 +430,9 @@ def show_exception_handler(ex):
 
 
 def verify_property(instance, condition):
-    from jmespath import compile as compile_jmespath
+    from azure.cli.core._query import compile_query
     result = todict(instance)
-    jmes_query = compile_jmespath(condition)
+    jmes_query = compile_query(condition)
     value = jmes_query.search(result)
     return value
 
@@ -86,6 +86,10 @@ def configure_common_settings(cli_ctx, client):
 
     client.config.enable_http_logger = True
 
+    # Reuse the connections of the other clients created in this process
+    from azure.cli.core._transport import use_pooled_adapters
+    use_pooled_adapters(client.config)
+
     client.config.add_user_agent(get_az_user_agent())
 
     try:
@@ -106,6 +110,10 @@ def configure_common_settings(cli_ctx, client):
     # Prepare x-ms-client-request-id header
     client.config.generate_client_request_id = 'x-ms-client-request-id' not in cli_ctx.data['headers']
 
+    from azure.cli.core.perf_trace import is_enabled, requests_response_hook
+    if is_enabled():
+        client.config.hooks.append(requests_response_hook)
+
     logger.debug("Adding custom headers to the client:")
 
     for header, value in cli_ctx.data['headers'].items():
@@ -160,6 +168,12 @@ def _prepare_client_kwargs_track2(cli_ctx):
     from azure.core.pipeline.policies import SansIOHTTPPolicy
     client_kwargs['http_logging_policy'] = SansIOHTTPPolicy()
 
+    # Record the latency of every HTTP request (including retries) when --perf-trace is enabled.
+    from azure.cli.core.perf_trace import is_enabled
+    if is_enabled():
+        from azure.cli.core.sdk.policies import PerfTracePolicy
+        client_kwargs['per_retry_policies'] = [PerfTracePolicy()]
+
     return client_kwargs
 
 
@@ -173,6 +187,11 @@ def _prepare_mgmt_client_kwargs_track2(cli_ctx, cred):
 
     client_kwargs['credential_scopes'] = scopes
 
+    # Reuse the connections of the other clients created in this process
+    from azure.cli.core._transport import create_requests_transport
+    transport_kwargs = {key: client_kwargs[key] for key in ['connection_verify'] if key in client_kwargs}
+    client_kwargs['transport'] = create_requests_transport(**transport_kwargs)
+
     # Track 2 currently lacks the ability to take external credentials.
     #   https://github.com/Azure/azure-sdk-for-python/issues/8313
     # As a temporary workaround, manually add external tokens to 'x-ms-authorization-auxiliary' header.
@@ -164,7 +164,7 @@ class GenericUpdateCommandOperation(BaseCommandOperation):     # pylint: disable
     def handler(self, command_args):  # pylint: disable=too-many-locals, too-many-statements, too-many-branches
         """ Callback function of CLICommand handler """
         from knack.util import CLIError
-        from azure.cli.core.commands import cached_get, cached_put, _is_poller
+        from azure.cli.core.commands import cached_get, cached_put, _is_poller, CacheObject
         from azure.cli.core.util import find_child_item, augment_no_wait_handler_args
         from azure.cli.core.commands.arm import add_usage, remove_usage, set_usage,\
             add_properties, remove_properties, set_properties
@@ -251,6 +251,9 @@ class GenericUpdateCommandOperation(BaseCommandOperation):     # pylint: disable
 
         if _is_poller(result):
             result = result.result()
+        elif isinstance(result, CacheObject) and self.child_collection_prop_name:
+            # the parent was cached with --defer
+            result = result.result()
 
         if self.child_collection_prop_name:
             result = find_child_item(
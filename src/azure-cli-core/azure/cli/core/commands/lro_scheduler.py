@@ -0,0 +1,253 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Wait for long-running operation pollers from a single loop
+
+Track 1 and Track 2 SDK pollers poll the service from their own threads, honoring the Retry-After header, and run
+their done callbacks when the operation finishes. The scheduler registers such a callback so that a waiting command
+wakes up as soon as its operation completes, instead of after a fixed sleep. Pollers without done callbacks are
+checked with an adaptive interval which backs off from the initial interval and follows the Retry-After header of
+the last response.
+
+Any number of threads, e.g. the jobs of an `--ids` fan-out, can wait concurrently. One of them drives the loop for
+all pending operations at a time, the others sleep until their operation completes or they take over the loop.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from knack.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_MAX_INTERVAL = 10.0
+DEFAULT_BACKOFF = 1.5
+# Don't let a server suggestion postpone a completion check forever
+MAX_RETRY_AFTER = 60.0
+
+
+def get_retry_after(poller):
+    """Return the Retry-After header of the last response of a poller in seconds, or None."""
+    response = None
+    try:
+        polling_method = poller.polling_method()
+        pipeline_response = getattr(polling_method, '_pipeline_response', None)
+        response = pipeline_response.http_response if pipeline_response is not None else \
+            getattr(polling_method, '_response', None)
+    except AttributeError:
+        pass
+    if response is None:
+        response = getattr(poller, '_response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        # missing, or an HTTP-date which the SDK poller handles itself
+        return None
+
+
+class LROOperation:  # pylint: disable=too-many-instance-attributes
+    """A poller registered with the scheduler."""
+
+    def __init__(self, scheduler, poller, interval, on_tick=None):
+        self.poller = poller
+        self.interval = interval
+        self.on_tick = on_tick
+        self.done = False
+        self.next_check = None
+        self.checks = 0
+        self._delay = interval
+        self._scheduler = scheduler
+        self._wake = threading.Event()
+        self.has_callback = False
+
+    def complete(self, *_):
+        if not self.done:
+            self.done = True
+            self._wake.set()
+            self._scheduler._on_operation_done(self)  # pylint: disable=protected-access
+
+    def check(self, now):
+        """Check whether the operation finished. If not, schedule the next check with backoff or Retry-After."""
+        self.checks += 1
+        if self.poller.done():
+            self.complete()
+            return
+        retry_after = get_retry_after(self.poller)
+        if retry_after is not None:
+            delay = min(max(retry_after, self.interval), MAX_RETRY_AFTER)
+        else:
+            self._delay = min(self._delay * self._scheduler.backoff, self._scheduler.max_interval)
+            delay = self._delay
+        if self.has_callback:
+            # the callback wakes us up, the check is only a safety net
+            delay = max(delay, self._scheduler.max_interval)
+        self.next_check = now + delay
+
+
+class LROScheduler:  # pylint: disable=too-many-instance-attributes
+    """Wait for long-running operation pollers from a single loop.
+
+    :param float interval: Default interval of progress updates and of the first completion check, in seconds
+    :param float max_interval: Maximum interval between completion checks of pollers, in seconds
+    :param float backoff: Factor to increase the interval between completion checks after each check
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL, backoff=DEFAULT_BACKOFF):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.progress_bar = None
+        self.wakeups = 0
+        self._operations = []
+        self._lock = threading.Lock()
+        self._driver_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._progress_total = 0
+        self._progress_done = 0
+        self._progress_reported = 0
+        self._progress_started = False
+
+    @staticmethod
+    def _clock():
+        return time.monotonic()
+
+    def _sleep(self, timeout):
+        self._wakeup.wait(timeout)
+        self._wakeup.clear()
+
+    def add(self, poller, interval=None, on_tick=None):
+        """Register a poller.
+
+        :param poller: An LROPoller or AzureOperationPoller
+        :param float interval: Interval of on_tick calls and of the first completion check, in seconds
+        :param on_tick: Called by the thread driving the loop at each interval while the operation is pending
+        :rtype: LROOperation
+        """
+        operation = LROOperation(self, poller, interval or self.interval, on_tick)
+        operation.next_check = self._clock() + operation.interval
+        with self._lock:
+            self._operations.append(operation)
+            if self.progress_bar is not None:
+                self._progress_total += 1
+                if not self._progress_started:
+                    self._progress_started = True
+                    self.progress_bar.begin()
+        try:
+            poller.add_done_callback(operation.complete)
+            operation.has_callback = True
+        except (AttributeError, ValueError):
+            # not supported, or already completed
+            pass
+        if poller.done():
+            operation.complete()
+        return operation
+
+    def wait(self, operation):
+        """Block until the operation completes. Returns whether the operation was pending."""
+        pending = not operation.done
+        try:
+            while not operation.done:
+                if self._driver_lock.acquire(False):  # pylint: disable=consider-using-with
+                    try:
+                        self._drive(operation)
+                    finally:
+                        self._driver_lock.release()
+                        self._hand_over()
+                else:
+                    # another thread drives the loop, sleep until the operation completes or the driver leaves
+                    operation._wake.wait()  # pylint: disable=protected-access
+                    operation._wake.clear()  # pylint: disable=protected-access
+        finally:
+            # no-op once completed, otherwise the wait was interrupted, e.g. by Ctrl+C
+            self._discard(operation)
+        return pending
+
+    def _discard(self, operation):
+        with self._lock:
+            if operation in self._operations:
+                self._operations.remove(operation)
+
+    def _hand_over(self):
+        with self._lock:
+            operations = list(self._operations)
+        for op in operations:
+            op._wake.set()  # pylint: disable=protected-access
+
+    def _drive(self, operation):
+        next_tick = self._clock()
+        while not operation.done:
+            now = self._clock()
+            with self._lock:
+                operations = list(self._operations)
+            for op in operations:
+                if not op.done and now >= op.next_check:
+                    op.check(now)
+            if operation.done:
+                break
+
+            ticking = [op for op in operations if not op.done and (op.on_tick or self.progress_bar is not None)]
+            if ticking and now >= next_tick:
+                for op in ticking:
+                    if op.on_tick:
+                        op.on_tick()
+                self._report_progress()
+                next_tick = now + min(op.interval for op in ticking)
+            elif self._progress_done != self._progress_reported:
+                self._report_progress()
+
+            wake_times = [op.next_check for op in operations if not op.done] + ([next_tick] if ticking else [])
+            if not wake_times:
+                # completed in the meantime
+                continue
+            self._sleep(max(0.0, min(wake_times) - self._clock()))
+            self.wakeups += 1
+
+    def _on_operation_done(self, operation):
+        with self._lock:
+            if operation in self._operations:
+                self._operations.remove(operation)
+                if self.progress_bar is not None:
+                    self._progress_done += 1
+        self._wakeup.set()
+
+    def _report_progress(self):
+        progress_bar = self.progress_bar
+        if progress_bar is not None and self._progress_started:
+            self._progress_reported = self._progress_done
+            progress_bar.message = 'Running ({}/{} done)'.format(self._progress_done, self._progress_total)
+            progress_bar.update_progress()
+
+    @contextmanager
+    def shared_progress(self, progress_bar):
+        """Report the progress of all operations added in the block on a single progress bar."""
+        if progress_bar is None or self.progress_bar is not None:
+            yield
+            return
+        with self._lock:
+            self.progress_bar = progress_bar
+            self._progress_total = self._progress_done = self._progress_reported = 0
+            self._progress_started = False
+        try:
+            yield
+        finally:
+            if self._progress_started:
+                self._report_progress()
+                progress_bar.end()
+            with self._lock:
+                self.progress_bar = None
+                self._progress_started = False
+
+
+_scheduler = LROScheduler()
+
+
+def get_lro_scheduler():
+    return _scheduler
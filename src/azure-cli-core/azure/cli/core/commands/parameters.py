@@ -6,6 +6,7 @@
 
 import argparse
 import platform
+from functools import lru_cache
 
 from azure.cli.core import EXCLUDED_PARAMS
 from azure.cli.core.commands.constants import CLI_PARAM_KWARGS, CLI_POSITIONAL_PARAM_KWARGS
@@ -170,6 +171,17 @@ def get_three_state_flag(positive_label='true', negative_label='false', invert=F
     """
     choices = [positive_label, negative_label]
 
+    params = {
+        'choices': CaseInsensitiveList(choices),
+        'nargs': '?',
+        'action': _get_three_state_action(positive_label, negative_label, invert, return_label)
+    }
+    return CLIArgumentType(**params)
+
+
+@lru_cache(maxsize=None)
+def _get_three_state_action(positive_label, negative_label, invert, return_label):
+
     # pylint: disable=too-few-public-methods
     class ThreeStateAction(argparse.Action):
 
@@ -184,12 +196,23 @@ def get_three_state_flag(positive_label='true', negative_label='false', invert=F
                 set_val = is_positive
             setattr(namespace, self.dest, set_val)
 
-    params = {
-        'choices': CaseInsensitiveList(choices),
-        'nargs': '?',
-        'action': ThreeStateAction
-    }
-    return CLIArgumentType(**params)
+    return ThreeStateAction
+
+
+# pylint: disable=too-few-public-methods
+class _EnumDefaultAction(argparse.Action):
+    """ Normalize the casing of values to the matching choice. Shared by all get_enum_type arguments. """
+
+    def __call__(self, parser, args, values, option_string=None):
+
+        def _get_value(val):
+            return next((x for x in self.choices if x.lower() == val.lower()), val)
+
+        if isinstance(values, list):
+            values = [_get_value(v) for v in values]
+        else:
+            values = _get_value(values)
+        setattr(args, self.dest, values)
 
 
 def get_enum_type(data, default=None):
@@ -203,20 +226,6 @@ def get_enum_type(data, default=None):
     except AttributeError:
         choices = data
 
-    # pylint: disable=too-few-public-methods
-    class DefaultAction(argparse.Action):
-
-        def __call__(self, parser, args, values, option_string=None):
-
-            def _get_value(val):
-                return next((x for x in self.choices if x.lower() == val.lower()), val)
-
-            if isinstance(values, list):
-                values = [_get_value(v) for v in values]
-            else:
-                values = _get_value(values)
-            setattr(args, self.dest, values)
-
     def _type(value):
         return next((x for x in choices if x.lower() == value.lower()), value) if value else value
 
@@ -226,9 +235,10 @@ def get_enum_type(data, default=None):
         if not default_value:
             raise CLIError("Command authoring exception: unrecognized default '{}' from choices '{}'"
                            .format(default, choices))
-        arg_type = CLIArgumentType(choices=CaseInsensitiveList(choices), action=DefaultAction, default=default_value)
+        arg_type = CLIArgumentType(choices=CaseInsensitiveList(choices), action=_EnumDefaultAction,
+                                   default=default_value)
     else:
-        arg_type = CLIArgumentType(choices=CaseInsensitiveList(choices), action=DefaultAction)
+        arg_type = CLIArgumentType(choices=CaseInsensitiveList(choices), action=_EnumDefaultAction)
     return arg_type
 
 
@@ -336,10 +346,11 @@ def patch_arg_update_description(description):
 class AzArgumentContext(ArgumentsContext):
 
     def __init__(self, command_loader, scope, **kwargs):
-        from azure.cli.core.commands import _merge_kwargs as merge_kwargs
         super(AzArgumentContext, self).__init__(command_loader, scope)
         self.scope = scope  # this is called "command" in knack, but that is not an accurate name
-        self.group_kwargs = merge_kwargs(kwargs, command_loader.module_kwargs, CLI_PARAM_KWARGS)
+        self._kwargs = kwargs
+        self._group_kwargs = None
+        self._is_applicable = None
 
     def __enter__(self):
         return self
@@ -347,6 +358,25 @@ class AzArgumentContext(ArgumentsContext):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.is_stale = True
 
+    @property
+    def group_kwargs(self):
+        # merged on first use, so contexts which do not apply to the command being loaded skip it
+        if self._group_kwargs is None:
+            from azure.cli.core.commands import _merge_kwargs as merge_kwargs
+            self._group_kwargs = merge_kwargs(self._kwargs, self.command_loader.module_kwargs, CLI_PARAM_KWARGS)
+        return self._group_kwargs
+
+    @group_kwargs.setter
+    def group_kwargs(self, value):
+        self._group_kwargs = value
+
+    def _applicable(self):
+        # The command being loaded doesn't change while a context is in use. Evaluate the scope once instead of
+        # for every registration in the block.
+        if self._is_applicable is None:
+            self._is_applicable = super(AzArgumentContext, self)._applicable()
+        return self._is_applicable
+
     def _flatten_kwargs(self, kwargs, arg_type):
         merged_kwargs = self._merge_kwargs(kwargs)
         if arg_type:
@@ -478,6 +508,9 @@ class AzArgumentContext(ArgumentsContext):
             super(AzArgumentContext, self).ignore(arg)
 
     def extra(self, dest, arg_type=None, **kwargs):
+        self._check_stale()
+        if not self._applicable():
+            return
 
         merged_kwargs = self._flatten_kwargs(kwargs, arg_type)
         resource_type = merged_kwargs.get('resource_type', None)
@@ -492,9 +525,6 @@ class AzArgumentContext(ArgumentsContext):
             # merged_kwargs.pop('dest', None)
             # super(AzArgumentContext, self).extra(dest, **merged_kwargs)
             from knack.arguments import CLICommandArgument
-            self._check_stale()
-            if not self._applicable():
-                return
 
             if self.command_scope in self.command_loader.command_group_table:
                 raise ValueError("command authoring error: extra argument '{}' cannot be registered to a group-level "
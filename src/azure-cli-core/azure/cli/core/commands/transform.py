@@ -4,10 +4,14 @@
 # --------------------------------------------------------------------------------------------
 
 import re
+from datetime import date, time, datetime, timedelta
+from enum import Enum
+from functools import lru_cache
 
 from azure.cli.core.util import b64_to_hex
 
 import knack.events as events
+from knack.util import to_camel_case
 
 
 def register_global_transforms(cli_ctx):
@@ -58,13 +62,92 @@ def _add_x509_hex(obj):
 
 
 def _resource_group_transform(_, **kwargs):
+    if kwargs['event_data'].get('global_transforms_applied'):
+        return
     _add_resource_group(kwargs['event_data']['result'])
 
 
 def _x509_from_base64_to_hex_transform(_, **kwargs):
+    if kwargs['event_data'].get('global_transforms_applied'):
+        return
     _add_x509_hex(kwargs['event_data']['result'])
 
 
+# Types returned as is by todict, checked by exact type since subclasses such as enums are converted
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None), bytes])
+
+
+def todict_with_global_transforms(obj, post_processor=None):
+    """
+    Convert a result to dictionaries like knack.util.todict and apply the global transforms to each dictionary in
+    the same traversal, instead of walking the converted result again for each transform. Use
+    'post_processor(original_obj, dictionary)' to update the dictionaries in the process.
+
+    The global transforms add 'resourceGroup', parsed from 'id', and 'x509ThumbprintHex', converted from
+    'x509Thumbprint'. The resource group isn't added under 'sourceVault'.
+    """
+    return _todict_and_transform(obj, post_processor, True)
+
+
+def _todict_and_transform(obj, post_processor, add_resource_group):  # pylint: disable=too-many-return-statements
+    if type(obj) in _SCALAR_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        result = {k: _todict_and_transform(v, post_processor, add_resource_group and k != 'sourceVault')
+                  for k, v in obj.items()}
+        if post_processor:
+            result = post_processor(obj, result)
+        return _add_global_properties(result, add_resource_group)
+    if isinstance(obj, list):
+        return [_todict_and_transform(a, post_processor, add_resource_group) for a in obj]
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, time, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return str(obj)
+    if hasattr(obj, '_asdict'):
+        return _todict_and_transform(obj._asdict(), post_processor, add_resource_group)
+    if hasattr(obj, '__dict__'):
+        result = {}
+        for k, v in obj.__dict__.items():
+            if not callable(v) and not k.startswith('_'):
+                key = _to_camel_case(k)
+                result[key] = _todict_and_transform(v, post_processor, add_resource_group and key != 'sourceVault')
+        if post_processor:
+            result = post_processor(obj, result)
+        return _add_global_properties(result, add_resource_group)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _to_camel_case(name):
+    return to_camel_case(name)
+
+
+def _add_global_properties(result, add_resource_group):
+    """Equivalent to _add_resource_group and _add_x509_hex for a single dictionary."""
+    if add_resource_group and 'resourceGroup' not in result:
+        resource_id = result.get('id')
+        if resource_id and isinstance(resource_id, str):
+            parts = resource_id.split('/')
+            if len(parts) > 8 and parts[3].lower() == 'resourcegroups':
+                for key in result:
+                    if isinstance(key, str) and key.lower() == 'resourcegroup':
+                        break
+                else:
+                    result['resourceGroup'] = parts[4]
+
+    if 'x509ThumbprintHex' not in result:
+        thumbprint = result.get('x509Thumbprint')
+        if thumbprint:
+            try:
+                result['x509ThumbprintHex'] = b64_to_hex(thumbprint)
+            except (IndexError, TypeError):
+                pass
+    return result
+
+
 def gen_dict_to_list_transform(key='value'):
 
     def _dict_to_list_transform(result):
@@ -8,6 +8,7 @@ import os
 import traceback
 import json
 import re
+import time
 from distutils.sysconfig import get_python_lib
 
 import pkginfo
@@ -26,6 +27,11 @@ EXTENSIONS_SYS_DIR = os.path.expanduser(_CUSTOM_EXT_SYS_DIR) if _CUSTOM_EXT_SYS_
 
 EXTENSIONS_MOD_PREFIX = 'azext_'
 
+# Metadata of the installed wheel extensions, valid as long as the modification times of their directories match
+EXTENSIONS_CACHE_FILE_NAME = 'extensionMetadata.json'
+# A directory modified within this many seconds of a scan may change again without a change of its modification time
+EXTENSIONS_CACHE_MIN_AGE = 2
+
 AZEXT_METADATA_FILENAME = 'azext_metadata.json'
 
 EXT_METADATA_MINCLICOREVERSION = 'azext.minCliCoreVersion'
@@ -141,6 +147,10 @@ class WheelExtension(Extension):
     def get_metadata(self):
         from glob import glob
 
+        if self._metadata is not None:
+            # read from the extensions cache or already loaded
+            return self._metadata
+
         metadata = {}
         ext_dir = self.path or get_extension_path(self.name)
         if not ext_dir or not os.path.isdir(ext_dir):
@@ -189,6 +199,14 @@ class WheelExtension(Extension):
         """
         Returns all wheel-based extensions.
         """
+        exts = _load_extensions_cache()
+        if exts is None:
+            exts = WheelExtension._find_all()
+            _save_extensions_cache(exts)
+        return exts
+
+    @staticmethod
+    def _find_all():
         from glob import glob
         exts = []
         if os.path.isdir(EXTENSIONS_DIR):
@@ -300,8 +318,95 @@ def ext_compat_with_cli(azext_metadata):
     return is_compatible, core_version, min_required, max_required, min_ext_required
 
 
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_extensions_cache_file():
+    # the configuration directory may change after this module is imported, e.g. in tests
+    from azure.cli.core._environment import get_config_dir
+    return os.path.join(get_config_dir(), EXTENSIONS_CACHE_FILE_NAME)
+
+
+def _get_extensions_cache_dirs():
+    return [[ext_dir, _get_mtime(ext_dir)] for ext_dir in (EXTENSIONS_DIR, EXTENSIONS_SYS_DIR)]
+
+
+# module names of the extensions read from the cache, by extension directory
+_cached_modnames = {}
+
+
+def _load_extensions_cache():
+    """Return the wheel extensions saved by _save_extensions_cache, or None if any of their directories changed."""
+    try:
+        with open(_get_extensions_cache_file()) as f:
+            cache = json.load(f)
+        if cache['dirs'] != _get_extensions_cache_dirs():
+            return None
+        exts, modnames = [], {}
+        for entry in cache['extensions']:
+            if _get_mtime(entry['path']) != entry['mtime']:
+                return None
+            ext = WheelExtension(entry['name'], entry['path'])
+            ext._metadata = entry['metadata']  # pylint: disable=protected-access
+            exts.append(ext)
+            if entry['modname']:
+                modnames[entry['path']] = entry['modname']
+    except (OSError, IOError, ValueError, KeyError, TypeError):
+        return None
+    _cached_modnames.update(modnames)
+    return exts
+
+
+def _save_extensions_cache(exts):
+    """Save the metadata of the wheel extensions found by scanning their directories."""
+    dirs = _get_extensions_cache_dirs()
+    entries = []
+    for ext in exts:
+        try:
+            modname = get_extension_modname(ext_dir=ext.path)
+        except (OSError, AssertionError):
+            modname = None
+        entries.append({'name': ext.name, 'path': ext.path, 'mtime': _get_mtime(ext.path),
+                        'metadata': ext.metadata, 'modname': modname})
+
+    # a directory modified right before the scan may be modified again without changing its modification time
+    min_age_ns = EXTENSIONS_CACHE_MIN_AGE * 10 ** 9
+    now = int(time.time() * 10 ** 9)
+    if any(mtime is not None and now - mtime < min_age_ns
+           for mtime in [d[1] for d in dirs] + [e['mtime'] for e in entries]):
+        logger.debug('Extension directories were modified recently, not caching their metadata.')
+        invalidate_extensions_cache()
+        return
+
+    from azure.cli.core.util import write_file_json
+    try:
+        write_file_json(_get_extensions_cache_file(), {'dirs': dirs, 'extensions': entries})
+    except (OSError, IOError, TypeError, ValueError) as ex:
+        logger.debug('Unable to save the extension metadata cache: %s', ex)
+
+
+def invalidate_extensions_cache():
+    _cached_modnames.clear()
+    try:
+        os.remove(_get_extensions_cache_file())
+    except OSError:
+        pass
+
+
+def update_extensions_cache():
+    """Rescan the wheel extensions and save their metadata. Called after extensions are added, updated or removed."""
+    invalidate_extensions_cache()
+    _save_extensions_cache(WheelExtension._find_all())  # pylint: disable=protected-access
+
+
 def get_extension_modname(ext_name=None, ext_dir=None):
     ext_dir = ext_dir or get_extension_path(ext_name)
+    if ext_dir in _cached_modnames:
+        return _cached_modnames[ext_dir]
     pos_mods = [n for n in os.listdir(ext_dir)
                 if n.startswith(EXTENSIONS_MOD_PREFIX) and os.path.isdir(os.path.join(ext_dir, n))]
     if len(pos_mods) != 1:
@@ -3,21 +3,123 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import hashlib
+import json
+import os
+
 from knack.log import get_logger
 from knack.util import CLIError
 
+from azure.cli.core.extension import (EXT_METADATA_MINCLICOREVERSION, EXT_METADATA_MAXCLICOREVERSION,
+                                      EXT_METADATA_ISPREVIEW, EXT_METADATA_ISEXPERIMENTAL)
+
 logger = get_logger(__name__)
 
 DEFAULT_INDEX_URL = "https://aka.ms/azure-cli-extension-index-v1"
 
+INDEX_CACHE_DIR_NAME = 'extensionIndex'
+
 ERR_TMPL_EXT_INDEX = 'Unable to get extension index.\n'
 ERR_TMPL_NON_200 = '{}Server returned status code {{}} for {{}}'.format(ERR_TMPL_EXT_INDEX)
 ERR_TMPL_NO_NETWORK = '{}Please ensure you have network connection. Error detail: {{}}'.format(ERR_TMPL_EXT_INDEX)
 ERR_TMPL_BAD_JSON = '{}Response body does not contain valid json. Error detail: {{}}'.format(ERR_TMPL_EXT_INDEX)
 
+ERR_TMPL_NO_CACHED_INDEX = '{}The index is not cached for offline use. Run the command once with network ' \
+                           'access or disable extension.index_offline. Index url: {{}}'.format(ERR_TMPL_EXT_INDEX)
+
 ERR_UNABLE_TO_GET_EXTENSIONS = 'Unable to get extensions from index. Improper index format.'
 TRIES = 3
 
+# The search index only keeps what is needed to list, choose and install the extensions
+SEARCH_INDEX_ITEM_KEYS = ['filename', 'downloadUrl', 'sha256Digest']
+SEARCH_INDEX_METADATA_KEYS = ['name', 'version', 'summary', EXT_METADATA_MINCLICOREVERSION,
+                              EXT_METADATA_MAXCLICOREVERSION, EXT_METADATA_ISPREVIEW, EXT_METADATA_ISEXPERIMENTAL]
+
+
+class HttpCache:
+    """JSON documents derived from the response to a GET request, saved with the validators of the response so that
+    the next request can be conditional (If-None-Match, If-Modified-Since)."""
+
+    def __init__(self, url, cli_ctx=None):
+        self.url = url
+        self._dir = get_index_cache_dir(cli_ctx)
+        self._prefix = os.path.join(self._dir, hashlib.sha256(url.encode('utf-8')).hexdigest()[:32])
+        self._info = None
+
+    def _path(self, name):
+        return '{}.{}.json'.format(self._prefix, name)
+
+    def _read(self, name):
+        try:
+            with open(self._path(name), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, IOError, ValueError):
+            return None
+
+    def _write(self, name, document):
+        from azure.cli.core.util import write_file_json
+        write_file_json(self._path(name), document)
+
+    @property
+    def info(self):
+        if self._info is None:
+            info = self._read('info')
+            self._info = info if isinstance(info, dict) and info.get('url') == self.url else {}
+        return self._info
+
+    def load(self, name):
+        """Return the cached document or None."""
+        return self._read(name) if self.info else None
+
+    def validators(self):
+        headers = {}
+        if self.info.get('etag'):
+            headers['If-None-Match'] = self.info['etag']
+        if self.info.get('lastModified'):
+            headers['If-Modified-Since'] = self.info['lastModified']
+        return headers
+
+    def save(self, response_headers, **documents):
+        from knack.util import ensure_dir
+        try:
+            ensure_dir(self._dir)
+            # the documents are only valid once the info is written
+            if os.path.exists(self._path('info')):
+                os.remove(self._path('info'))
+            for name, document in documents.items():
+                self._write(name, document)
+            self._info = {'url': self.url, 'etag': response_headers.get('ETag'),
+                          'lastModified': response_headers.get('Last-Modified')}
+            self._write('info', self._info)
+        except (OSError, IOError, TypeError, ValueError) as ex:
+            logger.debug('Unable to cache the response of %s: %s', self.url, ex)
+
+
+def get_index_cache_dir(cli_ctx=None):
+    """The cache is kept in the configuration directory of the CLI, like the extension command tree."""
+    from azure.cli.core._environment import get_config_dir
+    return os.path.join(cli_ctx.config.config_dir if cli_ctx else get_config_dir(), INDEX_CACHE_DIR_NAME)
+
+
+def is_index_offline(cli_ctx=None):
+    """Whether the extension index and the extension command tree are only read from the cache."""
+    from azure.cli.core.extension import az_config
+    config = cli_ctx.config if cli_ctx else az_config
+    return config.getboolean('extension', 'index_offline', False)
+
+
+def build_search_index(index):
+    extensions = index.get('extensions') if isinstance(index, dict) else None
+    if not isinstance(extensions, dict):
+        return index
+    search_index = {}
+    for name, items in extensions.items():
+        search_index[name] = [dict({key: item[key] for key in SEARCH_INDEX_ITEM_KEYS if key in item},
+                                   metadata={key: item['metadata'][key] for key in SEARCH_INDEX_METADATA_KEYS
+                                             if key in item['metadata']})
+                              for item in items]
+    return {'extensions': search_index}
+
 
 def get_index_url(cli_ctx=None):
     """Use extension index url in the order of:
@@ -37,31 +139,58 @@ def get_index_url(cli_ctx=None):
 
 
 # pylint: disable=inconsistent-return-statements
-def get_index(index_url=None, cli_ctx=None):
+def get_index(index_url=None, cli_ctx=None, details=True):
+    """Get the extension index, revalidating the copy cached by the previous download.
+
+    :param details: Whether the full metadata of the extensions is needed. Otherwise the search index, which only has
+     what is needed to list, choose and install extensions, may be returned.
+    """
     import requests
     from azure.cli.core.util import should_disable_connection_verify
     index_url = index_url or get_index_url(cli_ctx=cli_ctx)
+    cache = HttpCache(index_url, cli_ctx=cli_ctx)
+    cached_index = cache.load('index' if details else 'search')
+
+    if is_index_offline(cli_ctx=cli_ctx):
+        if cached_index is None:
+            raise CLIError(ERR_TMPL_NO_CACHED_INDEX.format(index_url))
+        return cached_index
 
+    headers = cache.validators() if cached_index is not None else {}
     for try_number in range(TRIES):
         try:
-            response = requests.get(index_url, verify=(not should_disable_connection_verify()))
+            response = requests.get(index_url, verify=(not should_disable_connection_verify()), headers=headers)
+            if response.status_code == 304:
+                return cached_index
             if response.status_code == 200:
-                return response.json()
+                index = response.json()
+                try:
+                    search_index = build_search_index(index)
+                except (AttributeError, KeyError, TypeError):
+                    search_index = index
+                cache.save(response.headers, index=index, search=search_index)
+                return index
             msg = ERR_TMPL_NON_200.format(response.status_code, index_url)
+            if cached_index is not None:
+                logger.warning('%s\nUsing the cached copy of the index.', msg)
+                return cached_index
             raise CLIError(msg)
         except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError, ValueError) as err:
             if try_number == TRIES - 1:
                 # ValueError indicates that shortlink url is not redirecting properly to intended index url
                 msg = ERR_TMPL_BAD_JSON.format(str(err)) if isinstance(err, ValueError) else \
                     ERR_TMPL_NO_NETWORK.format(str(err))
+                if cached_index is not None:
+                    logger.warning('%s\nUsing the cached copy of the index.', msg)
+                    return cached_index
                 raise CLIError(msg)
             import time
             time.sleep(0.5)
             continue
 
 
-def get_index_extensions(index_url=None, cli_ctx=None):
-    index = get_index(index_url=index_url, cli_ctx=cli_ctx)
+def get_index_extensions(index_url=None, cli_ctx=None, details=True):
+    index = get_index(index_url=index_url, cli_ctx=cli_ctx, details=details)
     extensions = index.get('extensions')
     if extensions is None:
         logger.warning(ERR_UNABLE_TO_GET_EXTENSIONS)
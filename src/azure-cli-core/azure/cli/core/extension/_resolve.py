@@ -61,7 +61,7 @@ def resolve_from_index(extension_name, cur_version=None, index_url=None, target_
 
     :param cur_version: threshold verssion to filter out extensions.
     """
-    candidates = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx).get(extension_name, [])
+    candidates = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx, details=False).get(extension_name, [])
 
     if not candidates:
         raise NoExtensionCandidatesError("No extension found with name '{}'".format(extension_name))
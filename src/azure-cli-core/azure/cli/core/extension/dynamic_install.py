@@ -13,33 +13,53 @@ logger = get_logger(__name__)
 
 def _get_extension_command_tree(cli_ctx):
     from azure.cli.core._session import EXT_CMD_TREE
+    from azure.cli.core.extension._index import HttpCache, is_index_offline
     import os
+    import time
     VALID_SECOND = 3600 * 24 * 10
     if not cli_ctx:
         return None
-    EXT_CMD_TREE.load(os.path.join(cli_ctx.config.config_dir, 'extensionCommandTree.json'), VALID_SECOND)
-    if not EXT_CMD_TREE.data:
-        import posixpath
-        import requests
-        from azure.cli.core.util import should_disable_connection_verify
+    EXT_CMD_TREE.load(os.path.join(cli_ctx.config.config_dir, 'extensionCommandTree.json'))
+    if EXT_CMD_TREE.data:
         try:
-            azmirror_endpoint = cli_ctx.cloud.endpoints.azmirror_storage_account_resource_id if cli_ctx and \
-                cli_ctx.cloud.endpoints.has_endpoint_set('azmirror_storage_account_resource_id') else None
-            url = posixpath.join(azmirror_endpoint, 'extensions', 'extensionCommandTree.json') if \
-                azmirror_endpoint else 'https://aka.ms/azExtCmdTree'
-            response = requests.get(
-                url,
-                verify=(not should_disable_connection_verify()),
-                timeout=10)
-        except Exception as ex:  # pylint: disable=broad-except
-            logger.info("Request failed for extension command tree: %s", str(ex))
-            return None
-        if response.status_code == 200:
-            EXT_CMD_TREE.data = response.json()
-            EXT_CMD_TREE.save_with_retry()
-        else:
-            logger.info("Error when retrieving extension command tree. Response code: %s", response.status_code)
-            return None
+            expired = os.stat(EXT_CMD_TREE.filename).st_mtime + VALID_SECOND < time.time()
+        except OSError:
+            expired = True
+        if not expired or is_index_offline(cli_ctx=cli_ctx):
+            return EXT_CMD_TREE
+    elif is_index_offline(cli_ctx=cli_ctx):
+        return None
+
+    import posixpath
+    import requests
+    from azure.cli.core.util import should_disable_connection_verify
+    azmirror_endpoint = cli_ctx.cloud.endpoints.azmirror_storage_account_resource_id if cli_ctx and \
+        cli_ctx.cloud.endpoints.has_endpoint_set('azmirror_storage_account_resource_id') else None
+    url = posixpath.join(azmirror_endpoint, 'extensions', 'extensionCommandTree.json') if \
+        azmirror_endpoint else 'https://aka.ms/azExtCmdTree'
+    # an expired tree is revalidated, and still used if the request fails
+    cache = HttpCache(url, cli_ctx=cli_ctx)
+    try:
+        response = requests.get(
+            url,
+            verify=(not should_disable_connection_verify()),
+            headers=cache.validators() if EXT_CMD_TREE.data else {},
+            timeout=10)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.info("Request failed for extension command tree: %s", str(ex))
+        return EXT_CMD_TREE if EXT_CMD_TREE.data else None
+    if response.status_code == 304:
+        try:
+            os.utime(EXT_CMD_TREE.filename)
+        except OSError:
+            pass
+    elif response.status_code == 200:
+        EXT_CMD_TREE.data = response.json()
+        EXT_CMD_TREE.save_with_retry()
+        cache.save(response.headers)
+    else:
+        logger.info("Error when retrieving extension command tree. Response code: %s", response.status_code)
+        return EXT_CMD_TREE if EXT_CMD_TREE.data else None
     return EXT_CMD_TREE
 
 
@@ -20,7 +20,7 @@ from packaging.version import parse
 from azure.cli.core import CommandIndex
 from azure.cli.core.util import CLIError, reload_module, rmtree_with_retry
 from azure.cli.core.extension import (extension_exists, build_extension_path, get_extensions, get_extension_modname,
-                                      get_extension, ext_compat_with_cli,
+                                      get_extension, ext_compat_with_cli, update_extensions_cache,
                                       EXT_METADATA_ISPREVIEW, EXT_METADATA_ISEXPERIMENTAL,
                                       WheelExtension, DevExtension, ExtensionNotInstalledException, WHEEL_INFO_RE)
 from azure.cli.core.telemetry import set_extension_management_detail
@@ -346,6 +346,7 @@ def add_extension(cmd=None, source=None, extension_name=None, index_url=None, ye
         elif extension_name and ext.preview:
             logger.warning("The installed extension '%s' is in preview.", extension_name)
         CommandIndex().invalidate()
+        update_extensions_cache()
     except ExtensionNotInstalledException:
         pass
 
@@ -362,6 +363,7 @@ def remove_extension(extension_name):
         _augment_telemetry_with_ext_info(extension_name, ext)
         rmtree_with_retry(ext.path)
         CommandIndex().invalidate()
+        update_extensions_cache()
     except ExtensionNotInstalledException as e:
         raise CLIError(e)
 
@@ -418,12 +420,13 @@ def update_extension(cmd=None, extension_name=None, index_url=None, pip_extra_in
             shutil.copytree(backup_dir, extension_path)
             raise CLIError('Failed to update. Rolled {} back to {}.'.format(extension_name, cur_version))
         CommandIndex().invalidate()
+        update_extensions_cache()
     except ExtensionNotInstalledException as e:
         raise CLIError(e)
 
 
 def list_available_extensions(index_url=None, show_details=False, cli_ctx=None):
-    index_data = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx)
+    index_data = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx, details=show_details)
     if show_details:
         return index_data
     installed_extensions = get_extensions(ext_type=WheelExtension)
@@ -454,7 +457,7 @@ def list_available_extensions(index_url=None, show_details=False, cli_ctx=None):
 
 
 def list_versions(extension_name, index_url=None, cli_ctx=None):
-    index_data = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx)
+    index_data = get_index_extensions(index_url=index_url, cli_ctx=cli_ctx, details=False)
 
     try:
         exts = index_data[extension_name]
@@ -45,8 +45,11 @@ class TestExtensionCommands(unittest.TestCase):
     def setUp(self):
         self.ext_dir = tempfile.mkdtemp()
         self.ext_sys_dir = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.cache_dir, 'extensionMetadata.json')
         self.patchers = [mock.patch('azure.cli.core.extension.EXTENSIONS_DIR', self.ext_dir),
-                         mock.patch('azure.cli.core.extension.EXTENSIONS_SYS_DIR', self.ext_sys_dir)]
+                         mock.patch('azure.cli.core.extension.EXTENSIONS_SYS_DIR', self.ext_sys_dir),
+                         mock.patch.dict('os.environ', {'AZURE_CONFIG_DIR': self.cache_dir})]
         for patcher in self.patchers:
             patcher.start()
         self.cmd = self._setup_cmd()
@@ -56,6 +59,7 @@ class TestExtensionCommands(unittest.TestCase):
             patcher.stop()
         shutil.rmtree(self.ext_dir, ignore_errors=True)
         shutil.rmtree(self.ext_sys_dir, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
 
     def test_no_extensions_dir(self):
         shutil.rmtree(self.ext_dir)
@@ -76,6 +80,32 @@ class TestExtensionCommands(unittest.TestCase):
         num_exts = len(list_extensions())
         self.assertEqual(num_exts, 0)
 
+    def test_extension_metadata_cache(self):
+        from azure.cli.core.extension import WheelExtension, get_extension_modname
+        add_extension(cmd=self.cmd, source=MY_EXT_SOURCE)
+        ext_path = build_extension_path(MY_EXT_NAME)
+        # the cache is only saved for directories which were not modified right before the scan
+        self.assertFalse(os.path.exists(self.cache_file))
+        for path in [self.ext_dir, self.ext_sys_dir, ext_path]:
+            os.utime(path, (0, 0))
+        expected = list_extensions()
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        with mock.patch.object(WheelExtension, '_find_all', side_effect=AssertionError), \
+                mock.patch.object(WheelExtension, 'get_metadata', side_effect=AssertionError), \
+                mock.patch('os.listdir', side_effect=AssertionError):
+            self.assertEqual(list_extensions(), expected)
+            self.assertEqual(get_extension_modname(ext_dir=ext_path), 'azext_hello')
+
+        os.mkdir(os.path.join(self.ext_dir, 'another'))
+        with mock.patch.object(WheelExtension, '_find_all', return_value=[]) as find_all:
+            self.assertEqual(list_extensions(), [])
+        find_all.assert_called_once_with()
+
+        remove_extension(MY_EXT_NAME)
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertEqual(list_extensions(), [])
+
     def test_add_list_show_remove_system_extension(self):
         add_extension(cmd=self.cmd, source=MY_EXT_SOURCE, system=True)
         actual = list_extensions()
@@ -333,18 +363,18 @@ class TestExtensionCommands(unittest.TestCase):
     def test_list_available_extensions_default(self):
         with mock.patch('azure.cli.core.extension.operations.get_index_extensions', autospec=True) as c:
             list_available_extensions(cli_ctx=self.cmd.cli_ctx)
-            c.assert_called_once_with(None, self.cmd.cli_ctx)
+            c.assert_called_once_with(None, self.cmd.cli_ctx, False)
 
     def test_list_available_extensions_operations_index_url(self):
         with mock.patch('azure.cli.core.extension.operations.get_index_extensions', autospec=True) as c:
             index_url = 'http://contoso.com'
             list_available_extensions(index_url=index_url, cli_ctx=self.cmd.cli_ctx)
-            c.assert_called_once_with(index_url, self.cmd.cli_ctx)
+            c.assert_called_once_with(index_url, self.cmd.cli_ctx, False)
 
     def test_list_available_extensions_show_details(self):
         with mock.patch('azure.cli.core.extension.operations.get_index_extensions', autospec=True) as c:
             list_available_extensions(show_details=True, cli_ctx=self.cmd.cli_ctx)
-            c.assert_called_once_with(None, self.cmd.cli_ctx)
+            c.assert_called_once_with(None, self.cmd.cli_ctx, True)
 
     def test_list_available_extensions_no_show_details(self):
         sample_index_extensions = {
@@ -3,19 +3,22 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 import os
+import shutil
+import tempfile
 from unittest import mock
 import unittest
 from requests.exceptions import ConnectionError, HTTPError
 from azure.cli.core.util import CLIError
 from azure.cli.core.extension._index import (get_index, get_index_extensions, DEFAULT_INDEX_URL,
                                              ERR_TMPL_NON_200, ERR_TMPL_NO_NETWORK, ERR_TMPL_BAD_JSON,
-                                             ERR_UNABLE_TO_GET_EXTENSIONS)
+                                             ERR_TMPL_NO_CACHED_INDEX, ERR_UNABLE_TO_GET_EXTENSIONS)
 
 
 class MockResponse(object):
-    def __init__(self, status_code, data):
+    def __init__(self, status_code, data, headers=None):
         self.status_code = status_code
         self.data = data
+        self.headers = headers or {}
 
     def json(self):
         if isinstance(self.data, Exception):
@@ -24,7 +27,7 @@ class MockResponse(object):
 
 
 def mock_index_get_generator(index_url, index_data):
-    def mock_req_get(url, verify):
+    def mock_req_get(url, verify, headers=None):
         if url == index_url:
             return MockResponse(200, index_data)
         return MockResponse(404, None)
@@ -33,6 +36,15 @@ def mock_index_get_generator(index_url, index_data):
 
 class TestExtensionIndexGet(unittest.TestCase):
 
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.patcher = mock.patch.dict('os.environ', {'AZURE_CONFIG_DIR': self.cache_dir})
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
     def test_get_index(self):
         with mock.patch('requests.get', side_effect=mock_index_get_generator(DEFAULT_INDEX_URL, {})):
             self.assertEqual(get_index(), {})
@@ -85,6 +97,63 @@ class TestExtensionIndexGet(unittest.TestCase):
                 self.assertEqual(get_index_extensions(), None)
                 logger_mock.assert_called_once_with(ERR_UNABLE_TO_GET_EXTENSIONS)
 
+    def test_get_index_revalidates_cached_copy(self):
+        index = {'extensions': {'myext': [{'filename': 'myext-0.0.1-py2.py3-none-any.whl', 'downloadUrl': 'url',
+                                           'sha256Digest': 'digest',
+                                           'metadata': {'name': 'myext', 'version': '0.0.1', 'summary': 'My ext',
+                                                        'azext.minCliCoreVersion': '2.0.0',
+                                                        'classifiers': ['License :: OSI Approved :: MIT License']}}]}}
+        responses = [MockResponse(200, index, {'ETag': '"1"', 'Last-Modified': 'Mon, 18 Oct 2021 00:00:00 GMT'}),
+                     MockResponse(304, None)]
+        with mock.patch('requests.get', side_effect=responses) as get:
+            self.assertEqual(get_index(), index)
+            self.assertEqual(get_index(details=False), {'extensions': {'myext': [{
+                'filename': 'myext-0.0.1-py2.py3-none-any.whl', 'downloadUrl': 'url', 'sha256Digest': 'digest',
+                'metadata': {'name': 'myext', 'version': '0.0.1', 'summary': 'My ext',
+                             'azext.minCliCoreVersion': '2.0.0'}}]}})
+        self.assertEqual(get.call_args_list[0][1]['headers'], {})
+        self.assertEqual(get.call_args_list[1][1]['headers'], {'If-None-Match': '"1"',
+                                                               'If-Modified-Since': 'Mon, 18 Oct 2021 00:00:00 GMT'})
+
+    @mock.patch('time.sleep')
+    def test_get_index_cached_copy_without_network(self, _):
+        index = {'extensions': {'myext': []}}
+        with mock.patch('requests.get', side_effect=mock_index_get_generator(DEFAULT_INDEX_URL, index)):
+            get_index()
+        with mock.patch('requests.get', side_effect=mock_index_get_generator(DEFAULT_INDEX_URL,
+                                                                             ConnectionError('no network'))), \
+                mock.patch('azure.cli.core.extension._index.logger.warning') as logger_mock:
+            self.assertEqual(get_index(), index)
+        self.assertIn(ERR_TMPL_NO_NETWORK.format('no network'), logger_mock.call_args[0][1])
+
+    def test_get_index_offline(self):
+        from azure.cli.core.mock import DummyCli
+        cli_ctx = DummyCli(config_dir=self.cache_dir)
+        index = {'extensions': {'myext': []}}
+        with mock.patch.object(cli_ctx.config, 'getboolean', return_value=True), \
+                mock.patch('requests.get') as get:
+            with self.assertRaises(CLIError) as err:
+                get_index(index_url='http://contoso.com/cli-index', cli_ctx=cli_ctx)
+            self.assertEqual(str(err.exception), ERR_TMPL_NO_CACHED_INDEX.format('http://contoso.com/cli-index'))
+            get.side_effect = mock_index_get_generator('http://contoso.com/cli-index', index)
+            with mock.patch('azure.cli.core.extension._index.is_index_offline', return_value=False):
+                get_index(index_url='http://contoso.com/cli-index', cli_ctx=cli_ctx)
+            get.reset_mock()
+            self.assertEqual(get_index(index_url='http://contoso.com/cli-index', cli_ctx=cli_ctx), index)
+            get.assert_not_called()
+
+    def test_get_index_cached_in_config_dir(self):
+        from azure.cli.core.mock import DummyCli
+        config_dir = os.path.join(self.cache_dir, 'other')
+        with mock.patch.dict('os.environ'):
+            # AZURE_CONFIG_DIR takes precedence over the configuration directory of the CLI
+            del os.environ['AZURE_CONFIG_DIR']
+            cli_ctx = DummyCli(config_dir=config_dir)
+        with mock.patch('requests.get', side_effect=mock_index_get_generator('http://contoso.com/cli-index', {})):
+            get_index(index_url='http://contoso.com/cli-index', cli_ctx=cli_ctx)
+        self.assertEqual(len(os.listdir(os.path.join(config_dir, 'extensionIndex'))), 3)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, 'extensionIndex')))
+
     # pylint: disable=line-too-long
     def test_get_index_cloud(self):
 
@@ -8,7 +8,7 @@ from azure.cli.core import AzCli
 
 class DummyCli(AzCli):
     """A dummy CLI instance can be used to facilitate automation"""
-    def __init__(self, commands_loader_cls=None, **kwargs):
+    def __init__(self, commands_loader_cls=None, config_dir=None, **kwargs):
         import os
 
         from azure.cli.core import MainCommandsLoader
@@ -19,17 +19,19 @@ class DummyCli(AzCli):
         from azure.cli.core._config import GLOBAL_CONFIG_DIR, ENV_VAR_PREFIX
         from azure.cli.core._help import AzCliHelp
         from azure.cli.core._output import AzOutputProducer
+        from azure.cli.core._query import AzCliQuery
 
         from knack.completion import ARGCOMPLETE_ENV_NAME
 
         super(DummyCli, self).__init__(
             cli_name='az',
-            config_dir=GLOBAL_CONFIG_DIR,
+            config_dir=config_dir or GLOBAL_CONFIG_DIR,
             config_env_var_prefix=ENV_VAR_PREFIX,
             commands_loader_cls=commands_loader_cls or MainCommandsLoader,
             parser_cls=AzCliCommandParser,
             logging_cls=AzCliLogging,
             output_cls=AzOutputProducer,
+            query_cls=AzCliQuery,
             help_cls=AzCliHelp,
             invocation_cls=AzCliCommandInvoker)
 
@@ -59,6 +59,15 @@ class AzCompletionFinder(argcomplete.CompletionFinder):
                                                                                        cword_prequote,
                                                                                        last_wordbreak_pos)
 
+    @staticmethod
+    def _action_allowed(action, parser):  # pylint: disable=protected-access
+        # Don't complete an option which is already given, unless its values are appended
+        if not argcomplete.CompletionFinder._action_allowed(action, parser):
+            return False
+        if action._orig_class in (argparse._AppendAction, argparse._AppendConstAction):
+            return True
+        return action not in parser._seen_non_default_actions
+
 
 class AzCliCommandParser(CLICommandParser):
     """ArgumentParser implementation specialized for the Azure CLI utility."""
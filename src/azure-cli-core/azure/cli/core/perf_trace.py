@@ -0,0 +1,278 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Phase-level performance tracing for Azure CLI
+
+Tracing is turned on with the global --perf-trace flag, optionally followed by a file name as in
+--perf-trace=trace.json. Nested spans are recorded for command table loading, argument loading, parser
+construction, argument parsing, validation, command execution, HTTP requests, token acquisition, long-running
+operation polling and output formatting.
+
+When the invocation finishes the spans are written to
+  - a speedscope file (https://www.speedscope.app), if the file name ends with '.speedscope.json'
+  - a Chrome trace-event file (chrome://tracing, https://ui.perfetto.dev), otherwise
+
+Without a file name the trace is written to the 'traces' folder under the CLI configuration directory.
+"""
+
+import json
+import os
+import threading
+import time
+
+from knack.events import EVENT_CLI_POST_EXECUTE, EVENT_INVOKER_POST_PARSE_ARGS, EVENT_PARSER_GLOBAL_CREATE
+from knack.log import get_logger
+
+logger = get_logger(__name__)
+
+PERF_TRACE_FLAG = '--perf-trace'
+SPEEDSCOPE_SUFFIX = '.speedscope.json'
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name, category, args):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self._args['error'] = exc_type.__name__
+        self._tracer.add_span(self._name, self._start, time.perf_counter(), self._category, **self._args)
+        return False
+
+
+class PerfTracer:
+    """Collect spans from all threads of the current process."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self._origin = time.perf_counter()
+        self._start = None
+        self._events = []
+        self._lock = threading.Lock()
+
+    def enable(self, path=None):
+        self.enabled = True
+        self.path = path
+        self._start = time.perf_counter()
+
+    def reset(self):
+        self.enabled = False
+        self.path = None
+        self._start = None
+        with self._lock:
+            self._events = []
+
+    def span(self, name, category='cli', **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def add_span(self, name, start, end, category='cli', **args):
+        """Record a span from two time.perf_counter() readings."""
+        if not self.enabled:
+            return
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self._origin) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+            'pid': os.getpid(),
+            'tid': threading.get_ident()
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self):
+        with self._lock:
+            return list(self._events)
+
+    def to_chrome_trace(self):
+        events = self.events
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                     'args': {'name': thread_names.get(tid, str(tid))}}
+                    for tid in sorted({e['tid'] for e in events})]
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def to_speedscope(self, name='az'):
+        frames = []
+        frame_index = {}
+        profiles = []
+        by_thread = {}
+        for e in self.events:
+            by_thread.setdefault(e['tid'], []).append(e)
+
+        for tid, events in sorted(by_thread.items()):
+            markers = []
+            for e in events:
+                if e['name'] not in frame_index:
+                    frame_index[e['name']] = len(frames)
+                    frames.append({'name': e['name']})
+                frame = frame_index[e['name']]
+                start, end = e['ts'] / 1000.0, (e['ts'] + e['dur']) / 1000.0
+                # order markers at the same instant so that spans nest: closes before opens, outer spans
+                # open first and close last
+                markers.append((start, 1, -end, {'type': 'O', 'frame': frame, 'at': start}))
+                markers.append((end, 0, -start, {'type': 'C', 'frame': frame, 'at': end}))
+            markers.sort(key=lambda m: m[:3])
+            profiles.append({
+                'type': 'evented',
+                'name': 'Thread {}'.format(tid),
+                'unit': 'milliseconds',
+                'startValue': markers[0][0] if markers else 0,
+                'endValue': max(m[0] for m in markers) if markers else 0,
+                'events': [m[3] for m in markers]
+            })
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'exporter': 'azure-cli'
+        }
+
+    def save(self, path, name='az'):
+        data = self.to_speedscope(name) if path.endswith(SPEEDSCOPE_SUFFIX) else self.to_chrome_trace()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        return path
+
+
+_tracer = PerfTracer()
+
+
+def get_tracer():
+    return _tracer
+
+
+def is_enabled():
+    return _tracer.enabled
+
+
+def trace_span(name, category='cli', **args):
+    """Context manager recording a span. It is a no-op unless tracing is enabled."""
+    return _tracer.span(name, category, **args)
+
+
+def find_perf_trace_arg(args):
+    """Look for --perf-trace[=FILE] in the command line arguments, like knack does for --debug.
+
+    The arguments are only parsed once the command table is loaded, so the flag is looked for beforehand to
+    trace the loading too.
+
+    :return: a tuple of (whether the flag is present, the file name or None)
+    """
+    found = False
+    path = None
+    for arg in args:
+        if arg == PERF_TRACE_FLAG:
+            found = True
+        elif arg.startswith(PERF_TRACE_FLAG + '='):
+            found = True
+            path = arg.split('=', 1)[1] or None
+    return found, path
+
+
+def register_global_perf_trace_argument(cli_ctx):
+    """Register the global --perf-trace argument, and start tracing when it is found in the arguments."""
+
+    def add_perf_trace_argument(_, **kwargs):
+        arg_group = kwargs.get('arg_group')
+        arg_group.add_argument(PERF_TRACE_FLAG, dest='_perf_trace', nargs='?', const='', metavar='FILE',
+                               help='Trace the phases of the command and save the trace to FILE, or to a new file '
+                                    'in the "traces" folder of the configuration directory. Use a file name ending '
+                                    'with "{}" to open it in https://www.speedscope.app.'.format(SPEEDSCOPE_SUFFIX))
+
+    def handle_perf_trace_parameter(cli_ctx, **kwargs):
+        args = kwargs['args']
+        path = getattr(args, '_perf_trace', None)
+        if hasattr(args, '_perf_trace'):
+            del args._perf_trace  # pylint: disable=protected-access
+        if not _tracer.enabled:
+            return
+        if path is None:
+            # --perf-trace was the value of another argument
+            cli_ctx.unregister_event(EVENT_CLI_POST_EXECUTE, _save_perf_trace)
+            _tracer.reset()
+            return
+        if path:
+            _tracer.path = os.path.abspath(os.path.expanduser(path))
+        # never record the arguments, their values may be secrets
+        cli_ctx.data['perf_trace_command'] = 'az {}'.format(kwargs['command']).strip()
+
+    cli_ctx.register_event(EVENT_PARSER_GLOBAL_CREATE, add_perf_trace_argument)
+    cli_ctx.register_event(EVENT_INVOKER_POST_PARSE_ARGS, handle_perf_trace_parameter)
+
+
+def start_perf_trace(cli_ctx, args):
+    """Enable tracing if --perf-trace is present in the arguments."""
+    found, path = find_perf_trace_arg(args)
+    if found and not _tracer.enabled:
+        _tracer.enable(os.path.abspath(os.path.expanduser(path)) if path else None)
+        cli_ctx.data['perf_trace_command'] = 'az'
+        cli_ctx.register_event(EVENT_CLI_POST_EXECUTE, _save_perf_trace)
+
+
+def _save_perf_trace(cli_ctx, **_):
+    cli_ctx.unregister_event(EVENT_CLI_POST_EXECUTE, _save_perf_trace)
+    if not _tracer.enabled:
+        return
+    command = cli_ctx.data.get('perf_trace_command', 'az')
+    _tracer.add_span(command, _tracer._start, time.perf_counter(), 'cli')  # pylint: disable=protected-access
+    path = _tracer.path or os.path.join(cli_ctx.config.config_dir, 'traces',
+                                        'az-{}-{}.json'.format(time.strftime('%Y%m%d-%H%M%S'), os.getpid()))
+    try:
+        _tracer.save(path, command)
+        logger.warning('Performance trace saved to %s', path)
+    except (OSError, TypeError, ValueError) as ex:
+        logger.warning('Failed to save performance trace to %s: %s', path, ex)
+    finally:
+        _tracer.reset()
+
+
+def requests_response_hook(response, *_, **__):
+    """A 'requests' response hook recording the latency of HTTP requests sent by Track 1 SDK clients."""
+    if not _tracer.enabled:
+        return
+    end = time.perf_counter()
+    elapsed = response.elapsed.total_seconds() if response.elapsed else 0
+    _tracer.add_span(format_http_span_name(response.request.method, response.request.url), end - elapsed, end,
+                     'http', status_code=response.status_code)
+
+
+def format_http_span_name(method, url):
+    from urllib.parse import urlsplit
+    # never record the query string, it may contain secrets like SAS tokens
+    parts = urlsplit(url)
+    return '{} {}{}'.format(method, parts.netloc, parts.path)
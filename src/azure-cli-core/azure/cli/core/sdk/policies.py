@@ -5,6 +5,7 @@
 
 import logging
 import re
+import time
 import types
 
 from azure.core.pipeline.policies import SansIOHTTPPolicy
@@ -96,3 +97,30 @@ class SafeNetworkTraceLoggingPolicy(SansIOHTTPPolicy):
                         _LOGGER.debug(response.http_response.text())
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.debug("Failed to log response: %s", repr(err))
+
+
+class PerfTracePolicy(SansIOHTTPPolicy):
+    """Record a performance trace span for every HTTP request sent by the pipeline.
+    It is only added to the pipeline when --perf-trace is enabled, see azure.cli.core.perf_trace.
+    """
+
+    _START_TIME_KEY = 'perf_trace_start_time'
+
+    def on_request(self, request):  # pylint: disable=no-self-use
+        request.context[self._START_TIME_KEY] = time.perf_counter()
+
+    def on_response(self, request, response):
+        self._add_span(request, status_code=response.http_response.status_code)
+
+    def on_exception(self, request):  # pylint: disable=arguments-differ
+        import sys
+        self._add_span(request, error=getattr(sys.exc_info()[0], '__name__', 'Exception'))
+
+    def _add_span(self, request, **args):
+        from azure.cli.core.perf_trace import get_tracer, format_http_span_name
+        start_time = request.context.get(self._START_TIME_KEY)
+        if start_time is None:
+            return
+        http_request = request.http_request
+        get_tracer().add_span(format_http_span_name(http_request.method, http_request.url), start_time,
+                              time.perf_counter(), 'http', **args)
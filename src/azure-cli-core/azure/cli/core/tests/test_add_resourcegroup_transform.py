@@ -3,9 +3,29 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import json
 import unittest
+from datetime import datetime
+from enum import Enum
 from io import StringIO
-from azure.cli.core.commands.transform import _parse_id, _add_resource_group
+
+from knack.util import todict
+
+from azure.cli.core.commands import AzCliCommandInvoker
+from azure.cli.core.commands.transform import (_parse_id, _add_resource_group, _add_x509_hex,
+                                               todict_with_global_transforms)
+
+
+class _Model:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, **kwargs):
+        self.additional_properties = kwargs.pop('additional_properties', None)
+        self.__dict__.update(kwargs)
+        self._private = 'hidden'
+
+
+class _Color(str, Enum):
+    red = 'Red'
 
 
 class TestResourceGroupTransform(unittest.TestCase):
@@ -85,6 +105,36 @@ class TestResourceGroupTransform(unittest.TestCase):
             'name': 'A name'
         })
 
+    def test_todict_with_global_transforms_matches_separate_passes(self):
+        rg_id = TestResourceGroupTransform.CORRECT_ID
+        result = [
+            _Model(id=rg_id, name='vm', color=_Color.red, created=datetime(2021, 1, 2),
+                   source_vault=_Model(id=rg_id, secret_url='url'),
+                   certificates=[{'x509Thumbprint': 'AAE=', 'id': rg_id}, {'x509Thumbprint': None}],
+                   additional_properties={'extra': {'id': rg_id}, 'id': rg_id + '/child/c'}),
+            {'id': rg_id, 'ResourceGroup': 'existing'},
+            {'id': TestResourceGroupTransform.NON_RG_ID, 'value': ('tuple', 1)},
+            {'id': TestResourceGroupTransform.DICT_ID, 'nested': [[{'id': rg_id}]]},
+            {'id': '/subscriptions/sub/resourceGroups/rg'},
+            {'sourceVault': {'nested': {'id': rg_id}, 'x509Thumbprint': 'AAE='}},
+            'string', 3, None,
+        ]
+        post_processor = AzCliCommandInvoker.remove_additional_prop_layer
+
+        expected = todict(result, post_processor)
+        _add_resource_group(expected)
+        _add_x509_hex(expected)
+        actual = todict_with_global_transforms(result, post_processor)
+
+        # same content and key order
+        self.assertEqual(json.dumps(actual), json.dumps(expected))
+        self.assertEqual(actual[0]['resourceGroup'], 'REsourceGROUPname')
+        self.assertNotIn('resourceGroup', actual[0]['sourceVault'])
+        self.assertEqual(actual[0]['certificates'][0]['x509ThumbprintHex'], '0001')
+        self.assertEqual(actual[0]['extra']['resourceGroup'], 'REsourceGROUPname')
+        self.assertNotIn('resourceGroup', actual[4])
+        self.assertEqual(actual[5]['sourceVault']['x509ThumbprintHex'], '0001')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -520,6 +520,48 @@ class TestCommandRegistration(unittest.TestCase):
             self.assertDictContainsSubset(some_expected_arguments[existing].settings,
                                           command_metadata.arguments[existing].options)
 
+    def test_single_command_skips_other_scopes(self):
+
+        contexts = {}
+
+        class TestCommandsLoader(AzCommandsLoader):
+
+            def load_command_table(self, args):
+                super(TestCommandsLoader, self).load_command_table(args)
+                with self.command_group('test', operations_tmpl='{}#TestCommandRegistration.{{}}'.format(__name__)) as g:
+                    g.command('vm-get', 'sample_vm_get')
+                    g.command('command vm-get-1', 'sample_vm_get')
+                return self.command_table
+
+            def load_arguments(self, command):
+                super(TestCommandsLoader, self).load_arguments(command)
+                with self.argument_context('test') as c:
+                    contexts['test'] = c
+                    c.argument('vm_name', options_list=['--foo'])
+                with self.argument_context('test command vm-get-1') as c:
+                    contexts['test command vm-get-1'] = c
+                    c.argument('vm_name', options_list=['--bar'])
+                    c.extra('added_param', options_list=['--added-param'])
+
+        cli = DummyCli(commands_loader_cls=TestCommandsLoader)
+        loader = TestCommandsLoader(cli)
+        loader.cli_ctx.invocation = mock.MagicMock()
+        loader.cli_ctx.invocation.commands_loader = loader
+        loader.cli_ctx.invocation.data = {'command_string': 'test vm-get'}
+        loader.command_name = 'test vm-get'
+        loader.load_command_table(None)
+        with mock.patch.object(loader, 'supported_api_version', wraps=loader.supported_api_version) as api_check:
+            loader.load_arguments(loader.command_name)
+        loader._update_command_definitions()
+
+        self.assertEqual(loader.command_table['test vm-get'].arguments['vm_name'].options_list, ['--foo'])
+        self.assertEqual(loader.command_table['test command vm-get-1'].arguments, {})
+        self.assertNotIn('test command vm-get-1', loader.argument_registry.arguments)
+        self.assertNotIn('test command vm-get-1', loader.extra_argument_registry)
+        # registrations in scopes which don't apply return before merging kwargs or checking API versions
+        self.assertEqual(api_check.call_count, 1)
+        self.assertIsNone(contexts['test command vm-get-1']._group_kwargs)
+
     def test_command_build_argument_help_text(self):
 
         def sample_sdk_method_with_weird_docstring(param_a, param_b, param_c):  # pylint: disable=unused-argument
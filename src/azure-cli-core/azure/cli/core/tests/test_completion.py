@@ -0,0 +1,121 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import argcomplete
+
+from azure.cli.core import __version__
+from azure.cli.core._completion import CompletionIndex, complete_from_index
+from azure.cli.core.commands import AzCliCommand
+from azure.cli.core.commands.parameters import get_enum_type
+from azure.cli.core.mock import DummyCli
+from azure.cli.core.parser import AzCliCommandParser, AzCompletionFinder
+
+
+def _handler():
+    pass
+
+
+class TestCompletionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+
+        self.cli = cli = DummyCli()
+        cli.loader = mock.MagicMock()
+        cli.loader.cli_ctx = cli
+        show = AzCliCommand(cli.loader, 'demo show', _handler)
+        show.add_argument('name', '--name', '-n', completer=lambda **_: ['dynamic'])
+        show.add_argument('color', '--color', **get_enum_type(['Red', 'Green', 'Blue']).settings)
+        show.add_argument('force', '--force', action='store_true')
+        show.add_argument('tags', '--tags', nargs='+')
+        show.add_argument('labels', '--label', action='append')
+        self.command_table = {'demo show': show,
+                              'demo item list': AzCliCommand(cli.loader, 'demo item list', _handler),
+                              'version': AzCliCommand(cli.loader, 'version', _handler)}
+        cli.commands_loader.command_table = self.command_table
+
+        self.index = CompletionIndex(self.config_dir)
+        self.index.update(self.command_table, __version__, 'latest')
+        for command in ['demo show', 'demo item']:
+            self.index.add_parser(self._get_parser(), command)
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+
+    def _get_parser(self):
+        parser = AzCliCommandParser(self.cli)
+        parser.load_command_table(self.cli.commands_loader)
+        return parser
+
+    def _complete_with_parser(self, words, prefix):
+        # argcomplete patches the parser, so that it can complete a single command line
+        finder = AzCompletionFinder(self._get_parser(),
+                                    validator=lambda c, p: c.lower().startswith(p.lower()),
+                                    default_completer=lambda *_, **__: ())
+        return finder._get_completions(['az'] + words, prefix, '', None)  # pylint: disable=protected-access
+
+    def _complete_with_index(self, words, prefix):
+        completions = CompletionIndex(self.config_dir).get_completions(words, prefix)
+        if completions is None:
+            return None
+        return argcomplete.CompletionFinder().quote_completions(completions, '', None)
+
+    def test_completions_match_the_parser(self):
+        for line in ['', 'de', 'demo ', 'demo i', 'demo item ', 'demo item l', 'demo show ', 'demo show --c',
+                     'demo show --color ', 'demo show --color g', 'demo show --color Red ', 'demo show --force ',
+                     'demo show --force --col', 'demo show --name x -', 'demo show --tags a --force ',
+                     'demo show --color -', 'demo show --name x --color Red --force -',
+                     'demo show --label a --label b --']:
+            words = line.split(' ')
+            self.assertEqual(self._complete_with_index(words[:-1], words[-1]),
+                             self._complete_with_parser(words[:-1], words[-1]), line)
+
+    def test_completions_ignore_case(self):
+        self.assertEqual(self._complete_with_index([], 'DE'), ['demo '])
+        self.assertEqual(self._complete_with_index(['demo'], 'It'), ['item '])
+        self.assertEqual(self._complete_with_index(['demo', 'show'], '--CO'), ['--color '])
+
+    def test_completions_which_need_the_parser(self):
+        for line in ['demo show --name ', 'demo show --tags a ', 'demo show x ', 'demo show --color=', 'demo other ',
+                     'version ', 'demo show --unknown ', 'demo show -- ']:
+            words = line.split(' ')
+            self.assertIsNone(self.index.get_completions(words[:-1], words[-1]), line)
+
+    def test_complete_from_index(self):
+        output = os.path.join(self.config_dir, 'completions')
+        env = {'AZURE_CONFIG_DIR': self.config_dir, '_ARGCOMPLETE': '1', '_ARGCOMPLETE_IFS': '\n',
+               '_ARGCOMPLETE_STDOUT_FILENAME': output, 'COMP_LINE': 'az demo show --col', 'COMP_POINT': '18'}
+
+        def _complete(command_index):
+            with open(os.path.join(self.config_dir, 'commandIndex.json'), 'w') as f:
+                json.dump(command_index, f)
+            exit_method = mock.MagicMock()
+            with mock.patch.dict(os.environ, env):
+                complete_from_index(exit_method)
+            return exit_method
+
+        _complete({'version': __version__, 'cloudProfile': 'latest'}).assert_called_once_with(0)
+        with open(output) as f:
+            self.assertEqual(f.read(), '--color ')
+
+        # the index is ignored once the command index is invalidated
+        _complete({'version': '', 'cloudProfile': ''}).assert_not_called()
+
+    def test_update_drops_the_options(self):
+        self.index.update(self.command_table, __version__, 'latest')
+        self.assertIsNone(CompletionIndex(self.config_dir).get_completions(['demo', 'show'], '--c'))
+        self.assertEqual(CompletionIndex(self.config_dir).load()['groups'],
+                         {'': ['demo', 'version'], 'demo': ['show', 'item'], 'demo item': ['list']})
+
+
+if __name__ == '__main__':
+    unittest.main()
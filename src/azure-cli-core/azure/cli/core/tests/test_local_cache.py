@@ -0,0 +1,194 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from msrest.serialization import Model
+
+from azure.cli.core.azclierror import AzureResponseError
+from azure.cli.core.commands import cached_get, cached_put, upsert_to_collection
+from azure.cli.core.util import sdk_no_wait
+
+
+class Listener(Model):
+    _attribute_map = {
+        'name': {'key': 'name', 'type': 'str'},
+        'port': {'key': 'port', 'type': 'int'},
+    }
+
+    def __init__(self, **kwargs):
+        super(Listener, self).__init__(**kwargs)
+        self.name = kwargs.get('name')
+        self.port = kwargs.get('port')
+
+
+class Gateway(Model):
+    _validation = {
+        'etag': {'readonly': True},
+    }
+
+    _attribute_map = {
+        'name': {'key': 'name', 'type': 'str'},
+        'etag': {'key': 'etag', 'type': 'str'},
+        'listeners': {'key': 'properties.listeners', 'type': '[Listener]'},
+    }
+
+    def __init__(self, **kwargs):
+        super(Gateway, self).__init__(**kwargs)
+        self.name = kwargs.get('name')
+        self.etag = None
+        self.listeners = kwargs.get('listeners')
+
+    @classmethod
+    def _infer_class_models(cls):
+        # the models of the SDKs are looked up in their package
+        return {'Gateway': Gateway, 'Listener': Listener}
+
+
+class _PreconditionFailed(Exception):
+    status_code = 412
+
+
+class _Poller:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result
+
+
+class _GatewayOperations:
+    """ A service storing a single gateway, which records its requests. """
+
+    def __init__(self):
+        self.version = 1
+        self.gateway = {'name': 'gateway', 'properties': {'listeners': []}}
+        self.requests = []
+
+    def _current(self):
+        gateway = Gateway.deserialize(self.gateway)
+        gateway.etag = 'etag{}'.format(self.version)
+        return gateway
+
+    def get(self, resource_group_name, gateway_name):
+        """
+        :return: Gateway, or the result of cls(response)
+        """
+        self.requests.append(('GET', gateway_name, None))
+        return self._current()
+
+    def begin_create_or_update(self, resource_group_name, gateway_name, parameters, headers=None, **kwargs):
+        """
+        :return: An instance of LROPoller that returns either Gateway or the result of cls(response)
+        """
+        self.requests.append(('PUT', gateway_name, dict(headers or {}, **kwargs)))
+        if headers and headers.get('If-Match') != 'etag{}'.format(self.version):
+            raise _PreconditionFailed('The precondition failed')
+        self.gateway = parameters.serialize()
+        self.version += 1
+        return _Poller(self._current())
+
+
+class TestLocalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        patcher = mock.patch.dict(os.environ, {'AZURE_CONFIG_DIR': self.config_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('azure.cli.core.commands.client_factory.get_subscription_id',
+                             return_value='00000000-0000-0000-0000-000000000000')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cmd = mock.MagicMock()
+        self.cmd.command_kwargs = {'supports_local_cache': True, 'model_path': __name__}
+        self.cmd.cli_ctx.data = {}
+        self.cmd.cli_ctx.cloud.name = 'AzureCloud'
+        self.cmd.cli_ctx.config.get.return_value = '10'
+        self.client = _GatewayOperations()
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+
+    def _add_listener(self, name, defer=True, no_wait=False):
+        self.cmd.cli_ctx.data['_cache'] = defer
+        gateway = cached_get(self.cmd, self.client.get, 'rg', 'gateway')
+        upsert_to_collection(gateway, 'listeners', Listener(name=name, port=80), 'name')
+        return sdk_no_wait(no_wait, cached_put, self.cmd, self.client.begin_create_or_update, gateway, 'rg', 'gateway')
+
+    def _cache_files(self):
+        return [f for _, _, files in os.walk(os.path.join(self.config_dir, 'object_cache')) for f in files]
+
+    def test_deferred_changes_committed_with_a_single_put(self):
+        for i in range(3):
+            self._add_listener('listener{}'.format(i))
+        self.assertEqual(self.client.requests, [('GET', 'gateway', None)])
+        self.assertEqual(self._cache_files(), ['gateway.json'])
+
+        result = self._add_listener('listener3', defer=False).result()
+
+        self.assertEqual(self.client.requests, [('GET', 'gateway', None), ('PUT', 'gateway', {'If-Match': 'etag1'})])
+        self.assertEqual([l.name for l in result.listeners], ['listener{}'.format(i) for i in range(4)])
+        self.assertEqual(self._cache_files(), [])
+
+    def test_commit_conflicting_changes(self):
+        self._add_listener('listener0')
+
+        # the gateway is changed by someone else while the changes are deferred
+        self.client.version += 1
+
+        with self.assertRaisesRegex(AzureResponseError, "Gateway 'gateway' was changed since it was cached"):
+            self._add_listener('listener1', defer=False)
+        # the deferred changes are kept
+        self.assertEqual(self._cache_files(), ['gateway.json'])
+
+    def test_stale_deferred_changes_are_kept(self):
+        self._add_listener('listener0')
+        self.cmd.cli_ctx.config.get.return_value = '0'
+
+        with mock.patch('azure.cli.core.commands.logger.warning') as warning:
+            result = self._add_listener('listener1', defer=False).result()
+
+        # the stale cache isn't replaced by the object in Azure, so the deferred changes are committed too
+        self.assertIn("has changes deferred since", warning.call_args[0][0])
+        self.assertEqual(self.client.requests, [('GET', 'gateway', None), ('PUT', 'gateway', {'If-Match': 'etag1'})])
+        self.assertEqual([l.name for l in result.listeners], ['listener0', 'listener1'])
+
+    def test_stale_cache_without_etag_is_refreshed(self):
+        self._add_listener('listener0')
+        # objects cached by older versions have no ETag
+        cache_file = os.path.join(next(root for root, _, files in os.walk(self.config_dir) if files), 'gateway.json')
+        with open(cache_file) as f:
+            cached = json.load(f)
+        del cached['etag']
+        with open(cache_file, 'w') as f:
+            json.dump(cached, f)
+        self.cmd.cli_ctx.config.get.return_value = '0'
+
+        with mock.patch('azure.cli.core.commands.logger.warning') as warning:
+            result = self._add_listener('listener1', defer=False).result()
+
+        # the object is retrieved from Azure again instead of overwriting it with the stale cache
+        self.assertIn("stale in cache. Retrieving from Azure", warning.call_args[0][0])
+        self.assertEqual(self.client.requests, [('GET', 'gateway', None), ('GET', 'gateway', None),
+                                                ('PUT', 'gateway', {'If-Match': 'etag1'})])
+        self.assertEqual([l.name for l in result.listeners], ['listener1'])
+
+    def test_put_without_deferred_changes(self):
+        self._add_listener('listener0', defer=False, no_wait=True)
+
+        # the options of the request are passed to the operation, without the condition on the ETag
+        self.assertEqual(self.client.requests, [('GET', 'gateway', None), ('PUT', 'gateway', {'polling': False})])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from azure.cli.core.commands import LongRunningOperation
+from azure.cli.core.commands.lro_scheduler import LROScheduler, get_retry_after
+from azure.cli.core.mock import DummyCli
+
+
+class FakeClockScheduler(LROScheduler):
+    """Scheduler on a simulated clock. Sleeping advances the clock and completes the due fake pollers."""
+
+    def __init__(self, **kwargs):
+        super(FakeClockScheduler, self).__init__(**kwargs)
+        self.now = 0.0
+        self.pollers = []
+
+    def _clock(self):
+        return self.now
+
+    def _sleep(self, timeout):
+        pending = [p for p in self.pollers if not p.finished]
+        if any(p.callbacks for p in pending):
+            # a done callback interrupts the sleep
+            timeout = min([timeout] + [p.finish_at - self.now for p in pending if p.callbacks])
+        self.now += max(timeout, 0.0)
+        for poller in pending:
+            poller.advance(self.now)
+
+
+class FakePoller:
+    """A poller without done callbacks, completing at a given time of the simulated clock."""
+
+    def __init__(self, scheduler, finish_at, retry_after=None, result='done'):
+        self.finish_at = finish_at
+        self.finished = False
+        self.callbacks = None
+        self.done_calls = 0
+        self._result = result
+        self._response = mock.MagicMock(headers={'Retry-After': str(retry_after)} if retry_after else {})
+        scheduler.pollers.append(self)
+
+    def advance(self, now):
+        if not self.finished and now >= self.finish_at:
+            self.finished = True
+            for callback in self.callbacks or []:
+                callback(self)
+
+    def done(self):
+        self.done_calls += 1
+        return self.finished
+
+    def polling_method(self):
+        raise AttributeError()
+
+    def result(self):
+        return self._result
+
+
+class FakeCallbackPoller(FakePoller):
+
+    def __init__(self, *args, **kwargs):
+        super(FakeCallbackPoller, self).__init__(*args, **kwargs)
+        self.callbacks = []
+
+    def add_done_callback(self, func):
+        self.callbacks.append(func)
+
+
+class ThreadPoller:
+    """A poller completing on its own thread after a delay, like the SDK pollers."""
+
+    def __init__(self, delay):
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._finished = False
+        self._thread = threading.Timer(delay, self._finish)
+        self._thread.start()
+
+    def _finish(self):
+        with self._lock:
+            self._finished = True
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(self)
+
+    def done(self):
+        return self._finished
+
+    def add_done_callback(self, func):
+        with self._lock:
+            if self._finished:
+                raise ValueError('Process is complete.')
+            self._callbacks.append(func)
+
+    def result(self):
+        self._thread.join()
+        return 'done'
+
+
+class TestLROScheduler(unittest.TestCase):
+
+    def test_done_callback_wakes_up_immediately(self):
+        scheduler = FakeClockScheduler(interval=0.5)
+        poller = FakeCallbackPoller(scheduler, finish_at=10.2)
+        operation = scheduler.add(poller)
+
+        self.assertTrue(scheduler.wait(operation))
+        # the fixed 0.5 second loop would wake up 21 times and return at 10.5 seconds
+        self.assertAlmostEqual(scheduler.now, 10.2)
+        self.assertLessEqual(scheduler.wakeups, 2)
+
+    def test_adaptive_backoff_without_callbacks(self):
+        scheduler = FakeClockScheduler(interval=0.5, max_interval=10, backoff=1.5)
+        poller = FakePoller(scheduler, finish_at=30)
+        operation = scheduler.add(poller)
+
+        scheduler.wait(operation)
+        overhead = scheduler.now - poller.finish_at
+        self.assertLess(poller.done_calls, 15)
+        self.assertLessEqual(overhead, scheduler.max_interval)
+
+    def test_retry_after(self):
+        scheduler = FakeClockScheduler(interval=0.5)
+        poller = FakePoller(scheduler, finish_at=29, retry_after=15)
+        self.assertEqual(get_retry_after(poller), 15)
+        operation = scheduler.add(poller)
+
+        scheduler.wait(operation)
+        # checked at 0.5, 15.5 and 30.5 seconds
+        self.assertEqual(poller.done_calls, 4)
+        self.assertEqual(scheduler.now, 30.5)
+
+    def test_on_tick(self):
+        scheduler = FakeClockScheduler(interval=0.5)
+        ticks = []
+        poller = FakeCallbackPoller(scheduler, finish_at=2.2)
+        operation = scheduler.add(poller, on_tick=lambda: ticks.append(scheduler.now))
+
+        scheduler.wait(operation)
+        self.assertEqual(ticks, [0, 0.5, 1.0, 1.5, 2.0])
+        self.assertAlmostEqual(scheduler.now, 2.2)
+
+    def test_already_done(self):
+        scheduler = FakeClockScheduler()
+        poller = FakePoller(scheduler, finish_at=0)
+        poller.finished = True
+        operation = scheduler.add(poller)
+        self.assertFalse(scheduler.wait(operation))
+        self.assertEqual(scheduler.wakeups, 0)
+
+    def test_concurrent_waits_share_one_loop(self):
+        scheduler = LROScheduler(interval=0.05)
+        progress_bar = mock.MagicMock()
+        delays = [0.05, 0.1, 0.15, 0.2, 0.25, 0.3]
+        drivers = []
+        original_drive = scheduler._drive
+
+        def _drive(operation):
+            drivers.append(threading.get_ident())
+            self.assertTrue(scheduler._driver_lock.locked())
+            return original_drive(operation)
+
+        finished = {}
+
+        def _job(delay):
+            operation = scheduler.add(ThreadPoller(delay))
+            scheduler.wait(operation)
+            finished[delay] = time.perf_counter() - start
+
+        with mock.patch.object(scheduler, '_drive', _drive), scheduler.shared_progress(progress_bar):
+            start = time.perf_counter()
+            threads = [threading.Thread(target=_job, args=(d,)) for d in delays]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(sorted(finished), delays)
+        # the loop is handed over when the operation of the driving thread completes
+        self.assertLessEqual(len(drivers), len(delays))
+        for delay, elapsed in finished.items():
+            self.assertLess(elapsed - delay, 0.2)
+        self.assertEqual(scheduler._operations, [])
+        progress_bar.begin.assert_called_once()
+        progress_bar.end.assert_called_once()
+        self.assertEqual(progress_bar.message, 'Running ({0}/{0} done)'.format(len(delays)))
+        self.assertIsNone(scheduler.progress_bar)
+
+    def test_long_running_operation(self):
+        scheduler = FakeClockScheduler()
+        cli = DummyCli()
+        progress_bar = mock.MagicMock()
+        poller = FakeCallbackPoller(scheduler, finish_at=3.1, result={'name': 'vm1'})
+        with mock.patch('azure.cli.core.commands.get_lro_scheduler', return_value=scheduler):
+            result = LongRunningOperation(cli, progress_bar=progress_bar)(poller)
+
+        self.assertEqual(result, {'name': 'vm1'})
+        self.assertAlmostEqual(scheduler.now, 3.1)
+        progress_bar.begin.assert_called_once()
+        self.assertEqual(progress_bar.update_progress.call_count, 7)
+        progress_bar.end.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
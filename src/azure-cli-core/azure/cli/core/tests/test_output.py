@@ -3,7 +3,28 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import io
 import unittest
+from collections import OrderedDict
+from unittest import mock
+
+from knack.util import CommandResultItem
+
+FORMATTER_CORPUS = [
+    [{'name': 'vm1', 'tags': {'b': '2', 'a': '1'}, 'disks': [{'lun': 0, 'sizeGb': 128}], 'primary': True,
+      'ratio': 0.5, 'zone': None}],
+    OrderedDict([('z', 1), ('a', [1, 2]), ('m', {'k': 'v'})]),
+    [OrderedDict([('z', 'last'), ('a', 'first')]), {'b': False, 'a': 'x'}],
+    {'unicode': '\u00e9\u4e2d\U0001F600', 'escapes': '"\\\n\t\x00\x1f\x7f\u2028', 'empty': {}, 'list': []},
+    [1.5e-5, 1e16, -1e16, 1e-4, 123456789.123, 0.0, -0.0, float('nan'), float('inf'), 2 ** 70, -2 ** 63, 10 ** 20],
+    {1: 'int key', 2: (1, 2)},
+    [True, False, None, 'text', 3],
+    'plain string',
+    42,
+    True,
+    None,
+    [],
+]
 
 
 class TestCoreCLIOutput(unittest.TestCase):
@@ -41,6 +62,49 @@ class TestCoreCLIOutput(unittest.TestCase):
         yaml_output = output_producer.get_formatter('yaml')(CommandResultItem(result=OrderedDict(account_dict)))
         self.assertEqual(account_dict, yaml.safe_load(yaml_output))
 
+    def _assert_formatters_match(self):
+        import knack.output
+        from azure.cli.core import _output
+
+        for result in FORMATTER_CORPUS:
+            for format_type in ['json', 'tsv']:
+                expected = knack.output.OutputProducer._FORMAT_DICT[format_type](CommandResultItem(result))
+                actual = _output.AzOutputProducer._FORMAT_DICT[format_type](CommandResultItem(result))
+                self.assertEqual(expected, actual, '{} output of {!r}'.format(format_type, result))
+
+    def test_formatters_match_knack(self):
+        self._assert_formatters_match()
+
+    def test_formatters_match_knack_without_fast_encoder(self):
+        with mock.patch('azure.cli.core._output._get_fast_json_encoder', return_value=False):
+            self._assert_formatters_match()
+
+    def test_out_writes_in_chunks(self):
+        from azure.cli.core._output import AzOutputProducer, format_json, format_tsv
+        from azure.cli.core.mock import DummyCli
+
+        result = [{'name': 'resource{}'.format(i), 'index': i} for i in range(5000)]
+        output_producer = AzOutputProducer(DummyCli())
+        for formatter in [format_json, format_tsv]:
+            out_file = io.StringIO()
+            with mock.patch.object(out_file, 'write', wraps=out_file.write) as write, \
+                    mock.patch('azure.cli.core._output.OUTPUT_CHUNK_SIZE', 4096):
+                output_producer.out(CommandResultItem(result), formatter=formatter, out_file=out_file)
+            self.assertEqual(out_file.getvalue(), formatter(CommandResultItem(result)))
+            self.assertGreater(write.call_count, 1)
+
+    def test_out_discards_unsupported_characters(self):
+        from azure.cli.core._output import AzOutputProducer
+        from azure.cli.core.mock import DummyCli
+
+        buffer = io.BytesIO()
+        out_file = io.TextIOWrapper(buffer, encoding='ascii')
+        output_producer = AzOutputProducer(DummyCli())
+        output_producer.out(CommandResultItem(['caf\u00e9']), formatter=output_producer.get_formatter('tsv'),
+                            out_file=out_file)
+        out_file.flush()
+        self.assertEqual(buffer.getvalue(), b'caf\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,136 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from azure.cli.core import AzCommandsLoader
+from azure.cli.core.mock import DummyCli
+from azure.cli.core.perf_trace import PerfTracer, get_tracer, find_perf_trace_arg, format_http_span_name
+
+
+def sample_command(name='world'):
+    return {'hello': name}
+
+
+class TestCommandsLoader(AzCommandsLoader):
+
+    def load_command_table(self, args):
+        super(TestCommandsLoader, self).load_command_table(args)
+        with self.command_group('test', operations_tmpl='{}#{{}}'.format(__name__)) as g:
+            g.command('hello', 'sample_command')
+        return self.command_table
+
+
+class TestPerfTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        get_tracer().reset()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_find_perf_trace_arg(self):
+        self.assertEqual(find_perf_trace_arg(['vm', 'list']), (False, None))
+        self.assertEqual(find_perf_trace_arg(['vm', 'list', '--perf-trace']), (True, None))
+        self.assertEqual(find_perf_trace_arg(['vm', '--perf-trace=t.json', 'list']), (True, 't.json'))
+
+    def test_format_http_span_name_strips_query(self):
+        self.assertEqual(format_http_span_name('GET', 'https://account.blob.core.windows.net/c/b?sig=secret'),
+                         'GET account.blob.core.windows.net/c/b')
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = PerfTracer()
+        with tracer.span('outer'):
+            pass
+        tracer.add_span('manual', 0, 1)
+        self.assertEqual(tracer.events, [])
+
+    def test_chrome_trace_nesting(self):
+        tracer = PerfTracer()
+        tracer.enable()
+        with tracer.span('outer', category='test', key='value'):
+            with tracer.span('inner'):
+                time.sleep(0.001)
+        with self.assertRaises(ValueError):
+            with tracer.span('failing'):
+                raise ValueError()
+
+        events = {e['name']: e for e in tracer.to_chrome_trace()['traceEvents'] if e['ph'] == 'X'}
+        outer, inner = events['outer'], events['inner']
+        self.assertEqual(outer['cat'], 'test')
+        self.assertEqual(outer['args'], {'key': 'value'})
+        self.assertLessEqual(outer['ts'], inner['ts'])
+        self.assertGreaterEqual(outer['ts'] + outer['dur'], inner['ts'] + inner['dur'])
+        self.assertEqual(events['failing']['args'], {'error': 'ValueError'})
+
+    def test_speedscope_events_are_balanced(self):
+        tracer = PerfTracer()
+        tracer.enable()
+        tracer.add_span('inner', 1.0, 2.0)
+        tracer.add_span('outer', 1.0, 3.0)
+        tracer.add_span('next', 3.0, 4.0)
+
+        profile = tracer.to_speedscope()
+        frames = [f['name'] for f in profile['shared']['frames']]
+        events = [(e['type'], frames[e['frame']]) for e in profile['profiles'][0]['events']]
+        self.assertEqual(events, [('O', 'outer'), ('O', 'inner'), ('C', 'inner'), ('C', 'outer'),
+                                  ('O', 'next'), ('C', 'next')])
+
+    def test_perf_trace_flag(self):
+        trace_file = os.path.join(self.temp_dir, 'trace.json')
+        cli = DummyCli(commands_loader_cls=TestCommandsLoader)
+        with open(os.devnull, 'w') as out_file:
+            exit_code = cli.invoke(['test', 'hello', '--perf-trace={}'.format(trace_file)], out_file=out_file)
+        self.assertEqual(exit_code, 0)
+        self.assertFalse(get_tracer().enabled)
+
+        with open(trace_file) as f:
+            names = [e['name'] for e in json.load(f)['traceEvents'] if e['ph'] == 'X']
+        for phase in ['load_command_table', 'load_arguments', 'parser.load_command_table', 'parse_args',
+                      'validation', 'execute', 'handler', 'todict', 'transform_result', 'output', 'az test hello']:
+            self.assertIn(phase, names)
+
+    def test_perf_trace_flag_with_file_value(self):
+        trace_file = os.path.join(self.temp_dir, 'trace.json')
+        cli = DummyCli(commands_loader_cls=TestCommandsLoader)
+        with open(os.devnull, 'w') as out_file:
+            exit_code = cli.invoke(['test', 'hello', '--name', 'secret', '--perf-trace', trace_file],
+                                   out_file=out_file)
+        self.assertEqual(exit_code, 0)
+
+        with open(trace_file) as f:
+            content = f.read()
+        # the trace is named after the command, the values of the arguments are never recorded
+        self.assertIn('az test hello', [e['name'] for e in json.loads(content)['traceEvents']])
+        self.assertNotIn('secret', content)
+
+    def test_perf_trace_policy(self):
+        from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext
+        from azure.core.pipeline.transport import HttpRequest
+        from azure.cli.core.sdk.policies import PerfTracePolicy
+
+        get_tracer().enable()
+        policy = PerfTracePolicy()
+        request = PipelineRequest(HttpRequest('GET', 'https://management.azure.com/subscriptions?api-version=1'),
+                                  PipelineContext(None))
+        policy.on_request(request)
+        http_response = mock.MagicMock(status_code=200)
+        policy.on_response(request, PipelineResponse(request.http_request, http_response, request.context))
+
+        event = get_tracer().events[0]
+        self.assertEqual(event['name'], 'GET management.azure.com/subscriptions')
+        self.assertEqual(event['cat'], 'http')
+        self.assertEqual(event['args'], {'status_code': 200})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1854,6 +1854,8 @@ class TestProfile(unittest.TestCase):
         r = profile.auth_ctx_factory(cli, 'common', None)
         self.assertEqual(r.authority.url, aad_url + '/common')
 
+    # the mocks return their results in the order of the calls, so find the tenants one by one
+    @mock.patch('azure.cli.core._profile._TENANT_DISCOVERY_WORKERS', 1)
     @mock.patch('adal.AuthenticationContext', autospec=True)
     @mock.patch('azure.cli.core._profile._get_authorization_code', autospec=True)
     def test_find_using_common_tenant(self, _get_authorization_code_mock, mock_auth_context):
@@ -1877,6 +1879,8 @@ class TestProfile(unittest.TestCase):
         self.assertEqual(len(all_subscriptions), 1)
         self.assertEqual(all_subscriptions[0].tenant_id, self.tenant_id)
 
+    # the mocks return their results in the order of the calls, so find the tenants one by one
+    @mock.patch('azure.cli.core._profile._TENANT_DISCOVERY_WORKERS', 1)
     @mock.patch('adal.AuthenticationContext', autospec=True)
     @mock.patch('azure.cli.core._profile._get_authorization_code', autospec=True)
     def test_find_using_common_tenant_mfa_warning(self, _get_authorization_code_mock, mock_auth_context):
@@ -1919,6 +1923,83 @@ class TestProfile(unittest.TestCase):
 
         # With pytest, use -o log_cli=True to manually check the log
 
+    @mock.patch('azure.cli.core._profile._TENANT_DISCOVERY_TIMEOUT', 0.5)
+    def test_find_using_common_tenant_concurrently(self):
+        """Tenants are found concurrently. Failures are isolated per tenant and the results keep the tenant order"""
+        import threading
+        import time
+        cli = DummyCli()
+        tenant_ids = ['tenant{}'.format(i) for i in range(6)]
+        mfa_tenant, failed_tenant, stuck_tenant = tenant_ids[1], tenant_ids[3], tenant_ids[4]
+        unblock = threading.Event()
+        concurrency = {'running': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def _auth_context_factory(_, tenant, _1):
+            def _acquire_token(*_):
+                with lock:
+                    concurrency['running'] += 1
+                    concurrency['max'] = max(concurrency['max'], concurrency['running'])
+                # tenants listed first complete last
+                time.sleep(0.05 * (len(tenant_ids) - tenant_ids.index(tenant)))
+                with lock:
+                    concurrency['running'] -= 1
+                if tenant == mfa_tenant:
+                    raise AdalError('', {'error_description': 'AADSTS50076: MFA required'})
+                if tenant == stuck_tenant:
+                    unblock.wait(5)
+                return {'accessToken': tenant}
+            return mock.MagicMock(acquire_token=_acquire_token)
+
+        def _arm_client_factory(credentials):
+            tenant = credentials.access_token
+            client = mock.MagicMock()
+            client.tenants.list.return_value = [TenantStub(t) for t in tenant_ids]
+            if tenant == failed_tenant:
+                client.subscriptions.list.side_effect = ValueError('failed to list')
+            else:
+                # the same subscription is accessible from every tenant, plus one of the tenant's own
+                client.subscriptions.list.return_value = [
+                    SubscriptionStub('subscriptions/shared', 'shared', self.state1, 'home'),
+                    SubscriptionStub('subscriptions/' + tenant, tenant, self.state1, 'home')]
+            return client
+
+        finder = SubscriptionFinder(cli, _auth_context_factory, None, _arm_client_factory)
+        finder.user_id = self.user1
+        with mock.patch('azure.cli.core._profile.logger.warning') as warning:
+            all_subscriptions = finder._find_using_common_tenant(access_token='common',
+                                                                 resource='https://management.core.windows.net/')
+        unblock.set()
+
+        self.assertGreater(concurrency['max'], 1)
+        self.assertEqual(finder.tenants, ['tenant0', 'tenant2', 'tenant5'])
+        self.assertEqual([(s.subscription_id, s.tenant_id) for s in all_subscriptions],
+                         [('shared', 'tenant0'), ('tenant0', 'tenant0'), ('tenant2', 'tenant2'),
+                          ('tenant5', 'tenant5')])
+        messages = [args[0] % args[1:] for args, _ in warning.call_args_list]
+        self.assertIn("Failed to find subscriptions under tenant 'tenant3' due to error 'failed to list'", messages)
+        self.assertIn("Timed out finding subscriptions under tenant 'tenant4'. It will be skipped.", messages)
+        self.assertEqual(messages[-1], 'tenant1 \'DISPLAY_NAME\'')
+
+    @mock.patch('azure.cli.core._profile._TENANT_DISCOVERY_WORKERS', 1)
+    def test_find_using_common_tenant_serially_fails_on_listing_error(self):
+        """With a single worker, an error listing the subscriptions of a tenant fails the login as before"""
+        cli = DummyCli()
+        tenant_ids = ['tenant0', 'tenant1']
+
+        def _arm_client_factory(credentials):
+            client = mock.MagicMock()
+            client.tenants.list.return_value = [TenantStub(t) for t in tenant_ids]
+            client.subscriptions.list.side_effect = ValueError('failed to list')
+            return client
+
+        auth_context = mock.MagicMock()
+        auth_context.acquire_token.return_value = {'accessToken': 'token'}
+        finder = SubscriptionFinder(cli, lambda *_: auth_context, None, _arm_client_factory)
+        finder.user_id = self.user1
+        with self.assertRaisesRegex(ValueError, 'failed to list'):
+            finder._find_using_common_tenant(access_token='common', resource='https://management.core.windows.net/')
+
     @mock.patch('adal.AuthenticationContext', autospec=True)
     @mock.patch('azure.cli.core._profile._get_authorization_code', autospec=True)
     def test_find_using_specific_tenant(self, _get_authorization_code_mock, mock_auth_context):
@@ -0,0 +1,83 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import io
+import json
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+import jmespath
+
+from azure.cli.core import AzCommandsLoader
+from azure.cli.core._query import AzQuery, compile_query
+from azure.cli.core.commands import AzCliCommand
+from azure.cli.core.mock import DummyCli
+
+RESOURCE_ID = '/subscriptions/sub/resourceGroups/{}/providers/Microsoft.Compute/virtualMachines/{}'
+RESOURCES = [
+    {'name': 'vm1', 'id': RESOURCE_ID.format('rg1', 'vm1'), 'tags': {'env': 'prod'},
+     'powerState': 'VM running', 'disks': [1, 2]},
+    {'name': 'vm2', 'id': RESOURCE_ID.format('RG2', 'vm2'), 'tags': None,
+     'powerState': 'VM stopped', 'disks': []},
+    {'name': 'web3', 'id': RESOURCE_ID.format('rg1', 'web3'), 'powerState': 'VM running'},
+    [{'name': 'nested'}],
+]
+
+
+class TestQuery(unittest.TestCase):
+
+    def test_streamable_expressions(self):
+        for expression in ['[].id', '[*].name', '[].{n: name, env: tags.env}', "[?powerState=='VM running'].name",
+                           '[?tags]', 'length(@)', '[].disks[0]']:
+            self.assertTrue(AzQuery(jmespath.compile(expression)).streamable, expression)
+        for expression in ['[0]', 'length([])', '[].id | [0]', 'sort_by(@, &name)', 'max_by(@, &name).name',
+                           'a[].id', '@', "[?name=='vm1'] | [0]"]:
+            self.assertFalse(AzQuery(jmespath.compile(expression)).streamable, expression)
+
+    def test_search_items_matches_search(self):
+        options = jmespath.Options(OrderedDict)
+        for expression in ['[].id', '[*].name', '[].{n: name, env: tags.env}', "[?powerState=='VM running'].name",
+                           '[?tags]', 'length(@)', '[].disks[0]', "[?contains(name || '', 'vm')].{name: name}"]:
+            query = AzQuery(jmespath.compile(expression))
+            for data in [RESOURCES, []]:
+                self.assertEqual(query.search_items(iter(data), options), query.search(data, options), expression)
+
+    def test_compile_query_is_cached(self):
+        compile_query.cache_clear()
+        query = compile_query('[].name')
+        self.assertIs(compile_query('[].name'), query)
+        self.assertEqual(query.expression, '[].name')
+        compile_query.cache_clear()
+
+    def test_query_is_applied_while_paging(self):
+        from azure.core.paging import ItemPaged
+
+        def _handler(_):
+            pages = [RESOURCES[:2], RESOURCES[2:3]]
+            return ItemPaged(lambda token: pages[int(token or 0)],
+                             lambda page: (str(pages.index(page) + 1) if pages.index(page) + 1 < len(pages) else None,
+                                           iter(page)))
+
+        class TestCommandsLoader(AzCommandsLoader):
+
+            def load_command_table(self, args):
+                super(TestCommandsLoader, self).load_command_table(args)
+                self.command_table = {'test': AzCliCommand(self, 'test', _handler)}
+                return self.command_table
+
+        for expression in ['[].name', "[?powerState=='VM running'].{name: name, rg: resourceGroup}", 'length(@)']:
+            cli = DummyCli(commands_loader_cls=TestCommandsLoader)
+            out_file = io.StringIO()
+            with mock.patch.object(AzQuery, 'search', autospec=True, side_effect=AzQuery.search) as search:
+                cli.invoke(['test', '--query', expression], out_file=out_file)
+            search.assert_not_called()
+            expected = jmespath.search(expression, [dict(r, resourceGroup=r['id'].split('/')[4])
+                                                    for r in RESOURCES[:3]])
+            self.assertEqual(json.loads(out_file.getvalue()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
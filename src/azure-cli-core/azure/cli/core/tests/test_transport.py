@@ -0,0 +1,154 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import ssl
+import threading
+import unittest
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+from msrest.service_client import SDKClient
+from msrestazure import AzureConfiguration
+
+from azure.cli.core import AzCommandsLoader
+from azure.cli.core._transport import close_pools, create_requests_transport, create_session, use_pooled_adapters
+from azure.cli.core.commands import AzCliCommand
+from azure.cli.core.mock import DummyCli
+
+CERT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sp_cert.pem')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class _TLSServer(ThreadingHTTPServer):
+    """An HTTPS server counting the TLS handshakes of its clients."""
+    daemon_threads = True
+
+    def __init__(self):
+        super(_TLSServer, self).__init__(('localhost', 0), _Handler)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(CERT_FILE)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.handshakes = 0
+        self.url = 'https://localhost:{}'.format(self.server_address[1])
+
+    def get_request(self):
+        request = super(_TLSServer, self).get_request()
+        self.handshakes += 1
+        return request
+
+
+class _Track1Client(SDKClient):
+
+    def __init__(self, credentials, subscription_id, base_url=None):
+        self.config = AzureConfiguration(base_url)
+        self.subscription_id = subscription_id
+        super(_Track1Client, self).__init__(credentials, self.config)
+
+    def get(self, url):
+        return self._client.send(self._client.get(url)).json()
+
+
+class _Credential:
+
+    def get_token(self, *_, **__):  # pylint: disable=no-self-use
+        from azure.core.credentials import AccessToken
+        return AccessToken('token', 9999999999)
+
+    def signed_session(self, session=None):  # pylint: disable=no-self-use
+        session = session or requests.Session()
+        session.headers['Authorization'] = 'Bearer token'
+        return session
+
+
+class TestTransport(unittest.TestCase):
+
+    def setUp(self):
+        close_pools()
+        self.server = _TLSServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        warnings.simplefilter('ignore', requests.packages.urllib3.exceptions.InsecureRequestWarning)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        close_pools()
+        warnings.resetwarnings()
+
+    def test_clients_share_connections(self):
+        from azure.core import PipelineClient
+        from azure.core.pipeline.transport import HttpRequest
+
+        # pylint: disable=protected-access
+        for _ in range(2):
+            client = PipelineClient(self.server.url, transport=create_requests_transport(connection_verify=False))
+            with client:
+                client._pipeline.run(HttpRequest('GET', self.server.url + '/track2'))
+
+            client = _Track1Client(None, None, base_url=self.server.url)
+            client.config.connection.verify = False
+            use_pooled_adapters(client.config)
+            client.get('/track1')
+
+            create_session().get(self.server.url + '/raw', verify=False).close()
+        self.assertEqual(self.server.handshakes, 1)
+
+        # sessions which don't use the shared pools open their own connections
+        for _ in range(2):
+            with requests.Session() as session:
+                session.get(self.server.url + '/raw', verify=False)
+        self.assertEqual(self.server.handshakes, 3)
+
+    @mock.patch.dict(os.environ, {'AZURE_CLI_DISABLE_CONNECTION_VERIFICATION': '1'})
+    @mock.patch('azure.cli.core._profile.Profile.get_login_credentials', autospec=True)
+    def test_multi_client_command(self, get_login_credentials):
+        from azure.cli.core.commands.client_factory import get_mgmt_service_client
+        from azure.cli.core.profiles import ResourceType
+        from azure.cli.core.util import send_raw_request
+
+        subscription_id = '00000000-0000-0000-0000-000000000000'
+        get_login_credentials.return_value = (_Credential(), subscription_id, 'tenant')
+
+        def _handler(_):
+            for _ in range(2):
+                get_mgmt_service_client(cli, ResourceType.MGMT_RESOURCE_RESOURCES).resource_groups.get('rg')
+                get_mgmt_service_client(cli, _Track1Client).get('/subscriptions/' + subscription_id)
+                send_raw_request(cli, 'GET', self.server.url + '/raw', skip_authorization_header=True)
+
+        class TestCommandsLoader(AzCommandsLoader):
+
+            def load_command_table(self, args):
+                super(TestCommandsLoader, self).load_command_table(args)
+                self.command_table = {'test': AzCliCommand(self, 'test', _handler)}
+                return self.command_table
+
+        cli = DummyCli(commands_loader_cls=TestCommandsLoader)
+        cli.cloud.endpoints.resource_manager = self.server.url
+        self.assertEqual(cli.invoke(['test']), 0)
+        self.assertEqual(self.server.handshakes, 1)
+
+        # the connections are closed when the command completes
+        self.assertEqual(cli.invoke(['test']), 0)
+        self.assertEqual(self.server.handshakes, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
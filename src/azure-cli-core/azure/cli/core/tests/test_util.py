@@ -6,6 +6,7 @@
 # pylint: disable=line-too-long
 from collections import namedtuple
 import os
+import shutil
 import sys
 import unittest
 from unittest import mock
@@ -16,7 +17,7 @@ from azure.cli.core.util import \
     (get_file_json, truncate_text, shell_safe_json_parse, b64_to_hex, hash_string, random_string,
      open_page_in_browser, can_launch_browser, handle_exception, ConfiguredDefaultSetter, send_raw_request,
      should_disable_connection_verify, parse_proxy_resource_id, get_az_user_agent, get_az_rest_user_agent,
-     _get_parent_proc_name, is_wsl)
+     _get_parent_proc_name, is_wsl, write_file_json)
 from azure.cli.core.mock import DummyCli
 
 
@@ -41,6 +42,23 @@ class TestUtils(unittest.TestCase):
                 self.assertTrue(str(ex).find(
                     'contains error: Expecting value: line 1 column 1 (char 0)'))
 
+    def test_write_file_json(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        pathname = os.path.join(directory, 'data.json')
+        with open(pathname, 'w') as f:
+            f.write('{"key1": "value1"}')
+
+        write_file_json(pathname, {'key2': 'value2'}, separators=(',', ':'))
+        with open(pathname) as f:
+            self.assertEqual(f.read(), '{"key2":"value2"}')
+
+        # the file is kept and the temporary file is removed if the data can't be written
+        with self.assertRaises(TypeError):
+            write_file_json(pathname, {'key3': object()})
+        self.assertEqual(get_file_json(pathname), {'key2': 'value2'})
+        self.assertEqual(os.listdir(directory), ['data.json'])
+
     def test_truncate_text(self):
         expected = 'stri [...]'
         actual = truncate_text('string to shorten', width=10)
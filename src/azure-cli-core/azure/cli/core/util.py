@@ -497,6 +497,23 @@ def read_file_content(file_path, allow_binary=False):
     raise CLIError('Failed to decode file {} - unknown decoding'.format(file_path))
 
 
+def write_file_json(file_path, data, **kwargs):
+    """ Write data as JSON to a file, replacing the file atomically so that concurrent commands never read a
+    partial file. kwargs are passed to json.dump. If writing fails, the temporary file is removed and the error is
+    raised. """
+    temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **kwargs)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
 def shell_safe_json_parse(json_or_dict_string, preserve_order=False, strict=True):
     """ Allows the passing of JSON or Python dictionary strings. This is needed because certain
     JSON strings in CMD shell are not received in main's argv. This allows the user to specify
@@ -804,8 +821,9 @@ def send_raw_request(cli_ctx, method, url, headers=None, uri_parameters=None,  #
                      body=None, skip_authorization_header=False, resource=None, output_file=None,
                      generated_client_request_id_name='x-ms-client-request-id'):
     import uuid
-    from requests import Session, Request
+    from requests import Request
     from requests.structures import CaseInsensitiveDict
+    from azure.cli.core._transport import create_session
 
     result = CaseInsensitiveDict()
     for s in headers or []:
@@ -918,7 +936,7 @@ def send_raw_request(cli_ctx, method, url, headers=None, uri_parameters=None,  #
                            "If access token is required, use --resource to specify the resource")
 
     # https://requests.readthedocs.io/en/latest/user/advanced/#prepared-requests
-    s = Session()
+    s = create_session()
     req = Request(method=method, url=url, headers=headers, params=uri_parameters, data=body)
     prepped = s.prepare_request(req)
 
@@ -5,11 +5,16 @@
 
 import os
 import json
+import time
 import shlex
+import atexit
+import shutil
 import logging
 import inspect
 import unittest
 import tempfile
+import threading
+from unittest import mock
 
 from azure_devtools.scenario_tests import (IntegrationTestBase, ReplayableTest, SubscriptionRecordingProcessor,
                                            OAuthRequestResponsesFilter, LargeRequestBodyProcessor,
@@ -23,7 +28,7 @@ from .patches import (patch_load_cached_subscriptions, patch_main_exception_hand
                       patch_progress_controller, patch_get_current_system_username)
 from .exceptions import CliExecutionError
 from .utilities import find_recording_dir, StorageAccountKeyReplacer, GraphClientPasswordReplacer, GeneralNameReplacer
-from .reverse_dependency import get_dummy_cli
+from .reverse_dependency import get_dummy_cli, get_global_config_dir
 
 logger = logging.getLogger('azure.cli.testsdk')
 
@@ -31,6 +36,58 @@ logger = logging.getLogger('azure.cli.testsdk')
 ENV_COMMAND_COVERAGE = 'AZURE_CLI_TEST_COMMAND_COVERAGE'
 COVERAGE_FILE = 'az_command_coverage.txt'
 
+ENV_TEST_TIMINGS = 'AZURE_CLI_TEST_TIMINGS'
+TIMINGS_FILE = 'az_test_timings.txt'
+
+
+class _TestWorker(object):
+    """ The state shared by the scenario tests which run in a process.
+
+    Each test replayed in the process gets a config directory of its own, so that the tests can run in parallel
+    processes without sharing ~/.azure. The files which are expensive to rebuild, such as the command index which
+    tells the command loader which modules to load, are carried over from a test to the next one.
+    """
+    WARM_CONFIG_FILES = ['commandIndex.json', 'versionCheck.json']
+
+    def __init__(self):
+        # vcrpy and the sessions of the CLI are process-wide, so the tests run by threads are serialized
+        self.lock = threading.Lock()
+        self._config_dir = None
+        self._warm_config_files = self._read_warm_config_files(get_global_config_dir())
+        atexit.register(self.remove_config_dir)
+
+    def _read_warm_config_files(self, config_dir):
+        warm_config_files = {}
+        for name in self.WARM_CONFIG_FILES:
+            try:
+                with open(os.path.join(config_dir, name), 'rb') as f:
+                    warm_config_files[name] = f.read()
+            except (OSError, IOError):
+                pass
+        return warm_config_files
+
+    def create_config_dir(self):
+        """ Create the config directory of a test, with the warm files of the previous one. """
+        self.remove_config_dir()
+        # Named like ~/.azure, as the local context is saved in a directory of the same name
+        config_dir = os.path.join(tempfile.mkdtemp(prefix='azclitest'), '.azure')
+        os.mkdir(config_dir)
+        for name, content in self._warm_config_files.items():
+            with open(os.path.join(config_dir, name), 'wb') as f:
+                f.write(content)
+        self._config_dir = config_dir
+        return config_dir
+
+    def remove_config_dir(self):
+        # The directory is kept until the next test, as the sessions of the CLI are still loaded from it
+        if self._config_dir:
+            self._warm_config_files.update(self._read_warm_config_files(self._config_dir))
+            shutil.rmtree(os.path.dirname(self._config_dir), ignore_errors=True)
+            self._config_dir = None
+
+
+_worker = _TestWorker()
+
 
 class CheckerMixin(object):
 
@@ -80,10 +137,11 @@ class CheckerMixin(object):
 class ScenarioTest(ReplayableTest, CheckerMixin, unittest.TestCase):
     def __init__(self, method_name, config_file=None, recording_name=None,
                  recording_processors=None, replay_processors=None, recording_patches=None, replay_patches=None):
-        self.cli_ctx = get_dummy_cli()
+        self._cli_ctx = None
         self.name_replacer = GeneralNameReplacer()
         self.kwargs = {}
         self.test_guid_count = 0
+        self._command_timings = []
         self._processors_to_reset = [StorageAccountKeyReplacer(), GraphClientPasswordReplacer()]
         default_recording_processors = [
             SubscriptionRecordingProcessor(MOCKED_SUBSCRIPTION_ID),
@@ -131,11 +189,54 @@ class ScenarioTest(ReplayableTest, CheckerMixin, unittest.TestCase):
             recording_name=recording_name
         )
 
+    @property
+    def cli_ctx(self):
+        # Created when the test is set up, rather than when all the tests are collected
+        if self._cli_ctx is None:
+            self._cli_ctx = get_dummy_cli()
+        return self._cli_ctx
+
+    @cli_ctx.setter
+    def cli_ctx(self, value):
+        self._cli_ctx = value
+
+    def setUp(self):
+        _worker.lock.acquire()
+        self.addCleanup(_worker.lock.release)
+        if os.environ.get(ENV_TEST_TIMINGS, None):
+            self.addCleanup(self._write_timing, time.time())
+
+        if self.in_recording:
+            self.cli_ctx = get_dummy_cli()
+        else:
+            # The CLI is created before the cassette is loaded, in case it checks the latest versions
+            config_dir = _worker.create_config_dir()
+            self.set_env('AZURE_CONFIG_DIR', config_dir)
+            patcher = mock.patch('azure.cli.core.cloud.CLOUD_CONFIG_FILE', os.path.join(config_dir, 'clouds.config'))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+            self.cli_ctx = get_dummy_cli(config_dir=config_dir)
+        super(ScenarioTest, self).setUp()
+
     def tearDown(self):
         for processor in self._processors_to_reset:
             processor.reset()
         super(ScenarioTest, self).tearDown()
 
+    def _write_timing(self, start_time):
+        timing = {
+            'test': self.id(),
+            'recording': self.recording_file,
+            'mode': 'recording' if self.in_recording else 'playback',
+            'seconds': round(time.time() - start_time, 3),
+            'commands': len(self._command_timings)
+        }
+        if self._command_timings:
+            seconds, command = max(self._command_timings)
+            timing.update({'slowestCommand': command, 'slowestCommandSeconds': round(seconds, 3)})
+        with open(TIMINGS_FILE, 'a') as timings_file:
+            timings_file.write(json.dumps(timing) + '\n')
+
     def create_random_name(self, prefix, length):
         self.test_resources_count += 1
         moniker = '{}{:06}'.format(prefix, self.test_resources_count)
@@ -164,7 +265,12 @@ class ScenarioTest(ReplayableTest, CheckerMixin, unittest.TestCase):
 
     def cmd(self, command, checks=None, expect_failure=False):
         command = self._apply_kwargs(command)
-        return execute(self.cli_ctx, command, expect_failure=expect_failure).assert_with_checks(checks)
+        start_time = time.time()
+        try:
+            result = execute(self.cli_ctx, command, expect_failure=expect_failure)
+        finally:
+            self._command_timings.append((time.time() - start_time, command))
+        return result.assert_with_checks(checks)
 
     def get_subscription_id(self):
         if self.in_recording or self.is_live:
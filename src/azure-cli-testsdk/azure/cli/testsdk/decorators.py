@@ -9,9 +9,9 @@ import pytest
 
 
 def api_version_constraint(resource_type, **kwargs):
-    from .reverse_dependency import get_dummy_cli, get_support_api_version_func
+    from .reverse_dependency import get_cached_dummy_cli, get_support_api_version_func
 
-    return unittest.skipUnless(get_support_api_version_func()(get_dummy_cli(), resource_type, **kwargs),
+    return unittest.skipUnless(get_support_api_version_func()(get_cached_dummy_cli(), resource_type, **kwargs),
                                "Test not supported by current profile.")
 
 
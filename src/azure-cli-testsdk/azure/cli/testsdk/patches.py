@@ -85,7 +85,7 @@ def patch_long_run_operation_delay(unit_test):
                       'msrestazure.polling.arm_polling.ARMPolling._delay',
                       _shortcut_long_run_operation)
     mock_in_unit_test(unit_test,
-                      'azure.cli.core.commands.LongRunningOperation._delay',
+                      'azure.cli.core.commands.lro_scheduler.LROScheduler._sleep',
                       _shortcut_long_run_operation)
 
 
@@ -10,7 +10,7 @@ from azure_devtools.scenario_tests import AbstractPreparer, SingleValueReplacer
 
 from .base import LiveScenarioTest
 from .exceptions import CliTestError
-from .reverse_dependency import get_dummy_cli
+from .reverse_dependency import get_cached_dummy_cli
 from .utilities import StorageAccountKeyReplacer, GraphClientPasswordReplacer
 
 KEY_RESOURCE_GROUP = 'rg'
@@ -57,7 +57,7 @@ class ResourceGroupPreparer(NoTrafficRecordingPreparer, SingleValueReplacer):
         if ' ' in name_prefix:
             raise CliTestError('Error: Space character in resource group name prefix \'%s\'' % name_prefix)
         super(ResourceGroupPreparer, self).__init__(name_prefix, random_name_length)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.location = location
         self.subscription = subscription
         self.parameter_name = parameter_name
@@ -102,7 +102,7 @@ class StorageAccountPreparer(NoTrafficRecordingPreparer, SingleValueReplacer):
                  parameter_name='storage_account', resource_group_parameter_name='resource_group', skip_delete=True,
                  dev_setting_name='AZURE_CLI_TEST_DEV_STORAGE_ACCOUNT_NAME', key='sa'):
         super(StorageAccountPreparer, self).__init__(name_prefix, length)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.location = location
         self.sku = sku
         self.kind = kind
@@ -158,7 +158,7 @@ class KeyVaultPreparer(NoTrafficRecordingPreparer, SingleValueReplacer):
                  parameter_name='key_vault', resource_group_parameter_name='resource_group', skip_delete=False,
                  dev_setting_name='AZURE_CLI_TEST_DEV_KEY_VAULT_NAME', key='kv', name_len=24, additional_params=None):
         super(KeyVaultPreparer, self).__init__(name_prefix, name_len)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.location = location
         self.sku = sku
         self.enable_soft_delete = enable_soft_delete
@@ -214,7 +214,7 @@ class RoleBasedServicePrincipalPreparer(NoTrafficRecordingPreparer, SingleValueR
                  dev_setting_sp_name='AZURE_CLI_TEST_DEV_SP_NAME',
                  dev_setting_sp_password='AZURE_CLI_TEST_DEV_SP_PASSWORD', key='sp'):
         super(RoleBasedServicePrincipalPreparer, self).__init__(name_prefix, 24)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.skip_assignment = skip_assignment
         self.result = {}
         self.parameter_name = parameter_name
@@ -259,7 +259,7 @@ class ManagedApplicationPreparer(AbstractPreparer, SingleValueReplacer):
                  dev_setting_app_name='AZURE_CLI_TEST_DEV_APP_NAME',
                  dev_setting_app_secret='AZURE_CLI_TEST_DEV_APP_SECRET', key='app'):
         super(ManagedApplicationPreparer, self).__init__(name_prefix, 24)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.parameter_name = parameter_name
         self.parameter_secret = parameter_secret
         self.result = {}
@@ -298,7 +298,7 @@ class VirtualNetworkPreparer(NoTrafficRecordingPreparer, SingleValueReplacer):
                 'Error: Space character in name prefix \'%s\'' % name_prefix)
         super(VirtualNetworkPreparer, self).__init__(
             name_prefix, random_name_length)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.location = location
         self.parameter_name = parameter_name
         self.key = key
@@ -355,7 +355,7 @@ class VnetNicPreparer(NoTrafficRecordingPreparer, SingleValueReplacer):
             raise CliTestError(
                 'Error: Space character in name prefix \'%s\'' % name_prefix)
         super(VnetNicPreparer, self).__init__(name_prefix, 15)
-        self.cli_ctx = get_dummy_cli()
+        self.cli_ctx = get_cached_dummy_cli()
         self.parameter_name = parameter_name
         self.key = key
         self.resource_group_parameter_name = resource_group_parameter_name
@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+from functools import lru_cache
 from importlib import import_module
 
 DUMMY_CLI_TYPE = 'DummyCli'
@@ -14,6 +15,12 @@ def get_dummy_cli(*args, **kwargs):
     return getattr(mod, 'DummyCli')(*args, **kwargs)
 
 
+@lru_cache(maxsize=None)
+def get_cached_dummy_cli():
+    """ A dummy CLI shared in the process, for the preparers and decorators to be constructed with. """
+    return get_dummy_cli()
+
+
 def get_support_api_version_func():
     mod = import_module('azure.cli.core.profiles')
     return getattr(mod, 'supported_api_version')
@@ -22,3 +29,8 @@ def get_support_api_version_func():
 def get_commands_loggers():
     mod = import_module('azure.cli.core.commands')
     return getattr(mod, 'logger')
+
+
+def get_global_config_dir():
+    mod = import_module('azure.cli.core._config')
+    return getattr(mod, 'GLOBAL_CONFIG_DIR')
@@ -0,0 +1,57 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Report the slowest recordings from the timings written by the scenario tests.
+
+Run the tests with AZURE_CLI_TEST_TIMINGS=True, then:
+
+    python -m azure.cli.testsdk.timings [--file az_test_timings.txt] [--top 20]
+"""
+
+import argparse
+import json
+
+from .base import TIMINGS_FILE
+
+
+def load_timings(path=TIMINGS_FILE):
+    """ Load the timings of the tests, keeping the last run of each test. """
+    timings = {}
+    with open(path, 'r') as timings_file:
+        for line in timings_file:
+            line = line.strip()
+            if line:
+                timing = json.loads(line)
+                timings[timing['test']] = timing
+    return list(timings.values())
+
+
+def get_slowest_recordings(timings, top=20):
+    return sorted(timings, key=lambda t: t['seconds'], reverse=True)[:top]
+
+
+def format_timings(timings):
+    lines = ['{:>9} {:>8}  {}'.format('Seconds', 'Commands', 'Recording (slowest command)')]
+    for timing in timings:
+        lines.append('{:>9.3f} {:>8}  {}'.format(timing['seconds'], timing['commands'], timing['recording']))
+        if timing.get('slowestCommand'):
+            lines.append('{:>9.3f} {:>8}    az {}'.format(timing['slowestCommandSeconds'], '',
+                                                       timing['slowestCommand']))
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Report the slowest recordings of the scenario tests.')
+    parser.add_argument('--file', default=TIMINGS_FILE, help='The timings written by the tests.')
+    parser.add_argument('--top', type=int, default=20, help='The number of recordings to report.')
+    args = parser.parse_args(args)
+
+    timings = load_timings(args.file)
+    print('{} tests, {:.1f} seconds'.format(len(timings), sum(t['seconds'] for t in timings)))
+    print(format_timings(get_slowest_recordings(timings, args.top)))
+
+
+if __name__ == '__main__':
+    main()
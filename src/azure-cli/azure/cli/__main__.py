@@ -8,6 +8,7 @@ import timeit
 # Log the start time
 start_time = timeit.default_timer()
 
+import os
 import sys
 import uuid
 
@@ -35,6 +36,11 @@ def cli_main(cli, args):
     return cli.invoke(args)
 
 
+# Answer tab completion from the completion index when possible, without loading the command modules
+if ARGCOMPLETE_ENV_NAME in os.environ:
+    from azure.cli.core._completion import complete_from_index
+    complete_from_index()
+
 az_cli = get_default_cli()
 
 telemetry.set_application(az_cli, ARGCOMPLETE_ENV_NAME)
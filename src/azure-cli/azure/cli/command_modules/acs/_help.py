@@ -750,6 +750,32 @@ examples:
     crafted: true
 """
 
+helps['aks get-credentials-batch'] = """
+type: command
+short-summary: Get access credentials for many managed Kubernetes clusters at once.
+long-summary: >
+    Credentials of all clusters in the resource group (or subscription) are fetched concurrently and merged
+    into the .kube/config file with a single write.
+parameters:
+  - name: --admin -a
+    type: bool
+    short-summary: "Get cluster administrator credentials.  Default: cluster user credentials."
+  - name: --file -f
+    type: string
+    short-summary: Kubernetes configuration file to update. Use "-" to print YAML to stdout instead.
+  - name: --overwrite-existing
+    type: bool
+    short-summary: Overwrite any existing cluster entry with the same name.
+  - name: --public-fqdn
+    type: bool
+    short-summary: Get private cluster credential with server address to be public fqdn.
+examples:
+  - name: Get access credentials for every managed Kubernetes cluster in a resource group.
+    text: az aks get-credentials-batch --resource-group MyResourceGroup
+  - name: Get access credentials for two managed Kubernetes clusters, replacing entries with the same name.
+    text: az aks get-credentials-batch --resource-group MyResourceGroup --names MyCluster1 MyCluster2 --overwrite-existing
+"""
+
 helps['aks get-upgrades'] = """
 type: command
 short-summary: Get the upgrade versions available for a managed Kubernetes cluster.
@@ -24,7 +24,7 @@ from ._validators import (
     validate_priority, validate_eviction_policy, validate_spot_max_price,
     validate_load_balancer_outbound_ip_prefixes, validate_taints, validate_ip_ranges, validate_acr, validate_nodepool_tags,
     validate_load_balancer_outbound_ports, validate_load_balancer_idle_timeout, validate_vnet_subnet_id, validate_nodepool_labels,
-    validate_ppg, validate_assign_identity, validate_max_surge, validate_assign_kubelet_identity)
+    validate_ppg, validate_assign_identity, validate_max_surge, validate_assign_kubelet_identity, validate_max_workers)
 from ._consts import CONST_OUTBOUND_TYPE_LOAD_BALANCER, CONST_OUTBOUND_TYPE_USER_DEFINED_ROUTING, \
     CONST_SCALE_SET_PRIORITY_REGULAR, CONST_SCALE_SET_PRIORITY_SPOT, \
     CONST_SPOT_EVICTION_POLICY_DELETE, CONST_SPOT_EVICTION_POLICY_DEALLOCATE, \
@@ -349,6 +349,17 @@ def load_arguments(self, _):
                    default=os.path.join(os.path.expanduser('~'), '.kube', 'config'))
         c.argument('public_fqdn', default=False, action='store_true')
 
+    with self.argument_context('aks get-credentials-batch', resource_type=ResourceType.MGMT_CONTAINERSERVICE, operation_group='managed_clusters') as c:
+        c.argument('resource_group_name', required=False)
+        c.argument('names', nargs='+', options_list=['--names'],
+                   help='Space-separated names of the managed clusters. Default: all clusters in scope.')
+        c.argument('admin', options_list=['--admin', '-a'], default=False)
+        c.argument('path', options_list=['--file', '-f'], type=file_type, completer=FilesCompleter(),
+                   default=os.path.join(os.path.expanduser('~'), '.kube', 'config'))
+        c.argument('public_fqdn', default=False, action='store_true')
+        c.argument('max_workers', type=int, validator=validate_max_workers,
+                   help='Maximum number of credentials requests sent concurrently.')
+
     for scope in ['aks', 'acs kubernetes', 'acs dcos']:
         with self.argument_context('{} install-cli'.format(scope)) as c:
             c.argument('client_version', validator=validate_kubectl_version,
@@ -248,6 +248,12 @@ def validate_nodes_count(namespace):
             raise CLIError('--max-count must be in the range [1,100]')
 
 
+def validate_max_workers(namespace):
+    """Validates that max_workers is a positive integer"""
+    if namespace.max_workers is not None and namespace.max_workers < 1:
+        raise InvalidArgumentValueError('--max-workers must be at least 1')
+
+
 def validate_taints(namespace):
     """Validates that provided taint is a valid format"""
 
@@ -99,6 +99,7 @@ def load_command_table(self, _):
         g.custom_command('enable-addons', 'aks_enable_addons',
                          supports_no_wait=True)
         g.custom_command('get-credentials', 'aks_get_credentials')
+        g.custom_command('get-credentials-batch', 'aks_get_credentials_batch')
         g.custom_command('check-acr', 'aks_check_acr')
         g.command('get-upgrades', 'get_upgrade_profile',
                   table_transformer=aks_upgrades_table_format)
@@ -6,6 +6,7 @@
 import colorama
 import base64
 import binascii
+import contextlib
 import datetime
 import errno
 import io
@@ -1158,13 +1159,22 @@ def _handle_merge(existing, addition, key, replace):
         existing[key] = addition[key]
         return
 
+    # index the existing entries by name so merging into a kubeconfig with many clusters is linear
+    merged = existing[key]
+    index = {}
+    for pos, j in enumerate(merged):
+        if j.get('name', False):
+            index.setdefault(j['name'], []).append(pos)
+    removed = set()
+
     for i in addition[key]:
-        for j in existing[key]:
-            if not i.get('name', False) or not j.get('name', False):
-                continue
-            if i['name'] == j['name']:
+        if i.get('name', False):
+            for pos in index.get(i['name'], []):
+                if pos in removed:
+                    continue
+                j = merged[pos]
                 if replace or i == j:
-                    existing[key].remove(j)
+                    removed.add(pos)
                 else:
                     msg = 'A different object named {} already exists in your kubeconfig file.\nOverwrite?'
                     overwrite = False
@@ -1173,17 +1183,58 @@ def _handle_merge(existing, addition, key, replace):
                     except NoTTYException:
                         pass
                     if overwrite:
-                        existing[key].remove(j)
+                        removed.add(pos)
                     else:
                         msg = 'A different object named {} already exists in {} in your kubeconfig file.'
                         raise CLIError(msg.format(i['name'], key))
-        existing[key].append(i)
+            index[i['name']] = [len(merged)]
+        merged.append(i)
+
+    if removed:
+        merged[:] = [j for pos, j in enumerate(merged) if pos not in removed]
+
+
+def _load_yaml(stream):
+    # prefer the libyaml based loader, it is an order of magnitude faster on large kubeconfig files
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _dump_yaml(data, stream):
+    yaml.dump(data, stream, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), default_flow_style=False)
+
+
+@contextlib.contextmanager
+def _kubeconfig_lock(path, timeout=30):
+    """Hold the "<path>.lock" file while updating a kubeconfig file. This is the same convention kubectl
+    uses, so concurrent az and kubectl invocations don't overwrite each other's changes.
+    """
+    lock_path = path + '.lock'
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            break
+        except OSError as ex:
+            if ex.errno != errno.EEXIST:
+                raise
+            if time.time() > deadline:
+                raise FileOperationError('Timed out waiting for the lock on {}. If no other process is updating '
+                                         'the file, delete {} and try again.'.format(path, lock_path))
+            time.sleep(0.1)
+    try:
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
 
 
 def load_kubernetes_configuration(filename):
     try:
         with open(filename) as stream:
-            return yaml.safe_load(stream)
+            return _load_yaml(stream)
     except (IOError, OSError) as ex:
         if getattr(ex, 'errno', 0) == errno.ENOENT:
             raise CLIError('{} does not exist'.format(filename))
@@ -1192,10 +1243,7 @@ def load_kubernetes_configuration(filename):
         raise CLIError('Error parsing {} ({})'.format(filename, str(ex)))
 
 
-def merge_kubernetes_configurations(existing_file, addition_file, replace, context_name=None):
-    existing = load_kubernetes_configuration(existing_file)
-    addition = load_kubernetes_configuration(addition_file)
-
+def _prepare_kubernetes_configuration_addition(addition, context_name=None):
     if context_name is not None:
         addition['contexts'][0]['name'] = context_name
         addition['contexts'][0]['context']['cluster'] = context_name
@@ -1212,18 +1260,18 @@ def merge_kubernetes_configurations(existing_file, addition_file, replace, conte
         except (KeyError, TypeError):
             continue
 
-    if addition is None:
-        raise CLIError(
-            'failed to load additional configuration from {}'.format(addition_file))
 
+def _merge_kubernetes_configuration_objects(existing, addition, replace):
     if existing is None:
-        existing = addition
-    else:
-        _handle_merge(existing, addition, 'clusters', replace)
-        _handle_merge(existing, addition, 'users', replace)
-        _handle_merge(existing, addition, 'contexts', replace)
-        existing['current-context'] = addition['current-context']
+        return addition
+    _handle_merge(existing, addition, 'clusters', replace)
+    _handle_merge(existing, addition, 'users', replace)
+    _handle_merge(existing, addition, 'contexts', replace)
+    existing['current-context'] = addition['current-context']
+    return existing
+
 
+def _write_kubernetes_configuration(existing_file, config):
     # check that ~/.kube/config is only read- and writable by its owner
     if platform.system() != 'Windows':
         existing_file_perms = "{:o}".format(
@@ -1233,7 +1281,20 @@ def merge_kubernetes_configurations(existing_file, addition_file, replace, conte
                            existing_file, existing_file_perms)
 
     with open(existing_file, 'w+') as stream:
-        yaml.safe_dump(existing, stream, default_flow_style=False)
+        _dump_yaml(config, stream)
+
+
+def merge_kubernetes_configurations(existing_file, addition_file, replace, context_name=None):
+    addition = load_kubernetes_configuration(addition_file)
+    if addition is None:
+        raise CLIError(
+            'failed to load additional configuration from {}'.format(addition_file))
+    _prepare_kubernetes_configuration_addition(addition, context_name)
+
+    with _kubeconfig_lock(existing_file):
+        existing = load_kubernetes_configuration(existing_file)
+        existing = _merge_kubernetes_configuration_objects(existing, addition, replace)
+        _write_kubernetes_configuration(existing_file, existing)
 
     current_context = addition.get('current-context', 'UNKNOWN')
     msg = 'Merged "{}" as current context in {}'.format(
@@ -1241,6 +1302,40 @@ def merge_kubernetes_configurations(existing_file, addition_file, replace, conte
     logger.warning(msg)
 
 
+def _combine_kubernetes_configurations(kubeconfigs):
+    """Combine a list of unencrypted kubeconfig documents into a single kubeconfig object."""
+    combined = {}
+    for kubeconfig in kubeconfigs:
+        addition = _load_yaml(kubeconfig)
+        if not addition:
+            continue
+        _prepare_kubernetes_configuration_addition(addition)
+        if not combined:
+            combined = addition
+            continue
+        for key in ('clusters', 'users', 'contexts'):
+            combined.setdefault(key, []).extend(addition.get(key) or [])
+        combined['current-context'] = addition.get('current-context')
+    if not combined:
+        raise CLIError('No Kubernetes credentials found.')
+    return combined
+
+
+def merge_kubernetes_configuration_batch(existing_file, kubeconfigs, replace):
+    """Merge a list of unencrypted kubeconfig documents into a kubeconfig file with a single locked
+    read-modify-write.
+    """
+    combined = _combine_kubernetes_configurations(kubeconfigs)
+
+    with _kubeconfig_lock(existing_file):
+        existing = load_kubernetes_configuration(existing_file)
+        existing = _merge_kubernetes_configuration_objects(existing, combined, replace)
+        _write_kubernetes_configuration(existing_file, existing)
+
+    logger.warning('Merged %d cluster(s) into %s, "%s" is the current context',
+                   len(kubeconfigs), existing_file, combined.get('current-context', 'UNKNOWN'))
+
+
 def _get_host_name(acs_info):
     """
     Gets the FQDN from the acs_info object.
@@ -2652,10 +2747,7 @@ def aks_get_versions(cmd, client, location):
     return client.list_orchestrators(location, resource_type='managedClusters')
 
 
-def aks_get_credentials(cmd, client, resource_group_name, name, admin=False,
-                        path=os.path.join(os.path.expanduser(
-                            '~'), '.kube', 'config'),
-                        overwrite_existing=False, context_name=None, public_fqdn=False):
+def _get_aks_kubeconfig(client, resource_group_name, name, admin=False, public_fqdn=False):
     credentialResults = None
     serverType = None
     if public_fqdn:
@@ -2675,23 +2767,73 @@ def aks_get_credentials(cmd, client, resource_group_name, name, admin=False,
             credentialResults = client.list_cluster_user_credentials(
                 resource_group_name, name, serverType)
 
+    if not credentialResults:
+        raise CLIError("No Kubernetes credentials found.")
+    try:
+        return credentialResults.kubeconfigs[0].value.decode(
+            encoding='UTF-8')
+    except (IndexError, ValueError):
+        raise CLIError("Fail to find kubeconfig file.")
+
+
+def _get_kubeconfig_path(path):
     # Check if KUBECONFIG environmental variable is set
     # If path is different than default then that means -f/--file is passed
     # in which case we ignore the KUBECONFIG variable
     if "KUBECONFIG" in os.environ and path == os.path.join(os.path.expanduser('~'), '.kube', 'config'):
         path = os.environ["KUBECONFIG"]
+    return path
 
-    if not credentialResults:
-        raise CLIError("No Kubernetes credentials found.")
+
+def aks_get_credentials(cmd, client, resource_group_name, name, admin=False,
+                        path=os.path.join(os.path.expanduser(
+                            '~'), '.kube', 'config'),
+                        overwrite_existing=False, context_name=None, public_fqdn=False):
+    kubeconfig = _get_aks_kubeconfig(client, resource_group_name, name, admin, public_fqdn)
+    path = _get_kubeconfig_path(path)
     try:
-        kubeconfig = credentialResults.kubeconfigs[0].value.decode(
-            encoding='UTF-8')
         _print_or_merge_credentials(
             path, kubeconfig, overwrite_existing, context_name)
     except (IndexError, ValueError):
         raise CLIError("Fail to find kubeconfig file.")
 
 
+def aks_get_credentials_batch(cmd, client, resource_group_name=None, names=None, admin=False,
+                              path=os.path.join(os.path.expanduser(
+                                  '~'), '.kube', 'config'),
+                              overwrite_existing=False, public_fqdn=False, max_workers=10):
+    from concurrent.futures import ThreadPoolExecutor
+    from msrestazure.tools import parse_resource_id
+
+    if resource_group_name:
+        managed_clusters = client.list_by_resource_group(resource_group_name)
+    else:
+        managed_clusters = client.list()
+    managed_clusters = list(managed_clusters)
+    if names:
+        managed_clusters = [mc for mc in managed_clusters if mc.name in names]
+        missing = set(names) - {mc.name for mc in managed_clusters}
+        if missing:
+            raise ResourceNotFoundError('Managed cluster(s) not found: {}'.format(', '.join(sorted(missing))))
+    if not managed_clusters:
+        raise ResourceNotFoundError('No managed clusters found.')
+
+    def _fetch(mc):
+        return _get_aks_kubeconfig(client, parse_resource_id(mc.id)['resource_group'], mc.name,
+                                   admin, public_fqdn)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        kubeconfigs = list(executor.map(_fetch, managed_clusters))
+
+    path = _get_kubeconfig_path(path)
+    if path == "-":
+        # print a single kubeconfig, concatenated documents would repeat its top-level keys
+        _dump_yaml(_combine_kubernetes_configurations(kubeconfigs), sys.stdout)
+        return
+    _ensure_kubeconfig_file(path)
+    merge_kubernetes_configuration_batch(path, kubeconfigs, overwrite_existing)
+
+
 def aks_list(cmd, client, resource_group_name=None):
     if resource_group_name:
         managed_clusters = client.list_by_resource_group(resource_group_name)
@@ -4510,15 +4652,7 @@ def _validate_autoscaler_update_counts(min_count, max_count, is_enable_or_update
                 'Value of min-count should be less than or equal to value of max-count.')
 
 
-def _print_or_merge_credentials(path, kubeconfig, overwrite_existing, context_name):
-    """Merge an unencrypted kubeconfig into the file at the specified path, or print it to
-    stdout if the path is "-".
-    """
-    # Special case for printing to stdout
-    if path == "-":
-        print(kubeconfig)
-        return
-
+def _ensure_kubeconfig_file(path):
     # ensure that at least an empty ~/.kube/config exists
     directory = os.path.dirname(path)
     if directory and not os.path.exists(directory):
@@ -4531,6 +4665,18 @@ def _print_or_merge_credentials(path, kubeconfig, overwrite_existing, context_na
         with os.fdopen(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600), 'wt'):
             pass
 
+
+def _print_or_merge_credentials(path, kubeconfig, overwrite_existing, context_name):
+    """Merge an unencrypted kubeconfig into the file at the specified path, or print it to
+    stdout if the path is "-".
+    """
+    # Special case for printing to stdout
+    if path == "-":
+        print(kubeconfig)
+        return
+
+    _ensure_kubeconfig_file(path)
+
     # merge the new kubeconfig into the existing one
     fd, temp_path = tempfile.mkstemp()
     additional_file = os.fdopen(fd, 'w+t')
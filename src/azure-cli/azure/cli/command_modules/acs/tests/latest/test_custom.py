@@ -5,6 +5,7 @@
 
 # pylint: skip-file
 from unittest import mock
+import io
 import os
 import platform
 import requests
@@ -24,6 +25,7 @@ from azure.graphrbac.models import GraphErrorException
 from azure.cli.command_modules.acs._params import (regions_in_preview,
                                                    regions_in_prod)
 from azure.cli.command_modules.acs.custom import (merge_kubernetes_configurations, list_acs_locations,
+                                                  merge_kubernetes_configuration_batch, aks_get_credentials_batch,
                                                   _acs_browse_internal, _add_role_assignment, _get_default_dns_prefix,
                                                   create_application, _update_addons,
                                                   _ensure_container_insights_for_monitoring,
@@ -597,6 +599,92 @@ class AcsCustomCommandTest(unittest.TestCase):
         self.assertEqual(merged['users'], expected_users)
         self.assertEqual(merged['current-context'], obj2['current-context'])
 
+    def _make_kubeconfig(self, name, token='token'):
+        return {
+            'apiVersion': 'v1',
+            'clusters': [{'cluster': {'server': 'https://{}.hcp.eastus.azmk8s.io:443'.format(name)}, 'name': name}],
+            'contexts': [{'context': {'cluster': name, 'user': 'clusterUser_rg_{}'.format(name)}, 'name': name}],
+            'current-context': name,
+            'kind': 'Config',
+            'preferences': {},
+            'users': [{'name': 'clusterUser_rg_{}'.format(name), 'user': {'token': token}}]
+        }
+
+    def test_merge_credentials_replace_in_large_config(self):
+        existing = tempfile.NamedTemporaryFile(delete=False)
+        existing.close()
+        self.addCleanup(os.remove, existing.name)
+        addition = tempfile.NamedTemporaryFile(delete=False)
+        addition.close()
+        self.addCleanup(os.remove, addition.name)
+
+        obj1 = self._make_kubeconfig('cluster0')
+        for ix in range(1, 500):
+            other = self._make_kubeconfig('cluster{}'.format(ix))
+            for key in ('clusters', 'contexts', 'users'):
+                obj1[key].extend(other[key])
+        with open(existing.name, 'w+') as stream:
+            yaml.safe_dump(obj1, stream)
+
+        obj2 = self._make_kubeconfig('cluster250', token='newtoken')
+        with open(addition.name, 'w+') as stream:
+            yaml.safe_dump(obj2, stream)
+
+        with self.assertRaises(CLIError):
+            merge_kubernetes_configurations(existing.name, addition.name, False)
+        self.assertFalse(os.path.exists(existing.name + '.lock'))
+        merge_kubernetes_configurations(existing.name, addition.name, True)
+
+        with open(existing.name, 'r') as stream:
+            merged = yaml.safe_load(stream)
+        self.assertEqual(len(merged['users']), 500)
+        self.assertEqual(merged['users'][-1], obj2['users'][0])
+        self.assertEqual([u for u in merged['users'] if u['name'] == 'clusterUser_rg_cluster250'], obj2['users'])
+        self.assertEqual(merged['users'][:250], obj1['users'][:250])
+        self.assertEqual(merged['current-context'], 'cluster250')
+        self.assertFalse(os.path.exists(existing.name + '.lock'))
+
+    def test_merge_credentials_batch(self):
+        existing = tempfile.NamedTemporaryFile(delete=False)
+        existing.close()
+        self.addCleanup(os.remove, existing.name)
+
+        obj1 = self._make_kubeconfig('cluster1')
+        with open(existing.name, 'w+') as stream:
+            yaml.safe_dump(obj1, stream)
+
+        additions = [self._make_kubeconfig('cluster{}'.format(ix), token='newtoken') for ix in range(1, 4)]
+        merge_kubernetes_configuration_batch(existing.name, [yaml.safe_dump(a) for a in additions], True)
+
+        with open(existing.name, 'r') as stream:
+            merged = yaml.safe_load(stream)
+        self.assertEqual(merged['clusters'], [a['clusters'][0] for a in additions])
+        self.assertEqual(merged['users'], [a['users'][0] for a in additions])
+        self.assertEqual(merged['contexts'], [a['contexts'][0] for a in additions])
+        self.assertEqual(merged['current-context'], 'cluster3')
+        self.assertFalse(os.path.exists(existing.name + '.lock'))
+
+    def test_get_credentials_batch_to_stdout(self):
+        additions = [self._make_kubeconfig('cluster{}'.format(ix)) for ix in range(1, 4)]
+        client = mock.MagicMock()
+        client.list_by_resource_group.return_value = [
+            mock.Mock(id='/subscriptions/sub/resourceGroups/rg/providers/Microsoft.ContainerService/managedClusters/'
+                         'cluster{}'.format(ix)) for ix in range(1, 4)]
+        for ix, mc in enumerate(client.list_by_resource_group.return_value, 1):
+            mc.name = 'cluster{}'.format(ix)
+        client.list_cluster_user_credentials.side_effect = lambda rg, name: mock.Mock(kubeconfigs=[mock.Mock(
+            value=yaml.safe_dump(additions[int(name[-1]) - 1]).encode('utf-8'))])
+
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            aks_get_credentials_batch(None, client, resource_group_name='rg', path='-')
+
+        # a single kubeconfig document holds the credentials of all the clusters
+        printed = yaml.safe_load(stdout.getvalue())
+        self.assertEqual(printed['clusters'], [a['clusters'][0] for a in additions])
+        self.assertEqual(printed['users'], [a['users'][0] for a in additions])
+        self.assertEqual(printed['contexts'], [a['contexts'][0] for a in additions])
+        self.assertEqual(printed['current-context'], 'cluster3')
+
     def test_acs_sp_create_failed_with_polished_error_if_due_to_permission(self):
 
         class FakedError(object):
@@ -208,6 +208,23 @@ class TestMaxSurge(unittest.TestCase):
         self.assertTrue('positive' in str(cm.exception), msg=str(cm.exception))
 
 
+class MaxWorkersNamespace:
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+
+class TestMaxWorkers(unittest.TestCase):
+    def test_valid_cases(self):
+        for v in [None, 1, 10]:
+            validators.validate_max_workers(MaxWorkersNamespace(v))
+
+    def test_throws_on_less_than_one(self):
+        for v in [0, -1]:
+            with self.assertRaises(CLIError) as cm:
+                validators.validate_max_workers(MaxWorkersNamespace(v))
+            self.assertTrue('at least 1' in str(cm.exception), msg=str(cm.exception))
+
+
 class TestLabels(unittest.TestCase):
     def test_invalid_labels_prefix(self):
         invalid_labels = "k8s##.io/label1=value"
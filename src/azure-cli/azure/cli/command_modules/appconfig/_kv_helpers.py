@@ -7,6 +7,8 @@
 
 import io
 import json
+import threading
+import time
 
 import chardet
 import javaproperties
@@ -15,10 +17,11 @@ from jsondiff import JsonDiffer
 from knack.log import get_logger
 from knack.util import CLIError
 from azure.appconfiguration import ResourceReadOnlyError
+from azure.core import MatchConditions
 from azure.core.exceptions import HttpResponseError
 from azure.cli.core.util import user_confirmation
 
-from ._constants import (FeatureFlagConstants, KeyVaultConstants)
+from ._constants import (FeatureFlagConstants, KeyVaultConstants, StatusCodes)
 from ._utils import prep_label_filter_for_url_encoding
 from ._models import (KeyValue, convert_configurationsetting_to_keyvalue,
                       convert_keyvalue_to_configurationsetting, QueryFields)
@@ -30,6 +33,13 @@ logger = get_logger(__name__)
 FEATURE_MANAGEMENT_KEYWORDS = ["FeatureManagement", "featureManagement", "feature_management", "feature-management"]
 ENABLED_FOR_KEYWORDS = ["EnabledFor", "enabledFor", "enabled_for", "enabled-for"]
 
+# Number of key-values written to a configuration store concurrently
+MAX_CONCURRENT_WRITES = 8
+# Number of times a write throttled by the configuration store is retried
+MAX_THROTTLED_RETRIES = 5
+# Number of key vault references resolved concurrently
+MAX_CONCURRENT_SECRET_READS = 8
+
 
 class FeatureManagementReservedKeywords:
     '''
@@ -67,6 +77,26 @@ class FeatureManagementReservedKeywords:
             select_keywords()
 
 
+class WriteThrottle:
+    '''
+    Shared by the concurrent writes to a configuration store. When a write is throttled, all the writes wait
+    for the time requested by the store before they are sent.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0
+
+    def pause(self, seconds):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.time() + seconds)
+
+    def wait(self):
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
 def __compare_kvs_for_restore(restore_kvs, current_kvs):
     # compares two lists and find those that are new or changed in the restore_kvs
     # optionally (delete == True) find the new ones in current_kvs for deletion
@@ -89,6 +119,22 @@ def __compare_kvs_for_restore(restore_kvs, current_kvs):
     return kvs_to_restore, kvs_to_modify, kvs_to_delete
 
 
+def __compare_kvs_for_import(import_kvs, current_kvs):
+    # compares two lists and find those that are new or changed in the import_kvs
+    # import only writes the value, content type and tags of a key-value, so the lock state is not compared
+    dict_current_kvs = {(kv.key, kv.label): (kv.value, kv.content_type or None, kv.tags or {}) for kv in current_kvs}
+    kvs_to_add = []
+    kvs_to_update = []
+    for entry in import_kvs:
+        current_tuple = dict_current_kvs.get((entry.key, entry.label), None)
+        if current_tuple is None:
+            kvs_to_add.append(entry)
+        elif current_tuple != (entry.value, entry.content_type or None, entry.tags or {}):
+            kvs_to_update.append(entry)
+
+    return kvs_to_add, kvs_to_update
+
+
 def validate_import_key(key):
     if key:
         if key == '.' or key == '..' or '%' in key:
@@ -256,17 +302,39 @@ def __write_kv_and_features_to_file(file_path, key_values=None, features=None, f
             exported_features = __export_features(features, naming_convention)
             exported_keyvalues.update(exported_features)
 
+        content = ''
+        if format_ == 'json':
+            content = json.dumps(exported_keyvalues, indent=2, ensure_ascii=False)
+        elif format_ == 'yaml':
+            content = yaml.safe_dump(exported_keyvalues, sort_keys=False, width=float('inf'))
+        elif format_ == 'properties':
+            content = javaproperties.dumps(exported_keyvalues)
+
+        # An export which doesn't change the file leaves it untouched, so that its watchers aren't triggered
+        if __is_file_content_unchanged(file_path, content, format_):
+            logger.debug("The key-values in file '%s' are unchanged.", file_path)
+            return
         with open(file_path, 'w', encoding='utf-8') as fp:
-            if format_ == 'json':
-                json.dump(exported_keyvalues, fp, indent=2, ensure_ascii=False)
-            elif format_ == 'yaml':
-                yaml.safe_dump(exported_keyvalues, fp, sort_keys=False, width=float('inf'))
-            elif format_ == 'properties':
-                javaproperties.dump(exported_keyvalues, fp)
+            fp.write(content)
     except Exception as exception:
         raise CLIError("Failed to export key-values to file. " + str(exception))
 
 
+def __is_file_content_unchanged(file_path, content, format_):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as fp:
+            current_content = fp.read()
+    except (OSError, ValueError):
+        return False
+    if format_ == 'properties':
+        # properties files start with a comment holding the time they were written
+        try:
+            return list(javaproperties.loads(current_content).items()) == list(javaproperties.loads(content).items())
+        except ValueError:
+            return False
+    return current_content == content
+
+
 # Config Store <-> List of KeyValue object
 
 def __read_kv_from_config_store(azconfig_client,
@@ -305,7 +373,6 @@ def __read_kv_from_config_store(azconfig_client,
         raise CLIError('Failed to read key-value(s) that match the specified key and label. ' + str(exception))
 
     retrieved_kvs = []
-    count = 0
 
     if all_:
         top = float('inf')
@@ -318,33 +385,43 @@ def __read_kv_from_config_store(azconfig_client,
     else:
         keyvault_client = None
 
-    for setting in configsetting_iterable:
-        kv = convert_configurationsetting_to_keyvalue(setting)
+    # Key vault references are resolved concurrently while the next pages are read,
+    # and the references to the same secret are resolved once.
+    from concurrent.futures import ThreadPoolExecutor
+    keyvault_references = []
+    resolved_references = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SECRET_READS) as executor:
+        for setting in configsetting_iterable:
+            kv = convert_configurationsetting_to_keyvalue(setting)
+
+            if kv.key:
+                # remove prefix if specified
+                if kv.key.startswith(prefix_to_remove):
+                    kv.key = kv.key[len(prefix_to_remove):]
+
+                # add prefix if specified
+                kv.key = prefix_to_add + kv.key
+
+                if kv.content_type and kv.value:
+                    # resolve key vault reference
+                    if keyvault_client and __is_key_vault_ref(kv):
+                        # the reference is kept before the secret replaces the value of the key-value
+                        reference = kv.value
+                        keyvault_references.append((kv, reference))
+                        if reference not in resolved_references:
+                            resolved_references[reference] = executor.submit(__resolve_secret, keyvault_client, kv)
 
-        if kv.key:
-            # remove prefix if specified
-            if kv.key.startswith(prefix_to_remove):
-                kv.key = kv.key[len(prefix_to_remove):]
-
-            # add prefix if specified
-            kv.key = prefix_to_add + kv.key
+            retrieved_kvs.append(kv)
+            if len(retrieved_kvs) >= top:
+                break
 
-            if kv.content_type and kv.value:
-                # resolve key vault reference
-                if keyvault_client and __is_key_vault_ref(kv):
-                    __resolve_secret(keyvault_client, kv)
+        # the first invalid reference fails the read, as when the references are resolved one by one
+        for kv, reference in keyvault_references:
+            kv.value = resolved_references[reference].result().value
 
-        # trim unwanted fields from kv object instead of leaving them as null.
-        if fields:
-            partial_kv = {}
-            for field in fields:
-                partial_kv[field.name.lower()] = kv.__dict__[field.name.lower()]
-            retrieved_kvs.append(partial_kv)
-        else:
-            retrieved_kvs.append(kv)
-        count += 1
-        if count >= top:
-            return retrieved_kvs
+    # trim unwanted fields from kv object instead of leaving them as null.
+    if fields:
+        return [{field.name.lower(): kv.__dict__[field.name.lower()] for field in fields} for kv in retrieved_kvs]
     return retrieved_kvs
 
 
@@ -353,14 +430,19 @@ def __write_kv_and_features_to_config_store(azconfig_client,
                                             features=None,
                                             label=None,
                                             preserve_labels=False,
-                                            content_type=None):
+                                            content_type=None,
+                                            current_kvs=None):
+    # current_kvs: the key-values and feature flags already in the target store for the labels written, if known.
+    # Only the new or changed key-values are written then.
     if not key_values and not features:
-        return
+        return []
 
     # write all keyvalues to target store
     if features:
         key_values.extend(__convert_featureflag_list_to_keyvalue_list(features))
 
+    # the last of the key-values with the same key and label is written
+    settings_to_set = {}
     for kv in key_values:
         set_kv = convert_keyvalue_to_configurationsetting(kv)
         if not preserve_labels:
@@ -370,14 +452,108 @@ def __write_kv_and_features_to_config_store(azconfig_client,
         if content_type and not __is_feature_flag(set_kv) and not __is_key_vault_ref(set_kv):
             set_kv.content_type = content_type
 
+        settings_to_set[(set_kv.key, set_kv.label)] = set_kv
+    settings_to_set = list(settings_to_set.values())
+
+    keys_to_add = None
+    unchanged = 0
+    if current_kvs is not None:
+        settings_to_add, settings_to_update = __compare_kvs_for_import(settings_to_set, current_kvs)
+        keys_to_add = {(kv.key, kv.label) for kv in settings_to_add}
+        unchanged = len(settings_to_set) - len(settings_to_add) - len(settings_to_update)
+        settings_to_set = settings_to_add + settings_to_update
+
+    results = __write_settings_to_config_store(azconfig_client, settings_to_set)
+    for result in results:
+        exception = result['error']
+        if isinstance(exception, ResourceReadOnlyError):
+            logger.warning("Failed to set read only key-value with key '%s' and label '%s'. Unlock the key-value before updating it.", result['key'], result['label'])
+        elif isinstance(exception, HttpResponseError):
+            logger.warning("Failed to set key-value with key '%s' and label '%s'. %s", result['key'], result['label'], str(exception))
+    logger.warning(__summarize_write_results(results, keys_to_add, unchanged))
+    for result in results:
+        if result['error'] is not None and not isinstance(result['error'], HttpResponseError):
+            raise CLIError(str(result['error']))
+    return results
+
+
+def __write_settings_to_config_store(azconfig_client, settings_to_set, kvs_to_delete=None):
+    '''
+    Set and delete key-values concurrently. Writes throttled by the store are retried after the time it requests.
+
+    :return: The result of each write, in the order of settings_to_set followed by kvs_to_delete, as a dict with
+        the 'key', 'label', 'action' ('set' or 'delete'), 'error' (the exception raised, or None) and 'retries'
+        (the number of times the write was throttled and retried) of the write.
+    '''
+    from concurrent.futures import ThreadPoolExecutor
+
+    throttle = WriteThrottle()
+
+    def _write(action, kv):
+        for attempt in range(MAX_THROTTLED_RETRIES + 1):
+            throttle.wait()
+            try:
+                if action == 'set':
+                    azconfig_client.set_configuration_setting(kv)
+                else:
+                    azconfig_client.delete_configuration_setting(key=kv.key,
+                                                                 label=kv.label,
+                                                                 etag=kv.etag,
+                                                                 match_condition=MatchConditions.IfNotModified)
+                error = None
+            except HttpResponseError as exception:
+                error = exception
+                if exception.status_code == StatusCodes.TOO_MANY_REQUESTS and attempt < MAX_THROTTLED_RETRIES:
+                    throttle.pause(__get_retry_after(exception, attempt))
+                    continue
+            except Exception as exception:  # pylint: disable=broad-except
+                error = exception
+            return {'key': kv.key, 'label': kv.label, 'action': action, 'error': error, 'retries': attempt}
+
+    writes = [('set', kv) for kv in settings_to_set] + [('delete', kv) for kv in kvs_to_delete or []]
+    if not writes:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_WRITES, len(writes))) as executor:
+        return list(executor.map(lambda write: _write(*write), writes))
+
+
+def __summarize_write_results(results, keys_to_add=None, unchanged=0):
+    '''
+    Summarize the results of __write_settings_to_config_store: the number of key-values added, updated, skipped and
+    retried, and the key-values which failed with their status code.
+
+    :param keys_to_add: The (key, label) of the new key-values, or None if the target store wasn't compared.
+    :param unchanged: The number of unchanged key-values which weren't written.
+    '''
+    written = [result for result in results if result['error'] is None]
+    if keys_to_add is None:
+        summary = "Set {} key-values.".format(len(written))
+    else:
+        added = sum(1 for result in written if (result['key'], result['label']) in keys_to_add)
+        summary = "Added {} key-values, updated {} and skipped {} unchanged.".format(added, len(written) - added, unchanged)
+
+    retried = sum(1 for result in results if result['retries'])
+    if retried:
+        summary += " {} writes were throttled and retried.".format(retried)
+
+    failed = [result for result in results if result['error'] is not None]
+    if failed:
+        summary += " Failed to set {} key-values: {}.".format(len(failed), ", ".join(
+            "'{}' with label '{}' ({})".format(result['key'], result['label'],
+                                               getattr(result['error'], 'status_code', None) or 'no status code')
+            for result in failed))
+    return summary
+
+
+def __get_retry_after(exception, attempt):
+    # The store returns the time to wait in milliseconds in retry-after-ms, or in seconds in Retry-After
+    headers = exception.response.headers if exception.response is not None else {}
+    for header, scale in [('retry-after-ms', 0.001), ('x-ms-retry-after-ms', 0.001), ('Retry-After', 1)]:
         try:
-            azconfig_client.set_configuration_setting(set_kv)
-        except ResourceReadOnlyError:
-            logger.warning("Failed to set read only key-value with key '%s' and label '%s'. Unlock the key-value before updating it.", set_kv.key, set_kv.label)
-        except HttpResponseError as exception:
-            logger.warning("Failed to set key-value with key '%s' and label '%s'. %s", set_kv.key, set_kv.label, str(exception))
-        except Exception as exception:
-            raise CLIError(str(exception))
+            return float(headers[header]) * scale
+        except (KeyError, TypeError, ValueError):
+            pass
+    return min(2 ** attempt, 30)
 
 
 def __is_feature_flag(kv):
@@ -462,8 +638,8 @@ def __read_kv_from_app_service(cmd, appservice_account, prefix_to_add="", conten
 
 def __write_kv_to_app_service(cmd, key_values, appservice_account):
     try:
-        non_slot_settings = []
-        slot_settings = []
+        # the last of the key-values with the same name is written
+        settings = {}
         for kv in key_values:
             name = kv.key
             value = kv.value
@@ -480,12 +656,31 @@ def __write_kv_to_app_service(cmd, key_values, appservice_account):
                     logger.debug(
                         'Key "%s" with value "%s" is not a well-formatted KeyVault reference. It will be treated like a regular key-value.\n%s', name, value, str(e))
 
-            if 'AppService:SlotSetting' in kv.tags and kv.tags['AppService:SlotSetting'] == 'true':
+            settings[name] = (value, 'AppService:SlotSetting' in kv.tags and kv.tags['AppService:SlotSetting'] == 'true')
+
+        # Updating the app settings restarts the app, so they are only updated when some of them changed
+        from azure.cli.command_modules.appservice.custom import get_app_settings, update_app_settings
+        current_settings = {item['name']: (item['value'], bool(item['slotSetting'])) for item in get_app_settings(
+            cmd, resource_group_name=appservice_account["resource_group"], name=appservice_account["name"], slot=None)}
+
+        non_slot_settings = []
+        slot_settings = []
+        for name, (value, slot_setting) in settings.items():
+            current_value, current_slot_setting = current_settings.get(name, (None, False))
+            # Setting a non slot setting never clears the slot setting flag of an app setting,
+            # so only the value of non slot settings is compared
+            if name in current_settings and current_value == value and (current_slot_setting or not slot_setting):
+                continue
+            if slot_setting:
                 slot_settings.append(name + '=' + value)
             else:
                 non_slot_settings.append(name + '=' + value)
+        logger.debug("Updating %d app settings. %d app settings are unchanged.", len(non_slot_settings) + len(slot_settings),
+                     len(settings) - len(non_slot_settings) - len(slot_settings))
+        if not non_slot_settings and not slot_settings:
+            return
+
         # known issue 4/26: with in-place update, AppService could change slot-setting true/false incorrectly
-        from azure.cli.command_modules.appservice.custom import update_app_settings
         update_app_settings(cmd, resource_group_name=appservice_account["resource_group"],
                             name=appservice_account["name"], settings=non_slot_settings, slot_settings=slot_settings)
     except Exception as exception:
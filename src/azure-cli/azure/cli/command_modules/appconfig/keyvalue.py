@@ -31,7 +31,8 @@ from ._kv_helpers import (__compare_kvs_for_restore, __read_kv_from_file, __read
                           __write_kv_and_features_to_file, __read_kv_from_config_store, __is_json_content_type,
                           __write_kv_and_features_to_config_store, __discard_features_from_retrieved_kv, __read_kv_from_app_service,
                           __write_kv_to_app_service, __serialize_kv_list_to_comparable_json_object, __serialize_features_from_kv_list_to_comparable_json_object,
-                          __serialize_feature_list_to_comparable_json_object, __print_features_preview, __print_preview, __print_restore_preview)
+                          __serialize_feature_list_to_comparable_json_object, __print_features_preview, __print_preview, __print_restore_preview,
+                          __write_settings_to_config_store, __is_feature_flag)
 from .feature import list_feature
 
 logger = get_logger(__name__)
@@ -128,14 +129,15 @@ def import_config(cmd,
         src_kvs = __read_kv_from_app_service(
             cmd, appservice_account=appservice_account, prefix_to_add=prefix, content_type=content_type)
 
+    # fetch the key-values and feature flags of the label in the target store, to only write the new or changed ones
+    dest_kvs = __read_kv_from_config_store(azconfig_client,
+                                           key=SearchFilterOptions.ANY_KEY,
+                                           label=label if label else SearchFilterOptions.EMPTY_LABEL)
+    dest_features = [kv for kv in dest_kvs if __is_feature_flag(kv)]
+    __discard_features_from_retrieved_kv(dest_kvs)
+
     # if customer needs preview & confirmation
     if not yes:
-        # fetch key values from user's configstore
-        dest_kvs = __read_kv_from_config_store(azconfig_client,
-                                               key=SearchFilterOptions.ANY_KEY,
-                                               label=label if label else SearchFilterOptions.EMPTY_LABEL)
-        __discard_features_from_retrieved_kv(dest_kvs)
-
         # generate preview and wait for user confirmation
         need_kv_change = __print_preview(
             old_json=__serialize_kv_list_to_comparable_json_object(keyvalues=dest_kvs, level=source),
@@ -143,14 +145,6 @@ def import_config(cmd,
 
         need_feature_change = False
         if src_features and not skip_features:
-            # Append all features to dest_features list
-            all_features = __read_kv_from_config_store(azconfig_client,
-                                                       key=FeatureFlagConstants.FEATURE_FLAG_PREFIX + '*',
-                                                       label=label if label else SearchFilterOptions.EMPTY_LABEL)
-            for feature in all_features:
-                if feature.content_type == FeatureFlagConstants.FEATURE_FLAG_CONTENT_TYPE:
-                    dest_features.append(feature)
-
             need_feature_change = __print_features_preview(
                 old_json=__serialize_features_from_kv_list_to_comparable_json_object(keyvalues=dest_features),
                 new_json=__serialize_features_from_kv_list_to_comparable_json_object(keyvalues=src_features))
@@ -168,7 +162,8 @@ def import_config(cmd,
                                             key_values=src_kvs,
                                             label=label,
                                             preserve_labels=preserve_labels,
-                                            content_type=content_type)
+                                            content_type=content_type,
+                                            current_kvs=dest_kvs + dest_features)
 
 
 def export_config(cmd,
@@ -247,27 +242,17 @@ def export_config(cmd,
                                         auth_mode=auth_mode,
                                         endpoint=endpoint)
 
+    if destination == 'appconfig':
+        # fetch the key-values and feature flags of the label in the target store, to only write the new or changed ones
+        dest_kvs = __read_kv_from_config_store(dest_azconfig_client,
+                                               key=SearchFilterOptions.ANY_KEY,
+                                               label=dest_label if dest_label else SearchFilterOptions.EMPTY_LABEL)
+        dest_features = [kv for kv in dest_kvs if __is_feature_flag(kv)]
+        __discard_features_from_retrieved_kv(dest_kvs)
+
     # if customer needs preview & confirmation
     if not yes:
-        if destination == 'appconfig':
-            # dest_kvs contains features and KV that match the label
-            dest_kvs = __read_kv_from_config_store(dest_azconfig_client,
-                                                   key=SearchFilterOptions.ANY_KEY,
-                                                   label=dest_label if dest_label else SearchFilterOptions.EMPTY_LABEL)
-            __discard_features_from_retrieved_kv(dest_kvs)
-
-            if not skip_features:
-                # Append all features to dest_features list
-                dest_features = list_feature(cmd,
-                                             feature='*',
-                                             label=dest_label if dest_label else SearchFilterOptions.EMPTY_LABEL,
-                                             name=dest_name,
-                                             connection_string=dest_connection_string,
-                                             all_=True,
-                                             auth_mode=dest_auth_mode,
-                                             endpoint=dest_endpoint)
-
-        elif destination == 'appservice':
+        if destination == 'appservice':
             dest_kvs = __read_kv_from_app_service(cmd, appservice_account=appservice_account)
 
         # generate preview and wait for user confirmation
@@ -278,7 +263,7 @@ def export_config(cmd,
         need_feature_change = False
         if src_features:
             need_feature_change = __print_features_preview(
-                old_json=__serialize_feature_list_to_comparable_json_object(features=dest_features),
+                old_json=__serialize_features_from_kv_list_to_comparable_json_object(keyvalues=dest_features),
                 new_json=__serialize_feature_list_to_comparable_json_object(features=src_features))
 
         if not need_kv_change and not need_feature_change:
@@ -293,7 +278,8 @@ def export_config(cmd,
                                         naming_convention=naming_convention)
     elif destination == 'appconfig':
         __write_kv_and_features_to_config_store(dest_azconfig_client, key_values=src_kvs, features=src_features,
-                                                label=dest_label, preserve_labels=preserve_labels)
+                                                label=dest_label, preserve_labels=preserve_labels,
+                                                current_kvs=dest_kvs + dest_features)
     elif destination == 'appservice':
         __write_kv_to_app_service(cmd, key_values=src_kvs, appservice_account=appservice_account)
 
@@ -677,32 +663,32 @@ def restore_key(cmd,
 
         keys_to_restore = len(kvs_to_restore) + len(kvs_to_modify) + len(kvs_to_delete)
         restored_so_far = 0
-
-        for kv in chain(kvs_to_restore, kvs_to_modify):
-            set_kv = convert_keyvalue_to_configurationsetting(kv)
-            try:
-                azconfig_client.set_configuration_setting(set_kv)
+        failed_writes = []
+
+        results = __write_settings_to_config_store(azconfig_client,
+                                                   [convert_keyvalue_to_configurationsetting(kv) for kv in chain(kvs_to_restore, kvs_to_modify)],
+                                                   kvs_to_delete)
+        for result in results:
+            exception = result['error']
+            if exception is None:
                 restored_so_far += 1
-            except ResourceReadOnlyError:
-                exception = "Failed to update read-only key-value with key '{}' and label '{}'. Unlock the key-value before updating it.".format(set_kv.key, set_kv.label)
+            elif isinstance(exception, ResourceReadOnlyError):
+                if result['action'] == 'set':
+                    exception = "Failed to update read-only key-value with key '{}' and label '{}'. Unlock the key-value before updating it.".format(result['key'], result['label'])
+                else:
+                    exception = "Failed to delete read-only key-value with key '{}' and label '{}'. Unlock the key-value before deleting it.".format(result['key'], result['label'])
                 exception_messages.append(exception)
-            except ResourceModifiedError:
-                exception = "Failed to update key-value with key '{}' and label '{}' due to a conflicting operation.".format(set_kv.key, set_kv.label)
+            elif isinstance(exception, ResourceModifiedError):
+                exception = "Failed to {} key-value with key '{}' and label '{}' due to a conflicting operation.".format('update' if result['action'] == 'set' else 'delete', result['key'], result['label'])
                 exception_messages.append(exception)
+            elif isinstance(exception, HttpResponseError):
+                failed_writes.append(str(exception))
+            else:
+                raise exception
 
-        for kv in kvs_to_delete:
-            try:
-                azconfig_client.delete_configuration_setting(key=kv.key,
-                                                             label=kv.label,
-                                                             etag=kv.etag,
-                                                             match_condition=MatchConditions.IfNotModified)
-                restored_so_far += 1
-            except ResourceReadOnlyError:
-                exception = "Failed to delete read-only key-value with key '{}' and label '{}'. Unlock the key-value before deleting it.".format(kv.key, kv.label)
-                exception_messages.append(exception)
-            except ResourceModifiedError:
-                exception = "Failed to delete key-value with key '{}' and label '{}' due to a conflicting operation.".format(kv.key, kv.label)
-                exception_messages.append(exception)
+        if failed_writes:
+            exception_messages.extend(failed_writes)
+            raise CLIError('Restore operation failed. The following error(s) occurred:\n' + json.dumps(exception_messages, indent=2, ensure_ascii=False))
 
         if restored_so_far != keys_to_restore:
             logger.error('Failed after restoring %d out of %d keys. The following error(s) occurred:\n%s\n',
@@ -0,0 +1,151 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+# pylint: disable=line-too-long
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from azure.appconfiguration import ResourceReadOnlyError
+from azure.core.exceptions import HttpResponseError
+from azure.cli.command_modules.appconfig._kv_helpers import (
+    __write_kv_and_features_to_config_store as write_kv_and_features_to_config_store,
+    __write_settings_to_config_store as write_settings_to_config_store)
+from azure.cli.command_modules.appconfig._models import KeyValue, convert_keyvalue_to_configurationsetting
+
+
+class _Response:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.reason = 'Too Many Requests'
+        self.headers = headers or {}
+
+
+class _ConfigStore:
+    '''
+    An in-process configuration store which records the writes it receives and throttles the first ones.
+    '''
+
+    def __init__(self, throttled_writes=0, retry_after_ms='50'):
+        self.lock = threading.Lock()
+        self.throttled_writes = throttled_writes
+        self.retry_after_ms = retry_after_ms
+        self.settings = {}
+        self.writes = []
+        self.concurrent_writes = 0
+        self.max_concurrent_writes = 0
+        self.read_only = set()
+
+    def _write(self, key, label):
+        with self.lock:
+            if self.throttled_writes:
+                self.throttled_writes -= 1
+                raise HttpResponseError(message='Too many requests',
+                                        response=_Response(429, {'retry-after-ms': self.retry_after_ms}))
+            if (key, label) in self.read_only:
+                raise ResourceReadOnlyError(message='The key-value is read only', response=_Response(409))
+            self.concurrent_writes += 1
+            self.max_concurrent_writes = max(self.max_concurrent_writes, self.concurrent_writes)
+        time.sleep(0.05)
+        with self.lock:
+            self.concurrent_writes -= 1
+            self.writes.append((key, label))
+
+    def set_configuration_setting(self, setting):
+        self._write(setting.key, setting.label)
+        self.settings[(setting.key, setting.label)] = setting.value
+
+    def delete_configuration_setting(self, key, label, **_):
+        self._write(key, label)
+        self.settings.pop((key, label), None)
+
+
+class AppConfigBulkWriteTest(unittest.TestCase):
+
+    def test_write_only_changed_key_values(self):
+        store = _ConfigStore()
+        key_values = [KeyValue('Color', 'Red'), KeyValue('Region', 'West US'), KeyValue('Size', '10'),
+                      KeyValue('Color', 'Blue')]
+        current_kvs = [KeyValue('Color', 'Green'), KeyValue('Region', 'West US'), KeyValue('Size', '10', tags={'a': 'b'})]
+
+        results = write_kv_and_features_to_config_store(store, key_values=key_values, label='dev', current_kvs=[
+            KeyValue(kv.key, kv.value, label='dev', tags=kv.tags) for kv in current_kvs])
+
+        # the unchanged key-value is skipped and the last of the duplicated keys is written
+        self.assertEqual(sorted(store.writes), [('Color', 'dev'), ('Size', 'dev')])
+        self.assertEqual(store.settings[('Color', 'dev')], 'Blue')
+        self.assertEqual([(r['key'], r['action'], r['error']) for r in results], [('Color', 'set', None), ('Size', 'set', None)])
+
+    def test_write_all_key_values_without_current_kvs(self):
+        store = _ConfigStore()
+        key_values = [KeyValue('Key{}'.format(i), 'Value') for i in range(20)]
+
+        results = write_kv_and_features_to_config_store(store, key_values=key_values)
+
+        self.assertEqual(len(store.writes), 20)
+        self.assertEqual([r['key'] for r in results], ['Key{}'.format(i) for i in range(20)])
+        self.assertGreater(store.max_concurrent_writes, 1)
+
+    def test_retry_throttled_writes(self):
+        store = _ConfigStore(throttled_writes=3)
+        key_values = [KeyValue('Key{}'.format(i), 'Value') for i in range(5)]
+
+        start = time.time()
+        results = write_settings_to_config_store(store, [_to_setting(kv) for kv in key_values])
+
+        self.assertGreaterEqual(time.time() - start, 0.05)
+        self.assertEqual(sorted(store.writes), [('Key{}'.format(i), None) for i in range(5)])
+        self.assertTrue(all(r['error'] is None for r in results))
+
+    @mock.patch('azure.cli.command_modules.appconfig._kv_helpers.MAX_THROTTLED_RETRIES', 2)
+    def test_report_write_errors(self):
+        store = _ConfigStore(throttled_writes=3, retry_after_ms='1')
+        store.read_only.add(('Locked', None))
+
+        # the write is throttled more times than it is retried
+        results = write_settings_to_config_store(store, [_to_setting(KeyValue('Key', 'Value'))])
+        self.assertEqual(results[0]['action'], 'set')
+        self.assertEqual(results[0]['error'].status_code, 429)
+
+        results = write_settings_to_config_store(store, [], [KeyValue('Locked', 'Value')])
+        self.assertEqual(results[0]['action'], 'delete')
+        self.assertIsInstance(results[0]['error'], ResourceReadOnlyError)
+
+    @mock.patch('azure.cli.command_modules.appconfig._kv_helpers.logger')
+    def test_warn_on_read_only_key_values(self, logger):
+        store = _ConfigStore()
+        store.read_only.add(('Locked', None))
+
+        write_kv_and_features_to_config_store(store, key_values=[KeyValue('Locked', 'Value'), KeyValue('Key', 'Value')])
+
+        self.assertEqual(store.writes, [('Key', None)])
+        warnings = [call[0][0] for call in logger.warning.call_args_list]
+        self.assertIn("Failed to set read only key-value with key '%s' and label '%s'. Unlock the key-value before updating it.", warnings)
+
+    @mock.patch('azure.cli.command_modules.appconfig._kv_helpers.logger')
+    def test_summarize_writes(self, logger):
+        store = _ConfigStore(throttled_writes=1, retry_after_ms='1')
+        store.read_only.add(('Locked', 'dev'))
+        key_values = [KeyValue('Color', 'Red'), KeyValue('Region', 'West US'), KeyValue('Size', '10'),
+                      KeyValue('Locked', 'Value')]
+        current_kvs = [KeyValue('Color', 'Green', label='dev'), KeyValue('Region', 'West US', label='dev'),
+                       KeyValue('Locked', 'Old', label='dev')]
+
+        write_kv_and_features_to_config_store(store, key_values=key_values, label='dev', current_kvs=current_kvs)
+
+        summary = logger.warning.call_args_list[-1][0][0]
+        self.assertTrue(summary.startswith('Added 1 key-values, updated 1 and skipped 1 unchanged. 1 writes were throttled and retried.'))
+        self.assertTrue(summary.endswith("Failed to set 1 key-values: 'Locked' with label 'dev' (409)."), summary)
+
+
+def _to_setting(kv):
+    return convert_keyvalue_to_configurationsetting(kv)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ import os
 import sys
 import time
 import yaml
+from unittest import mock
 
 from knack.util import CLIError
 from azure.cli.testsdk import (ResourceGroupPreparer, ScenarioTest, KeyVaultPreparer, live_only, LiveScenarioTest)
@@ -20,6 +21,18 @@ from azure_devtools.scenario_tests import AllowLargeResponse
 
 TEST_DIR = os.path.abspath(os.path.join(os.path.abspath(__file__), '..'))
 
+# vcrpy restores the original connection classes of the process while it creates a connection, so the connections
+# created concurrently by other threads could bypass the recordings. Write the key-values one at a time.
+_serial_writes = mock.patch('azure.cli.command_modules.appconfig._kv_helpers.MAX_CONCURRENT_WRITES', 1)
+
+
+def setUpModule():
+    _serial_writes.start()
+
+
+def tearDownModule():
+    _serial_writes.stop()
+
 
 class AppConfigMgmtScenarioTest(ScenarioTest):
 
@@ -0,0 +1,154 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from knack.util import CLIError
+from azure.cli.command_modules.appconfig._constants import KeyVaultConstants
+from azure.cli.command_modules.appconfig._kv_helpers import (
+    __read_kv_from_config_store as read_kv_from_config_store,
+    __write_kv_and_features_to_file as write_kv_and_features_to_file,
+    __write_kv_to_app_service as write_kv_to_app_service)
+from azure.cli.command_modules.appconfig._models import KeyValue, QueryFields, convert_keyvalue_to_configurationsetting
+
+SECRET_URI = 'https://myvault.vault.azure.net/secrets/{}/ec96f02080254f109c51a1f14cdb1931'
+APPSERVICE_ACCOUNT = {'resource_group': 'rg', 'name': 'app'}
+
+
+class _ConfigStore:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, key_values):
+        self.settings = [convert_keyvalue_to_configurationsetting(kv) for kv in key_values]
+
+    def list_configuration_settings(self, **_):
+        return iter(self.settings)
+
+
+class _KeyVault:
+    '''
+    An in-process key vault which records the secrets it is asked for.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reads = []
+        self.concurrent_reads = 0
+        self.max_concurrent_reads = 0
+
+    def get_secret(self, vault_base_url, secret_name, secret_version):  # pylint: disable=unused-argument
+        with self.lock:
+            self.concurrent_reads += 1
+            self.max_concurrent_reads = max(self.max_concurrent_reads, self.concurrent_reads)
+        time.sleep(0.05)
+        with self.lock:
+            self.concurrent_reads -= 1
+            self.reads.append(secret_name)
+        return mock.MagicMock(value='value of ' + secret_name)
+
+
+def _keyvault_reference(key, secret_name, label=None):
+    return KeyValue(key, json.dumps({'uri': SECRET_URI.format(secret_name)}), label=label,
+                    content_type=KeyVaultConstants.KEYVAULT_CONTENT_TYPE, tags={})
+
+
+class AppConfigExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.keyvault = _KeyVault()
+        patcher = mock.patch('azure.cli.command_modules.keyvault._client_factory.keyvault_data_plane_factory',
+                             return_value=self.keyvault)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+    def test_resolve_keyvault_references_concurrently(self):
+        key_values = [_keyvault_reference('Secret{}'.format(i), 'secret{}'.format(i)) for i in range(10)]
+        key_values += [KeyValue('Color', 'Red'), _keyvault_reference('Secret0', 'secret0', label='prod')]
+
+        kvs = read_kv_from_config_store(_ConfigStore(key_values), cli_ctx=mock.MagicMock())
+
+        self.assertEqual([kv.key for kv in kvs], ['Secret{}'.format(i) for i in range(10)] + ['Color', 'Secret0'])
+        self.assertEqual([kv.value for kv in kvs],
+                         ['value of secret{}'.format(i) for i in range(10)] + ['Red', 'value of secret0'])
+        # the references to the same secret are resolved once
+        self.assertEqual(sorted(self.keyvault.reads), sorted('secret{}'.format(i) for i in range(10)))
+        self.assertGreater(self.keyvault.max_concurrent_reads, 1)
+
+    def test_resolve_keyvault_references_of_the_returned_key_values(self):
+        key_values = [_keyvault_reference('Secret{}'.format(i), 'secret{}'.format(i)) for i in range(5)]
+
+        kvs = read_kv_from_config_store(_ConfigStore(key_values), cli_ctx=mock.MagicMock(), all_=False, top=2,
+                                        fields=[QueryFields.KEY, QueryFields.VALUE])
+
+        self.assertEqual(kvs, [{'key': 'Secret0', 'value': 'value of secret0'},
+                               {'key': 'Secret1', 'value': 'value of secret1'}])
+        self.assertEqual(sorted(self.keyvault.reads), ['secret0', 'secret1'])
+
+    def test_fail_on_invalid_keyvault_reference(self):
+        key_values = [_keyvault_reference('Secret', 'secret'),
+                      KeyValue('Invalid', 'not a reference', content_type=KeyVaultConstants.KEYVAULT_CONTENT_TYPE)]
+
+        with self.assertRaisesRegex(CLIError, 'Invalid key vault reference for key Invalid'):
+            read_kv_from_config_store(_ConfigStore(key_values), cli_ctx=mock.MagicMock())
+
+    def test_leave_unchanged_file_untouched(self):
+        for format_ in ['json', 'yaml', 'properties']:
+            file_path = os.path.join(self.test_dir, 'export.' + format_)
+            write_kv_and_features_to_file(file_path, key_values=[KeyValue('Color', 'Red'), KeyValue('Size', '10')],
+                                          format_=format_, separator=':')
+            os.utime(file_path, (0, 0))
+
+            write_kv_and_features_to_file(file_path, key_values=[KeyValue('Color', 'Red'), KeyValue('Size', '10')],
+                                          format_=format_, separator=':')
+            self.assertEqual(os.path.getmtime(file_path), 0, format_)
+
+            write_kv_and_features_to_file(file_path, key_values=[KeyValue('Color', 'Blue'), KeyValue('Size', '10')],
+                                          format_=format_, separator=':')
+            self.assertNotEqual(os.path.getmtime(file_path), 0, format_)
+            with open(file_path) as f:
+                self.assertIn('Blue', f.read())
+
+    @mock.patch('azure.cli.command_modules.appservice.custom.update_app_settings')
+    @mock.patch('azure.cli.command_modules.appservice.custom.get_app_settings')
+    def test_write_only_changed_app_settings(self, get_app_settings, update_app_settings):
+        get_app_settings.return_value = [
+            {'name': 'Color', 'value': 'Red', 'slotSetting': False},
+            {'name': 'Size', 'value': '10', 'slotSetting': False},
+            {'name': 'Region', 'value': 'West US', 'slotSetting': True},
+            {'name': 'Secret', 'value': '@Microsoft.KeyVault(SecretUri={})'.format(SECRET_URI.format('secret')),
+             'slotSetting': False}]
+        key_values = [KeyValue('Color', 'Red', tags={}), KeyValue('Size', '20', tags={}),
+                      KeyValue('Region', 'West US', tags={'AppService:SlotSetting': 'true'}),
+                      KeyValue('Zone', '1', tags={'AppService:SlotSetting': 'true'}),
+                      _keyvault_reference('Secret', 'secret'), KeyValue('Size', '10', tags={})]
+
+        write_kv_to_app_service(mock.MagicMock(), key_values, APPSERVICE_ACCOUNT)
+        update_app_settings.assert_called_once_with(mock.ANY, resource_group_name='rg', name='app',
+                                                    settings=[], slot_settings=['Zone=1'])
+
+        # the app settings are not updated when none of them changed
+        update_app_settings.reset_mock()
+        write_kv_to_app_service(mock.MagicMock(), key_values[:3] + key_values[4:], APPSERVICE_ACCOUNT)
+        update_app_settings.assert_not_called()
+
+        # the slot setting flag of an app setting is kept when it is written as a non slot setting
+        update_app_settings.reset_mock()
+        write_kv_to_app_service(mock.MagicMock(), [KeyValue('Region', 'West US', tags={})], APPSERVICE_ACCOUNT)
+        update_app_settings.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
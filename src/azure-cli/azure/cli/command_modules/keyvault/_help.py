@@ -12,6 +12,38 @@ type: group
 short-summary: Manage KeyVault keys, secrets, and certificates.
 """
 
+helps['keyvault archive'] = """
+type: group
+short-summary: Back up and restore all the secrets, keys and certificates of a vault with a single archive.
+"""
+
+helps['keyvault archive create'] = """
+type: command
+short-summary: Back up the secrets, keys and certificates of a vault into an archive.
+long-summary: >
+    The objects are backed up concurrently into a zip file, with a manifest recording the checksum of each backup.
+    With --base-archive, the objects which are unchanged since the base archive was created are copied from it
+    instead of being backed up again. The objects which could not be backed up are listed in the output.
+examples:
+  - name: Back up all the objects of a vault.
+    text: az keyvault archive create --vault-name MyKeyVault --file backup.zip
+  - name: Back up the objects changed since the last backup, replacing it.
+    text: az keyvault archive create --vault-name MyKeyVault --file backup.zip --base-archive backup.zip
+"""
+
+helps['keyvault archive restore'] = """
+type: command
+short-summary: Restore the secrets, keys and certificates of an archive into a vault.
+long-summary: >
+    The objects are restored concurrently. The objects must not exist in the vault. The objects which could not be
+    restored are listed in the output, and can be restored again with --names.
+examples:
+  - name: Restore all the objects of an archive.
+    text: az keyvault archive restore --vault-name MyKeyVault --file backup.zip
+  - name: Restore the secrets of an archive.
+    text: az keyvault archive restore --vault-name MyKeyVault --file backup.zip --types secret
+"""
+
 helps['keyvault backup'] = """
 type: group
 short-summary: Manage full HSM backup.
@@ -593,6 +593,27 @@ def load_arguments(self, _):
         c.argument('file_path', options_list=['--file', '-f'], type=file_type, completer=FilesCompleter(),
                    help='Local key backup from which to restore storage account.')
 
+    # region KeyVault Archive
+    with self.argument_context('keyvault archive') as c:
+        c.argument('vault_base_url', vault_name_type, type=get_vault_base_url_type(self.cli_ctx), id_part=None)
+        c.argument('object_types', options_list=['--types'], nargs='+',
+                   arg_type=get_enum_type(['secret', 'key', 'certificate']),
+                   help='Space-separated types of the objects. Defaults to all types.')
+        c.argument('max_workers', type=int, help='Maximum number of objects backed up or restored concurrently.')
+
+    with self.argument_context('keyvault archive create') as c:
+        c.argument('file_path', options_list=['--file', '-f'], type=file_type, completer=FilesCompleter(),
+                   help='Local file path in which to store the archive.')
+        c.argument('base_archive', type=file_type, completer=FilesCompleter(),
+                   help='Archive created by a previous backup of the vault. The objects which are unchanged since it '
+                        'was created are copied from it. It can be the same file as --file.')
+
+    with self.argument_context('keyvault archive restore') as c:
+        c.argument('file_path', options_list=['--file', '-f'], type=file_type, completer=FilesCompleter(),
+                   help='Local archive from which to restore the objects.')
+        c.argument('names', nargs='+', help='Space-separated names of the objects to restore. Defaults to all.')
+    # endregion
+
     with self.argument_context('keyvault storage sas-definition', arg_group='Id') as c:
         c.argument('storage_account_name', options_list=['--account-name'],
                    help='Name to identify the storage account in the vault.', id_part='child_name_1',
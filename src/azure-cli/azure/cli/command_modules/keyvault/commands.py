@@ -313,6 +313,10 @@ def load_command_table(self, _):
             g.keyvault_custom('restore', 'restore_storage_account',
                               doc_string_source=data_entity.operations_docs_tmpl.format('restore_storage_account'))
 
+    with self.command_group('keyvault archive', data_entity.command_type, is_preview=True) as g:
+        g.keyvault_custom('create', 'create_vault_archive')
+        g.keyvault_custom('restore', 'restore_vault_archive')
+
     if data_api_version != '2016_10_01':
         with self.command_group('keyvault storage sas-definition', data_entity.command_type) as g:
             g.keyvault_command('create', 'set_sas_definition',
@@ -1776,6 +1776,221 @@ def restore_storage_account(client, vault_base_url, file_path):
 # endregion
 
 
+# region vault archive
+ARCHIVE_MANIFEST = 'manifest.json'
+ARCHIVE_FORMAT_VERSION = 1
+ARCHIVE_OBJECT_TYPES = ['secret', 'key', 'certificate']
+# Number of times an operation throttled by the vault is retried
+ARCHIVE_THROTTLED_RETRIES = 5
+
+
+def _archive_call(func, *args):
+    """ Call the vault, retrying after the time requested by the vault when the call is throttled. """
+    from msrest.exceptions import HttpOperationError
+    for attempt in range(ARCHIVE_THROTTLED_RETRIES + 1):
+        try:
+            return func(*args)
+        except HttpOperationError as ex:
+            response = getattr(ex, 'response', None)
+            if getattr(response, 'status_code', None) != 429 or attempt == ARCHIVE_THROTTLED_RETRIES:
+                raise
+            try:
+                delay = float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                delay = min(2 ** attempt, 30)
+            logger.debug('Throttled by the vault, retrying in %s seconds', delay)
+            time.sleep(delay)
+
+
+def _archive_failure(item, ex):
+    from msrest.exceptions import HttpOperationError
+    response = getattr(ex, 'response', None) if isinstance(ex, HttpOperationError) else None
+    try:
+        message = ex.inner_exception.error.message
+    except AttributeError:
+        message = str(ex)
+    return {'type': item['type'], 'name': item['name'], 'error': message,
+            'throttled': getattr(response, 'status_code', None) == 429}
+
+
+def _list_archive_objects(client, vault_base_url, object_types):
+    """ List the latest version of the objects of the vault, following the pages of the list operations. """
+    objects = []
+    for object_type in object_types:
+        list_func = getattr(client, 'get_{}s'.format(object_type))
+        for item in list_func(vault_base_url):
+            # the keys and secrets backing a certificate are backed up with the certificate
+            if getattr(item, 'managed', None):
+                continue
+            attributes = item.attributes
+            updated = attributes.updated if attributes else None
+            objects.append({'type': object_type,
+                            'name': item.id.split('/')[4],
+                            'updated': updated.isoformat() if updated else None})
+    return objects
+
+
+def _read_archive_manifest(archive):
+    try:
+        manifest = json.loads(archive.read(ARCHIVE_MANIFEST).decode('utf-8'))
+    except KeyError:
+        raise InvalidArgumentValueError('{} is not a Key Vault archive: {} is missing.'.format(
+            archive.filename, ARCHIVE_MANIFEST))
+    if manifest.get('version', 0) > ARCHIVE_FORMAT_VERSION:
+        raise InvalidArgumentValueError('{} was created by a newer version of the CLI.'.format(archive.filename))
+    return manifest
+
+
+def _archive_entry_name(item):
+    from urllib.parse import quote
+    return '{}s/{}'.format(item['type'], quote(item['name']))
+
+
+def create_vault_archive(client, vault_base_url, file_path, base_archive=None, object_types=None,
+                         max_workers=8):
+    """ Back up the secrets, keys and certificates of a vault into a single archive.
+
+    The archive is a zip file containing the backup of each object and a manifest listing the objects with the
+    SHA-256 checksums of their backups. Objects which are unchanged since the base archive are copied from it
+    instead of being backed up again.
+    """
+    import hashlib
+    import tempfile
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
+
+    object_types = object_types or ARCHIVE_OBJECT_TYPES
+    if 'certificate' in object_types and not hasattr(client, 'backup_certificate'):
+        raise InvalidArgumentValueError('Backing up certificates is not supported by the API version of the vault.')
+    if max_workers < 1:
+        raise InvalidArgumentValueError('--max-workers must be at least 1.')
+
+    objects = _list_archive_objects(client, vault_base_url, object_types)
+
+    base_items = {}
+    base = None
+    if base_archive:
+        base = zipfile.ZipFile(base_archive)
+        base_items = {(i['type'], i['name']): i for i in _read_archive_manifest(base)['items']}
+
+    unchanged = []
+    to_back_up = []
+    for item in objects:
+        base_item = base_items.get((item['type'], item['name']))
+        if base_item and item['updated'] and base_item.get('updated') == item['updated']:
+            unchanged.append(base_item)
+        else:
+            to_back_up.append(item)
+
+    def _back_up(item):
+        try:
+            backup_func = getattr(client, 'backup_{}'.format(item['type']))
+            return item, _archive_call(backup_func, vault_base_url, item['name']).value, None
+        except Exception as ex:  # pylint: disable=broad-except
+            return item, None, ex
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(handle)
+    items = []
+    failed = []
+    try:
+        with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_STORED) as archive:
+            for item in unchanged:
+                data = base.read(item['file'])
+                if hashlib.sha256(data).hexdigest() != item['sha256']:
+                    # a corrupted backup in the base archive is taken again
+                    to_back_up.append({k: item[k] for k in ('type', 'name', 'updated')})
+                    continue
+                archive.writestr(item['file'], data)
+                items.append(item)
+            copied = len(items)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # the archive is only written by this thread
+                for item, data, ex in executor.map(_back_up, to_back_up):
+                    if ex is not None:
+                        failed.append(_archive_failure(item, ex))
+                        continue
+                    item = dict(item, file=_archive_entry_name(item), sha256=hashlib.sha256(data).hexdigest())
+                    archive.writestr(item['file'], data)
+                    items.append(item)
+
+            items.sort(key=lambda i: (ARCHIVE_OBJECT_TYPES.index(i['type']), i['name']))
+            manifest = {'version': ARCHIVE_FORMAT_VERSION,
+                        'vault': vault_base_url,
+                        'created': datetime.utcnow().isoformat(),
+                        'items': items}
+            archive.writestr(ARCHIVE_MANIFEST, json.dumps(manifest, indent=2))
+        if base:
+            base.close()
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if base:
+            base.close()
+        os.remove(temp_path)
+        raise
+
+    if failed:
+        logger.warning('Failed to back up %d object(s). Run the command again with --base-archive %s to back up '
+                       'them without backing up the others again.', len(failed), file_path)
+    return {'file': file_path,
+            'backedUp': len(items) - copied,
+            'unchanged': copied,
+            'failed': failed}
+
+
+def restore_vault_archive(client, vault_base_url, file_path, object_types=None, names=None, max_workers=8):
+    """ Restore the secrets, keys and certificates backed up into an archive by `az keyvault archive create`.
+
+    The objects must not exist in the vault. The checksum of each backup is verified before it is restored.
+    """
+    import hashlib
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    if max_workers < 1:
+        raise InvalidArgumentValueError('--max-workers must be at least 1.')
+
+    with zipfile.ZipFile(file_path) as archive:
+        items = _read_archive_manifest(archive)['items']
+        if object_types:
+            items = [i for i in items if i['type'] in object_types]
+        if names:
+            items = [i for i in items if i['name'] in names]
+        backups = {}
+        failed = []
+        for item in items:
+            data = archive.read(item['file'])
+            if hashlib.sha256(data).hexdigest() != item['sha256']:
+                failed.append({'type': item['type'], 'name': item['name'], 'throttled': False,
+                               'error': 'The checksum of the backup does not match the manifest.'})
+                continue
+            backups[(item['type'], item['name'])] = data
+
+    def _restore(item):
+        try:
+            restore_func = getattr(client, 'restore_{}'.format(item['type']))
+            _archive_call(restore_func, vault_base_url, backups[(item['type'], item['name'])])
+            return None
+        except Exception as ex:  # pylint: disable=broad-except
+            return _archive_failure(item, ex)
+
+    to_restore = [i for i in items if (i['type'], i['name']) in backups]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        restore_failed = [f for f in executor.map(_restore, to_restore) if f]
+    failed.extend(restore_failed)
+
+    if failed:
+        logger.warning('Failed to restore %d object(s). Run the command again with --names to restore them.',
+                       len(failed))
+    return {'file': file_path,
+            'restored': len(to_restore) - len(restore_failed),
+            'failed': failed}
+# endregion
+
+
 # region private_link
 def _verify_vault_or_hsm_name(vault_name, hsm_name):
     if not vault_name and not hsm_name:
@@ -0,0 +1,175 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import zipfile
+from datetime import datetime
+from unittest import mock
+
+from msrest.exceptions import HttpOperationError
+
+from azure.cli.command_modules.keyvault.custom import create_vault_archive, restore_vault_archive
+
+VAULT = 'https://myvault.vault.azure.net'
+
+
+class _Object:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class _Response:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.reason = 'Too Many Requests'
+        self.text = ''
+
+    def raise_for_status(self):
+        pass
+
+
+class _VaultClient:
+    """ An in-process vault storing the backups of its objects, which throttles the first requests. """
+
+    def __init__(self, objects=None, throttled_requests=0):
+        self.lock = threading.Lock()
+        # (type, name) -> updated
+        self.objects = dict(objects or {})
+        self.throttled_requests = throttled_requests
+        self.backups = []
+        self.restored = []
+
+    def _list(self, object_type):
+        return [_Object(id='{}/{}s/{}'.format(VAULT, t, name), managed=False,
+                        attributes=_Object(updated=updated))
+                for (t, name), updated in sorted(self.objects.items()) if t == object_type]
+
+    def _throttle(self):
+        with self.lock:
+            if self.throttled_requests:
+                self.throttled_requests -= 1
+                raise HttpOperationError(None, _Response(429, {'Retry-After': '0'}))
+
+    def _backup(self, object_type, name):
+        self._throttle()
+        with self.lock:
+            self.backups.append((object_type, name))
+        return _Object(value='{}:{}:{}'.format(object_type, name, self.objects[(object_type, name)]).encode())
+
+    def _restore(self, data):
+        self._throttle()
+        object_type, name, _ = data.decode().split(':', 2)
+        with self.lock:
+            if (object_type, name) in self.objects:
+                raise ValueError('{} already exists'.format(name))
+            self.restored.append((object_type, name))
+
+    def get_secrets(self, _):
+        return self._list('secret') + [_Object(id=VAULT + '/secrets/cert', managed=True, attributes=None)]
+
+    def get_keys(self, _):
+        return self._list('key')
+
+    def get_certificates(self, _):
+        return self._list('certificate')
+
+    def backup_secret(self, _, name):
+        return self._backup('secret', name)
+
+    def backup_key(self, _, name):
+        return self._backup('key', name)
+
+    def backup_certificate(self, _, name):
+        return self._backup('certificate', name)
+
+    def restore_secret(self, _, data):
+        return self._restore(data)
+
+    def restore_key(self, _, data):
+        return self._restore(data)
+
+    def restore_certificate(self, _, data):
+        return self._restore(data)
+
+
+class KeyVaultArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.archive = os.path.join(self.directory, 'backup.zip')
+        self.updated = datetime(2021, 9, 1)
+        self.objects = {('secret', 'secret{}'.format(i)): self.updated for i in range(20)}
+        self.objects.update({('key', 'key1'): self.updated, ('certificate', 'cert'): self.updated})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_archive_create_and_restore(self):
+        client = _VaultClient(self.objects)
+
+        result = create_vault_archive(client, VAULT, self.archive)
+
+        self.assertEqual(result['backedUp'], 22)
+        self.assertEqual(result['failed'], [])
+        # the secret backing the certificate is backed up with the certificate
+        self.assertEqual(sorted(client.backups), sorted(self.objects))
+        with zipfile.ZipFile(self.archive) as archive:
+            manifest = json.loads(archive.read('manifest.json').decode('utf-8'))
+        self.assertEqual(len(manifest['items']), 22)
+        self.assertEqual(manifest['items'][0]['type'], 'secret')
+
+        client = _VaultClient()
+        result = restore_vault_archive(client, VAULT, self.archive)
+        self.assertEqual(result['restored'], 22)
+        self.assertEqual(sorted(client.restored), sorted(self.objects))
+
+        client = _VaultClient()
+        result = restore_vault_archive(client, VAULT, self.archive, object_types=['key'])
+        self.assertEqual(client.restored, [('key', 'key1')])
+
+    def test_archive_create_incremental(self):
+        create_vault_archive(_VaultClient(self.objects), VAULT, self.archive)
+
+        self.objects[('secret', 'secret1')] = datetime(2021, 9, 2)
+        self.objects[('secret', 'new')] = self.updated
+        client = _VaultClient(self.objects)
+        result = create_vault_archive(client, VAULT, self.archive, base_archive=self.archive)
+
+        self.assertEqual(sorted(client.backups), [('secret', 'new'), ('secret', 'secret1')])
+        self.assertEqual((result['backedUp'], result['unchanged']), (2, 21))
+
+        client = _VaultClient()
+        restore_vault_archive(client, VAULT, self.archive)
+        self.assertEqual(len(client.restored), 23)
+
+    def test_archive_throttling_and_failures(self):
+        client = _VaultClient(self.objects, throttled_requests=3)
+        result = create_vault_archive(client, VAULT, self.archive, max_workers=4)
+        self.assertEqual(result['backedUp'], 22)
+
+        with mock.patch('azure.cli.command_modules.keyvault.custom.ARCHIVE_THROTTLED_RETRIES', 0):
+            client = _VaultClient(throttled_requests=1)
+            client.objects[('secret', 'secret2')] = self.updated
+            result = restore_vault_archive(client, VAULT, self.archive, names=['secret1', 'secret2', 'secret3'],
+                                           max_workers=1)
+
+        self.assertEqual(result['restored'], 1)
+        failed = sorted(result['failed'], key=lambda f: f['name'])
+        self.assertEqual([f['name'] for f in failed], ['secret1', 'secret2'])
+        self.assertTrue(failed[0]['throttled'])
+        self.assertFalse(failed[1]['throttled'])
+        self.assertIn('already exists', failed[1]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1057,6 +1057,11 @@ examples:
     text: |
         az network application-gateway update --name MyApplicationGateway --resource-group MyResourceGroup --set useRemoteGateways=true
     crafted: true
+  - name: Add a listener and a rule with a single update of the application gateway. The commands run with --defer change the application gateway in the local cache, the update sends it to Azure.
+    text: |
+        az network application-gateway http-listener create -g MyResourceGroup --gateway-name MyApplicationGateway -n MyListener --frontend-port MyFrontendPort --defer
+        az network application-gateway rule create -g MyResourceGroup --gateway-name MyApplicationGateway -n MyRule --http-listener MyListener --address-pool MyAddressPool --http-settings MyHttpSettings --defer
+        az network application-gateway update -g MyResourceGroup -n MyApplicationGateway
 """
 
 helps['network application-gateway url-path-map'] = """
@@ -4314,6 +4319,10 @@ short-summary: Manage network security group rules.
 helps['network nsg rule create'] = """
 type: command
 short-summary: Create a network security group rule.
+long-summary: >
+    With --defer, the rule is added to the network security group in the local cache. Only creating rules can be
+    deferred: commit the deferred rules, for example with `az network nsg update`, before updating or deleting
+    rules of the same network security group.
 examples:
   - name: Create a basic "Allow" NSG rule with the highest priority.
     text: >
@@ -4334,6 +4343,13 @@ examples:
         az network nsg rule create -g MyResourceGroup --nsg-name MyNsg -n MyNsgRuleWithAsg \\
             --priority 500 --source-address-prefixes Internet --destination-port-ranges 80 8080 \\
             --destination-asgs Web --access Allow --protocol Tcp --description "Allow Internet to Web ASG on ports 80,8080."
+  - name: Create two rules with a single update of the network security group.
+    text: |
+        az network nsg rule create -g MyResourceGroup --nsg-name MyNsg -n AllowHttp --priority 100 \\
+            --destination-port-ranges 80 --access Allow --protocol Tcp --defer
+        az network nsg rule create -g MyResourceGroup --nsg-name MyNsg -n AllowHttps --priority 110 \\
+            --destination-port-ranges 443 --access Allow --protocol Tcp --defer
+        az network nsg update -g MyResourceGroup -n MyNsg
 """
 
 helps['network nsg rule delete'] = """
@@ -5031,11 +5047,22 @@ short-summary: Manage routes in a route table.
 helps['network route-table route create'] = """
 type: command
 short-summary: Create a route in a route table.
+long-summary: >
+    With --defer, the route is added to the route table in the local cache. Only creating routes can be deferred:
+    commit the deferred routes, for example with `az network route-table update`, before updating or deleting
+    routes of the same route table.
 examples:
   - name: Create a route that forces all inbound traffic to a Network Virtual Appliance.
     text: |
         az network route-table route create -g MyResourceGroup --route-table-name MyRouteTable -n MyRoute \\
             --next-hop-type VirtualAppliance --address-prefix 10.0.0.0/16 --next-hop-ip-address 10.0.100.4
+  - name: Create two routes with a single update of the route table.
+    text: |
+        az network route-table route create -g MyResourceGroup --route-table-name MyRouteTable -n MyRoute1 \\
+            --next-hop-type VirtualAppliance --address-prefix 10.0.0.0/16 --next-hop-ip-address 10.0.100.4 --defer
+        az network route-table route create -g MyResourceGroup --route-table-name MyRouteTable -n MyRoute2 \\
+            --next-hop-type Internet --address-prefix 10.1.0.0/16 --defer
+        az network route-table update -g MyResourceGroup -n MyRouteTable
 """
 
 helps['network route-table route delete'] = """
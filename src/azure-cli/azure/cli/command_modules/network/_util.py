@@ -5,10 +5,11 @@
 
 import sys
 from knack.util import CLIError
+from azure.cli.core.commands import cached_get, cached_put
 from azure.cli.core.util import sdk_no_wait
 
 from ._client_factory import network_client_factory
-from .custom import lb_get
+from .custom import lb_get_operation
 from azure.cli.core.azclierror import UnrecognizedArgumentError
 
 
@@ -48,7 +49,7 @@ def delete_network_resource_property_entry(resource, prop):
 
     def delete_func(cmd, resource_group_name, resource_name, item_name, no_wait=False):  # pylint: disable=unused-argument
         client = getattr(network_client_factory(cmd.cli_ctx), resource)
-        item = client.get(resource_group_name, resource_name)
+        item = cached_get(cmd, client.get, resource_group_name, resource_name)
 
         if item.__getattribute__(prop) is not None:
             keep_items = [x for x in item.__getattribute__(prop) if x.name.lower() != item_name.lower()]
@@ -58,10 +59,11 @@ def delete_network_resource_property_entry(resource, prop):
         with cmd.update_context(item) as c:
             c.set_param(prop, keep_items)
         if no_wait:
-            sdk_no_wait(no_wait, client.begin_create_or_update, resource_group_name, resource_name, item)
+            sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, item,
+                        resource_group_name, resource_name)
         else:
-            result = sdk_no_wait(no_wait, client.begin_create_or_update,
-                                 resource_group_name, resource_name, item).result()
+            result = sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, item,
+                                 resource_group_name, resource_name).result()
             if next((x for x in getattr(result, prop) or [] if x.name.lower() == item_name.lower()), None):
                 raise CLIError("Failed to delete '{}' on '{}'".format(item_name, resource_name))
 
@@ -76,7 +78,7 @@ def delete_lb_resource_property_entry(resource, prop):
 
     def delete_func(cmd, resource_group_name, resource_name, item_name, no_wait=False):  # pylint: disable=unused-argument
         client = getattr(network_client_factory(cmd.cli_ctx), resource)
-        item = lb_get(client, resource_group_name, resource_name)
+        item = lb_get_operation(cached_get(cmd, client.get, resource_group_name, resource_name))
 
         if item.__getattribute__(prop) is not None:
             keep_items = [x for x in item.__getattribute__(prop) if x.name.lower() != item_name.lower()]
@@ -86,10 +88,11 @@ def delete_lb_resource_property_entry(resource, prop):
         with cmd.update_context(item) as c:
             c.set_param(prop, keep_items)
         if no_wait:
-            sdk_no_wait(no_wait, client.begin_create_or_update, resource_group_name, resource_name, item)
+            sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, item,
+                        resource_group_name, resource_name)
         else:
-            result = sdk_no_wait(no_wait, client.begin_create_or_update,
-                                 resource_group_name, resource_name, item).result()
+            result = sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, item,
+                                 resource_group_name, resource_name).result()
             if next((x for x in getattr(result, prop) or [] if x.name.lower() == item_name.lower()), None):
                 raise CLIError("Failed to delete '{}' on '{}'".format(item_name, resource_name))
 
@@ -489,7 +489,7 @@ def load_command_table(self, _):
         g.command('start', 'begin_start')
         g.command('stop', 'begin_stop')
         g.custom_command('show-backend-health', 'show_ag_backend_health', min_api='2016-09-01', client_factory=cf_application_gateways)
-        g.generic_update_command('update', supports_no_wait=True, setter_name='begin_create_or_update', custom_func_name='update_application_gateway')
+        g.generic_update_command('update', supports_no_wait=True, setter_name='begin_create_or_update', custom_func_name='update_application_gateway', supports_local_cache=True)
         g.wait_command('wait')
 
     subresource_properties = [
@@ -525,48 +525,50 @@ def load_command_table(self, _):
         with self.command_group('network application-gateway {}'.format(alias), network_util) as g:
             g.command('list', list_network_resource_property('application_gateways', subresource))
             g.show_command('show', get_network_resource_property_entry('application_gateways', subresource))
-            g.command('delete', delete_network_resource_property_entry('application_gateways', subresource), supports_no_wait=True)
-            g.custom_command('create', 'create_ag_{}'.format(_make_singular(subresource)), supports_no_wait=True, validator=create_validator)
+            g.command('delete', delete_network_resource_property_entry('application_gateways', subresource), supports_no_wait=True, supports_local_cache=True)
+            g.custom_command('create', 'create_ag_{}'.format(_make_singular(subresource)), supports_no_wait=True, validator=create_validator, supports_local_cache=True)
             g.generic_update_command('update', command_type=network_ag_sdk, supports_no_wait=True,
                                      setter_name='begin_create_or_update',
                                      custom_func_name='update_ag_{}'.format(_make_singular(subresource)),
-                                     child_collection_prop_name=subresource, validator=create_validator)
+                                     child_collection_prop_name=subresource, validator=create_validator,
+                                     supports_local_cache=True)
 
     with self.command_group('network application-gateway rewrite-rule', network_ag_sdk, min_api='2018-12-01') as g:
-        g.custom_command('create', 'create_ag_rewrite_rule', supports_no_wait=True)
+        g.custom_command('create', 'create_ag_rewrite_rule', supports_no_wait=True, supports_local_cache=True)
         g.custom_show_command('show', 'show_ag_rewrite_rule')
         g.custom_command('list', 'list_ag_rewrite_rules')
-        g.custom_command('delete', 'delete_ag_rewrite_rule', supports_no_wait=True)
+        g.custom_command('delete', 'delete_ag_rewrite_rule', supports_no_wait=True, supports_local_cache=True)
         g.generic_update_command('update', command_type=network_ag_sdk, supports_no_wait=True,
                                  setter_name='begin_create_or_update',
                                  custom_func_name='update_ag_rewrite_rule',
                                  child_collection_prop_name='rewrite_rule_sets.rewrite_rules',
                                  child_collection_key='name.name',
-                                 child_arg_name='rule_set_name.rule_name')
+                                 child_arg_name='rule_set_name.rule_name', supports_local_cache=True)
 
     with self.command_group('network application-gateway rewrite-rule condition', network_ag_sdk, min_api='2018-12-01') as g:
-        g.custom_command('create', 'create_ag_rewrite_rule_condition', supports_no_wait=True)
+        g.custom_command('create', 'create_ag_rewrite_rule_condition', supports_no_wait=True, supports_local_cache=True)
         g.custom_show_command('show', 'show_ag_rewrite_rule_condition')
         g.custom_command('list', 'list_ag_rewrite_rule_conditions')
-        g.custom_command('delete', 'delete_ag_rewrite_rule_condition', supports_no_wait=True)
+        g.custom_command('delete', 'delete_ag_rewrite_rule_condition', supports_no_wait=True, supports_local_cache=True)
         g.generic_update_command('update', command_type=network_ag_sdk, supports_no_wait=True,
                                  setter_name='begin_create_or_update',
                                  custom_func_name='update_ag_rewrite_rule_condition',
                                  child_collection_prop_name='rewrite_rule_sets.rewrite_rules.conditions',
                                  child_collection_key='name.name.variable',
-                                 child_arg_name='rule_set_name.rule_name.variable')
+                                 child_arg_name='rule_set_name.rule_name.variable', supports_local_cache=True)
 
     with self.command_group('network application-gateway redirect-config', network_util, min_api='2017-06-01') as g:
         subresource = 'redirect_configurations'
         g.command('list', list_network_resource_property('application_gateways', subresource))
         g.show_command('show', get_network_resource_property_entry('application_gateways', subresource))
-        g.command('delete', delete_network_resource_property_entry('application_gateways', subresource), supports_no_wait=True)
-        g.custom_command('create', 'create_ag_{}'.format(_make_singular(subresource)), supports_no_wait=True, doc_string_source='ApplicationGatewayRedirectConfiguration')
+        g.command('delete', delete_network_resource_property_entry('application_gateways', subresource), supports_no_wait=True, supports_local_cache=True)
+        g.custom_command('create', 'create_ag_{}'.format(_make_singular(subresource)), supports_no_wait=True, doc_string_source='ApplicationGatewayRedirectConfiguration', supports_local_cache=True)
         g.generic_update_command('update', command_type=network_ag_sdk,
                                  client_factory=cf_application_gateways, supports_no_wait=True,
                                  setter_name='begin_create_or_update',
                                  custom_func_name='update_ag_{}'.format(_make_singular(subresource)),
-                                 child_collection_prop_name=subresource, doc_string_source='ApplicationGatewayRedirectConfiguration')
+                                 child_collection_prop_name=subresource, doc_string_source='ApplicationGatewayRedirectConfiguration',
+                                 supports_local_cache=True)
 
     with self.command_group('network application-gateway rewrite-rule', network_ag_sdk, min_api='2018-12-01') as g:
         g.command('condition list-server-variables', 'list_available_server_variables')
@@ -574,8 +576,8 @@ def load_command_table(self, _):
         g.command('list-response-headers', 'list_available_response_headers')
 
     with self.command_group('network application-gateway ssl-policy') as g:
-        g.custom_command('set', 'set_ag_ssl_policy_2017_06_01', min_api='2017-06-01', supports_no_wait=True, validator=process_ag_ssl_policy_set_namespace, doc_string_source='ApplicationGatewaySslPolicy')
-        g.custom_command('set', 'set_ag_ssl_policy_2017_03_01', max_api='2017-03-01', supports_no_wait=True, validator=process_ag_ssl_policy_set_namespace)
+        g.custom_command('set', 'set_ag_ssl_policy_2017_06_01', min_api='2017-06-01', supports_no_wait=True, validator=process_ag_ssl_policy_set_namespace, doc_string_source='ApplicationGatewaySslPolicy', supports_local_cache=True)
+        g.custom_command('set', 'set_ag_ssl_policy_2017_03_01', max_api='2017-03-01', supports_no_wait=True, validator=process_ag_ssl_policy_set_namespace, supports_local_cache=True)
         g.custom_show_command('show', 'show_ag_ssl_policy')
 
     with self.command_group('network application-gateway ssl-policy', network_ag_sdk, min_api='2017-06-01') as g:
@@ -584,12 +586,12 @@ def load_command_table(self, _):
         g.show_command('predefined show', 'get_ssl_predefined_policy')
 
     with self.command_group('network application-gateway url-path-map rule') as g:
-        g.custom_command('create', 'create_ag_url_path_map_rule', supports_no_wait=True, validator=process_ag_url_path_map_rule_create_namespace)
-        g.custom_command('delete', 'delete_ag_url_path_map_rule', supports_no_wait=True)
+        g.custom_command('create', 'create_ag_url_path_map_rule', supports_no_wait=True, validator=process_ag_url_path_map_rule_create_namespace, supports_local_cache=True)
+        g.custom_command('delete', 'delete_ag_url_path_map_rule', supports_no_wait=True, supports_local_cache=True)
 
     with self.command_group('network application-gateway waf-config') as g:
-        g.custom_command('set', 'set_ag_waf_config_2017_03_01', min_api='2017-03-01', supports_no_wait=True)
-        g.custom_command('set', 'set_ag_waf_config_2016_09_01', max_api='2016-09-01', supports_no_wait=True)
+        g.custom_command('set', 'set_ag_waf_config_2017_03_01', min_api='2017-03-01', supports_no_wait=True, supports_local_cache=True)
+        g.custom_command('set', 'set_ag_waf_config_2016_09_01', max_api='2016-09-01', supports_no_wait=True, supports_local_cache=True)
         g.custom_show_command('show', 'show_ag_waf_config')
         g.custom_command('list-rule-sets', 'list_ag_waf_rule_sets', min_api='2017-03-01', client_factory=cf_application_gateways, table_transformer=transform_waf_rule_sets_table_output)
 
@@ -903,10 +905,10 @@ def load_command_table(self, _):
         with self.command_group('network lb {}'.format(alias), network_util) as g:
             g.command('list', list_network_resource_property('load_balancers', subresource))
             g.show_command('show', get_network_resource_property_entry('load_balancers', subresource))
-            g.command('delete', delete_lb_resource_property_entry('load_balancers', subresource))
+            g.command('delete', delete_lb_resource_property_entry('load_balancers', subresource), supports_local_cache=True)
 
     with self.command_group('network lb frontend-ip', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_frontend_ip_configuration', validator=process_lb_frontend_ip_namespace)
+        g.custom_command('create', 'create_lb_frontend_ip_configuration', validator=process_lb_frontend_ip_namespace, supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='frontend_ip_configurations',
                                  getter_name='lb_get',
                                  getter_type=network_load_balancers_custom,
@@ -916,20 +918,16 @@ def load_command_table(self, _):
                                  validator=process_lb_frontend_ip_namespace)
 
     with self.command_group('network lb inbound-nat-rule', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_inbound_nat_rule')
+        g.custom_command('create', 'create_lb_inbound_nat_rule', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='inbound_nat_rules',
-                                 getter_name='lb_get',
-                                 getter_type=network_load_balancers_custom,
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_inbound_nat_rule')
+                                 custom_func_name='set_lb_inbound_nat_rule', supports_local_cache=True)
 
     with self.command_group('network lb inbound-nat-pool', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_inbound_nat_pool')
+        g.custom_command('create', 'create_lb_inbound_nat_pool', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='inbound_nat_pools',
-                                 getter_name='lb_get',
-                                 getter_type=network_load_balancers_custom,
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_inbound_nat_pool')
+                                 custom_func_name='set_lb_inbound_nat_pool', supports_local_cache=True)
 
     with self.command_group('network lb address-pool', network_lb_backend_pool_sdk) as g:
         g.custom_command('create', 'create_lb_backend_address_pool')
@@ -943,7 +941,7 @@ def load_command_table(self, _):
     with self.command_group('network lb address-pool', network_util, max_api='2020-03-01') as g:
         g.command('list', list_network_resource_property('load_balancers', 'backend_address_pools'))
         g.show_command('show', get_network_resource_property_entry('load_balancers', 'backend_address_pools'))
-        g.command('delete', delete_lb_resource_property_entry('load_balancers', 'backend_address_pools'))
+        g.command('delete', delete_lb_resource_property_entry('load_balancers', 'backend_address_pools'), supports_local_cache=True)
 
     with self.command_group('network lb address-pool address', network_lb_backend_pool_sdk, is_preview=True) as g:
         g.custom_command('add', 'add_lb_backend_address_pool_address')
@@ -957,33 +955,29 @@ def load_command_table(self, _):
         g.custom_command('list', 'list_lb_backend_address_pool_tunnel_interface')
 
     with self.command_group('network lb rule', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_rule')
+        g.custom_command('create', 'create_lb_rule', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='load_balancing_rules',
-                                 getter_name='lb_get',
-                                 getter_type=network_load_balancers_custom,
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_rule')
+                                 custom_func_name='set_lb_rule', supports_local_cache=True)
 
     with self.command_group('network lb probe', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_probe')
+        g.custom_command('create', 'create_lb_probe', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='probes',
-                                 getter_name='lb_get',
-                                 getter_type=network_load_balancers_custom,
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_probe')
+                                 custom_func_name='set_lb_probe', supports_local_cache=True)
 
     with self.command_group('network lb outbound-rule', network_lb_sdk, min_api='2018-07-01') as g:
-        g.custom_command('create', 'create_lb_outbound_rule', validator=process_lb_outbound_rule_namespace)
+        g.custom_command('create', 'create_lb_outbound_rule', validator=process_lb_outbound_rule_namespace,
+                         supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='outbound_rules',
-                                 getter_name='lb_get',
-                                 getter_type=network_load_balancers_custom,
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_outbound_rule', validator=process_lb_outbound_rule_namespace)
+                                 custom_func_name='set_lb_outbound_rule', validator=process_lb_outbound_rule_namespace,
+                                 supports_local_cache=True)
 
     with self.command_group('network lb outbound-rule', network_util, min_api='2018-07-01') as g:
         g.command('list', list_network_resource_property('load_balancers', 'outbound_rules'))
         g.show_command('show', get_network_resource_property_entry('load_balancers', 'outbound_rules'))
-        g.command('delete', delete_lb_resource_property_entry('load_balancers', 'outbound_rules'))
+        g.command('delete', delete_lb_resource_property_entry('load_balancers', 'outbound_rules'), supports_local_cache=True)
     # endregion
 
     # region cross-region load balancer
@@ -1005,10 +999,10 @@ def load_command_table(self, _):
         with self.command_group('network cross-region-lb {}'.format(alias), network_util) as g:
             g.command('list', list_network_resource_property('load_balancers', subresource))
             g.show_command('show', get_network_resource_property_entry('load_balancers', subresource))
-            g.command('delete', delete_lb_resource_property_entry('load_balancers', subresource))
+            g.command('delete', delete_lb_resource_property_entry('load_balancers', subresource), supports_local_cache=True)
 
     with self.command_group('network cross-region-lb frontend-ip', network_lb_sdk) as g:
-        g.custom_command('create', 'create_cross_region_lb_frontend_ip_configuration', validator=process_cross_region_lb_frontend_ip_namespace)
+        g.custom_command('create', 'create_cross_region_lb_frontend_ip_configuration', validator=process_cross_region_lb_frontend_ip_namespace, supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='frontend_ip_configurations',
                                  setter_name='begin_create_or_update',
                                  custom_func_name='set_cross_region_lb_frontend_ip_configuration',
@@ -1026,16 +1020,16 @@ def load_command_table(self, _):
         g.custom_command('list', 'list_lb_backend_address_pool_address')
 
     with self.command_group('network cross-region-lb rule', network_lb_sdk) as g:
-        g.custom_command('create', 'create_cross_region_lb_rule')
+        g.custom_command('create', 'create_cross_region_lb_rule', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='load_balancing_rules',
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_cross_region_lb_rule')
+                                 custom_func_name='set_cross_region_lb_rule', supports_local_cache=True)
 
     with self.command_group('network cross-region-lb probe', network_lb_sdk) as g:
-        g.custom_command('create', 'create_lb_probe')
+        g.custom_command('create', 'create_lb_probe', supports_local_cache=True)
         g.generic_update_command('update', child_collection_prop_name='probes',
                                  setter_name='begin_create_or_update',
-                                 custom_func_name='set_lb_probe')
+                                 custom_func_name='set_lb_probe', supports_local_cache=True)
     # endregion
 
     # region LocalGateways
@@ -1088,17 +1082,17 @@ def load_command_table(self, _):
         g.show_command('show', 'get')
         g.custom_command('list', 'list_nsgs')
         g.custom_command('create', 'create_nsg', transform=transform_nsg_create_output)
-        g.generic_update_command('update', setter_name='begin_create_or_update')
+        g.generic_update_command('update', setter_name='begin_create_or_update', supports_local_cache=True)
 
     with self.command_group('network nsg rule', network_nsg_rule_sdk) as g:
         g.command('delete', 'begin_delete')
         g.custom_command('list', 'list_nsg_rules', table_transformer=lambda x: [transform_nsg_rule_table_output(i) for i in x])
         g.show_command('show', 'get', table_transformer=transform_nsg_rule_table_output)
-        g.custom_command('create', 'create_nsg_rule_2017_06_01', min_api='2017-06-01')
+        g.custom_command('create', 'create_nsg_rule_2017_06_01', min_api='2017-06-01', supports_local_cache=True)
         g.generic_update_command('update', setter_arg_name='security_rule_parameters', min_api='2017-06-01',
                                  setter_name='begin_create_or_update',
                                  custom_func_name='update_nsg_rule_2017_06_01', doc_string_source='SecurityRule')
-        g.custom_command('create', 'create_nsg_rule_2017_03_01', max_api='2017-03-01')
+        g.custom_command('create', 'create_nsg_rule_2017_03_01', max_api='2017-03-01', supports_local_cache=True)
         g.generic_update_command('update', max_api='2017-03-01', setter_arg_name='security_rule_parameters',
                                  setter_name='begin_create_or_update',
                                  custom_func_name='update_nsg_rule_2017_03_01', doc_string_source='SecurityRule')
@@ -1268,14 +1262,14 @@ def load_command_table(self, _):
         g.command('delete', 'begin_delete')
         g.show_command('show', 'get')
         g.custom_command('list', 'list_route_tables')
-        g.generic_update_command('update', setter_name='begin_create_or_update', custom_func_name='update_route_table')
+        g.generic_update_command('update', setter_name='begin_create_or_update', custom_func_name='update_route_table', supports_local_cache=True)
 
     network_rtr_sdk = CliCommandType(
         operations_tmpl='azure.mgmt.network.operations#RoutesOperations.{}',
         client_factory=cf_routes
     )
     with self.command_group('network route-table route', network_rtr_sdk) as g:
-        g.custom_command('create', 'create_route')
+        g.custom_command('create', 'create_route', supports_local_cache=True)
         g.command('delete', 'begin_delete')
         g.show_command('show', 'get')
         g.command('list', 'list')
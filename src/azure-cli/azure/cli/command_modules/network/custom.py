@@ -300,10 +300,11 @@ def create_ag_authentication_certificate(cmd, resource_group_name, application_g
                                          cert_data, no_wait=False):
     AuthCert = cmd.get_models('ApplicationGatewayAuthenticationCertificate')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     new_cert = AuthCert(data=cert_data, name=item_name)
     upsert_to_collection(ag, 'authentication_certificates', new_cert, 'name')
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_authentication_certificate(instance, parent, item_name, cert_data):
@@ -315,19 +316,28 @@ def create_ag_backend_address_pool(cmd, resource_group_name, application_gateway
                                    servers=None, no_wait=False):
     ApplicationGatewayBackendAddressPool = cmd.get_models('ApplicationGatewayBackendAddressPool')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
-    new_pool = ApplicationGatewayBackendAddressPool(name=item_name, backend_addresses=servers)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
+    new_pool = ApplicationGatewayBackendAddressPool(name=item_name,
+                                                    backend_addresses=_get_ag_backend_addresses(cmd, servers))
     upsert_to_collection(ag, 'backend_address_pools', new_pool, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
-def update_ag_backend_address_pool(instance, parent, item_name, servers=None):
+def update_ag_backend_address_pool(cmd, instance, parent, item_name, servers=None):
     if servers is not None:
-        instance.backend_addresses = servers
+        instance.backend_addresses = _get_ag_backend_addresses(cmd, servers)
     return parent
 
 
+def _get_ag_backend_addresses(cmd, servers):
+    # models rather than the dicts of the validator, so that the gateway can be cached with --defer
+    if not servers:
+        return servers
+    ApplicationGatewayBackendAddress = cmd.get_models('ApplicationGatewayBackendAddress')
+    return [ApplicationGatewayBackendAddress(**server) for server in servers]
+
+
 def create_ag_frontend_ip_configuration(cmd, resource_group_name, application_gateway_name, item_name,
                                         public_ip_address=None, subnet=None,
                                         virtual_network_name=None, private_ip_address=None,
@@ -335,7 +345,7 @@ def create_ag_frontend_ip_configuration(cmd, resource_group_name, application_ga
     ApplicationGatewayFrontendIPConfiguration, SubResource = cmd.get_models(
         'ApplicationGatewayFrontendIPConfiguration', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     if public_ip_address:
         new_config = ApplicationGatewayFrontendIPConfiguration(
             name=item_name,
@@ -347,8 +357,8 @@ def create_ag_frontend_ip_configuration(cmd, resource_group_name, application_ga
             private_ip_allocation_method='Static' if private_ip_address else 'Dynamic',
             subnet=SubResource(id=subnet))
     upsert_to_collection(ag, 'frontend_ip_configurations', new_config, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_frontend_ip_configuration(cmd, instance, parent, item_name, public_ip_address=None,
@@ -369,11 +379,11 @@ def create_ag_frontend_port(cmd, resource_group_name, application_gateway_name,
                             no_wait=False):
     ApplicationGatewayFrontendPort = cmd.get_models('ApplicationGatewayFrontendPort')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     new_port = ApplicationGatewayFrontendPort(name=item_name, port=port)
     upsert_to_collection(ag, 'frontend_ports', new_port, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_frontend_port(instance, parent, item_name, port=None):
@@ -387,7 +397,7 @@ def create_ag_http_listener(cmd, resource_group_name, application_gateway_name,
                             firewall_policy=None, no_wait=False, host_names=None):
     ApplicationGatewayHttpListener, SubResource = cmd.get_models('ApplicationGatewayHttpListener', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     if not frontend_ip:
         frontend_ip = _get_default_id(ag, 'frontend_ip_configurations', '--frontend-ip')
     new_listener = ApplicationGatewayHttpListener(
@@ -405,8 +415,8 @@ def create_ag_http_listener(cmd, resource_group_name, application_gateway_name,
         new_listener.firewall_policy = SubResource(id=firewall_policy) if firewall_policy else None
 
     upsert_to_collection(ag, 'http_listeners', new_listener, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_http_listener(cmd, instance, parent, item_name, frontend_ip=None, frontend_port=None,
@@ -918,7 +928,7 @@ def create_ag_backend_http_settings_collection(cmd, resource_group_name, applica
     ApplicationGatewayBackendHttpSettings, ApplicationGatewayConnectionDraining, SubResource = cmd.get_models(
         'ApplicationGatewayBackendHttpSettings', 'ApplicationGatewayConnectionDraining', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     new_settings = ApplicationGatewayBackendHttpSettings(
         port=port,
         protocol=protocol,
@@ -941,8 +951,8 @@ def create_ag_backend_http_settings_collection(cmd, resource_group_name, applica
     if cmd.supported_api_version(min_api='2019-04-01'):
         new_settings.trusted_root_certificates = [SubResource(id=x) for x in root_certs or []]
     upsert_to_collection(ag, 'backend_http_settings_collection', new_settings, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_backend_http_settings_collection(cmd, instance, parent, item_name, port=None, probe=None, protocol=None,
@@ -994,7 +1004,7 @@ def create_ag_redirect_configuration(cmd, resource_group_name, application_gatew
     ApplicationGatewayRedirectConfiguration, SubResource = cmd.get_models(
         'ApplicationGatewayRedirectConfiguration', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     new_config = ApplicationGatewayRedirectConfiguration(
         name=item_name,
         redirect_type=redirect_type,
@@ -1003,7 +1013,8 @@ def create_ag_redirect_configuration(cmd, resource_group_name, application_gatew
         include_path=include_path,
         include_query_string=include_query_string)
     upsert_to_collection(ag, 'redirect_configurations', new_config, 'name')
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_redirect_configuration(cmd, instance, parent, item_name, redirect_type=None,
@@ -1029,13 +1040,14 @@ def create_ag_rewrite_rule_set(cmd, resource_group_name, application_gateway_nam
     ApplicationGatewayRewriteRuleSet = cmd.get_models(
         'ApplicationGatewayRewriteRuleSet')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     new_set = ApplicationGatewayRewriteRuleSet(name=item_name)
     upsert_to_collection(ag, 'rewrite_rule_sets', new_set, 'name')
     if no_wait:
-        return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
-    parent = sdk_no_wait(no_wait, ncf.begin_create_or_update,
-                         resource_group_name, application_gateway_name, ag).result()
+        return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                           resource_group_name, application_gateway_name)
+    parent = sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                         resource_group_name, application_gateway_name).result()
     return find_child_item(parent, item_name,
                            path='rewrite_rule_sets', key_path='name')
 
@@ -1053,7 +1065,7 @@ def create_ag_rewrite_rule(cmd, resource_group_name, application_gateway_name, r
                                                           'ApplicationGatewayRewriteRuleActionSet',
                                                           'ApplicationGatewayUrlConfiguration')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     rule_set = find_child_item(ag, rule_set_name,
                                path='rewrite_rule_sets', key_path='name')
     url_configuration = None
@@ -1072,9 +1084,10 @@ def create_ag_rewrite_rule(cmd, resource_group_name, application_gateway_name, r
     )
     upsert_to_collection(rule_set, 'rewrite_rules', new_rule, 'name')
     if no_wait:
-        return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
-    parent = sdk_no_wait(no_wait, ncf.begin_create_or_update,
-                         resource_group_name, application_gateway_name, ag).result()
+        return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                           resource_group_name, application_gateway_name)
+    parent = sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                         resource_group_name, application_gateway_name).result()
     return find_child_item(parent, rule_set_name, rule_name,
                            path='rewrite_rule_sets.rewrite_rules', key_path='name.name')
 
@@ -1111,11 +1124,12 @@ def list_ag_rewrite_rules(cmd, resource_group_name, application_gateway_name, ru
 
 def delete_ag_rewrite_rule(cmd, resource_group_name, application_gateway_name, rule_set_name, rule_name, no_wait=None):
     client = network_client_factory(cmd.cli_ctx).application_gateways
-    gateway = client.get(resource_group_name, application_gateway_name)
+    gateway = cached_get(cmd, client.get, resource_group_name, application_gateway_name)
     rule_set = find_child_item(gateway, rule_set_name, path='rewrite_rule_sets', key_path='name')
     rule = find_child_item(rule_set, rule_name, path='rewrite_rules', key_path='name')
     rule_set.rewrite_rules.remove(rule)
-    sdk_no_wait(no_wait, client.begin_create_or_update, resource_group_name, application_gateway_name, gateway)
+    sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, gateway,
+                resource_group_name, application_gateway_name)
 
 
 def create_ag_rewrite_rule_condition(cmd, resource_group_name, application_gateway_name, rule_set_name, rule_name,
@@ -1123,7 +1137,7 @@ def create_ag_rewrite_rule_condition(cmd, resource_group_name, application_gatew
     ApplicationGatewayRewriteRuleCondition = cmd.get_models(
         'ApplicationGatewayRewriteRuleCondition')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     rule = find_child_item(ag, rule_set_name, rule_name,
                            path='rewrite_rule_sets.rewrite_rules', key_path='name.name')
     new_condition = ApplicationGatewayRewriteRuleCondition(
@@ -1134,9 +1148,10 @@ def create_ag_rewrite_rule_condition(cmd, resource_group_name, application_gatew
     )
     upsert_to_collection(rule, 'conditions', new_condition, 'variable')
     if no_wait:
-        return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
-    parent = sdk_no_wait(no_wait, ncf.begin_create_or_update,
-                         resource_group_name, application_gateway_name, ag).result()
+        return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                           resource_group_name, application_gateway_name)
+    parent = sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                         resource_group_name, application_gateway_name).result()
     return find_child_item(parent, rule_set_name, rule_name, variable,
                            path='rewrite_rule_sets.rewrite_rules.conditions', key_path='name.name.variable')
 
@@ -1168,12 +1183,13 @@ def list_ag_rewrite_rule_conditions(cmd, resource_group_name, application_gatewa
 def delete_ag_rewrite_rule_condition(cmd, resource_group_name, application_gateway_name, rule_set_name,
                                      rule_name, variable, no_wait=None):
     client = network_client_factory(cmd.cli_ctx).application_gateways
-    gateway = client.get(resource_group_name, application_gateway_name)
+    gateway = cached_get(cmd, client.get, resource_group_name, application_gateway_name)
     rule = find_child_item(gateway, rule_set_name, rule_name,
                            path='rewrite_rule_sets.rewrite_rules', key_path='name.name')
     condition = find_child_item(rule, variable, path='conditions', key_path='variable')
     rule.conditions.remove(condition)
-    sdk_no_wait(no_wait, client.begin_create_or_update, resource_group_name, application_gateway_name, gateway)
+    sdk_no_wait(no_wait, cached_put, cmd, client.begin_create_or_update, gateway,
+                resource_group_name, application_gateway_name)
 
 
 def create_ag_probe(cmd, resource_group_name, application_gateway_name, item_name, protocol, host,
@@ -1182,7 +1198,7 @@ def create_ag_probe(cmd, resource_group_name, application_gateway_name, item_nam
     ApplicationGatewayProbe, ProbeMatchCriteria = cmd.get_models(
         'ApplicationGatewayProbe', 'ApplicationGatewayProbeHealthResponseMatch')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     new_probe = ApplicationGatewayProbe(
         name=item_name,
         protocol=protocol,
@@ -1199,8 +1215,8 @@ def create_ag_probe(cmd, resource_group_name, application_gateway_name, item_nam
         new_probe.port = port
 
     upsert_to_collection(ag, 'probes', new_probe, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_probe(cmd, instance, parent, item_name, protocol=None, host=None, path=None,
@@ -1242,7 +1258,7 @@ def create_ag_request_routing_rule(cmd, resource_group_name, application_gateway
     ApplicationGatewayRequestRoutingRule, SubResource = cmd.get_models(
         'ApplicationGatewayRequestRoutingRule', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     if not address_pool and not redirect_config:
         address_pool = _get_default_id(ag, 'backend_address_pools', '--address-pool')
     if not http_settings and not redirect_config:
@@ -1264,8 +1280,8 @@ def create_ag_request_routing_rule(cmd, resource_group_name, application_gateway
     if cmd.supported_api_version(parameter_name=rewrite_rule_set_name):
         new_rule.rewrite_rule_set = SubResource(id=rewrite_rule_set) if rewrite_rule_set else None
     upsert_to_collection(ag, 'request_routing_rules', new_rule, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_request_routing_rule(cmd, instance, parent, item_name, address_pool=None,
@@ -1295,12 +1311,12 @@ def create_ag_ssl_certificate(cmd, resource_group_name, application_gateway_name
                               cert_password=None, key_vault_secret_id=None, no_wait=False):
     ApplicationGatewaySslCertificate = cmd.get_models('ApplicationGatewaySslCertificate')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     new_cert = ApplicationGatewaySslCertificate(
         name=item_name, data=cert_data, password=cert_password, key_vault_secret_id=key_vault_secret_id)
     upsert_to_collection(ag, 'ssl_certificates', new_cert, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_ssl_certificate(instance, parent, item_name,
@@ -1318,10 +1334,11 @@ def set_ag_ssl_policy_2017_03_01(cmd, resource_group_name, application_gateway_n
                                  clear=False, no_wait=False):
     ApplicationGatewaySslPolicy = cmd.get_models('ApplicationGatewaySslPolicy')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     ag.ssl_policy = None if clear else ApplicationGatewaySslPolicy(
         disabled_ssl_protocols=disabled_ssl_protocols)
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def set_ag_ssl_policy_2017_06_01(cmd, resource_group_name, application_gateway_name, policy_name=None, policy_type=None,
@@ -1330,7 +1347,7 @@ def set_ag_ssl_policy_2017_06_01(cmd, resource_group_name, application_gateway_n
     ApplicationGatewaySslPolicy, ApplicationGatewaySslPolicyType = cmd.get_models(
         'ApplicationGatewaySslPolicy', 'ApplicationGatewaySslPolicyType')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     policy_type = None
     if policy_name:
         policy_type = ApplicationGatewaySslPolicyType.predefined.value
@@ -1342,7 +1359,8 @@ def set_ag_ssl_policy_2017_06_01(cmd, resource_group_name, application_gateway_n
         disabled_ssl_protocols=disabled_ssl_protocols,
         cipher_suites=cipher_suites,
         min_protocol_version=min_protocol_version)
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def show_ag_ssl_policy(cmd, resource_group_name, application_gateway_name):
@@ -1354,12 +1372,12 @@ def create_ag_trusted_root_certificate(cmd, resource_group_name, application_gat
                                        cert_data=None, keyvault_secret=None):
     ApplicationGatewayTrustedRootCertificate = cmd.get_models('ApplicationGatewayTrustedRootCertificate')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     root_cert = ApplicationGatewayTrustedRootCertificate(name=item_name, data=cert_data,
                                                          key_vault_secret_id=keyvault_secret)
     upsert_to_collection(ag, 'trusted_root_certificates', root_cert, 'name')
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_trusted_root_certificate(instance, parent, item_name, cert_data=None, keyvault_secret=None):
@@ -1377,7 +1395,7 @@ def create_ag_url_path_map(cmd, resource_group_name, application_gateway_name, i
     ApplicationGatewayUrlPathMap, ApplicationGatewayPathRule, SubResource = cmd.get_models(
         'ApplicationGatewayUrlPathMap', 'ApplicationGatewayPathRule', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
 
     new_rule = ApplicationGatewayPathRule(
         name=rule_name,
@@ -1416,8 +1434,8 @@ def create_ag_url_path_map(cmd, resource_group_name, application_gateway_name, i
 
     new_map.path_rules.append(new_rule)
     upsert_to_collection(ag, 'url_path_maps', new_map, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def update_ag_url_path_map(cmd, instance, parent, item_name, default_address_pool=None,
@@ -1453,7 +1471,7 @@ def create_ag_url_path_map_rule(cmd, resource_group_name, application_gateway_na
     if address_pool and redirect_config:
         raise CLIError("Cannot reference a BackendAddressPool when Redirect Configuration is specified.")
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     url_map = next((x for x in ag.url_path_maps if x.name == url_path_map_name), None)
     if not url_map:
         raise CLIError('URL path map "{}" not found.'.format(url_path_map_name))
@@ -1479,21 +1497,21 @@ def create_ag_url_path_map_rule(cmd, resource_group_name, application_gateway_na
         new_rule.firewall_policy = SubResource(id=firewall_policy) if firewall_policy else None
 
     upsert_to_collection(url_map, 'path_rules', new_rule, 'name')
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def delete_ag_url_path_map_rule(cmd, resource_group_name, application_gateway_name, url_path_map_name,
                                 item_name, no_wait=False):
     ncf = network_client_factory(cmd.cli_ctx)
-    ag = ncf.application_gateways.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.application_gateways.get, resource_group_name, application_gateway_name)
     url_map = next((x for x in ag.url_path_maps if x.name == url_path_map_name), None)
     if not url_map:
         raise CLIError('URL path map "{}" not found.'.format(url_path_map_name))
     url_map.path_rules = \
         [x for x in url_map.path_rules if x.name.lower() != item_name.lower()]
-    return sdk_no_wait(no_wait, ncf.application_gateways.begin_create_or_update,
-                       resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.application_gateways.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def set_ag_waf_config_2016_09_01(cmd, resource_group_name, application_gateway_name, enabled,
@@ -1502,12 +1520,13 @@ def set_ag_waf_config_2016_09_01(cmd, resource_group_name, application_gateway_n
     ApplicationGatewayWebApplicationFirewallConfiguration = cmd.get_models(
         'ApplicationGatewayWebApplicationFirewallConfiguration')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     ag.web_application_firewall_configuration = \
         ApplicationGatewayWebApplicationFirewallConfiguration(
             enabled=(enabled == 'true'), firewall_mode=firewall_mode)
 
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def set_ag_waf_config_2017_03_01(cmd, resource_group_name, application_gateway_name, enabled,
@@ -1520,7 +1539,7 @@ def set_ag_waf_config_2017_03_01(cmd, resource_group_name, application_gateway_n
     ApplicationGatewayWebApplicationFirewallConfiguration = cmd.get_models(
         'ApplicationGatewayWebApplicationFirewallConfiguration')
     ncf = network_client_factory(cmd.cli_ctx).application_gateways
-    ag = ncf.get(resource_group_name, application_gateway_name)
+    ag = cached_get(cmd, ncf.get, resource_group_name, application_gateway_name)
     ag.web_application_firewall_configuration = \
         ApplicationGatewayWebApplicationFirewallConfiguration(
             enabled=(enabled == 'true'), firewall_mode=firewall_mode, rule_set_type=rule_set_type,
@@ -1559,7 +1578,8 @@ def set_ag_waf_config_2017_03_01(cmd, resource_group_name, application_gateway_n
         ag.web_application_firewall_configuration.file_upload_limit_in_mb = file_upload_limit
         ag.web_application_firewall_configuration.exclusions = exclusions
 
-    return sdk_no_wait(no_wait, ncf.begin_create_or_update, resource_group_name, application_gateway_name, ag)
+    return sdk_no_wait(no_wait, cached_put, cmd, ncf.begin_create_or_update, ag,
+                       resource_group_name, application_gateway_name)
 
 
 def show_ag_waf_config(cmd, resource_group_name, application_gateway_name):
@@ -3437,7 +3457,7 @@ def create_lb_inbound_nat_rule(
         backend_port, frontend_ip_name=None, floating_ip=None, idle_timeout=None, enable_tcp_reset=None):
     InboundNatRule = cmd.get_models('InboundNatRule')
     ncf = network_client_factory(cmd.cli_ctx)
-    lb = lb_get(ncf.load_balancers, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, ncf.load_balancers.get, resource_group_name, load_balancer_name))
     if not frontend_ip_name:
         frontend_ip_name = _get_default_name(lb, 'frontend_ip_configurations', '--frontend-ip-name')
     frontend_ip = get_property(lb.frontend_ip_configurations, frontend_ip_name)  # pylint: disable=no-member
@@ -3449,7 +3469,7 @@ def create_lb_inbound_nat_rule(
         idle_timeout_in_minutes=idle_timeout,
         enable_tcp_reset=enable_tcp_reset)
     upsert_to_collection(lb, 'inbound_nat_rules', new_rule, 'name')
-    poller = ncf.load_balancers.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, ncf.load_balancers.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().inbound_nat_rules, item_name)
 
 
@@ -3485,7 +3505,7 @@ def set_lb_inbound_nat_rule(
         c.set_param('idle_timeout_in_minutes', idle_timeout)
         c.set_param('enable_floating_ip', floating_ip)
 
-    return parent
+    return lb_get_operation(parent)
 
 
 def create_lb_inbound_nat_pool(
@@ -3494,7 +3514,7 @@ def create_lb_inbound_nat_pool(
         floating_ip=None, idle_timeout=None):
     InboundNatPool = cmd.get_models('InboundNatPool')
     ncf = network_client_factory(cmd.cli_ctx)
-    lb = lb_get(ncf.load_balancers, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, ncf.load_balancers.get, resource_group_name, load_balancer_name))
     if not frontend_ip_name:
         frontend_ip_name = _get_default_name(lb, 'frontend_ip_configurations', '--frontend-ip-name')
     frontend_ip = get_property(lb.frontend_ip_configurations, frontend_ip_name) \
@@ -3510,7 +3530,7 @@ def create_lb_inbound_nat_pool(
         enable_floating_ip=floating_ip,
         idle_timeout_in_minutes=idle_timeout)
     upsert_to_collection(lb, 'inbound_nat_pools', new_pool, 'name')
-    poller = ncf.load_balancers.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, ncf.load_balancers.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().inbound_nat_pools, item_name)
 
 
@@ -3535,7 +3555,7 @@ def set_lb_inbound_nat_pool(
         instance.frontend_ip_configuration = \
             get_property(parent.frontend_ip_configurations, frontend_ip_name)
 
-    return parent
+    return lb_get_operation(parent)
 
 
 def create_lb_frontend_ip_configuration(
@@ -3545,7 +3565,7 @@ def create_lb_frontend_ip_configuration(
     FrontendIPConfiguration, SubResource, Subnet = cmd.get_models(
         'FrontendIPConfiguration', 'SubResource', 'Subnet')
     ncf = network_client_factory(cmd.cli_ctx)
-    lb = lb_get(ncf.load_balancers, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, ncf.load_balancers.get, resource_group_name, load_balancer_name))
 
     if private_ip_address_allocation is None:
         private_ip_address_allocation = 'static' if private_ip_address else 'dynamic'
@@ -3563,7 +3583,7 @@ def create_lb_frontend_ip_configuration(
         new_config.zones = zone
 
     upsert_to_collection(lb, 'frontend_ip_configurations', new_config, 'name')
-    poller = ncf.load_balancers.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, ncf.load_balancers.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().frontend_ip_configurations, item_name)
 
 
@@ -3818,7 +3838,7 @@ def create_cross_region_lb_frontend_ip_configuration(
     FrontendIPConfiguration, SubResource = cmd.get_models(
         'FrontendIPConfiguration', 'SubResource')
     ncf = network_client_factory(cmd.cli_ctx)
-    lb = lb_get(ncf.load_balancers, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, ncf.load_balancers.get, resource_group_name, load_balancer_name))
 
     new_config = FrontendIPConfiguration(
         name=item_name,
@@ -3829,7 +3849,7 @@ def create_cross_region_lb_frontend_ip_configuration(
         new_config.zones = zone
 
     upsert_to_collection(lb, 'frontend_ip_configurations', new_config, 'name')
-    poller = ncf.load_balancers.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, ncf.load_balancers.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().frontend_ip_configurations, item_name)
 
 
@@ -4036,7 +4056,7 @@ def create_lb_outbound_rule(cmd, resource_group_name, load_balancer_name, item_n
                             outbound_ports=None, enable_tcp_reset=None, idle_timeout=None):
     OutboundRule, SubResource = cmd.get_models('OutboundRule', 'SubResource')
     client = network_client_factory(cmd.cli_ctx).load_balancers
-    lb = lb_get(client, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, client.get, resource_group_name, load_balancer_name))
     rule = OutboundRule(
         protocol=protocol, enable_tcp_reset=enable_tcp_reset, idle_timeout_in_minutes=idle_timeout,
         backend_address_pool=SubResource(id=backend_address_pool),
@@ -4044,7 +4064,7 @@ def create_lb_outbound_rule(cmd, resource_group_name, load_balancer_name, item_n
         if frontend_ip_configurations else None,
         allocated_outbound_ports=outbound_ports, name=item_name)
     upsert_to_collection(lb, 'outbound_rules', rule, 'name')
-    poller = client.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, client.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().outbound_rules, item_name)
 
 
@@ -4061,19 +4081,19 @@ def set_lb_outbound_rule(instance, cmd, parent, item_name, protocol=None, outbou
                     if backend_address_pool else None)
         c.set_param('frontend_ip_configurations',
                     [SubResource(id=x) for x in frontend_ip_configurations] if frontend_ip_configurations else None)
-    return parent
+    return lb_get_operation(parent)
 
 
 def create_lb_probe(cmd, resource_group_name, load_balancer_name, item_name, protocol, port,
                     path=None, interval=None, threshold=None):
     Probe = cmd.get_models('Probe')
     ncf = network_client_factory(cmd.cli_ctx)
-    lb = lb_get(ncf.load_balancers, resource_group_name, load_balancer_name)
+    lb = lb_get_operation(cached_get(cmd, ncf.load_balancers.get, resource_group_name, load_balancer_name))
     new_probe = Probe(
         protocol=protocol, port=port, interval_in_seconds=interval, number_of_probes=threshold,
         request_path=path, name=item_name)
     upsert_to_collection(lb, 'probes', new_probe, 'name')
-    poller = ncf.load_balancers.begin_create_or_update(resource_group_name, load_balancer_name, lb)
+    poller = cached_put(cmd, ncf.load_balancers.begin_create_or_update, lb, resource_group_name, load_balancer_name)
     return get_property(poller.result().probes, item_name)
 
 
@@ -4085,7 +4105,7 @@ def set_lb_probe(cmd, instance, parent, item_name, protocol=None, port=None,
         c.set_param('request_path', path)
         c.set_param('interval_in_seconds', interval)
         c.set_param('number_of_probes', threshold)
-    return parent
+    return lb_get_operation(parent)
 
 
 def create_lb_rule(
@@ -4166,7 +4186,7 @@ def set_lb_rule(
     elif probe_name is not None:
         instance.probe = get_property(parent.probes, probe_name)
 
-    return parent
+    return lb_get_operation(parent)
 
 
 def add_lb_backend_address_pool_tunnel_interface(cmd, resource_group_name, load_balancer_name,
@@ -4608,9 +4628,7 @@ def create_nsg_rule_2017_06_01(cmd, resource_group_name, network_security_group_
 
     SecurityRule = cmd.get_models('SecurityRule')
     settings = SecurityRule(**kwargs)
-    ncf = network_client_factory(cmd.cli_ctx)
-    return ncf.security_rules.begin_create_or_update(
-        resource_group_name, network_security_group_name, security_rule_name, settings)
+    return _create_nsg_rule(cmd, resource_group_name, network_security_group_name, security_rule_name, settings)
 
 
 def create_nsg_rule_2017_03_01(cmd, resource_group_name, network_security_group_name, security_rule_name,
@@ -4624,8 +4642,18 @@ def create_nsg_rule_2017_03_01(cmd, resource_group_name, network_security_group_
                             description=description, source_port_range=source_port_range,
                             destination_port_range=destination_port_range, priority=priority,
                             name=security_rule_name)
+    return _create_nsg_rule(cmd, resource_group_name, network_security_group_name, security_rule_name, settings)
+
 
+def _create_nsg_rule(cmd, resource_group_name, network_security_group_name, security_rule_name, settings):
     ncf = network_client_factory(cmd.cli_ctx)
+    if cmd.cli_ctx.data.get('_cache'):
+        # a deferred rule is added to the cached security group, which is committed with its other changes
+        nsg = cached_get(cmd, ncf.network_security_groups.get, resource_group_name, network_security_group_name)
+        upsert_to_collection(nsg, 'security_rules', settings, 'name')
+        nsg = cached_put(cmd, ncf.network_security_groups.begin_create_or_update, nsg,
+                         resource_group_name, network_security_group_name).result()
+        return get_property(nsg.security_rules, security_rule_name)
     return ncf.security_rules.begin_create_or_update(
         resource_group_name, network_security_group_name, security_rule_name, settings)
 
@@ -6095,6 +6123,13 @@ def create_route(cmd, resource_group_name, route_table_name, route_name, next_ho
     route = Route(next_hop_type=next_hop_type, address_prefix=address_prefix,
                   next_hop_ip_address=next_hop_ip_address, name=route_name)
     ncf = network_client_factory(cmd.cli_ctx)
+    if cmd.cli_ctx.data.get('_cache'):
+        # a deferred route is added to the cached route table, which is committed with its other changes
+        route_table = cached_get(cmd, ncf.route_tables.get, resource_group_name, route_table_name)
+        upsert_to_collection(route_table, 'routes', route, 'name')
+        route_table = cached_put(cmd, ncf.route_tables.begin_create_or_update, route_table,
+                                 resource_group_name, route_table_name).result()
+        return get_property(route_table.routes, route_name)
     return ncf.routes.begin_create_or_update(resource_group_name, route_table_name, route_name, route)
 
 
@@ -6,6 +6,8 @@
 import os
 import re
 import stat
+import shutil
+import hashlib
 import platform
 import subprocess
 import json
@@ -27,6 +29,7 @@ from azure.cli.core.azclierror import (
     ClientRequestError,
     InvalidTemplateError,
 )
+from azure.cli.core.util import write_file_json
 
 # See: https://semver.org/#is-there-a-suggested-regular-expression-regex-to-check-a-semver-string
 _semver_pattern = r"(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"  # pylint: disable=line-too-long
@@ -39,6 +42,14 @@ _bicep_installation_dir = os.path.join(_config_dir, "bin")
 _bicep_version_check_file_path = os.path.join(_config_dir, "bicepVersionCheck.json")
 _bicep_version_check_cache_ttl = timedelta(minutes=10)
 _bicep_version_check_time_format = "%Y-%m-%dT%H:%M:%S.%f"
+_bicep_installed_version_file_path = os.path.join(_config_dir, "bicepInstalledVersion.json")
+_bicep_build_cache_dir = os.path.join(_config_dir, "bicepBuildCache")
+_bicep_build_cache_max_entries = 100
+
+# Files referenced by a Bicep file: modules and the files loaded by the loadTextContent family of functions.
+_bicep_file_reference_pattern = (
+    r"(?:\bmodule\s+[a-zA-Z_][a-zA-Z0-9_]*\s+|\bload(?:TextContent|FileAsBase64|JsonContent)\(\s*)'((?:[^'\\]|\\.)+)'"
+)
 
 _logger = get_logger(__name__)
 
@@ -52,6 +63,34 @@ def validate_bicep_target_scope(template_schema, deployment_scope):
 
 
 def run_bicep_command(args, auto_install=True, check_version=True):
+    installation_path = _prepare_bicep_installation(auto_install, check_version)
+    return _run_command(installation_path, args)
+
+
+def build_bicep_template(template_file):
+    """Compile a Bicep file to the JSON of its ARM template.
+
+    The compiled template is cached by the content of the Bicep file, of the files it references and by the version of
+    the Bicep CLI, so deploying the same sources again doesn't start the Bicep CLI at all.
+    """
+    installation_path = _prepare_bicep_installation(auto_install=True, check_version=True)
+
+    cache_key = _get_bicep_build_cache_key(installation_path, template_file)
+    cached_build = _load_bicep_build_from_cache(cache_key) if cache_key else None
+    if cached_build:
+        _logger.debug("Using the cached build of %s", template_file)
+        template_content, command_warnings = cached_build
+    else:
+        template_content, command_warnings = _run_bicep_process(installation_path, ["build", "--stdout", template_file])
+        if cache_key:
+            _save_bicep_build_to_cache(cache_key, template_content, command_warnings)
+
+    if command_warnings:
+        _logger.warning(command_warnings)
+    return template_content
+
+
+def _prepare_bicep_installation(auto_install, check_version):
     installation_path = _get_bicep_installation_path(platform.system())
     installed = os.path.isfile(installation_path)
 
@@ -79,7 +118,7 @@ def run_bicep_command(args, auto_install=True, check_version=True):
             if cache_expired:
                 _refresh_bicep_version_check_cache(latest_release_tag)
 
-    return _run_command(installation_path, args)
+    return installation_path
 
 
 def ensure_bicep_installation(release_tag=None, stdout=True):
@@ -132,6 +171,10 @@ def remove_bicep_installation():
         os.remove(installation_path)
     if os.path.exists(_bicep_version_check_file_path):
         os.remove(_bicep_version_check_file_path)
+    if os.path.exists(_bicep_installed_version_file_path):
+        os.remove(_bicep_installed_version_file_path)
+    if os.path.exists(_bicep_build_cache_dir):
+        shutil.rmtree(_bicep_build_cache_dir, ignore_errors=True)
 
 
 def is_bicep_file(file_path):
@@ -178,8 +221,115 @@ def _refresh_bicep_version_check_cache(lastest_release_tag):
 
 
 def _get_bicep_installed_version(bicep_executable_path):
+    # Starting the Bicep CLI takes longer than most builds, so the version is cached until the executable changes.
+    executable_stat = os.stat(bicep_executable_path)
+    executable_id = [bicep_executable_path, executable_stat.st_size, executable_stat.st_mtime_ns]
+
+    with suppress(IOError, JSONDecodeError, KeyError, TypeError):
+        with open(_bicep_installed_version_file_path, "r") as installed_version_file:
+            installed_version_data = json.load(installed_version_file)
+        if installed_version_data["executable"] == executable_id:
+            return installed_version_data["installedVersion"]
+
     installed_version_output = _run_command(bicep_executable_path, ["--version"])
-    return _extract_semver(installed_version_output)
+    installed_version = _extract_semver(installed_version_output)
+
+    if installed_version:
+        _write_json_file(_bicep_installed_version_file_path,
+                         {"executable": executable_id, "installedVersion": installed_version})
+    return installed_version
+
+
+def _get_bicep_build_cache_key(bicep_executable_path, template_file):
+    """Hash the Bicep version and the content of the files the build depends on.
+
+    Returns None if the build can't be cached, e.g. when it references modules of a registry, which may change
+    without changes to the local files.
+    """
+    installed_version = _get_bicep_installed_version(bicep_executable_path)
+    if not installed_version:
+        return None
+
+    entry_dir = os.path.dirname(os.path.abspath(template_file))
+    build_hash = hashlib.sha256(installed_version.encode("utf-8"))
+
+    pending_files = [os.path.abspath(template_file)]
+    visited_files = set()
+    while pending_files:
+        file_path = os.path.normpath(pending_files.pop())
+        if file_path in visited_files:
+            continue
+        visited_files.add(file_path)
+
+        try:
+            with open(file_path, "rb") as f:
+                file_content = f.read()
+        except IOError:
+            # Let the Bicep CLI report the missing file
+            return None
+
+        relative_path = os.path.relpath(file_path, entry_dir).replace(os.sep, "/")
+        build_hash.update(b"\0" + relative_path.encode("utf-8") + b"\0")
+        build_hash.update(hashlib.sha256(file_content).digest())
+
+        if not is_bicep_file(file_path):
+            continue
+        # The Bicep CLI applies the bicepconfig.json nearest to each Bicep file, e.g. for linter rules and aliases
+        config_file_path = _find_bicep_config_file(os.path.dirname(file_path))
+        if config_file_path:
+            pending_files.append(config_file_path)
+        for reference in re.findall(_bicep_file_reference_pattern, file_content.decode("utf-8", errors="replace")):
+            if ":" in reference:
+                # A module of a registry or a template spec
+                return None
+            pending_files.append(os.path.join(os.path.dirname(file_path), reference.replace("\\'", "'")))
+
+    return build_hash.hexdigest()
+
+
+def _find_bicep_config_file(directory):
+    while True:
+        config_file_path = os.path.join(directory, "bicepconfig.json")
+        if os.path.isfile(config_file_path):
+            return config_file_path
+        parent_directory = os.path.dirname(directory)
+        if parent_directory == directory:
+            return None
+        directory = parent_directory
+
+
+def _load_bicep_build_from_cache(cache_key):
+    cache_file_path = os.path.join(_bicep_build_cache_dir, cache_key + ".json")
+    try:
+        with open(cache_file_path, "r") as cache_file:
+            cached_build = json.load(cache_file)
+        # Keep the recently used builds when pruning the cache
+        os.utime(cache_file_path)
+        return cached_build["template"], cached_build["warnings"]
+    except (IOError, JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def _save_bicep_build_to_cache(cache_key, template_content, command_warnings):
+    _write_json_file(os.path.join(_bicep_build_cache_dir, cache_key + ".json"),
+                     {"template": template_content, "warnings": command_warnings})
+
+    with suppress(OSError):
+        cache_files = [os.path.join(_bicep_build_cache_dir, f) for f in os.listdir(_bicep_build_cache_dir)
+                       if f.endswith(".json")]
+        if len(cache_files) > _bicep_build_cache_max_entries:
+            cache_files.sort(key=os.path.getmtime)
+            for cache_file_path in cache_files[:len(cache_files) - _bicep_build_cache_max_entries]:
+                os.remove(cache_file_path)
+
+
+def _write_json_file(file_path, data):
+    # Concurrent commands may write the same file, so replace it atomically
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        write_file_json(file_path, data)
+    except OSError as ex:
+        _logger.debug("Failed to write %s: %s", file_path, ex)
 
 
 def _get_bicep_download_url(system, release_tag):
@@ -212,14 +362,18 @@ def _extract_semver(text):
 
 
 def _run_command(bicep_installation_path, args):
+    command_output, command_warnings = _run_bicep_process(bicep_installation_path, args)
+    if command_warnings:
+        _logger.warning(command_warnings)
+    return command_output
+
+
+def _run_bicep_process(bicep_installation_path, args):
     process = subprocess.run([rf"{bicep_installation_path}"] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     try:
         process.check_returncode()
-        command_warnings = process.stderr.decode("utf-8")
-        if command_warnings:
-            _logger.warning(command_warnings)
-        return process.stdout.decode("utf-8")
+        return process.stdout.decode("utf-8"), process.stderr.decode("utf-8")
     except subprocess.CalledProcessError:
         raise UnclassifiedUserFault(process.stderr.decode("utf-8"))
 
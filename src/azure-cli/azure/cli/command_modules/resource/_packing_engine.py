@@ -8,7 +8,6 @@ import json
 from knack.util import CLIError
 from azure.cli.core.azclierror import BadRequestError
 from azure.cli.core.util import read_file_content, shell_safe_json_parse
-from azure.cli.command_modules.resource.custom import _remove_comments_from_json
 from azure.cli.core.profiles import ResourceType, get_sdk
 
 
@@ -23,10 +22,13 @@ class PackingContext():  # pylint: disable=too-few-public-methods
         self.RootTemplateDirectory = os.path.abspath(root_template_directory)
         self.CurrentDirectory = os.path.abspath(root_template_directory)
         self.Artifact = []
+        # The identities of the files of the artifacts, to find the files referenced again without comparing them
+        self.ArtifactFileIds = set()
+        # The minified templates by path, as each template is both searched for links and packed
+        self.MinifiedTemplates = {}
 
 
-# pylint: disable=redefined-outer-name
-def process_template(template, preserve_order=True, file_path=None):
+def _minify_template(template):
     from ._json_handler import json_min
 
     # When commenting at the bottom of all elements in a JSON object, jsmin has a bug that will wrap lines.
@@ -35,8 +37,15 @@ def process_template(template, preserve_order=True, file_path=None):
     template = re.sub(r'(^[\t ]*//[\s\S]*?\n)|(^[\t ]*/\*{1,2}[\s\S]*?\*/)', '', template, flags=re.M)
 
     # In order to solve the package conflict introduced by jsmin, the jsmin code is referenced into json_min
-    minified = json_min(template)
+    return json_min(template)
+
+
+# pylint: disable=redefined-outer-name
+def process_template(template, preserve_order=True, file_path=None):
+    return _process_minified_template(_minify_template(template), preserve_order, file_path)
 
+
+def _process_minified_template(minified, preserve_order=True, file_path=None):
     # Remove extra spaces, compress multiline string(s)
     result = re.sub(r'\s\s+', ' ', minified, flags=re.DOTALL)
 
@@ -58,12 +67,25 @@ def pack(cmd, template_file):
     """
     root_template_file_path = os.path.abspath(template_file)
     context = PackingContext(os.path.dirname(root_template_file_path))
-    template_content = read_file_content(template_file)
-    template_json = json.loads(json.dumps(process_template(template_content)))
+    template_json = json.loads(json.dumps(
+        _process_minified_template(_get_minified_template(context, root_template_file_path))))
     _pack_artifacts(cmd, root_template_file_path, context)
     return PackagedTemplate(template_json, getattr(context, 'Artifact'))
 
 
+def _get_minified_template(context, template_abs_file_path):
+    minified_templates = getattr(context, 'MinifiedTemplates')
+    if template_abs_file_path not in minified_templates:
+        minified_templates[template_abs_file_path] = _minify_template(read_file_content(template_abs_file_path))
+    return minified_templates[template_abs_file_path]
+
+
+def _get_file_id(file_path):
+    # The same identity as compared by os.path.samefile
+    stat = os.stat(file_path)
+    return stat.st_dev, stat.st_ino
+
+
 def _pack_artifacts(cmd, template_abs_file_path, context):
     """
     Recursively packs the specified template and its referenced artifacts and
@@ -79,8 +101,12 @@ def _pack_artifacts(cmd, template_abs_file_path, context):
     original_directory = getattr(context, 'CurrentDirectory')
     try:
         context.CurrentDirectory = os.path.dirname(template_abs_file_path)
-        template_content = read_file_content(template_abs_file_path)
-        artifactable_template_obj = _remove_comments_from_json(template_content)
+        minified = _get_minified_template(context, template_abs_file_path)
+        try:
+            # The same parsing as _remove_comments_from_json, which uses strict=False to allow multiline strings
+            artifactable_template_obj = shell_safe_json_parse(minified, True, strict=False)
+        except CLIError:
+            raise CLIError("Failed to parse the JSON data, please check whether it is a valid JSON format")
         template_link_to_artifact_objs = _get_template_links_to_artifacts(cmd, artifactable_template_obj,
                                                                           includeNested=True)
 
@@ -111,22 +137,17 @@ def _pack_artifacts(cmd, template_abs_file_path, context):
             # an artifact elsewhere, we'll do so here...
 
             as_relative_path = _absolute_to_relative_path(getattr(context, 'RootTemplateDirectory'), abs_local_path)
-            duplicateFile = False
-            for prev_added_artifact in getattr(context, 'Artifact'):
-                prev_added_artifact = os.path.join(getattr(context, 'RootTemplateDirectory'),
-                                                   getattr(prev_added_artifact, 'path'))
-                if os.path.samefile(prev_added_artifact, abs_local_path):
-                    duplicateFile = True
-                    continue
-            if duplicateFile:
+            file_id = _get_file_id(abs_local_path)
+            if file_id in getattr(context, 'ArtifactFileIds'):
                 continue
             _pack_artifacts(cmd, abs_local_path, context)
             LinkedTemplateArtifact = get_sdk(cmd.cli_ctx, ResourceType.MGMT_RESOURCE_TEMPLATESPECS,
                                              'LinkedTemplateArtifact', mod='models')
-            template_content = read_file_content(abs_local_path)
-            template_json = json.loads(json.dumps(process_template(template_content)))
+            template_json = json.loads(json.dumps(
+                _process_minified_template(_get_minified_template(context, abs_local_path))))
             artifact = LinkedTemplateArtifact(path=as_relative_path, template=template_json)
             context.Artifact.append(artifact)
+            context.ArtifactFileIds.add(file_id)
     finally:
         context.CurrentDirectory = original_directory
 
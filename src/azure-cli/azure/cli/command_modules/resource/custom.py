@@ -49,6 +49,7 @@ from ._validators import MSI_LOCAL_ID
 from ._formatters import format_what_if_operation_result
 from ._bicep import (
     run_bicep_command,
+    build_bicep_template,
     is_bicep_file,
     ensure_bicep_installation,
     remove_bicep_installation,
@@ -321,7 +322,7 @@ def _deploy_arm_template_core_unmodified(cmd, resource_group_name, template_file
         template_obj = _remove_comments_from_json(_urlretrieve(template_uri).decode('utf-8'), file_path=template_uri)
     else:
         template_content = (
-            run_bicep_command(["build", "--stdout", template_file])
+            build_bicep_template(template_file)
             if is_bicep_file(template_file)
             else read_file_content(template_file)
         )
@@ -978,7 +979,7 @@ def _prepare_deployment_properties_unmodified(cmd, deployment_scope, template_fi
         template_obj = show_resource(cmd=cmd, resource_ids=[template_spec], api_version=api_version).properties['mainTemplate']
     else:
         template_content = (
-            run_bicep_command(["build", "--stdout", template_file])
+            build_bicep_template(template_file)
             if is_bicep_file(template_file)
             else read_file_content(template_file)
         )
@@ -1943,7 +1944,7 @@ def create_template_spec(cmd, resource_group_name, name, template_file=None, loc
         if template_file:
             from azure.cli.command_modules.resource._packing_engine import (pack)
             if is_bicep_file(template_file):
-                template_content = run_bicep_command(["build", "--stdout", template_file])
+                template_content = build_bicep_template(template_file)
                 input_content = _remove_comments_from_json(template_content, file_path=template_file)
                 input_template = json.loads(json.dumps(input_content))
                 artifacts = []
@@ -1993,7 +1994,7 @@ def update_template_spec(cmd, resource_group_name=None, name=None, template_spec
     if template_file:
         from azure.cli.command_modules.resource._packing_engine import (pack)
         if is_bicep_file(template_file):
-            template_content = run_bicep_command(["build", "--stdout", template_file])
+            template_content = build_bicep_template(template_file)
             input_content = _remove_comments_from_json(template_content, file_path=template_file)
             input_template = json.loads(json.dumps(input_content))
             artifacts = []
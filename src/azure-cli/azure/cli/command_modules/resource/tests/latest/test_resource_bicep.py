@@ -4,12 +4,15 @@
 # --------------------------------------------------------------------------------------------
 
 import os
+import shutil
+import tempfile
 import contextlib
 import unittest
 from unittest import mock
 
 from knack.util import CLIError
 from azure.cli.command_modules.resource._bicep import (
+    build_bicep_template,
     ensure_bicep_installation,
     run_bicep_command,
     validate_bicep_target_scope,
@@ -125,3 +128,108 @@ class TestBicep(unittest.TestCase):
     def _remove_bicep_version_check_file(self):
         with contextlib.suppress(FileNotFoundError):
             os.remove(_bicep_version_check_file_path)
+
+
+class TestBicepBuildCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.bicep_executable_path = self._write_file("bin/bicep", "bicep")
+        self._write_file("main.bicep", "module storage 'modules/storage.bicep' = {\n  name: 'storage'\n}\n")
+        self._write_file("modules/storage.bicep", "var script = loadTextContent('../scripts/setup.sh')\n")
+        self._write_file("scripts/setup.sh", "echo setup")
+
+        self.builds = []
+        self.version_checks = 0
+
+        def _run_bicep_process(_, args):
+            if args == ["--version"]:
+                self.version_checks += 1
+                return "Bicep CLI version 0.4.1008 (223b8d227a)", ""
+            self.builds.append(args)
+            return '{"resources": []}', "main.bicep(1,1) : Warning no-unused-params"
+
+        for target, kwargs in [
+            ("_prepare_bicep_installation", {"return_value": self.bicep_executable_path}),
+            ("_run_bicep_process", {"side_effect": _run_bicep_process}),
+            ("_bicep_installed_version_file_path", {"new": os.path.join(self.directory, "bicepInstalledVersion.json")}),
+            ("_bicep_build_cache_dir", {"new": os.path.join(self.directory, "bicepBuildCache")}),
+        ]:
+            patcher = mock.patch("azure.cli.command_modules.resource._bicep." + target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write_file(self, relative_path, content):
+        file_path = os.path.join(self.directory, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+        return file_path
+
+    def _build(self):
+        return build_bicep_template(os.path.join(self.directory, "main.bicep"))
+
+    @mock.patch("azure.cli.command_modules.resource._bicep._logger.warning")
+    def test_build_bicep_template_uses_cache(self, warning_mock):
+        self.assertEqual(self._build(), '{"resources": []}')
+        self.assertEqual(self._build(), '{"resources": []}')
+
+        # the Bicep CLI is started once, its version is cached until the executable changes
+        self.assertEqual(len(self.builds), 1)
+        self.assertEqual(self.version_checks, 1)
+        # the warnings of the build are reported again with the cached template
+        self.assertEqual(warning_mock.call_count, 2)
+
+    def test_build_bicep_template_invalidate_cache(self):
+        self._build()
+
+        # a transitively referenced file changes
+        self._write_file("scripts/setup.sh", "echo setup again")
+        self._build()
+        self.assertEqual(len(self.builds), 2)
+
+        # the Bicep CLI is upgraded
+        with mock.patch("azure.cli.command_modules.resource._bicep._get_bicep_installed_version",
+                        return_value="0.5.6"):
+            self._build()
+        self.assertEqual(len(self.builds), 3)
+
+        self._build()
+        self.assertEqual(len(self.builds), 3)
+
+    def test_build_bicep_template_invalidate_cache_on_bicep_config_changes(self):
+        self._build()
+
+        # the configuration of the entry file is added and changed
+        self._write_file("bicepconfig.json", '{"analyzers": {"core": {"enabled": true}}}')
+        self._build()
+        self._write_file("bicepconfig.json", '{"analyzers": {"core": {"enabled": false}}}')
+        self._build()
+        self.assertEqual(len(self.builds), 3)
+
+        # a module is configured by the nearest configuration to it
+        self._write_file("modules/bicepconfig.json", '{"analyzers": {"core": {"enabled": true}}}')
+        self._build()
+        self.assertEqual(len(self.builds), 4)
+
+        self._build()
+        self.assertEqual(len(self.builds), 4)
+
+    def test_build_bicep_template_skip_cache_for_registry_modules(self):
+        self._write_file("main.bicep", "module storage 'br:contoso.azurecr.io/bicep/storage:v1' = {}\n")
+
+        self._build()
+        self._build()
+
+        self.assertEqual(len(self.builds), 2)
+
+    @mock.patch("azure.cli.command_modules.resource._bicep._bicep_build_cache_max_entries", 2)
+    def test_build_bicep_template_prune_cache(self):
+        for i in range(4):
+            self._write_file("main.bicep", "param index int = {}\n".format(i))
+            self._build()
+
+        cache_dir = os.path.join(self.directory, "bicepBuildCache")
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
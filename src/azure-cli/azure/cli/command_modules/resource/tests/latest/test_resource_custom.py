@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import json
 import os
 import tempfile
 import unittest
@@ -27,6 +28,7 @@ from azure.cli.command_modules.resource.custom import (
     deploy_arm_template_at_management_group,
     deploy_arm_template_at_tenant_scope,
 )
+from azure.cli.command_modules.resource._packing_engine import pack
 
 from azure.cli.core.mock import DummyCli
 from azure.cli.core import AzCommandsLoader
@@ -534,6 +536,34 @@ class TestCustom(unittest.TestCase):
         self.assertEqual(1, len(result.changes))
         self.assertEqual(ChangeType.modify, result.changes[0].change_type)
 
+    def test_pack_template_spec_artifacts(self):
+        def _write_template(path, links):
+            template = {
+                'resources': [{'type': 'Microsoft.Resources/deployments', 'name': str(i),
+                               'properties': {'templateLink': {'relativePath': link}}}
+                              for i, link in enumerate(links)]
+            }
+            path = os.path.join(root_dir, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write('// ' + path + '\n' + json.dumps(template, indent=2))
+            return template
+
+        with tempfile.TemporaryDirectory() as root_dir:
+            main = _write_template('main.json', ['a/first.json', 'b/second.json', 'a/first.json'])
+            first = _write_template(os.path.join('a', 'first.json'), ['../shared/module.json'])
+            second = _write_template(os.path.join('b', 'second.json'),
+                                     ['../shared/../shared/module.json', '../a/first.json'])
+            module = _write_template(os.path.join('shared', 'module.json'), [])
+
+            packed = pack(cmd, os.path.join(root_dir, 'main.json'))
+
+        self.assertEqual(packed.RootTemplate, main)
+        # each template is packed once, after the templates it links to
+        self.assertEqual([(a.path, a.template) for a in packed.Artifacts],
+                         [(os.path.join('shared', 'module.json'), module), (os.path.join('a', 'first.json'), first),
+                          (os.path.join('b', 'second.json'), second)])
+
 
 if __name__ == '__main__':
     unittest.main()
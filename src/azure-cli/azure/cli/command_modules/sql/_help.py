@@ -12,6 +12,25 @@ type: group
 short-summary: Manage Azure SQL Databases and Data Warehouses.
 """
 
+helps['sql capability'] = """
+type: group
+short-summary: Manage the cache of the capabilities of the locations.
+long-summary: >
+    The capabilities of a location, used to list the editions and to resolve the sku of the databases, elastic pools
+    and managed instances created or updated, are cached for a day.
+    Use `az config set sql.capability_cache_ttl=<minutes>` to change how long they are cached for, 0 disables the cache.
+"""
+
+helps['sql capability refresh'] = """
+type: command
+short-summary: Retrieve the capabilities of a location again and cache them.
+examples:
+  - name: Refresh the capabilities of a location.
+    text: az sql capability refresh -l westus
+  - name: Refresh the capabilities of all the cached locations.
+    text: az sql capability refresh
+"""
+
 helps['sql db'] = """
 type: group
 short-summary: Manage databases.
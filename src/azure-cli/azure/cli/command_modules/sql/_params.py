@@ -683,6 +683,13 @@ def load_arguments(self, _):
                    options_list=['--elastic-pool'],
                    help='If specified, lists only the databases in this elastic pool')
 
+    with self.argument_context('sql capability refresh') as c:
+        c.argument('location',
+                   arg_type=get_location_type(self.cli_ctx),
+                   required=False,
+                   help='Location whose capabilities are refreshed. If omitted, the capabilities of all the '
+                        'locations cached for the subscription are refreshed.')
+
     with self.argument_context('sql db list-editions') as c:
         c.argument('show_details',
                    options_list=['--show-details', '-d'],
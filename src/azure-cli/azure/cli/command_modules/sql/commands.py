@@ -166,6 +166,12 @@ def load_command_table(self, _):
             'db_list_capabilities',
             table_transformer=db_edition_table_format)
 
+    with self.command_group('sql capability',
+                            capabilities_operations,
+                            client_factory=get_sql_capabilities_operations) as g:
+
+        g.custom_command('refresh', 'capability_refresh')
+
     with self.command_group('sql db replica',
                             database_operations,
                             client_factory=get_sql_databases_operations) as g:
@@ -12,6 +12,7 @@ from dateutil.parser import parse
 from azure.cli.core.util import (
     CLIError,
     sdk_no_wait,
+    write_file_json,
 )
 
 from azure.mgmt.sql.models import (
@@ -128,17 +129,126 @@ def _get_managed_instance_location(cli_ctx, managed_instance_name, resource_grou
         resource_group_name=resource_group_name).location
 
 
+# Name of the directory, in the config directory, where the capabilities of the locations are cached
+CAPABILITY_CACHE_DIR = 'sqlCapabilities'
+# Number of minutes the capabilities of a location are cached for. Configured with sql.capability_cache_ttl,
+# 0 disables the cache.
+DEFAULT_CAPABILITY_CACHE_TTL = 1440
+# Appended to the errors about unavailable capabilities, which may come from cached capabilities
+CAPABILITY_CACHE_HINT = ("The capabilities of a location are cached for up to sql.capability_cache_ttl minutes "
+                         "(1 day by default). If they changed recently, run 'az sql capability refresh -l LOCATION'.")
+
+
+def _normalize_location(location):
+    '''
+    Returns the location in lower case without spaces, so 'East US' and 'eastus' share a cache file.
+    '''
+
+    return location.lower().replace(' ', '')
+
+
+def _get_capability_cache_path(cli_ctx, subscription_id, location=None, group=None):
+    '''
+    Returns the path of the file caching the capabilities of a location for a cloud and subscription, or the
+    directory of the cache if no location is given.
+    '''
+    import os
+    import re
+
+    directory = os.path.join(cli_ctx.config.config_dir, CAPABILITY_CACHE_DIR,
+                             re.sub(r'[^a-z0-9_.-]', '', '{}_{}'.format(cli_ctx.cloud.name, subscription_id).lower()))
+    if location is None:
+        return directory
+    name = re.sub(r'[^a-z0-9_.-]', '',
+                  '{}_{}'.format(_normalize_location(location), getattr(group, 'value', group)).lower())
+    return os.path.join(directory, name + '.json')
+
+
+def _get_location_capabilities(cli_ctx, location, group, client=None, refresh=False):
+    '''
+    Gets the capabilities of a location, from the cache if they were retrieved within the TTL.
+
+    A new object is returned by each call, so it can be filtered in place.
+    '''
+    import json
+    import os
+    import time
+    from azure.mgmt.sql.models import LocationCapabilities
+
+    client = client or get_sql_capabilities_operations(cli_ctx, None)
+    ttl = cli_ctx.config.getint('sql', 'capability_cache_ttl', fallback=DEFAULT_CAPABILITY_CACHE_TTL)
+    # pylint: disable=protected-access
+    path = _get_capability_cache_path(cli_ctx, client._config.subscription_id, location, group)
+
+    if ttl > 0 and not refresh:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - cached['retrieved'] < ttl * 60:
+                logger.debug('Using the capabilities of %s cached in %s', location, path)
+                return LocationCapabilities.deserialize(cached['capabilities'])
+        except (OSError, IOError, ValueError, KeyError, TypeError):
+            pass
+
+    capabilities = client.list_by_location(
+        location, group, cls=lambda pipeline_response, _, __: pipeline_response.http_response.text())
+    capabilities = json.loads(capabilities)
+
+    if ttl > 0:
+        from knack.util import ensure_dir
+        try:
+            ensure_dir(os.path.dirname(path))
+            write_file_json(path, {'location': _normalize_location(location), 'retrieved': time.time(),
+                                   'capabilities': capabilities})
+        except (OSError, IOError) as ex:
+            logger.debug('Unable to cache the capabilities of %s: %s', location, ex)
+
+    return LocationCapabilities.deserialize(capabilities)
+
+
 def _get_location_capability(cli_ctx, location, group):
     '''
     Gets the location capability for a location and verifies that it is available.
     '''
 
-    capabilities_client = get_sql_capabilities_operations(cli_ctx, None)
-    location_capability = capabilities_client.list_by_location(location, group)
+    location_capability = _get_location_capabilities(cli_ctx, location, group)
     _assert_capability_available(location_capability)
     return location_capability
 
 
+def capability_refresh(cmd, client, location=None):
+    '''
+    Retrieves the capabilities of a location again and caches them. Without a location, the capabilities of all
+    the cached locations are retrieved again.
+    '''
+    import glob
+    import json
+    import os
+
+    if location:
+        locations = [location]
+    else:
+        locations = set()
+        # pylint: disable=protected-access
+        directory = _get_capability_cache_path(cmd.cli_ctx, client._config.subscription_id)
+        for path in glob.glob(os.path.join(directory, '*.json')):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    locations.add(json.load(f)['location'])
+            except (OSError, IOError, ValueError, KeyError, TypeError):
+                pass
+        locations = sorted(locations)
+
+    result = []
+    for loc in locations:
+        for group in [CapabilityGroup.SUPPORTED_EDITIONS,
+                      CapabilityGroup.SUPPORTED_ELASTIC_POOL_EDITIONS,
+                      CapabilityGroup.SUPPORTED_MANAGED_INSTANCE_VERSIONS]:
+            _get_location_capabilities(cmd.cli_ctx, loc, group, client=client, refresh=True)
+        result.append(loc)
+    return result
+
+
 def _any_sku_values_specified(sku):
     '''
     Returns True if the sku object has any properties that are specified
@@ -218,7 +328,8 @@ def _get_default_capability(capabilities, fallback_predicate=None):
 
     # No custom fallback, so we have to throw an error.
     logger.debug('_get_default_capability failed')
-    raise CLIError('Provisioning is restricted in this region. Please choose a different region.')
+    raise CLIError('Provisioning is restricted in this region. Please choose a different region. ' +
+                   CAPABILITY_CACHE_HINT)
 
 
 def _assert_capability_available(capability):
@@ -229,7 +340,7 @@ def _assert_capability_available(capability):
     logger.debug('_assert_capability_available: %s', capability)
 
     if not is_available(capability.status):
-        raise CLIError(capability.reason)
+        raise CLIError(' '.join(r for r in [capability.reason, CAPABILITY_CACHE_HINT] if r))
 
 
 def is_available(status):
@@ -1296,6 +1407,7 @@ class DatabaseCapabilitiesAdditionalDetails(Enum):  # pylint: disable=too-few-pu
 
 
 def db_list_capabilities(
+        cmd,
         client,
         location,
         edition=None,
@@ -1313,7 +1425,7 @@ def db_list_capabilities(
         show_details = []
 
     # Get capabilities tree from server
-    capabilities = client.list_by_location(location, CapabilityGroup.SUPPORTED_EDITIONS)
+    capabilities = _get_location_capabilities(cmd.cli_ctx, location, CapabilityGroup.SUPPORTED_EDITIONS, client=client)
 
     # Get subtree related to databases
     editions = _get_default_server_version(capabilities).supported_editions
@@ -3363,6 +3475,7 @@ class ElasticPoolCapabilitiesAdditionalDetails(Enum):  # pylint: disable=too-few
 
 
 def elastic_pool_list_capabilities(
+        cmd,
         client,
         location,
         edition=None,
@@ -3381,7 +3494,8 @@ def elastic_pool_list_capabilities(
         dtu = int(dtu)
 
     # Get capabilities tree from server
-    capabilities = client.list_by_location(location, CapabilityGroup.SUPPORTED_ELASTIC_POOL_EDITIONS)
+    capabilities = _get_location_capabilities(cmd.cli_ctx, location, CapabilityGroup.SUPPORTED_ELASTIC_POOL_EDITIONS,
+                                              client=client)
 
     # Get subtree related to elastic pools
     editions = _get_default_server_version(capabilities).supported_elastic_pool_editions
@@ -0,0 +1,176 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import yaml
+
+from azure.mgmt.sql.models import CapabilityGroup, Sku
+
+from knack.util import CLIError
+
+from azure.cli.command_modules.sql.custom import (
+    _assert_capability_available,
+    _find_db_sku_from_capabilities,
+    _find_elastic_pool_sku_from_capabilities,
+    _get_capability_cache_path,
+    _get_location_capabilities,
+    capability_refresh,
+    db_list_capabilities)
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings')
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+def _load_recorded_capabilities():
+    '''
+    Returns the capability documents of the recordings of the scenario tests, by location and group.
+    '''
+    documents = {}
+    for recording, location, group in [('test_sql_db_serverless_mgmt', 'westus2', 'supportedEditions'),
+                                       ('test_sql_elastic_pool_maintenance', 'eastus2',
+                                        'supportedElasticPoolEditions')]:
+        with open(os.path.join(RECORDINGS_DIR, recording + '.yaml')) as f:
+            interactions = yaml.safe_load(f)['interactions']
+        documents[(location, group)] = next(i['response']['body']['string'] for i in interactions
+                                            if '/capabilities?include=' + group in i['request']['uri'])
+    return documents
+
+
+class _Config:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, config_dir, ttl=None):
+        self.config_dir = config_dir
+        self.ttl = ttl
+
+    def getint(self, section, option, fallback=None):
+        return self.ttl if (section, option) == ('sql', 'capability_cache_ttl') and self.ttl is not None \
+            else fallback
+
+
+class _CliContext:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, config_dir, ttl=None):
+        self.config = _Config(config_dir, ttl)
+        self.cloud = mock.MagicMock()
+        self.cloud.name = 'AzureCloud'
+
+
+class _CapabilitiesClient:
+    '''
+    Returns the recorded capability documents and counts the requests.
+    '''
+
+    documents = _load_recorded_capabilities()
+
+    def __init__(self):
+        self._config = mock.MagicMock(subscription_id=SUBSCRIPTION_ID)
+        self.requests = []
+
+    def list_by_location(self, location_name, include=None, cls=None):
+        group = getattr(include, 'value', include)
+        self.requests.append((location_name, group))
+        document = self.documents[(location_name, group)]
+        pipeline_response = mock.MagicMock()
+        pipeline_response.http_response.text.return_value = document
+        return cls(pipeline_response, None, {})
+
+
+class SqlCapabilityCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        self.cli_ctx = _CliContext(self.config_dir)
+        self.client = _CapabilitiesClient()
+        patcher = mock.patch('azure.cli.command_modules.sql.custom.get_sql_capabilities_operations',
+                             return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+
+    def test_sku_resolution_uses_cached_capabilities(self):
+        for _ in range(3):
+            sku = _find_db_sku_from_capabilities(self.cli_ctx, 'westus2',
+                                                 Sku(name=None, tier='GeneralPurpose', family='Gen5', capacity=2))
+            self.assertEqual(sku.name, 'GP_Gen5_2')
+            pool_sku = _find_elastic_pool_sku_from_capabilities(self.cli_ctx, 'eastus2',
+                                                                Sku(name=None, tier='Standard', capacity=100))
+            self.assertEqual(pool_sku.name, 'StandardPool')
+
+        self.assertEqual(self.client.requests, [('westus2', 'supportedEditions'),
+                                                ('eastus2', 'supportedElasticPoolEditions')])
+
+        # another process reads the cache
+        _find_db_sku_from_capabilities(_CliContext(self.config_dir), 'westus2', Sku(name=None, tier='Basic'))
+        self.assertEqual(len(self.client.requests), 2)
+
+    def test_cached_capabilities_expire(self):
+        _find_db_sku_from_capabilities(self.cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+
+        path = _get_capability_cache_path(self.cli_ctx, SUBSCRIPTION_ID, 'westus2',
+                                          CapabilityGroup.SUPPORTED_EDITIONS)
+        with open(path) as f:
+            cached = json.load(f)
+        cached['retrieved'] = time.time() - 25 * 3600
+        with open(path, 'w') as f:
+            json.dump(cached, f)
+
+        _find_db_sku_from_capabilities(self.cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+        self.assertEqual(len(self.client.requests), 2)
+
+        # the cache is disabled with a TTL of 0
+        cli_ctx = _CliContext(self.config_dir, ttl=0)
+        _find_db_sku_from_capabilities(cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+        _find_db_sku_from_capabilities(cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+        self.assertEqual(len(self.client.requests), 4)
+
+    def test_list_editions_filters_a_copy(self):
+        cmd = mock.MagicMock(cli_ctx=self.cli_ctx)
+
+        editions = db_list_capabilities(cmd, self.client, 'westus2', edition='Basic')
+        self.assertEqual([e.name for e in editions], ['Basic'])
+
+        editions = db_list_capabilities(cmd, self.client, 'westus2')
+        self.assertGreater(len(editions), 1)
+        self.assertEqual(len(self.client.requests), 1)
+
+    def test_refresh(self):
+        cmd = mock.MagicMock(cli_ctx=self.cli_ctx)
+        _find_db_sku_from_capabilities(self.cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+
+        with mock.patch('azure.cli.command_modules.sql.custom._get_location_capabilities') as get_capabilities:
+            self.assertEqual(capability_refresh(cmd, self.client), ['westus2'])
+        self.assertEqual([c[0][1] for c in get_capabilities.call_args_list], ['westus2'] * 3)
+        self.assertTrue(all(c[1]['refresh'] for c in get_capabilities.call_args_list))
+
+        # refreshing retrieves the capabilities even though they are cached
+        _get_location_capabilities(self.cli_ctx, 'westus2', CapabilityGroup.SUPPORTED_EDITIONS, refresh=True)
+        _find_db_sku_from_capabilities(self.cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+        self.assertEqual(len(self.client.requests), 2)
+
+    def test_location_is_normalized(self):
+        self.assertEqual(_get_capability_cache_path(self.cli_ctx, SUBSCRIPTION_ID, 'West US 2', 'supportedEditions'),
+                         _get_capability_cache_path(self.cli_ctx, SUBSCRIPTION_ID, 'westus2', 'supportedEditions'))
+
+        _find_db_sku_from_capabilities(self.cli_ctx, 'westus2', Sku(name=None, tier='Basic'))
+        with mock.patch('azure.cli.command_modules.sql.custom._get_location_capabilities'):
+            self.assertEqual(capability_refresh(mock.MagicMock(cli_ctx=self.cli_ctx), self.client), ['westus2'])
+
+    def test_unavailable_capability_suggests_refresh(self):
+        capability = mock.MagicMock(status='Visible', reason='Provisioning is restricted.')
+        with self.assertRaisesRegex(CLIError, "Provisioning is restricted. .*az sql capability refresh"):
+            _assert_capability_available(capability)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@
 
 import time
 import os
+from unittest import mock
 
 from azure_devtools.scenario_tests import AllowLargeResponse, live_only
 
@@ -34,6 +35,18 @@ from azure.cli.command_modules.sql.custom import (
 from datetime import datetime, timedelta
 from time import sleep
 
+# Each recording replays the capabilities it was recorded with, rather than capabilities cached by another test.
+_disable_capability_cache = mock.patch.dict(os.environ, {'AZURE_SQL_CAPABILITY_CACHE_TTL': '0'})
+
+
+def setUpModule():
+    _disable_capability_cache.start()
+
+
+def tearDownModule():
+    _disable_capability_cache.stop()
+
+
 # Constants
 server_name_prefix = 'clitestserver'
 server_name_max_length = 62
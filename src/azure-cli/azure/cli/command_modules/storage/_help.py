@@ -743,11 +743,24 @@ parameters:
   - name: --source-sas
     type: string
     short-summary: The shared access signature for the source storage account.
+  - name: --max-workers
+    type: integer
+    short-summary: The maximum number of copies started concurrently.
+  - name: --wait
+    type: bool
+    short-summary: Wait for the server-side copies to finish and output a manifest of the succeeded and failed copies.
+    long-summary: The copy status of the destination blobs is polled in batches by listing the destination container.
+  - name: --max-retries
+    type: integer
+    short-summary: With --wait, the number of times a failed or aborted copy is restarted.
 examples:
   - name: Copy multiple blobs to a blob container. Use `az storage blob show` to check the status of the blobs. (autogenerated)
     text: |
         az storage blob copy start-batch --account-key 00000000 --account-name MyAccount --destination-container MyDestinationContainer --source-account-key MySourceKey --source-account-name MySourceAccount --source-container MySourceContainer
     crafted: true
+  - name: Copy the blobs of a container to another account, wait for the copies to finish and save the manifest of succeeded and failed copies.
+    text: |
+        az storage blob copy start-batch --account-name MyAccount --destination-container MyDestinationContainer --source-account-name MySourceAccount --source-container MySourceContainer --max-workers 32 --wait > manifest.json
 """
 
 helps['storage blob delete'] = """
@@ -1526,6 +1539,61 @@ type: group
 short-summary: Manage table storage entities.
 """
 
+helps['storage entity export'] = """
+type: command
+short-summary: Export the entities of a table to a NDJSON or CSV file.
+long-summary: >
+    The entities are written in the JSON format of the Table service, where a property "<name>@odata.type" holds the type of a property which is not a string, a boolean or a 32-bit integer.
+    In a CSV file, every property which is not a string has such a type column, the columns are chosen from the first page of entities.
+parameters:
+  - name: --destination -d
+    type: string
+    short-summary: The file to write the entities to.
+  - name: --format
+    short-summary: The format of the file. Default is csv for files with the .csv extension, ndjson otherwise.
+  - name: --filter
+    type: string
+    short-summary: Only export the entities which satisfy the OData filter, e.g. "PartitionKey eq 'pk1'".
+  - name: --checkpoint
+    type: string
+    short-summary: A file to save the progress of the export to. If the file exists, an interrupted export continues from it. The file is removed when the export completes.
+examples:
+  - name: Export all entities of a table to a NDJSON file.
+    text: |
+        az storage entity export --account-name MyAccount --table-name MyTable --destination entities.ndjson
+  - name: Export some properties of the entities of a partition to a CSV file.
+    text: |
+        az storage entity export --account-name MyAccount --table-name MyTable --destination entities.csv --filter "PartitionKey eq 'pk1'" --select Name Price
+"""
+
+helps['storage entity import'] = """
+type: command
+short-summary: Import the entities of a NDJSON or CSV file into a table.
+long-summary: >
+    The entities are grouped by PartitionKey into entity group transactions of up to 100 entities, which are submitted concurrently.
+    Transactions which are throttled or fail with a server error are retried with an exponential backoff.
+    The file uses the format of `az storage entity export`: every entity must have a PartitionKey and a RowKey, and a property "<name>@odata.type" holds the type of a property, e.g. Edm.Int64, Edm.DateTime or Edm.Guid.
+parameters:
+  - name: --source -s
+    type: string
+    short-summary: The file to read the entities from.
+  - name: --format
+    short-summary: The format of the file. Default is csv for files with the .csv extension, ndjson otherwise.
+  - name: --if-exists
+    type: string
+    short-summary: Behavior when an entity already exists for the specified PartitionKey and RowKey.
+  - name: --max-workers
+    type: integer
+    short-summary: The maximum number of entity group transactions submitted concurrently.
+  - name: --checkpoint
+    type: string
+    short-summary: A file to save the progress of the import to. If the file exists, an interrupted import skips the entities which are already imported. The file is removed when the import completes.
+examples:
+  - name: Import the entities of a NDJSON file, resuming the import if it was interrupted.
+    text: |
+        az storage entity import --account-name MyAccount --table-name MyTable --source entities.ndjson --checkpoint import.checkpoint --if-exists replace
+"""
+
 helps['storage entity insert'] = """
 type: command
 short-summary: Insert an entity into a table.
@@ -1679,6 +1747,10 @@ parameters:
   - name: --max-connections
     type: integer
     short-summary: The maximum number of parallel connections to use. Default value is 1.
+  - name: --max-workers
+    type: integer
+    short-summary: The maximum number of files downloaded concurrently.
+    long-summary: With more than one worker, the progress is reported per finished file instead of per transferred byte.
   - name: --snapshot
     type: string
     short-summary: A string that represents the snapshot version, if applicable.
@@ -1782,6 +1854,10 @@ parameters:
   - name: --max-connections
     type: integer
     short-summary: The maximum number of parallel connections to use. Default value is 1.
+  - name: --max-workers
+    type: integer
+    short-summary: The maximum number of files uploaded concurrently.
+    long-summary: With more than one worker, the progress is reported per finished file instead of per transferred byte.
   - name: --validate-content
     type: bool
     short-summary: If set, calculates an MD5 hash for each range of the file for validation.
@@ -1049,6 +1049,11 @@ def load_arguments(self, _):  # pylint: disable=too-many-locals, too-many-statem
         c.argument('source_container')
         c.argument('source_share')
 
+    with self.argument_context('storage blob copy start-batch') as c:
+        c.argument('max_workers', type=int)
+        c.argument('wait', action='store_true')
+        c.argument('max_retries', type=int)
+
     with self.argument_context('storage blob incremental-copy start') as c:
         from azure.cli.command_modules.storage._validators import process_blob_source_uri
 
@@ -1512,6 +1517,7 @@ def load_arguments(self, _):  # pylint: disable=too-many-locals, too-many-statem
         c.argument('max_connections', arg_group='Download Control', type=int)
         c.argument('validate_content', action='store_true', min_api='2016-05-31')
         c.register_content_settings_argument(t_file_content_settings, update=False, arg_group='Content Settings')
+        c.argument('max_workers', arg_group='Download Control', type=int)
         c.extra('no_progress', progress_type)
 
     with self.argument_context('storage file download-batch') as c:
@@ -1520,6 +1526,7 @@ def load_arguments(self, _):  # pylint: disable=too-many-locals, too-many-statem
         c.argument('destination', options_list=('--destination', '-d'))
         c.argument('max_connections', arg_group='Download Control', type=int)
         c.argument('validate_content', action='store_true', min_api='2016-05-31')
+        c.argument('max_workers', arg_group='Download Control', type=int)
         c.extra('no_progress', progress_type)
 
     with self.argument_context('storage file delete-batch') as c:
@@ -1678,6 +1685,18 @@ def load_arguments(self, _):  # pylint: disable=too-many-locals, too-many-statem
     with self.argument_context('storage entity insert') as c:
         c.argument('if_exists', arg_type=get_enum_type(['fail', 'merge', 'replace']))
 
+    with self.argument_context('storage entity import') as c:
+        c.argument('source', options_list=('--source', '-s'), type=file_type, completer=FilesCompleter())
+        c.argument('source_format', options_list='--format', arg_type=get_enum_type(['ndjson', 'csv']))
+        c.argument('if_exists', arg_type=get_enum_type(['fail', 'merge', 'replace']))
+        c.argument('max_workers', type=int)
+        c.argument('checkpoint', type=file_type, completer=FilesCompleter())
+
+    with self.argument_context('storage entity export') as c:
+        c.argument('destination', options_list=('--destination', '-d'), type=file_type, completer=FilesCompleter())
+        c.argument('destination_format', options_list='--format', arg_type=get_enum_type(['ndjson', 'csv']))
+        c.argument('checkpoint', type=file_type, completer=FilesCompleter())
+
     with self.argument_context('storage entity query') as c:
         c.argument('accept', default='minimal', validator=validate_table_payload_format,
                    arg_type=get_enum_type(['none', 'minimal', 'full']),
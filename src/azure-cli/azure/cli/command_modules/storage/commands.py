@@ -771,6 +771,8 @@ def load_command_table(self, _):  # pylint: disable=too-many-locals, too-many-st
                           exception_handler=show_exception_handler,
                           transform=transform_entity_result)
         g.storage_custom_command('insert', 'insert_table_entity')
+        g.storage_custom_command('import', 'import_table_entities')
+        g.storage_custom_command('export', 'export_table_entities')
 
     adls_service_sdk = CliCommandType(
         operations_tmpl='azure.multiapi.storagev2.filedatalake._data_lake_service_client#DataLakeServiceClient.{}',
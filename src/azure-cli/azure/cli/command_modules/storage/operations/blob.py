@@ -23,6 +23,13 @@ from ..util import get_datetime_from_string
 
 logger = get_logger(__name__)
 
+# number of copies started concurrently by storage blob copy start-batch
+DEFAULT_COPY_WORKERS = 8
+# number of times a failed or aborted copy is restarted when waiting for the copies
+DEFAULT_COPY_RETRIES = 2
+COPY_STATUS_POLL_INTERVAL = 2
+MAX_COPY_STATUS_POLL_INTERVAL = 30
+
 
 def set_legal_hold(cmd, client, container_name, account_name, tags, resource_group_name=None):
     LegalHold = cmd.get_models('LegalHold', resource_type=ResourceType.MGMT_STORAGE)
@@ -266,7 +273,8 @@ def set_service_properties(client, parameters, delete_retention=None, delete_ret
 
 def storage_blob_copy_batch(cmd, client, source_client, container_name=None,
                             destination_path=None, source_container=None, source_share=None,
-                            source_sas=None, pattern=None, dryrun=False):
+                            source_sas=None, pattern=None, dryrun=False, max_workers=DEFAULT_COPY_WORKERS,
+                            wait=False, max_retries=DEFAULT_COPY_RETRIES):
     """Copy a group of blob or files to a blob container."""
 
     if dryrun:
@@ -279,6 +287,8 @@ def storage_blob_copy_batch(cmd, client, source_client, container_name=None,
         logger.warning(' operations')
 
     source_sas = source_sas.lstrip('?') if source_sas else source_sas
+    # list of (source name, destination blob name, function starting the copy)
+    copies = []
     if source_container:
         # copy blobs for blob container
 
@@ -288,19 +298,18 @@ def storage_blob_copy_batch(cmd, client, source_client, container_name=None,
             source_sas = create_short_lived_container_sas(cmd, source_client.account_name, source_client.account_key,
                                                           source_container)
 
-        # pylint: disable=inconsistent-return-statements
-        def action_blob_copy(blob_name):
+        def _blob_copy(blob_name):
+            return (blob_name, normalize_blob_file_path(destination_path, blob_name),
+                    lambda: _copy_blob_to_blob_container(client, source_client, container_name, destination_path,
+                                                         source_container, source_sas, blob_name))
+
+        for blob_name in collect_blobs(source_client, source_container, pattern):
             if dryrun:
                 logger.warning('  - copy blob %s', blob_name)
             else:
-                return _copy_blob_to_blob_container(client, source_client, container_name, destination_path,
-                                                    source_container, source_sas, blob_name)
-
-        return list(filter_none(action_blob_copy(blob) for blob in collect_blobs(source_client,
-                                                                                 source_container,
-                                                                                 pattern)))
+                copies.append(_blob_copy(blob_name))
 
-    if source_share:
+    elif source_share:
         # copy blob from file share
 
         # if the source client is None, recreate one from the destination client.
@@ -310,20 +319,96 @@ def storage_blob_copy_batch(cmd, client, source_client, container_name=None,
             source_sas = create_short_lived_share_sas(cmd, source_client.account_name, source_client.account_key,
                                                       source_share)
 
-        # pylint: disable=inconsistent-return-statements
-        def action_file_copy(file_info):
-            dir_name, file_name = file_info
+        def _file_copy(dir_name, file_name):
+            source_path = os.path.join(dir_name, file_name) if dir_name else file_name
+            return (source_path, normalize_blob_file_path(destination_path, source_path),
+                    lambda: _copy_file_to_blob_container(client, source_client, container_name, destination_path,
+                                                         source_share, source_sas, dir_name, file_name))
+
+        for dir_name, file_name in collect_files(cmd, source_client, source_share, pattern):
             if dryrun:
                 logger.warning('  - copy file %s', os.path.join(dir_name, file_name))
             else:
-                return _copy_file_to_blob_container(client, source_client, container_name, destination_path,
-                                                    source_share, source_sas, dir_name, file_name)
-
-        return list(filter_none(action_file_copy(file) for file in collect_files(cmd,
-                                                                                 source_client,
-                                                                                 source_share,
-                                                                                 pattern)))
-    raise ValueError('Fail to find source. Neither blob container or file share is specified')
+                copies.append(_file_copy(dir_name, file_name))
+    else:
+        raise ValueError('Fail to find source. Neither blob container or file share is specified')
+
+    if dryrun:
+        return []
+
+    urls = _start_blob_copies([start for _, _, start in copies], max_workers)
+    if not wait:
+        return urls
+    return _wait_for_blob_copies(cmd, client, container_name, copies, urls, max_workers, max_retries)
+
+
+def _start_blob_copies(starts, max_workers=DEFAULT_COPY_WORKERS):
+    """Start the copies concurrently and return the destination URLs in the same order."""
+    if max_workers <= 1 or len(starts) <= 1:
+        return [start() for start in starts]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+        return list(executor.map(lambda start: start(), starts))
+
+
+def _wait_for_blob_copies(cmd, client, container_name, copies, urls, max_workers=DEFAULT_COPY_WORKERS,
+                          max_retries=DEFAULT_COPY_RETRIES):
+    """
+    Wait for the server-side copies to finish and restart the failed or aborted ones up to max_retries times.
+
+    The copy status of all destination blobs is read by listing the destination container with the copy properties,
+    a single request returns the status of up to 5000 blobs. Returns a manifest of the succeeded and failed copies.
+    """
+    import time
+    t_include = cmd.get_models('blob.models#Include')
+
+    pending = {destination: (source, start, url) for (source, destination, start), url in zip(copies, urls)}
+    attempts = dict.fromkeys(pending, 1)
+    prefix = os.path.commonprefix(list(pending)) or None
+    succeeded, failed = [], []
+
+    progress = cmd.cli_ctx.get_progress_controller(det=True)
+    interval = COPY_STATUS_POLL_INTERVAL
+    while pending:
+        statuses = {}
+        for blob in client.list_blobs(container_name, prefix=prefix, include=t_include(copy=True)):
+            if blob.name in pending:
+                statuses[blob.name] = blob.properties.copy
+
+        retries = []
+        for name in list(pending):
+            copy = statuses.get(name)
+            status, description = (copy.status, copy.status_description) if copy else \
+                ('failed', 'The destination blob does not exist.')
+            if status in (None, 'pending'):
+                continue
+            source, start, url = pending[name]
+            if status == 'success':
+                succeeded.append({'source': source, 'destination': url, 'attempts': attempts[name]})
+                del pending[name]
+            elif attempts[name] <= max_retries:
+                logger.warning('Copy of %s %s: %s Retrying.', source, status, description)
+                attempts[name] += 1
+                retries.append(start)
+            else:
+                failed.append({'source': source, 'destination': url, 'attempts': attempts[name],
+                               'status': status, 'statusDescription': description})
+                del pending[name]
+
+        progress.add(message='{} of {} copies finished'.format(len(succeeded) + len(failed), len(copies)),
+                     value=len(succeeded) + len(failed), total_val=len(copies))
+        if retries:
+            _start_blob_copies(retries, max_workers)
+            interval = COPY_STATUS_POLL_INTERVAL
+        if pending:
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_COPY_STATUS_POLL_INTERVAL)
+    progress.end()
+
+    if failed:
+        logger.warning('%s of %s copies failed', len(failed), len(copies))
+    return {'succeeded': succeeded, 'failed': failed}
 
 
 # pylint: disable=unused-argument
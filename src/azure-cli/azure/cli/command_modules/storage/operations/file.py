@@ -17,6 +17,9 @@ from azure.cli.command_modules.storage.util import (filter_none, collect_blobs,
 from azure.cli.command_modules.storage.url_quote_util import encode_for_url, make_encoded_file_url_and_params
 from azure.cli.core.profiles import ResourceType
 
+# number of files transferred and of directories created concurrently by the batch commands
+DEFAULT_BATCH_WORKERS = 8
+
 
 def create_share_rm(cmd, client, resource_group_name, account_name, share_name, metadata=None, share_quota=None,
                     enabled_protocols=None, root_squash=None, access_tier=None):
@@ -131,7 +134,7 @@ def list_share_files(cmd, client, share_name, directory_name=None, timeout=None,
 
 def storage_file_upload_batch(cmd, client, destination, source, destination_path=None, pattern=None, dryrun=False,
                               validate_content=False, content_settings=None, max_connections=1, metadata=None,
-                              progress_callback=None):
+                              progress_callback=None, max_workers=DEFAULT_BATCH_WORKERS):
     """ Upload local files to Azure Storage File Share in batch """
 
     from azure.cli.command_modules.storage.util import glob_files_locally, normalize_blob_file_path
@@ -149,16 +152,18 @@ def storage_file_upload_batch(cmd, client, destination, source, destination_path
                  'Type': guess_content_type(src, content_settings, settings_class).content_type} for src, dst in
                 source_files]
 
-    # TODO: Performance improvement
-    # 1. Upload files in parallel
-    def _upload_action(src, dst):
-        dst = normalize_blob_file_path(destination_path, dst)
+    source_files = [(src, normalize_blob_file_path(destination_path, dst)) for src, dst in source_files]
+
+    # create the directory tree up front, so that the uploads don't race to create the same directories
+    _make_directories_in_files_share(client, destination, (os.path.dirname(dst) for _, dst in source_files),
+                                     max_workers=max_workers)
+
+    def _upload_action(src, dst, file_progress_callback):
         dir_name = os.path.dirname(dst)
         file_name = os.path.basename(dst)
 
-        _make_directory_in_files_share(client, destination, dir_name)
         create_file_args = {'share_name': destination, 'directory_name': dir_name, 'file_name': file_name,
-                            'local_file_path': src, 'progress_callback': progress_callback,
+                            'local_file_path': src, 'progress_callback': file_progress_callback,
                             'content_settings': guess_content_type(src, content_settings, settings_class),
                             'metadata': metadata, 'max_connections': max_connections}
 
@@ -170,18 +175,20 @@ def storage_file_upload_batch(cmd, client, destination, source, destination_path
 
         return client.make_file_url(destination, dir_name, file_name)
 
-    return list(_upload_action(src, dst) for src, dst in source_files)
+    return _run_file_batch(_upload_action, source_files, [dst for _, dst in source_files], progress_callback,
+                           max_workers)
 
 
 def storage_file_download_batch(cmd, client, source, destination, pattern=None, dryrun=False, validate_content=False,
-                                max_connections=1, progress_callback=None, snapshot=None):
+                                max_connections=1, progress_callback=None, snapshot=None,
+                                max_workers=DEFAULT_BATCH_WORKERS):
     """
     Download files from file share to local directory in batch
     """
 
     from azure.cli.command_modules.storage.util import glob_files_remotely, mkdir_p
 
-    source_files = glob_files_remotely(cmd, client, source, pattern, snapshot=snapshot)
+    source_files = glob_files_remotely(cmd, client, source, pattern, snapshot=snapshot, max_workers=max_workers)
 
     if dryrun:
         source_files_list = list(source_files)
@@ -199,21 +206,68 @@ def storage_file_download_batch(cmd, client, source, destination, pattern=None,
 
         return []
 
-    def _download_action(pair):
-        destination_dir = os.path.join(destination, pair[0])
+    source_files = list(source_files)
+    for destination_dir in sorted(set(os.path.join(destination, dir_name) for dir_name, _ in source_files)):
         mkdir_p(destination_dir)
 
-        get_file_args = {'share_name': source, 'directory_name': pair[0], 'file_name': pair[1],
-                         'file_path': os.path.join(destination, *pair), 'max_connections': max_connections,
-                         'progress_callback': progress_callback, 'snapshot': snapshot}
+    def _download_action(dir_name, file_name, file_progress_callback):
+        get_file_args = {'share_name': source, 'directory_name': dir_name, 'file_name': file_name,
+                         'file_path': os.path.join(destination, dir_name, file_name),
+                         'max_connections': max_connections, 'progress_callback': file_progress_callback,
+                         'snapshot': snapshot}
 
         if cmd.supported_api_version(min_api='2016-05-31'):
             get_file_args['validate_content'] = validate_content
 
         client.get_file_to_path(**get_file_args)
-        return client.make_file_url(source, *pair)
+        return client.make_file_url(source, dir_name, file_name)
 
-    return list(_download_action(f) for f in source_files)
+    return _run_file_batch(_download_action, source_files, ['/'.join(f).lstrip('/') for f in source_files],
+                           progress_callback, max_workers)
+
+
+def _run_file_batch(action, file_pairs, names, progress_callback=None, max_workers=DEFAULT_BATCH_WORKERS):
+    """
+    Run action(first, second, progress_callback) for each pair of file_pairs with up to max_workers threads and
+    return the results in the order of file_pairs. The names of the files are shown in the progress message.
+
+    With a single worker the progress of each file is reported, otherwise the number of finished files is reported
+    since the transfers of several files overlap.
+    """
+    if max_workers <= 1 or len(file_pairs) <= 1:
+        return [action(first, second, progress_callback) for first, second in file_pairs]
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from threading import Lock
+
+    total = len(file_pairs)
+    finished = [0]
+    progress_lock = Lock()
+    if progress_callback:
+        # tell progress reporter to reuse the same hook
+        progress_callback.reuse = True
+
+    results = [None] * total
+    with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        futures = {executor.submit(action, first, second, None): index
+                   for index, (first, second) in enumerate(file_pairs)}
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if progress_callback:
+                    with progress_lock:
+                        finished[0] += 1
+                        progress_callback.message = '{}/{}: "{}"'.format(
+                            finished[0], total, names[index])
+                        progress_callback(finished[0], total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    if progress_callback:
+        progress_callback.hook.end()
+    return results
 
 
 def storage_file_copy_batch(cmd, client, source_client, destination_share=None, destination_path=None,
@@ -394,7 +448,7 @@ def _make_directory_in_files_share(file_service, file_share, directory_path, exi
         p = os.path.dirname(p)
 
     for dir_name in reversed(parents):
-        if existing_dirs and (dir_name in existing_dirs):
+        if existing_dirs is not None and (dir_name in existing_dirs):
             continue
 
         try:
@@ -403,8 +457,50 @@ def _make_directory_in_files_share(file_service, file_share, directory_path, exi
             from knack.util import CLIError
             raise CLIError('Failed to create directory {}'.format(dir_name))
 
-        if existing_dirs:
-            existing_dirs.add(directory_path)
+        if existing_dirs is not None:
+            existing_dirs.add(dir_name)
+
+
+def _make_directories_in_files_share(file_service, file_share, directory_paths, existing_dirs=None,
+                                     max_workers=DEFAULT_BATCH_WORKERS):
+    """
+    Create the given directories and their parents, each of them once.
+
+    The directories are created level by level since a directory can only be created after its parent. The
+    directories of a level are created concurrently by up to max_workers threads. The created directories are
+    added to the existing_dirs set, directories already in the set are skipped.
+    """
+    from azure.common import AzureHttpError
+
+    existing_dirs = set() if existing_dirs is None else existing_dirs
+    levels = {}
+    for directory_path in directory_paths:
+        parents = []
+        p = directory_path
+        while p:
+            parents.append(p)
+            p = os.path.dirname(p)
+        for depth, dir_name in enumerate(reversed(parents)):
+            if dir_name not in existing_dirs:
+                levels.setdefault(depth, set()).add(dir_name)
+
+    def _create_directory(dir_name):
+        try:
+            file_service.create_directory(share_name=file_share, directory_name=dir_name, fail_on_exist=False)
+        except AzureHttpError:
+            from knack.util import CLIError
+            raise CLIError('Failed to create directory {}'.format(dir_name))
+        return dir_name
+
+    for depth in sorted(levels):
+        dir_names = sorted(levels[depth])
+        if max_workers > 1 and len(dir_names) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(dir_names))) as executor:
+                existing_dirs.update(executor.map(_create_directory, dir_names))
+        else:
+            existing_dirs.update(_create_directory(d) for d in dir_names)
+    return existing_dirs
 
 
 def _file_share_exists(client, resource_group_name, account_name, share_name):
@@ -345,7 +345,7 @@ def _make_directory_in_files_share(file_service, file_share, directory_path, exi
         p = os.path.dirname(p)
 
     for dir_name in reversed(parents):
-        if existing_dirs and (dir_name in existing_dirs):
+        if existing_dirs is not None and (dir_name in existing_dirs):
             continue
 
         try:
@@ -354,8 +354,8 @@ def _make_directory_in_files_share(file_service, file_share, directory_path, exi
             from knack.util import CLIError
             raise CLIError('Failed to create directory {}'.format(dir_name))
 
-        if existing_dirs:
-            existing_dirs.add(directory_path)
+        if existing_dirs is not None:
+            existing_dirs.add(dir_name)
 
 
 def _file_share_exists(client, resource_group_name, account_name, share_name):
@@ -3,6 +3,29 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import os
+
+from knack.log import get_logger
+
+logger = get_logger(__name__)
+
+# an entity group transaction contains up to 100 operations on entities of the same partition
+ENTITY_BATCH_SIZE = 100
+# the payload of an entity group transaction is limited to 4 MiB, leave room for the multipart envelope
+MAX_ENTITY_BATCH_PAYLOAD = 4 * 1024 * 1024 - 256 * 1024
+# partial batches of all partitions are submitted once this many entities are buffered
+MAX_BUFFERED_ENTITIES = 10000
+DEFAULT_IMPORT_WORKERS = 8
+# retries of a batch after the retries of the SDK, for throttling and server errors
+ENTITY_BATCH_RETRIES = 5
+RETRIABLE_STATUS_CODES = (408, 429, 500, 503, 504)
+EXPORT_PAGE_SIZE = 1000
+# minimum number of seconds between two checkpoint writes
+CHECKPOINT_INTERVAL = 1.0
+
+_ODATA_TYPE_SUFFIX = '@odata.type'
+_SYSTEM_PROPERTIES = ('etag', 'Timestamp')
+
 
 def insert_table_entity(client, table_name, entity, if_exists='fail', timeout=None):
     if if_exists == 'fail':
@@ -13,3 +36,467 @@ def insert_table_entity(client, table_name, entity, if_exists='fail', timeout=No
         return client.insert_or_replace_entity(table_name, entity, timeout)
     from knack.util import CLIError
     raise CLIError("Unrecognized value '{}' for --if-exists".format(if_exists))
+
+
+def import_table_entities(cmd, client, table_name, source, source_format=None, if_exists='fail',
+                          max_workers=DEFAULT_IMPORT_WORKERS, checkpoint=None, timeout=None):
+    """
+    Import the entities of a NDJSON or CSV file into a table.
+
+    The entities are grouped by PartitionKey into entity group transactions which are submitted concurrently. With a
+    checkpoint file, an interrupted import skips the entities which are already imported when it is run again.
+    """
+    from azure.cli.command_modules.storage.sdkutil import get_table_data_type
+
+    source_format = _get_entity_file_format(source, source_format)
+    t_batch, t_entity_property, t_edm_type = get_table_data_type(cmd.cli_ctx, 'table', 'TableBatch',
+                                                                 'EntityProperty', 'EdmType')
+    state = _EntityCheckpoint.load(checkpoint, table_name, source)
+    if state.committed or state.committed_above:
+        logger.warning('Resuming the import from %s: skipping %s imported entities', checkpoint,
+                       state.committed + len(state.committed_above))
+
+    def _entities():
+        for index, record in enumerate(_read_entity_records(source, source_format)):
+            if index >= state.committed and index not in state.committed_above:
+                yield index, _record_to_entity(record, t_entity_property, t_edm_type)
+
+    importer = _EntityBatchImporter(client, table_name, t_batch, if_exists, max_workers, state, timeout)
+    imported = importer.run(_entities())
+    state.remove()
+    return {'imported': imported, 'batches': importer.batches}
+
+
+def export_table_entities(cmd, client, table_name, destination, destination_format=None,
+                          filter=None, select=None, checkpoint=None, timeout=None):  # pylint: disable=redefined-builtin
+    """
+    Export the entities of a table to a NDJSON or CSV file, one page of entities at a time.
+
+    With a checkpoint file, an interrupted export continues after the last page written to the file.
+    """
+    import time
+    from knack.util import CLIError
+
+    destination_format = _get_entity_file_format(destination, destination_format)
+    state = _EntityCheckpoint.load(checkpoint, table_name, destination)
+    if state.marker is not None:
+        logger.warning('Resuming the export from %s: %s entities already exported', checkpoint, state.committed)
+        with open(destination, 'r+b') as f:
+            # drop the entities written after the last checkpoint
+            f.truncate(state.size)
+    else:
+        state.committed, state.size, state.columns = 0, 0, None
+
+    last_save = 0
+    marker = state.marker or None
+    newline = '' if destination_format == 'csv' else None
+    with open(destination, 'a' if marker else 'w', newline=newline, encoding='utf-8') as f:
+        writer = _EntityWriter(f, destination_format, select, state.columns, header=state.size == 0)
+        while True:
+            page = client.query_entities(table_name, filter=filter, select=select, num_results=EXPORT_PAGE_SIZE,
+                                         marker=marker, timeout=timeout)
+            for entity in page:
+                try:
+                    writer.write(_entity_to_record(entity, annotate=destination_format == 'csv'))
+                except ValueError as ex:
+                    raise CLIError('{} Use --select to choose the exported properties or export to NDJSON.'.format(
+                        ex))
+                state.committed += 1
+            writer.flush()
+            marker = page.next_marker
+            if not marker:
+                break
+            f.flush()
+            if checkpoint and time.monotonic() - last_save >= CHECKPOINT_INTERVAL:
+                state.marker, state.size, state.columns = marker, f.tell(), writer.columns
+                state.save()
+                last_save = time.monotonic()
+    state.remove()
+    return {'exported': state.committed}
+
+
+def _get_entity_file_format(path, file_format=None):
+    if file_format:
+        return file_format
+    return 'csv' if os.path.splitext(path)[1].lower() == '.csv' else 'ndjson'
+
+
+def _read_entity_records(path, file_format):
+    """Yield the entities of a NDJSON or CSV file as dictionaries in the JSON format of the Table service."""
+    import csv
+    import json
+    from knack.util import CLIError
+
+    with open(path, newline='' if file_format == 'csv' else None, encoding='utf-8-sig') as f:
+        if file_format == 'csv':
+            for row in csv.DictReader(f):
+                # an empty cell is a missing property
+                yield {k: v for k, v in row.items() if k and v != ''}
+            return
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as ex:
+                raise CLIError('Invalid JSON in line {} of {}: {}'.format(line_number, path, ex))
+
+
+def _record_to_entity(record, t_entity_property, t_edm_type):
+    """
+    Convert a dictionary in the JSON format of the Table service, where "<name>@odata.type" annotates the type of a
+    property, to an entity. Integers without annotation are Int32 values if they fit, like in the service.
+    """
+    import base64
+    from knack.util import CLIError
+
+    entity = {}
+    for name, value in record.items():
+        if name.endswith(_ODATA_TYPE_SUFFIX) or name.startswith('odata.') or name in _SYSTEM_PROPERTIES:
+            continue
+        edm_type = record.get(name + _ODATA_TYPE_SUFFIX)
+        if name in ('PartitionKey', 'RowKey') or value is None:
+            entity[name] = value
+        elif edm_type is None:
+            if isinstance(value, int) and not isinstance(value, bool) and -2 ** 31 <= value < 2 ** 31:
+                entity[name] = t_entity_property(t_edm_type.INT32, value)
+            else:
+                entity[name] = value
+        else:
+            try:
+                if edm_type == t_edm_type.BINARY:
+                    value = base64.b64decode(value)
+                elif edm_type == t_edm_type.BOOLEAN:
+                    value = value if isinstance(value, bool) else value.lower() == 'true'
+                elif edm_type == t_edm_type.DATETIME:
+                    value = _parse_entity_datetime(value)
+                elif edm_type == t_edm_type.DOUBLE:
+                    value = float(value)
+                elif edm_type in (t_edm_type.INT32, t_edm_type.INT64):
+                    value = int(value)
+                elif edm_type not in (t_edm_type.GUID, t_edm_type.STRING):
+                    raise ValueError('unsupported type {}'.format(edm_type))
+            except (TypeError, ValueError) as ex:
+                raise CLIError("Invalid value '{}' of property {} of type {}: {}".format(value, name, edm_type, ex))
+            entity[name] = t_entity_property(edm_type, value)
+    if 'PartitionKey' not in entity or 'RowKey' not in entity:
+        raise CLIError('An entity requires a PartitionKey and a RowKey: {}'.format(record))
+    return entity
+
+
+def _entity_to_record(entity, annotate=False):
+    """
+    Convert an entity to a dictionary in the JSON format of the Table service. With annotate, the type of every
+    property other than a string is annotated, for formats without native booleans and numbers.
+    """
+    import base64
+    from datetime import datetime
+    from uuid import UUID
+
+    record = {}
+    for name, value in entity.items():
+        if name in _SYSTEM_PROPERTIES:
+            continue
+        edm_type = None
+        if hasattr(value, 'type') and hasattr(value, 'value'):
+            edm_type, value = value.type, value.value
+        if isinstance(value, bytes):
+            edm_type, value = 'Edm.Binary', base64.b64encode(value).decode()
+        elif isinstance(value, datetime):
+            edm_type, value = 'Edm.DateTime', _format_entity_datetime(value)
+        elif isinstance(value, UUID):
+            edm_type, value = 'Edm.Guid', str(value)
+        elif isinstance(value, bool):
+            edm_type = 'Edm.Boolean' if annotate else None
+        elif isinstance(value, int):
+            if edm_type == 'Edm.Int64' or not -2 ** 31 <= value < 2 ** 31:
+                edm_type, value = 'Edm.Int64', str(value)
+            else:
+                edm_type = 'Edm.Int32' if annotate else None
+        elif isinstance(value, float):
+            if value != value or value in (float('inf'), float('-inf')):
+                # not representable in JSON
+                edm_type, value = 'Edm.Double', {'inf': 'Infinity', '-inf': '-Infinity'}.get(str(value), 'NaN')
+            else:
+                edm_type = 'Edm.Double' if annotate else None
+        elif edm_type == 'Edm.String':
+            edm_type = None
+        record[name] = value
+        if edm_type:
+            record[name + _ODATA_TYPE_SUFFIX] = edm_type
+    return record
+
+
+def _parse_entity_datetime(value):
+    from datetime import datetime, timezone
+    value = value.rstrip('Z')
+    if '.' in value:
+        # the service returns up to 7 fractional digits
+        seconds, fraction = value.split('.', 1)
+        value = '{}.{}'.format(seconds, fraction[:6])
+        parsed = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f')
+    else:
+        parsed = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_entity_datetime(value):
+    from datetime import timezone
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class _EntityWriter:
+    """Write entity records as NDJSON lines or CSV rows. The CSV columns are fixed by the first entities."""
+
+    def __init__(self, stream, file_format, select=None, columns=None, header=True):
+        self.stream = stream
+        self.file_format = file_format
+        self.columns = columns
+        self._select = [c.strip() for c in select.split(',')] if select else None
+        self._header = header
+        self._pending = []
+        self._csv_writer = None
+
+    def write(self, record):
+        import json
+        if self.file_format != 'csv':
+            self.stream.write(json.dumps(record, ensure_ascii=False))
+            self.stream.write('\n')
+            return
+        if self.columns is None:
+            # collect the records of the first page to choose the columns
+            self._pending.append(record)
+            if len(self._pending) >= EXPORT_PAGE_SIZE:
+                self.flush()
+            return
+        self._write_row(record)
+
+    def flush(self):
+        if self.file_format != 'csv' or not self._pending:
+            return
+        if self.columns is None:
+            names = ['PartitionKey', 'RowKey'] + (self._select or [])
+            for record in self._pending:
+                names.extend(n for n in record if n not in names)
+            # each type annotation follows its property
+            self.columns = [c for n in names if not n.endswith(_ODATA_TYPE_SUFFIX)
+                            for c in (n, n + _ODATA_TYPE_SUFFIX) if c in names]
+        pending, self._pending = self._pending, []
+        for record in pending:
+            self._write_row(record)
+
+    def _write_row(self, record):
+        import csv
+        if self._csv_writer is None:
+            self._csv_writer = csv.DictWriter(self.stream, fieldnames=self.columns)
+            if self._header:
+                self._csv_writer.writeheader()
+        unknown = [n for n in record if n not in self.columns]
+        if unknown:
+            raise ValueError('The entity {}/{} has properties not in the columns of the CSV file: {}.'.format(
+                record.get('PartitionKey'), record.get('RowKey'), ', '.join(unknown)))
+        self._csv_writer.writerow(record)
+
+
+class _EntityCheckpoint:
+    """
+    Progress of an import or export, saved to a JSON file.
+
+    For an import, all entities before the index committed, and those in committed_above, are imported. For an export,
+    the first size bytes of the destination hold the entities of the pages before marker.
+    """
+
+    def __init__(self, path, table_name, file_path):
+        self.path = path
+        self.table_name = table_name
+        self.file_path = os.path.abspath(file_path)
+        self.committed = 0
+        self.committed_above = set()
+        self.marker = None
+        self.size = 0
+        self.columns = None
+
+    @classmethod
+    def load(cls, path, table_name, file_path):
+        import json
+        from knack.util import CLIError
+
+        state = cls(path, table_name, file_path)
+        if not path or not os.path.exists(path):
+            return state
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('table') != table_name or data.get('file') != state.file_path:
+            raise CLIError('The checkpoint {} belongs to the transfer of table {} and file {}. Remove it to start '
+                           'over.'.format(path, data.get('table'), data.get('file')))
+        state.committed = data.get('committed', 0)
+        state.committed_above = set(data.get('committedAbove', []))
+        state.marker = data.get('marker')
+        state.size = data.get('size', 0)
+        state.columns = data.get('columns')
+        return state
+
+    def save(self):
+        from azure.cli.core.util import write_file_json
+        if not self.path:
+            return
+        data = {'table': self.table_name, 'file': self.file_path, 'committed': self.committed,
+                'committedAbove': sorted(self.committed_above), 'marker': self.marker, 'size': self.size,
+                'columns': self.columns}
+        write_file_json(self.path, data)
+
+    def remove(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class _EntityBatchImporter:  # pylint: disable=too-many-instance-attributes
+    """Group entities by PartitionKey into entity group transactions and submit them concurrently."""
+
+    def __init__(self, client, table_name, batch_factory, if_exists, max_workers, state, timeout=None):
+        self.client = client
+        self.table_name = table_name
+        self.batch_factory = batch_factory
+        self.if_exists = if_exists
+        self.max_workers = max(1, max_workers)
+        self.state = state
+        self.timeout = timeout
+        self.batches = 0
+        self.imported = 0
+        self._buffers = {}
+        self._buffered = 0
+        self._in_flight = {}
+        self._in_flight_row_keys = {}
+        self._next_index = state.committed
+        self._last_save = 0
+
+    def run(self, entities):
+        """Import (index, entity) pairs and return the number of imported entities."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for index, entity in entities:
+                    self._next_index = index + 1
+                    self._add(executor, index, entity)
+                for partition_key in list(self._buffers):
+                    self._submit(executor, partition_key)
+                while self._in_flight:
+                    self._wait(return_when_all=True)
+            finally:
+                from concurrent.futures import wait
+                for future in self._in_flight:
+                    future.cancel()
+                # record the transactions which were already running
+                wait(list(self._in_flight))
+                self._record([f for f in self._in_flight if not f.cancelled()])
+                self._save_checkpoint(force=True)
+        return self.imported
+
+    def _add(self, executor, index, entity):
+        import json
+        partition_key = entity['PartitionKey']
+        size = len(json.dumps(entity, default=str))
+        buffer = self._buffers.get(partition_key)
+        if buffer and (len(buffer['entities']) >= ENTITY_BATCH_SIZE or
+                       buffer['size'] + size > MAX_ENTITY_BATCH_PAYLOAD or
+                       entity['RowKey'] in buffer['row_keys']):
+            # a transaction may contain a single operation per entity
+            self._submit(executor, partition_key)
+            buffer = None
+        if buffer is None:
+            buffer = self._buffers[partition_key] = {'entities': [], 'indexes': [], 'row_keys': set(), 'size': 0}
+        buffer['entities'].append(entity)
+        buffer['indexes'].append(index)
+        buffer['row_keys'].add(entity['RowKey'])
+        buffer['size'] += size
+        self._buffered += 1
+        if len(buffer['entities']) >= ENTITY_BATCH_SIZE:
+            self._submit(executor, partition_key)
+        elif self._buffered >= MAX_BUFFERED_ENTITIES:
+            for key in list(self._buffers):
+                self._submit(executor, key)
+
+    def _submit(self, executor, partition_key):
+        buffer = self._buffers.pop(partition_key)
+        self._buffered -= len(buffer['entities'])
+        # the earlier transactions of the same entities are committed first, so the last record of an entity wins
+        earlier = [future for future, (key, row_keys) in self._in_flight_row_keys.items()
+                   if key == partition_key and not row_keys.isdisjoint(buffer['row_keys'])]
+        if earlier:
+            self._wait(earlier)
+        # bound the number of transactions in flight
+        while len(self._in_flight) >= 2 * self.max_workers:
+            self._wait()
+        future = executor.submit(self._commit, buffer['entities'])
+        self._in_flight[future] = buffer['indexes']
+        self._in_flight_row_keys[future] = (partition_key, buffer['row_keys'])
+
+    def _wait(self, futures=None, return_when_all=False):
+        """Wait for the given transactions, all or the first of the transactions in flight."""
+        from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
+        if futures is not None:
+            done, _ = wait(futures)
+        else:
+            done, _ = wait(list(self._in_flight),
+                           return_when=ALL_COMPLETED if return_when_all else FIRST_COMPLETED)
+        error = self._record(done)
+        self._save_checkpoint()
+        if error is not None:
+            raise error
+
+    def _record(self, done):
+        """Record the successful transactions and return the first error. Failed transactions stay pending."""
+        error = None
+        for future in done:
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            indexes = self._in_flight.pop(future)
+            self._in_flight_row_keys.pop(future, None)
+            self.state.committed_above.update(indexes)
+            self.batches += 1
+            self.imported += len(indexes)
+        return error
+
+    def _commit(self, entities):
+        import time
+        from azure.common import AzureHttpError
+        from knack.util import CLIError
+
+        batch = self.batch_factory()
+        add = {'fail': batch.insert_entity, 'merge': batch.insert_or_merge_entity,
+               'replace': batch.insert_or_replace_entity}[self.if_exists]
+        for entity in entities:
+            add(entity)
+
+        delay = 1
+        for attempt in range(ENTITY_BATCH_RETRIES + 1):
+            try:
+                return self.client.commit_batch(self.table_name, batch, timeout=self.timeout)
+            except AzureHttpError as ex:
+                if ex.status_code not in RETRIABLE_STATUS_CODES or attempt == ENTITY_BATCH_RETRIES:
+                    raise CLIError('Failed to import the entities of PartitionKey {} with RowKeys {} to {}: '
+                                   '{}'.format(entities[0]['PartitionKey'], entities[0]['RowKey'],
+                                               entities[-1]['RowKey'], ex))
+                logger.warning('The service is busy (%s), retrying in %s seconds', ex.status_code, delay)
+                time.sleep(delay)
+                delay = min(delay * 2, 60)
+        return None
+
+    def _save_checkpoint(self, force=False):
+        import time
+        if not self.state.path:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_save < CHECKPOINT_INTERVAL:
+            return
+        self._last_save = now
+        # everything before the oldest pending entity is imported
+        pending = [b['indexes'][0] for b in self._buffers.values()] + \
+            [indexes[0] for indexes in self._in_flight.values()]
+        low_watermark = min(pending + [self._next_index])
+        self.state.committed = max(self.state.committed, low_watermark)
+        self.state.committed_above = {i for i in self.state.committed_above if i >= self.state.committed}
+        self.state.save()
@@ -0,0 +1,84 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+from unittest import mock
+
+from azure.cli.command_modules.storage.operations.blob import _start_blob_copies, _wait_for_blob_copies
+
+
+def _blob(name, status):
+    blob = mock.MagicMock()
+    blob.name = name
+    blob.properties.copy.status = status
+    blob.properties.copy.status_description = 'description of {}'.format(status)
+    return blob
+
+
+class ScriptedBlobService:
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.list_calls = 0
+
+    def list_blobs(self, container_name, prefix=None, include=None):
+        listing = self.listings[min(self.list_calls, len(self.listings) - 1)]
+        self.list_calls += 1
+        return [_blob(name, status) for name, status in listing]
+
+
+class TestBlobCopyBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.cmd = mock.MagicMock()
+        self.starts = {}
+
+    def _copy(self, name):
+        start = mock.MagicMock(return_value='https://account/c/' + name)
+        self.starts[name] = start
+        return name, name, start
+
+    def test_start_blob_copies_keeps_order(self):
+        starts = [mock.MagicMock(return_value=i) for i in range(20)]
+        self.assertEqual(_start_blob_copies(starts, max_workers=4), list(range(20)))
+        for start in starts:
+            start.assert_called_once_with()
+
+    @mock.patch('time.sleep')
+    def test_wait_for_blob_copies(self, sleep):
+        copies = [self._copy('a'), self._copy('b'), self._copy('c')]
+        urls = [start() for _, _, start in copies]
+        client = ScriptedBlobService([
+            [('a', 'success'), ('b', 'pending'), ('c', 'failed'), ('unrelated', 'failed')],
+            [('a', 'success'), ('b', 'pending'), ('c', 'pending')],
+            [('a', 'success'), ('b', 'success'), ('c', 'aborted')],
+            [('a', 'success'), ('b', 'success'), ('c', 'failed')],
+        ])
+
+        manifest = _wait_for_blob_copies(self.cmd, client, 'container', copies, urls, max_retries=2)
+
+        self.assertEqual(client.list_calls, 4)
+        self.assertEqual([s['source'] for s in manifest['succeeded']], ['a', 'b'])
+        self.assertEqual(manifest['failed'], [{'source': 'c', 'destination': 'https://account/c/c', 'attempts': 3,
+                                               'status': 'failed', 'statusDescription': 'description of failed'}])
+        # started once initially, restarted after the failure and the abort
+        self.assertEqual(self.starts['c'].call_count, 3)
+        self.assertEqual(self.starts['a'].call_count, 1)
+        self.assertEqual(sleep.call_count, 3)
+
+    @mock.patch('time.sleep')
+    def test_wait_for_blob_copies_missing_destination(self, sleep):
+        copies = [self._copy('a')]
+        client = ScriptedBlobService([[]])
+
+        manifest = _wait_for_blob_copies(self.cmd, client, 'container', copies, ['url'], max_retries=0)
+
+        self.assertEqual(manifest['succeeded'], [])
+        self.assertEqual(manifest['failed'][0]['status'], 'failed')
+        sleep.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from azure.common import AzureHttpError
+from azure.multiapi.cosmosdb.v2017_04_17.table import EntityProperty, EdmType
+
+from azure.cli.command_modules.storage.operations.table import (_EntityBatchImporter, _EntityCheckpoint,
+                                                                _entity_to_record, _record_to_entity,
+                                                                _read_entity_records, export_table_entities)
+
+
+class FakeBatch:
+
+    def __init__(self):
+        self.entities = []
+
+    def insert_or_replace_entity(self, entity):
+        self.entities.append(entity)
+
+    insert_entity = insert_or_merge_entity = insert_or_replace_entity
+
+
+class FakeTableService:
+
+    def __init__(self, entities=None, failures=0):
+        self.entities = entities or []
+        self.batches = []
+        self.failures = failures
+        self._lock = threading.Lock()
+
+    def commit_batch(self, table_name, batch, timeout=None):
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise AzureHttpError('Server busy', 503)
+            self.batches.append(batch.entities)
+
+    def query_entities(self, table_name, filter=None, select=None, num_results=None, marker=None,
+                       timeout=None):  # pylint: disable=redefined-builtin
+        start = marker or 0
+        page = mock.MagicMock()
+        items = self.entities[start:start + 2]
+        page.__iter__.return_value = iter(items)
+        page.next_marker = start + 2 if start + 2 < len(self.entities) else None
+        return page
+
+
+class TestEntityTransfer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_record_round_trip(self):
+        record = {'PartitionKey': 'pk', 'RowKey': 'rk', 'Name': 'n', 'Count': 3, 'Ratio': 0.5, 'Active': True,
+                  'Big': '8589934592', 'Big@odata.type': 'Edm.Int64',
+                  'When': '2021-01-02T03:04:05.1234567Z', 'When@odata.type': 'Edm.DateTime',
+                  'Data': 'AAE=', 'Data@odata.type': 'Edm.Binary'}
+        entity = _record_to_entity(record, EntityProperty, EdmType)
+
+        self.assertEqual(entity['Count'].type, EdmType.INT32)
+        self.assertEqual(entity['Big'].value, 8589934592)
+        self.assertEqual(entity['When'].value, datetime(2021, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc))
+        self.assertEqual(entity['Data'].value, b'\x00\x01')
+
+        exported = _entity_to_record(dict(entity, etag='W/"1"'))
+        self.assertEqual(exported['When'], '2021-01-02T03:04:05.123456Z')
+        del exported['When'], record['When']
+        self.assertEqual(exported, record)
+
+        annotated = _entity_to_record(entity, annotate=True)
+        self.assertEqual(annotated['Count@odata.type'], 'Edm.Int32')
+        self.assertEqual(annotated['Active@odata.type'], 'Edm.Boolean')
+
+    def test_read_csv_records(self):
+        path = os.path.join(self.temp_dir, 'entities.csv')
+        with open(path, 'w') as f:
+            f.write('PartitionKey,RowKey,Count,Count@odata.type,Name\npk,1,5,Edm.Int32,\n')
+        record = next(_read_entity_records(path, 'csv'))
+        self.assertEqual(record, {'PartitionKey': 'pk', 'RowKey': '1', 'Count': '5', 'Count@odata.type': 'Edm.Int32'})
+        self.assertEqual(_record_to_entity(record, EntityProperty, EdmType)['Count'].value, 5)
+
+    def test_import_groups_by_partition(self):
+        client = FakeTableService()
+        entities = [(i, {'PartitionKey': 'pk{}'.format(i % 3), 'RowKey': str(i)}) for i in range(250)]
+        # a transaction contains a single operation per entity
+        entities.append((250, {'PartitionKey': 'pk0', 'RowKey': '0'}))
+        state = _EntityCheckpoint(None, 'table', 'file')
+
+        importer = _EntityBatchImporter(client, 'table', FakeBatch, 'replace', 4, state)
+        self.assertEqual(importer.run(iter(entities)), 251)
+
+        for batch in client.batches:
+            self.assertLessEqual(len(batch), 100)
+            self.assertEqual(len({e['PartitionKey'] for e in batch}), 1)
+            self.assertEqual(len({e['RowKey'] for e in batch}), len(batch))
+        self.assertEqual(sum(len(b) for b in client.batches), 251)
+        self.assertEqual(importer.batches, len(client.batches))
+
+    def test_import_last_record_of_an_entity_wins(self):
+        class SlowTableService(FakeTableService):
+            def commit_batch(self, table_name, batch, timeout=None):
+                # the earlier transaction is committed last if it isn't waited for
+                if any(e['Value'] == 'old' for e in batch.entities):
+                    time.sleep(0.1)
+                super().commit_batch(table_name, batch, timeout)
+
+        client = SlowTableService()
+        entities = [(0, {'PartitionKey': 'pk', 'RowKey': '1', 'Value': 'old'}),
+                    (1, {'PartitionKey': 'pk', 'RowKey': '1', 'Value': 'new'})]
+        state = _EntityCheckpoint(None, 'table', 'file')
+
+        importer = _EntityBatchImporter(client, 'table', FakeBatch, 'replace', 4, state)
+        self.assertEqual(importer.run(iter(entities)), 2)
+
+        self.assertEqual([[e['Value'] for e in batch] for batch in client.batches], [['old'], ['new']])
+
+    @mock.patch('time.sleep')
+    def test_import_retries_throttled_batches(self, sleep):
+        client = FakeTableService(failures=2)
+        state = _EntityCheckpoint(None, 'table', 'file')
+        importer = _EntityBatchImporter(client, 'table', FakeBatch, 'fail', 1, state)
+        self.assertEqual(importer.run(iter([(0, {'PartitionKey': 'pk', 'RowKey': '1'})])), 1)
+        self.assertEqual(sleep.call_args_list, [mock.call(1), mock.call(2)])
+
+    def test_import_checkpoint(self):
+        checkpoint = os.path.join(self.temp_dir, 'checkpoint')
+        state = _EntityCheckpoint(checkpoint, 'table', 'file')
+        client = FakeTableService()
+
+        class FailingBatch(FakeBatch):
+            def insert_entity(self, entity):
+                if entity['PartitionKey'] == 'bad':
+                    raise ValueError('invalid entity')
+                self.entities.append(entity)
+
+        entities = [(0, {'PartitionKey': 'a', 'RowKey': '0'}), (1, {'PartitionKey': 'bad', 'RowKey': '1'}),
+                    (2, {'PartitionKey': 'b', 'RowKey': '2'})]
+        importer = _EntityBatchImporter(client, 'table', FailingBatch, 'fail', 1, state)
+        with self.assertRaises(ValueError):
+            importer.run(iter(entities))
+
+        saved = _EntityCheckpoint.load(checkpoint, 'table', 'file')
+        self.assertEqual(saved.committed, 1)
+        self.assertEqual(saved.committed_above, {2})
+
+    def test_export_resumes_from_checkpoint(self):
+        entities = [{'PartitionKey': 'pk', 'RowKey': str(i), 'Value': i} for i in range(5)]
+        destination = os.path.join(self.temp_dir, 'entities.ndjson')
+        checkpoint = os.path.join(self.temp_dir, 'checkpoint')
+        with open(destination, 'w') as f:
+            f.write('{"PartitionKey": "pk", "RowKey": "0", "Value": 0}\n{"PartitionKey": "pk", "RowKey": "1", '
+                    '"Value": 1}\n{"partial": ')
+        size = len('{"PartitionKey": "pk", "RowKey": "0", "Value": 0}\n{"PartitionKey": "pk", "RowKey": "1", '
+                   '"Value": 1}\n')
+        with open(checkpoint, 'w') as f:
+            json.dump({'table': 'table', 'file': os.path.abspath(destination), 'committed': 2, 'marker': 2,
+                       'size': size}, f)
+
+        result = export_table_entities(mock.MagicMock(), FakeTableService(entities), 'table', destination,
+                                       checkpoint=checkpoint)
+
+        self.assertEqual(result, {'exported': 5})
+        with open(destination) as f:
+            self.assertEqual([json.loads(line) for line in f], entities)
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_export_csv(self):
+        entities = [{'PartitionKey': 'pk', 'RowKey': '1', 'Value': 1},
+                    {'PartitionKey': 'pk', 'RowKey': '2', 'Name': 'b'},
+                    {'PartitionKey': 'pk', 'RowKey': '3', 'Other': 'c'}]
+        destination = os.path.join(self.temp_dir, 'entities.csv')
+
+        export_table_entities(mock.MagicMock(), FakeTableService(entities[:2]), 'table', destination)
+        with open(destination) as f:
+            self.assertEqual(f.read().splitlines(), ['PartitionKey,RowKey,Value,Value@odata.type,Name',
+                                                     'pk,1,1,Edm.Int32,', 'pk,2,,,b'])
+
+        from knack.util import CLIError
+        with self.assertRaisesRegex(CLIError, 'Other'):
+            export_table_entities(mock.MagicMock(), FakeTableService(entities), 'table', destination)
+
+
+if __name__ == '__main__':
+    unittest.main()
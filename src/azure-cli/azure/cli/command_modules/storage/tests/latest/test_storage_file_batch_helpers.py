@@ -0,0 +1,102 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import threading
+import unittest
+from unittest import mock
+
+from azure.cli.command_modules.storage.operations.file import (_make_directory_in_files_share,
+                                                               _make_directories_in_files_share, _run_file_batch)
+from azure.cli.command_modules.storage.util import glob_files_remotely
+
+
+class FakeFileService:
+
+    def __init__(self, tree=None):
+        self.tree = tree or {}
+        self.created = []
+        self._lock = threading.Lock()
+
+    def create_directory(self, share_name, directory_name, fail_on_exist=False):
+        parent = directory_name.rpartition('/')[0]
+        with self._lock:
+            if parent and parent not in self.created:
+                raise AssertionError('{} created before its parent'.format(directory_name))
+            self.created.append(directory_name)
+
+    def list_directories_and_files(self, share_name, directory_name, snapshot=None):
+        return iter(self.tree.get(directory_name, []))
+
+
+class Directory:
+
+    def __init__(self, name):
+        self.name = name
+
+
+class File(Directory):
+    pass
+
+
+class TestFileBatchHelpers(unittest.TestCase):
+
+    def test_make_directory_in_files_share_cache(self):
+        service = FakeFileService()
+        existing_dirs = set()
+        _make_directory_in_files_share(service, 'share', 'a/b/c', existing_dirs)
+        _make_directory_in_files_share(service, 'share', 'a/b/d', existing_dirs)
+        self.assertEqual(service.created, ['a', 'a/b', 'a/b/c', 'a/b/d'])
+        self.assertEqual(existing_dirs, {'a', 'a/b', 'a/b/c', 'a/b/d'})
+
+    def test_make_directories_in_files_share(self):
+        service = FakeFileService()
+        paths = ['a/b/c', 'a/b/c', 'a/d', 'e', '', 'a/b/f']
+        existing_dirs = _make_directories_in_files_share(service, 'share', paths, existing_dirs={'e'}, max_workers=4)
+
+        self.assertEqual(sorted(service.created), ['a', 'a/b', 'a/b/c', 'a/b/f', 'a/d'])
+        self.assertEqual(existing_dirs, {'a', 'a/b', 'a/b/c', 'a/b/f', 'a/d', 'e'})
+
+        _make_directories_in_files_share(service, 'share', paths, existing_dirs=existing_dirs)
+        self.assertEqual(len(service.created), 5)
+
+    def test_run_file_batch_keeps_order(self):
+        pairs = [('dir', 'file{}'.format(i)) for i in range(20)]
+        progress_callback = mock.MagicMock()
+
+        results = _run_file_batch(lambda d, f, callback: '{}/{}'.format(d, f), pairs, [f for _, f in pairs],
+                                  progress_callback, max_workers=4)
+
+        self.assertEqual(results, ['dir/file{}'.format(i) for i in range(20)])
+        self.assertTrue(progress_callback.reuse)
+        self.assertEqual([c[0] for c in progress_callback.call_args_list], [(i, 20) for i in range(1, 21)])
+        progress_callback.hook.end.assert_called_once()
+
+    def test_run_file_batch_single_worker_reports_file_progress(self):
+        progress_callback = mock.MagicMock()
+        action = mock.MagicMock(return_value='url')
+
+        _run_file_batch(action, [('', 'a'), ('', 'b')], ['a', 'b'], progress_callback, max_workers=1)
+        action.assert_has_calls([mock.call('', 'a', progress_callback), mock.call('', 'b', progress_callback)])
+
+    def test_glob_files_remotely_breadth_first(self):
+        tree = {
+            '': [File('root.txt'), Directory('a'), Directory('b')],
+            'a': [Directory('c'), File('a1.txt')],
+            'b': [File('b1.txt')],
+            'a/c': [File('c1.txt')],
+        }
+        cmd = mock.MagicMock()
+        cmd.get_models.return_value = (Directory, File)
+
+        for max_workers in (1, 4):
+            files = list(glob_files_remotely(cmd, FakeFileService(tree), 'share', None, max_workers=max_workers))
+            self.assertEqual(files, [('', 'root.txt'), ('a', 'a1.txt'), ('b', 'b1.txt'), ('a/c', 'c1.txt')])
+
+        files = list(glob_files_remotely(cmd, FakeFileService(tree), 'share', '*1.txt', max_workers=4))
+        self.assertEqual(files, [('a', 'a1.txt'), ('b', 'b1.txt'), ('a/c', 'c1.txt')])
+
+
+if __name__ == '__main__':
+    unittest.main()
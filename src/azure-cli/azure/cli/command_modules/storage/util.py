@@ -89,20 +89,35 @@ def glob_files_locally(folder_path, pattern):
                 yield (full_path, full_path[len_folder_path:])
 
 
-def glob_files_remotely(cmd, client, share_name, pattern, snapshot=None):
-    """glob the files in remote file share based on the given pattern"""
-    from collections import deque
+def glob_files_remotely(cmd, client, share_name, pattern, snapshot=None, max_workers=1):
+    """glob the files in remote file share based on the given pattern
+
+    The directories are enumerated level by level. The directories of a level are listed concurrently by up to
+    max_workers threads, the files are yielded in the same order as with a sequential breadth-first traversal.
+    """
     t_dir, t_file = cmd.get_models('file.models#Directory', 'file.models#File')
 
-    queue = deque([""])
-    while queue:
-        current_dir = queue.pop()
-        for f in client.list_directories_and_files(share_name, current_dir, snapshot=snapshot):
-            if isinstance(f, t_file):
-                if not pattern or _match_path(os.path.join(current_dir, f.name), pattern):
-                    yield current_dir, f.name
-            elif isinstance(f, t_dir):
-                queue.appendleft(os.path.join(current_dir, f.name))
+    def _list_directory(directory):
+        return list(client.list_directories_and_files(share_name, directory, snapshot=snapshot))
+
+    level = [""]
+    while level:
+        if max_workers > 1 and len(level) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(level))) as executor:
+                listings = list(executor.map(_list_directory, level))
+        else:
+            listings = [_list_directory(d) for d in level]
+
+        next_level = []
+        for current_dir, items in zip(level, listings):
+            for f in items:
+                if isinstance(f, t_file):
+                    if not pattern or _match_path(os.path.join(current_dir, f.name), pattern):
+                        yield current_dir, f.name
+                elif isinstance(f, t_dir):
+                    next_level.append(os.path.join(current_dir, f.name))
+        level = next_level
 
 
 def create_short_lived_blob_sas(cmd, account_name, account_key, container, blob):
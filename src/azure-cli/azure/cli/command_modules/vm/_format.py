@@ -112,6 +112,13 @@ transform_disk_show_table_output = '{Name:name, ResourceGroup:resourceGroup, Loc
                                    'SizeGb:diskSizeGb, ProvisioningState:provisioningState}'
 
 
+transform_vmss_instance_inventory_table_output = '[].{ScaleSet:scaleSet, ResourceGroup:resourceGroup, ' \
+                                                 'InstanceId:instanceId, PowerState:powerState, ' \
+                                                 'PrivateIps:join(\' \', privateIpAddresses), ' \
+                                                 'PublicIps:join(\' \', publicIpAddresses), ' \
+                                                 'NatEndpoints:join(\' \', natEndpoints)}'
+
+
 def get_vmss_table_output_transformer(loader, for_list=True):
     transform = '{Name:name, ResourceGroup:resourceGroup, Location:location, $zone$Capacity:sku.capacity, ' \
                 'Overprovision:overprovision, UpgradePolicy:upgradePolicy.mode}'
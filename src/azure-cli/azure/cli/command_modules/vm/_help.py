@@ -2945,6 +2945,25 @@ examples:
     crafted: true
 """
 
+helps['vmss list-instance-inventory'] = """
+type: command
+short-summary: List the VM instances of scale sets with their power state, IP addresses and NAT endpoints.
+long-summary: >
+    The VMs, network interfaces, public IP addresses and load balancers of the scale sets are retrieved concurrently
+    and joined into a row per instance. A scale set or load balancer which can't be retrieved is skipped with a
+    warning. Scale sets in Flexible orchestration mode are skipped too, their VMs are listed by `az vm list`.
+examples:
+  - name: List the instances of all the scale sets in a resource group.
+    text: |
+        az vmss list-instance-inventory --resource-group MyResourceGroup --output table
+  - name: List the stopped instances of all the scale sets in the subscription.
+    text: |
+        az vmss list-instance-inventory --query "[?powerState!='VM running']"
+  - name: List the instances of a scale set.
+    text: |
+        az vmss list-instance-inventory --name MyScaleSet --resource-group MyResourceGroup
+"""
+
 helps['vmss list-instance-public-ips'] = """
 type: command
 short-summary: List public IP addresses of VM instances within a set.
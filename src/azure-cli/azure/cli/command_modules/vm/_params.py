@@ -725,6 +725,9 @@ def load_arguments(self, _):
     with self.argument_context('vmss nic list') as c:
         c.argument('virtual_machine_scale_set_name', arg_type=vmss_name_type, options_list=['--vmss-name'], id_part=None)
 
+    with self.argument_context('vmss list-instance-inventory') as c:
+        c.argument('vm_scale_set_name', vmss_name_type, configured_default=None, id_part=None, help='Scale set name. If omitted, the instances of all the scale sets in the resource group, or in the subscription, are listed.')
+
     with self.argument_context('vmss set-orchestration-service-state') as c:
         c.argument('service_name', arg_type=get_enum_type(OrchestrationServiceNames), help='The name of the orchestration service.')
         c.argument('action', arg_type=get_enum_type(OrchestrationServiceStateAction), help='The action to be performed.')
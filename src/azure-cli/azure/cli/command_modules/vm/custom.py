@@ -40,7 +40,7 @@ from ._vm_utils import read_content_if_is_file
 from ._vm_diagnostics_templates import get_default_diag_config
 
 from ._actions import (load_images_from_aliases_doc, load_extension_images_thru_services,
-                       load_images_thru_services, _get_latest_image_version)
+                       load_images_thru_services, _get_latest_image_version, _get_thread_count)
 from ._client_factory import (_compute_client_factory, cf_public_ip_addresses, cf_vm_image_term,
                               _dev_test_labs_client_factory)
 
@@ -2978,6 +2978,145 @@ def list_vmss_instance_connection_info(cmd, resource_group_name, vm_scale_set_na
     raise CLIError('The VM scale-set uses an internal load balancer, hence no connection information')
 
 
+# pylint: disable=too-many-locals
+def list_vmss_instance_inventory(cmd, resource_group_name=None, vm_scale_set_name=None):
+    from concurrent.futures import ThreadPoolExecutor
+    from azure.core.exceptions import HttpResponseError
+    from msrestazure.tools import parse_resource_id
+    if vm_scale_set_name and not resource_group_name:
+        raise RequiredArgumentMissingError('usage error: --name requires --resource-group')
+
+    client = _compute_client_factory(cmd.cli_ctx)
+    network_client = get_mgmt_service_client(cmd.cli_ctx, ResourceType.MGMT_NETWORK)
+    if vm_scale_set_name:
+        scale_sets = [client.virtual_machine_scale_sets.get(resource_group_name, vm_scale_set_name)]
+    else:
+        scale_sets = list(list_vmss(cmd, resource_group_name))
+
+    # the VMs of a scale set in Flexible orchestration mode aren't listed by the scale set APIs
+    flexible_scale_sets = [vmss for vmss in scale_sets
+                           if (getattr(vmss, 'orchestration_mode', None) or '').lower() == 'flexible']
+    for vmss in flexible_scale_sets:
+        logger.warning("Scale set '%s' uses Flexible orchestration mode. It will be skipped, use 'az vm list' "
+                       "to list its VMs.", vmss.name)
+    scale_sets = [vmss for vmss in scale_sets if vmss not in flexible_scale_sets]
+
+    def _list_vms(rg, name):
+        return list(client.virtual_machine_scale_set_vms.list(rg, name, expand='instanceView'))
+
+    def _list_nics(rg, name):
+        return list(network_client.network_interfaces.list_virtual_machine_scale_set_network_interfaces(rg, name))
+
+    def _list_public_ips(rg, name):
+        return list(network_client.public_ip_addresses.list_virtual_machine_scale_set_public_ip_addresses(rg, name))
+
+    def _get_load_balancer(lb_id):
+        lb_info = parse_resource_id(lb_id)
+        return network_client.load_balancers.get(lb_info['resource_group'], lb_info['name'])
+
+    def _get_public_ip(public_ip_id):
+        public_ip_info = parse_resource_id(public_ip_id)
+        return network_client.public_ip_addresses.get(public_ip_info['resource_group'], public_ip_info['name'])
+
+    # the VMs, NICs and public IPs of all the scale sets and their load balancers are retrieved concurrently
+    with ThreadPoolExecutor(max_workers=_get_thread_count()) as executor:
+        tasks = []
+        lb_ids = set()
+        for vmss in scale_sets:
+            rg = parse_resource_id(vmss.id)['resource_group']
+            tasks.append((vmss, rg, executor.submit(_list_vms, rg, vmss.name),
+                          executor.submit(_list_nics, rg, vmss.name),
+                          executor.submit(_list_public_ips, rg, vmss.name)))
+            lb_ids.update(_get_vmss_load_balancer_ids(vmss))
+        lb_tasks = [(lb_id, executor.submit(_get_load_balancer, lb_id)) for lb_id in lb_ids]
+        load_balancers = []
+        for lb_id, task in lb_tasks:
+            try:
+                load_balancers.append(task.result())
+            except HttpResponseError as ex:
+                # e.g. a load balancer deleted while the scale set still refers to it
+                logger.warning("Failed to get load balancer '%s': %s. Its NAT endpoints will be skipped.",
+                               lb_id, ex.message)
+
+        # the frontends of the load balancers are the addresses of the NAT endpoints
+        frontend_public_ip_ids = {f.public_ip_address.id for lb in load_balancers
+                                  for f in lb.frontend_ip_configurations or [] if f.public_ip_address}
+        public_ip_tasks = [(public_ip_id, executor.submit(_get_public_ip, public_ip_id))
+                           for public_ip_id in frontend_public_ip_ids]
+        frontend_public_ips = {}
+        for public_ip_id, task in public_ip_tasks:
+            try:
+                frontend_public_ips[public_ip_id.lower()] = task.result().ip_address
+            except HttpResponseError as ex:
+                logger.warning("Failed to get public IP address '%s': %s. Its NAT endpoints will be skipped.",
+                               public_ip_id, ex.message)
+
+    nat_endpoints = {}
+    for lb in load_balancers:
+        frontend_addresses = {f.id.lower(): (frontend_public_ips.get(f.public_ip_address.id.lower())
+                                             if f.public_ip_address else f.private_ip_address)
+                              for f in lb.frontend_ip_configurations or []}
+        for rule in lb.inbound_nat_rules or []:
+            if not rule.backend_ip_configuration or not rule.frontend_ip_configuration:
+                continue
+            address = frontend_addresses.get(rule.frontend_ip_configuration.id.lower())
+            if address:
+                nat_endpoints.setdefault(rule.backend_ip_configuration.id.lower(), []).append(
+                    '{}:{}'.format(address, rule.frontend_port))
+
+    result = []
+    for vmss, rg, vms_task, nics_task, public_ips_task in tasks:
+        try:
+            vms, vmss_nics, vmss_public_ips = vms_task.result(), nics_task.result(), public_ips_task.result()
+        except HttpResponseError as ex:
+            # e.g. a scale set deleted since it was listed
+            logger.warning("Failed to list the instances of scale set '%s': %s. It will be skipped.",
+                           vmss.name, ex.message)
+            continue
+        nics = {}
+        for nic in vmss_nics:
+            if nic.virtual_machine:
+                nics.setdefault(nic.virtual_machine.id.lower(), []).append(nic)
+        public_ips = {p.ip_configuration.id.lower(): p.ip_address for p in vmss_public_ips
+                      if p.ip_configuration and p.ip_address}
+        for vm in vms:
+            ip_config_ids = []
+            private_ips = []
+            for nic in nics.get(vm.id.lower(), []):
+                for ip_config in nic.ip_configurations or []:
+                    ip_config_ids.append(ip_config.id.lower())
+                    if ip_config.private_ip_address:
+                        private_ips.append(ip_config.private_ip_address)
+            statuses = vm.instance_view.statuses if vm.instance_view and vm.instance_view.statuses else []
+            power_state = next((s.display_status for s in statuses if s.code and s.code.startswith('PowerState/')),
+                               None)
+            result.append({
+                'resourceGroup': rg,
+                'scaleSet': vmss.name,
+                'instanceId': vm.instance_id,
+                'name': vm.name,
+                'computerName': vm.os_profile.computer_name if vm.os_profile else None,
+                'powerState': power_state,
+                'provisioningState': vm.provisioning_state,
+                'privateIpAddresses': private_ips,
+                'publicIpAddresses': [public_ips[i] for i in ip_config_ids if i in public_ips],
+                'natEndpoints': [e for i in ip_config_ids for e in nat_endpoints.get(i, [])]
+            })
+    return result
+
+
+def _get_vmss_load_balancer_ids(vmss):
+    lb_ids = set()
+    network_profile = vmss.virtual_machine_profile.network_profile if vmss.virtual_machine_profile else None
+    for nic_config in (network_profile.network_interface_configurations or []) if network_profile else []:
+        for ip_config in nic_config.ip_configurations or []:
+            for ref in (ip_config.load_balancer_backend_address_pools or []) + \
+                    (ip_config.load_balancer_inbound_nat_pools or []):
+                # the load balancer is the parent of its pools
+                lb_ids.add(ref.id.rsplit('/', 2)[0].lower())
+    return lb_ids
+
+
 def list_vmss_instance_public_ips(cmd, resource_group_name, vm_scale_set_name):
     result = cf_public_ip_addresses(cmd.cli_ctx).list_virtual_machine_scale_set_public_ip_addresses(
         resource_group_name, vm_scale_set_name)
@@ -16,7 +16,7 @@ from azure.cli.command_modules.vm.custom import (enable_boot_diagnostics, disabl
                                                  _get_extension_instance_name,
                                                  get_boot_log)
 from azure.cli.command_modules.vm.custom import \
-    (attach_unmanaged_data_disk, detach_data_disk, get_vmss_instance_view)
+    (attach_unmanaged_data_disk, detach_data_disk, get_vmss_instance_view, list_vmss_instance_inventory)
 
 from azure.cli.core import AzCommandsLoader
 from azure.cli.core.commands import AzCliCommand
@@ -225,6 +225,114 @@ class TestVmCustom(unittest.TestCase):
         vm_client.virtual_machine_scale_set_vms.list.assert_called_once_with('rg1', 'vmss1', expand='instanceView',
                                                                              select='instanceView')
 
+    @mock.patch('azure.cli.command_modules.vm.custom.get_mgmt_service_client')
+    @mock.patch('azure.cli.command_modules.vm.custom._compute_client_factory')
+    def test_list_vmss_instance_inventory(self, factory_mock, network_factory_mock):
+        rg_id = '/subscriptions/sub1/resourceGroups/rg1/providers'
+        lb_id = rg_id + '/Microsoft.Network/loadBalancers/lb1'
+        scale_sets = []
+        vms = {}
+        nics = {}
+        for name in ['vmss1', 'vmss2']:
+            vmss_id = rg_id + '/Microsoft.Compute/virtualMachineScaleSets/' + name
+            ip_config = _Object(load_balancer_backend_address_pools=None,
+                                load_balancer_inbound_nat_pools=[_Object(id=lb_id + '/inboundNatPools/' + name)])
+            scale_sets.append(_Object(id=vmss_id, name=name, virtual_machine_profile=_Object(
+                network_profile=_Object(network_interface_configurations=[_Object(ip_configurations=[ip_config])]))))
+            vms[name] = []
+            nics[name] = []
+            for i, power_state in enumerate(['running', 'stopped']):
+                vm_id = '{}/virtualMachines/{}'.format(vmss_id, i)
+                statuses = [_Object(code='ProvisioningState/succeeded', display_status='Provisioning succeeded'),
+                            _Object(code='PowerState/' + power_state, display_status='VM ' + power_state)]
+                vms[name].append(_Object(id=vm_id, name='{}_{}'.format(name, i), instance_id=str(i),
+                                         os_profile=_Object(computer_name='{}00000{}'.format(name, i)),
+                                         provisioning_state='Succeeded',
+                                         instance_view=_Object(statuses=statuses)))
+                nics[name].append(_Object(virtual_machine=_Object(id=vm_id), ip_configurations=[
+                    _Object(id=vm_id + '/networkInterfaces/nic/ipConfigurations/ipconfig',
+                            private_ip_address='10.0.{}.{}'.format(len(scale_sets), i + 4))]))
+        public_ip_id = rg_id + '/Microsoft.Network/publicIPAddresses/lb1-ip'
+        frontend_id = lb_id + '/frontendIPConfigurations/frontend'
+        load_balancer = _Object(
+            frontend_ip_configurations=[_Object(id=frontend_id, public_ip_address=_Object(id=public_ip_id))],
+            inbound_nat_rules=[_Object(frontend_port=50000 + i, frontend_ip_configuration=_Object(id=frontend_id),
+                                       backend_ip_configuration=_Object(id=nic.ip_configurations[0].id.upper()))
+                               for i, nic in enumerate(nics['vmss1'])])
+
+        compute_client = factory_mock.return_value
+        compute_client.virtual_machine_scale_sets.list.return_value = scale_sets
+        compute_client.virtual_machine_scale_set_vms.list.side_effect = lambda rg, name, **_: vms[name]
+        network_client = network_factory_mock.return_value
+        network_client.network_interfaces.list_virtual_machine_scale_set_network_interfaces.side_effect = \
+            lambda rg, name: nics[name]
+        network_client.public_ip_addresses.list_virtual_machine_scale_set_public_ip_addresses.side_effect = \
+            lambda rg, name: [_Object(ip_configuration=nics[name][0].ip_configurations[0], ip_address='20.0.0.1')] \
+            if name == 'vmss2' else []
+        network_client.load_balancers.get.return_value = load_balancer
+        network_client.public_ip_addresses.get.return_value = _Object(id=public_ip_id, ip_address='20.0.0.2')
+
+        # execute
+        result = list_vmss_instance_inventory(_get_test_cmd(), 'rg1')
+
+        # assert
+        compute_client.virtual_machine_scale_sets.list.assert_called_once_with('rg1')
+        # the load balancer shared by the scale sets is retrieved once
+        network_client.load_balancers.get.assert_called_once_with('rg1', 'lb1')
+        self.assertEqual([(r['scaleSet'], r['instanceId'], r['powerState']) for r in result],
+                         [('vmss1', '0', 'VM running'), ('vmss1', '1', 'VM stopped'),
+                          ('vmss2', '0', 'VM running'), ('vmss2', '1', 'VM stopped')])
+        self.assertEqual(result[1]['computerName'], 'vmss1000001')
+        self.assertEqual([r['privateIpAddresses'] for r in result],
+                         [['10.0.1.4'], ['10.0.1.5'], ['10.0.2.4'], ['10.0.2.5']])
+        self.assertEqual([r['publicIpAddresses'] for r in result], [[], [], ['20.0.0.1'], []])
+        self.assertEqual([r['natEndpoints'] for r in result], [['20.0.0.2:50000'], ['20.0.0.2:50001'], [], []])
+
+    @mock.patch('azure.cli.command_modules.vm.custom.logger.warning')
+    @mock.patch('azure.cli.command_modules.vm.custom.get_mgmt_service_client')
+    @mock.patch('azure.cli.command_modules.vm.custom._compute_client_factory')
+    def test_list_vmss_instance_inventory_skips_failures(self, factory_mock, network_factory_mock, warning_mock):
+        from azure.core.exceptions import ResourceNotFoundError
+        rg_id = '/subscriptions/sub1/resourceGroups/rg1/providers'
+        lb_id = rg_id + '/Microsoft.Network/loadBalancers/deleted-lb'
+        ip_config = _Object(load_balancer_backend_address_pools=[_Object(id=lb_id + '/backendAddressPools/pool')],
+                            load_balancer_inbound_nat_pools=None)
+        network_profile = _Object(network_interface_configurations=[_Object(ip_configurations=[ip_config])])
+        scale_sets = [_Object(id=rg_id + '/Microsoft.Compute/virtualMachineScaleSets/' + name, name=name,
+                              orchestration_mode=mode, virtual_machine_profile=_Object(network_profile=network_profile))
+                      for name, mode in [('vmss1', 'Uniform'), ('deleted', 'Uniform'), ('flexible', 'Flexible')]]
+        vm_id = scale_sets[0].id + '/virtualMachines/0'
+
+        def _list_vms(rg, name, **_):
+            if name == 'deleted':
+                raise ResourceNotFoundError('The scale set was not found')
+            return [_Object(id=vm_id, name='vmss1_0', instance_id='0', os_profile=None,
+                            provisioning_state='Succeeded', instance_view=None)]
+
+        compute_client = factory_mock.return_value
+        compute_client.virtual_machine_scale_sets.list.return_value = scale_sets
+        compute_client.virtual_machine_scale_set_vms.list.side_effect = _list_vms
+        network_client = network_factory_mock.return_value
+        network_client.network_interfaces.list_virtual_machine_scale_set_network_interfaces.return_value = [
+            _Object(virtual_machine=_Object(id=vm_id), ip_configurations=[
+                _Object(id=vm_id + '/networkInterfaces/nic/ipConfigurations/ipconfig', private_ip_address='10.0.0.4')])]
+        network_client.public_ip_addresses.list_virtual_machine_scale_set_public_ip_addresses.return_value = []
+        network_client.load_balancers.get.side_effect = ResourceNotFoundError('The load balancer was not found')
+
+        # execute
+        result = list_vmss_instance_inventory(_get_test_cmd(), 'rg1')
+
+        # assert
+        self.assertEqual([(r['scaleSet'], r['privateIpAddresses'], r['natEndpoints']) for r in result],
+                         [('vmss1', ['10.0.0.4'], [])])
+        self.assertEqual([c[0][1] for c in compute_client.virtual_machine_scale_set_vms.list.call_args_list],
+                         ['vmss1', 'deleted'])
+        warnings = [c[0][0] % c[0][1:] for c in warning_mock.call_args_list]
+        self.assertEqual(len(warnings), 3)
+        self.assertIn("Scale set 'flexible' uses Flexible orchestration mode", warnings[0])
+        self.assertIn("Failed to get load balancer '{}'".format(lb_id.lower()), warnings[1])
+        self.assertIn("Failed to list the instances of scale set 'deleted'", warnings[2])
+
     # pylint: disable=line-too-long
     @mock.patch('azure.cli.command_modules.vm.disk_encryption._compute_client_factory', autospec=True)
     @mock.patch('azure.cli.command_modules.vm.disk_encryption._get_keyvault_key_url', autospec=True)
@@ -401,6 +509,11 @@ class FakedVM(object):  # pylint: disable=too-few-public-methods
         self.instance_view.extensions = [ext]
 
 
+class _Object(object):  # pylint: disable=too-few-public-methods
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
 class FakedAccessExtensionEntity(object):  # pylint: disable=too-few-public-methods
     def __init__(self, is_linux, version):
         self.name = 'VMAccessForLinux' if is_linux else 'VMAccessAgent'
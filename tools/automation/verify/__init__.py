@@ -9,6 +9,7 @@ from automation.verify.default_modules import verify_default_modules
 import automation.verify.verify_packages
 import automation.verify.verify_commands
 import automation.verify.verify_module_load_times
+import automation.verify.verify_import_times
 import automation.verify.verify_load_all
 
 
@@ -63,4 +64,5 @@ def init_args(root):
     automation.verify.verify_packages.init(sub_parser)
     automation.verify.verify_commands.init(sub_parser)
     automation.verify.verify_module_load_times.init(sub_parser)
+    automation.verify.verify_import_times.init(sub_parser)
     automation.verify.verify_load_all.init(sub_parser)
@@ -0,0 +1,285 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Startup benchmark: measure `python -X importtime` and wall time for a matrix of representative commands,
+enforce import budgets for command modules and render a trend report across releases.
+
+Everything runs offline: the commands in the matrix only show help or local information, telemetry is disabled
+and a temporary configuration directory is used.
+"""
+
+from collections import OrderedDict
+import datetime
+import json
+import os
+import platform
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from automation.verify.verify_module_load_times import mean, pstdev
+
+
+NUM_RUNS = 5
+DEFAULT_COMMANDS = [
+    'version',
+    'group list -h',
+    'vm create -h',
+    'storage blob upload -h',
+]
+
+COMMAND_MODULE_PREFIX = 'azure.cli.command_modules.'
+EXTENSION_PREFIX = 'azext_'
+
+# Budgets, in milliseconds, for importing a module's __init__ plus its commands.py. Modules listed here
+# currently exceed the default, lower their budgets as module scope imports are deferred.
+DEFAULT_BUDGET = 30
+BUDGETS = {
+    'network': 80,
+    'storage': 80,
+    'vm': 250,
+}
+
+# Packages that must not be imported at module scope of a command module's __init__ or commands.py
+SDK_PREFIXES = (
+    'azure.mgmt.',
+    'azure.multiapi.',
+    'azure.storage.',
+    'azure.keyvault',
+    'azure.graphrbac',
+    'azure.batch',
+    'azure.synapse',
+    'azure.appconfiguration',
+    'azure.cosmos',
+    'azure.datalake',
+    'azure.loganalytics',
+)
+# module -> SDK packages allowed at module scope
+SDK_IMPORT_EXCLUSIONS = {}
+
+_IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def init(root):
+    parser = root.add_parser('import-time', help='Verify import time budgets of command modules and benchmark '
+                                                 'the startup time of representative commands.')
+    parser.add_argument('--commands', nargs='+', default=DEFAULT_COMMANDS,
+                        help='Commands to benchmark, without the leading "az", each quoted as a single argument.')
+    parser.add_argument('--runs', type=int, default=NUM_RUNS, help='Number of measured runs for each command.')
+    parser.add_argument('--budgets', help='JSON file mapping module names to import budgets in milliseconds. '
+                                          'Use the key "default" to change the default budget.')
+    parser.add_argument('--output-file', help='Write the results to a JSON file, the input for import-time-trend.')
+    parser.set_defaults(func=run_verifications)
+
+    trend = root.add_parser('import-time-trend', help='Render a Markdown trend report from the JSON results of '
+                                                      '"verify import-time" of several releases.')
+    trend.add_argument('reports', nargs='+', help='JSON result files, in release order.')
+    trend.set_defaults(func=print_trend_report)
+
+
+class ImportNode(object):  # pylint: disable=too-few-public-methods
+
+    def __init__(self, name, self_us, cumulative_us, level):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.level = level
+        self.children = []
+
+    def iter_descendants(self):
+        for child in self.children:
+            yield child
+            for node in child.iter_descendants():
+                yield node
+
+
+def parse_import_time(output):
+    """Parse the stderr of `python -X importtime` into a list of root ImportNode trees.
+
+    Children are printed before their parent, one level of indentation (2 spaces) deeper.
+    """
+    pending = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line.rstrip())
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        node = ImportNode(name, int(self_us), int(cumulative_us), len(indent) // 2)
+        while pending and pending[-1].level > node.level:
+            node.children.insert(0, pending.pop())
+        pending.append(node)
+    return pending
+
+
+def _module_of(import_name):
+    if import_name.startswith(COMMAND_MODULE_PREFIX):
+        return import_name[len(COMMAND_MODULE_PREFIX):].split('.', 1)[0]
+    if import_name.startswith(EXTENSION_PREFIX):
+        return import_name.split('.', 1)[0]
+    return None
+
+
+def analyze_import_time(roots):
+    """Compute the import cost of each command module, and the SDK packages it imports at module scope.
+
+    :return: dict of module name -> {'load': ms of __init__ + commands, 'total': ms of all of its imports,
+        'sdk_imports': [package names]}
+    """
+    modules = {}
+
+    def _visit(node, owner):
+        module = _module_of(node.name)
+        if module and module != owner:
+            entry = modules.setdefault(module, {'load': 0.0, 'total': 0.0, 'sdk_imports': []})
+            cost = node.cumulative_us / 1000.0
+            entry['total'] += cost
+            package = module if module.startswith(EXTENSION_PREFIX) else COMMAND_MODULE_PREFIX + module
+            if node.name in (package, package + '.commands'):
+                entry['load'] += cost
+                for child in node.iter_descendants():
+                    if child.name.startswith(SDK_PREFIXES) and child.name not in entry['sdk_imports']:
+                        entry['sdk_imports'].append(child.name)
+            owner = module
+        for child in node.children:
+            _visit(child, owner)
+
+    for root in roots:
+        _visit(root, None)
+    return modules
+
+
+def _run_command(command, config_dir):
+    env = dict(os.environ)
+    env['AZURE_CONFIG_DIR'] = config_dir
+    env['AZURE_CORE_COLLECT_TELEMETRY'] = 'no'
+    env['AZURE_CORE_NO_COLOR'] = 'true'
+    args = [sys.executable, '-X', 'importtime', '-m', 'azure.cli'] + shlex.split(command)
+    start = timeit.default_timer()
+    proc = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env,
+                          universal_newlines=True, check=False)
+    elapsed = (timeit.default_timer() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError('"az {}" exited with code {}:\n{}'.format(
+            command, proc.returncode, '\n'.join(l for l in proc.stderr.splitlines() if not l.startswith('import time'))))
+    return elapsed, parse_import_time(proc.stderr)
+
+
+def benchmark(commands, runs):
+    results = OrderedDict()
+    config_dir = tempfile.mkdtemp()
+    try:
+        for command in commands:
+            # Ignore the first run since it can be longer due to *.pyc compilation and the command index rebuild
+            _run_command(command, config_dir)
+            wall_times = []
+            module_loads = {}
+            sdk_imports = {}
+            for _ in range(runs):
+                elapsed, roots = _run_command(command, config_dir)
+                wall_times.append(elapsed)
+                for module, entry in analyze_import_time(roots).items():
+                    module_loads.setdefault(module, []).append(entry['load'])
+                    sdk_imports[module] = entry['sdk_imports']
+            results[command] = {
+                'wall': {'average': mean(wall_times), 'stdev': pstdev(wall_times) if runs > 1 else 0.0,
+                         'values': wall_times},
+                'modules': {m: {'average': mean(v), 'sdk_imports': sdk_imports[m]}
+                            for m, v in sorted(module_loads.items())}
+            }
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return results
+
+
+def check_budgets(results, budgets):
+    """Return a list of (command, module, message) budget violations."""
+    violations = []
+    default_budget = budgets.get('default', DEFAULT_BUDGET)
+    for command, result in results.items():
+        for module, entry in result['modules'].items():
+            budget = budgets.get(module, default_budget)
+            if entry['average'] > budget:
+                violations.append((command, module, '__init__/commands load takes {:.0f} ms, budget is {} ms'.format(
+                    entry['average'], budget)))
+            allowed = SDK_IMPORT_EXCLUSIONS.get(module, [])
+            for package in entry['sdk_imports']:
+                if not any(package.startswith(a) for a in allowed):
+                    violations.append((command, module, 'imports SDK package {} at module scope'.format(package)))
+    return violations
+
+
+def _get_cli_version():
+    try:
+        from azure.cli.core import __version__
+        return __version__
+    except ImportError:
+        return 'unknown'
+
+
+def run_verifications(args):
+    budgets = dict(BUDGETS)
+    if args.budgets:
+        with open(args.budgets) as f:
+            budgets.update(json.load(f))
+
+    results = benchmark(args.commands, args.runs)
+
+    print('{:<30} {:>12} {:>12}'.format('Command', 'Wall (ms)', 'Stdev'))
+    for command, result in results.items():
+        print('{:<30} {:>12.0f} {:>12.0f}'.format('az ' + command, result['wall']['average'], result['wall']['stdev']))
+    print()
+    print('{:<30} {:<20} {:>12}'.format('Command', 'Module', 'Load (ms)'))
+    for command, result in results.items():
+        for module, entry in result['modules'].items():
+            print('{:<30} {:<20} {:>12.1f}'.format('az ' + command, module, entry['average']))
+
+    if args.output_file:
+        report = {
+            'version': _get_cli_version(),
+            'timestamp': datetime.datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results
+        }
+        with open(args.output_file, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    violations = check_budgets(results, budgets)
+    if violations:
+        print('\nFAILED')
+        for command, module, message in violations:
+            print('az {}: {} {}'.format(command, module, message))
+        sys.exit(1)
+    print('\nPASSED')
+
+
+def render_trend_report(reports):
+    """Render a Markdown table of wall times per command (rows) and release (columns)."""
+    versions = [r['version'] for r in reports]
+    commands = []
+    for report in reports:
+        commands.extend(c for c in report['results'] if c not in commands)
+
+    lines = ['| Command | {} |'.format(' | '.join(versions)),
+             '|---|{}|'.format('|'.join('---:' for _ in versions))]
+    for command in commands:
+        cells = []
+        for report in reports:
+            result = report['results'].get(command)
+            cells.append('{:.0f} ms'.format(result['wall']['average']) if result else '-')
+        lines.append('| az {} | {} |'.format(command, ' | '.join(cells)))
+    return '\n'.join(lines)
+
+
+def print_trend_report(args):
+    reports = []
+    for path in args.reports:
+        with open(path) as f:
+            reports.append(json.load(f))
+    print(render_trend_report(reports))